@@ -1948,6 +1948,12 @@ def main():
         logger.info(f"Records with ADS: {stats['ads_records']}")
         logger.info(f"Parsing errors: {stats['errors']}")
         
+        # Full paths of all records, for correlation, timeline and search queries
+        if success_count:
+            from mft_path_resolver import build_path_table
+            path_count = build_path_table(mft_parser.db_manager.connection)
+            logger.info(f"Resolved paths: {path_count}")
+        
         # Cleanup
         mft_parser.cleanup()
         
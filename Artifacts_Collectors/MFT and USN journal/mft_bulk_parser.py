@@ -0,0 +1,667 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+MFT Bulk Parser - Block-based parser for offline $MFT files
+
+MFTParser decodes one record at a time and builds MFTRecord/MFTAttribute
+objects through the attribute parser registry, which dominates the parse time
+of multi-gigabyte offline $MFT files. This parser decodes the same fields
+straight into SQLite rows:
+- the file is memory-mapped and processed in blocks of records
+- the record headers of a block are decoded in one iter_unpack() pass
+- update sequence fixups are applied to every record of a block before it is
+  decoded, so values crossing a sector boundary are read correctly
+- STANDARD_INFORMATION and FILE_NAME attributes are decoded with precompiled
+  struct.Struct objects into row tuples, without per-record or per-attribute
+  objects
+- timestamps are formatted once per distinct second
+
+parse_mft_file_sharded() spreads the record range over worker processes that
+parse into temporary shard databases, merged back in record order.
+
+Rows go to the MFTParser database schema (see DatabaseManager), with the
+values MFTParser writes for the same records.
+"""
+
+import os
+import sys
+import mmap
+import shutil
+import struct
+import sqlite3
+import logging
+import datetime
+import tempfile
+import multiprocessing
+from dataclasses import dataclass, field, fields, replace
+from functools import lru_cache
+from typing import Any, Callable, List, Optional, Tuple
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+if script_dir not in sys.path:
+    sys.path.insert(0, script_dir)
+
+from MFT_Claw import NTFSConstants, MFTClawConfig, MFTClawError, DatabaseError, DatabaseManager
+from utils.time_utils import format_forensic_timestamp
+
+logger = logging.getLogger(__name__)
+
+# Size of a FILE record in offline $MFT files
+MFT_RECORD_SIZE = 1024
+
+# Records read, fixed up and decoded together
+DEFAULT_BLOCK_RECORDS = 4096
+
+# Update sequence fixups protect the last two bytes of every 512-byte stride
+_FIXUP_STRIDE = 512
+
+# Record header: signature, USA offset, USA count, sequence number (16),
+# first attribute offset (20), flags (22)
+_RECORD_HEADER = struct.Struct('<4sHH8xHxxHH')
+
+# Attribute header fields: type, length; resident value: length (16), offset (20)
+_UINT32 = struct.Struct('<I')
+_RESIDENT_VALUE = struct.Struct('<IH')
+
+# $STANDARD_INFORMATION: 4 FILETIMEs, flags, max versions, version, class id,
+# then (Windows 2000+) owner id, security id, quota charged, USN
+_STANDARD_INFO = struct.Struct('<4Q4I')
+_STANDARD_INFO_EXTENDED = struct.Struct('<4Q6I2Q')
+
+# $FILE_NAME: parent reference, 4 FILETIMEs, allocated size, real size,
+# flags, reparse value, name length (in characters), namespace
+_FILE_NAME = struct.Struct('<7Q2I2B')
+
+_WINDOWS_EPOCH = datetime.datetime(1601, 1, 1, tzinfo=datetime.timezone.utc)
+
+_SIGNATURE = NTFSConstants.MFT_RECORD_SIGNATURE
+_ATTR_END = 0xFFFFFFFF
+_ATTR_SI = NTFSConstants.ATTR_STANDARD_INFORMATION
+_ATTR_FN = NTFSConstants.ATTR_FILE_NAME
+_ATTR_DATA = NTFSConstants.ATTR_DATA
+_DOS_NAMESPACE = 2
+
+# Shards of a sharded parse: at least this many records, about this many per worker
+MIN_SHARD_RECORDS = 65536
+SHARDS_PER_WORKER = 4
+
+# Upper bound of the default number of worker processes
+DEFAULT_MAX_WORKERS = 8
+
+# Seconds between progress reports of a sharded parse
+PROGRESS_INTERVAL = 0.5
+
+_INSERT_RECORDS_SQL = """
+    INSERT OR REPLACE INTO mft_records (
+        record_number, file_name, volume_letter, extension,
+        file_size, in_use, is_directory, flags, mft_sequence_number, has_ads, ads_count,
+        created_time, modified_time, accessed_time, mft_modified_time, file_attributes
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+_INSERT_STANDARD_INFO_SQL = """
+    INSERT INTO mft_standard_info (
+        record_number, file_name, volume_letter, created, modified, accessed, mft_modified,
+        flags, max_versions, version_number, class_id, owner_id, security_id,
+        quota_charged, usn
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+_INSERT_FILE_NAMES_SQL = """
+    INSERT INTO mft_file_names (
+        record_number, file_name, volume_letter, parent_record, parent_sequence,
+        namespace, flags, created, modified, accessed, mft_modified,
+        allocated_size, real_size
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+_INSERT_DATA_ATTRIBUTES_SQL = """
+    INSERT INTO mft_data_attributes (
+        record_number, file_name, volume_letter, attribute_name, resident, size
+    ) VALUES (?, ?, ?, ?, ?, ?)
+"""
+
+
+# Columns copied from a shard database, per table in insertion order
+_MERGE_TABLES = [
+    ('mft_records', 'record_number, file_name, volume_letter, extension, file_size, in_use, '
+                    'is_directory, flags, mft_sequence_number, has_ads, ads_count, created_time, '
+                    'modified_time, accessed_time, mft_modified_time, file_attributes'),
+    ('mft_standard_info', 'record_number, file_name, volume_letter, created, modified, accessed, '
+                          'mft_modified, flags, max_versions, version_number, class_id, owner_id, '
+                          'security_id, quota_charged, usn'),
+    ('mft_file_names', 'record_number, file_name, volume_letter, parent_record, parent_sequence, '
+                       'namespace, created, modified, accessed, mft_modified, allocated_size, '
+                       'real_size, flags'),
+    ('mft_data_attributes', 'record_number, file_name, volume_letter, attribute_name, resident, '
+                            'size, data_type'),
+]
+
+
+class ParsingCancelled(MFTClawError):
+    """Raised when a bulk parse is cancelled"""
+    pass
+
+
+@dataclass
+class MFTRowBatch:
+    """Rows of decoded records, one list per MFT table"""
+    records: List[tuple] = field(default_factory=list)
+    standard_info: List[tuple] = field(default_factory=list)
+    file_names: List[tuple] = field(default_factory=list)
+    data_attributes: List[tuple] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def clear(self):
+        self.records.clear()
+        self.standard_info.clear()
+        self.file_names.clear()
+        self.data_attributes.clear()
+
+
+@dataclass
+class MFTBulkStatistics:
+    """Counts of one bulk parse"""
+    records_scanned: int = 0
+    records_parsed: int = 0
+    in_use_records: int = 0
+    directory_records: int = 0
+    file_records: int = 0
+    ads_records: int = 0
+    fixup_mismatches: int = 0
+
+    def add(self, other: 'MFTBulkStatistics'):
+        """Add the counts of another parse"""
+        for stat in fields(self):
+            setattr(self, stat.name, getattr(self, stat.name) + getattr(other, stat.name))
+
+
+@lru_cache(maxsize=65536)
+def _seconds_text(seconds: int) -> Optional[str]:
+    """Database text of a whole number of seconds since 1601 (None if out of range)"""
+    try:
+        return format_forensic_timestamp(_WINDOWS_EPOCH + datetime.timedelta(seconds=seconds))
+    except (ValueError, OverflowError, OSError):
+        return None
+
+
+def _filetime_text(filetime: int) -> Optional[str]:
+    """Database text of a FILETIME (None for 0 or out of range values)"""
+    if filetime == 0:
+        return None
+    # Rounded to microseconds like timedelta(microseconds=filetime / 10.0)
+    return _seconds_text(round(filetime / 10.0) // 1000000)
+
+
+@lru_cache(maxsize=None)
+def _record_headers_struct(record_size: int) -> struct.Struct:
+    """Record header struct padded to a whole record, for iter_unpack()"""
+    return struct.Struct(f"{_RECORD_HEADER.format}{record_size - _RECORD_HEADER.size}x")
+
+
+def read_record_headers(block, record_size: int = MFT_RECORD_SIZE) -> List[Tuple]:
+    """
+    Headers of every record in a block.
+
+    Args:
+        block: Whole records
+        record_size: Size of one record
+
+    Returns:
+        (signature, usa_offset, usa_count, sequence_number, first_attribute_offset,
+        flags) of each record
+    """
+    return list(_record_headers_struct(record_size).iter_unpack(block))
+
+
+def apply_fixups(block: bytearray, headers: List[Tuple], record_size: int = MFT_RECORD_SIZE) -> int:
+    """
+    Apply the update sequence fixups of every FILE record in a block.
+
+    The last two bytes of each 512-byte stride of a record are replaced with
+    the saved bytes of its update sequence array. Strides that do not end with
+    the update sequence number (torn writes) are left unchanged.
+
+    Args:
+        block: Whole records, fixed up in place
+        headers: Record headers of the block (read_record_headers)
+        record_size: Size of one record
+
+    Returns:
+        Number of strides that did not end with the update sequence number
+    """
+    mismatches = 0
+    strides = record_size // _FIXUP_STRIDE
+    for index, (signature, usa_offset, usa_count, _, _, _) in enumerate(headers):
+        if signature != _SIGNATURE or usa_count < 2 or usa_count - 1 > strides \
+                or usa_offset + 2 * usa_count > record_size:
+            continue
+        base = index * record_size
+        usa = base + usa_offset
+        sequence = block[usa:usa + 2]
+        for stride in range(1, usa_count):
+            end = base + stride * _FIXUP_STRIDE
+            if block[end - 2:end] == sequence:
+                block[end - 2:end] = block[usa + 2 * stride:usa + 2 * stride + 2]
+            else:
+                mismatches += 1
+    return mismatches
+
+
+def decode_records(block: bytearray, headers: List[Tuple], first_record_number: int,
+                   volume_letter: str, rows: MFTRowBatch, stats: MFTBulkStatistics,
+                   record_size: int = MFT_RECORD_SIZE):
+    """
+    Decode the FILE records of a fixed-up block into database rows.
+
+    Args:
+        block: Whole records with fixups applied
+        headers: Record headers of the block (read_record_headers)
+        first_record_number: MFT record number of the first record in the block
+        volume_letter: Volume letter stored with the rows
+        rows: Row batch the rows are appended to
+        stats: Statistics updated with the decoded records
+        record_size: Size of one record
+    """
+    unpack_uint32 = _UINT32.unpack_from
+    unpack_resident = _RESIDENT_VALUE.unpack_from
+    unpack_si = _STANDARD_INFO.unpack_from
+    unpack_si_extended = _STANDARD_INFO_EXTENDED.unpack_from
+    unpack_fn = _FILE_NAME.unpack_from
+    filetime_text = _filetime_text
+    splitext = os.path.splitext
+
+    for index, (signature, _, _, sequence_number, attr_offset, flags) in enumerate(headers):
+        if signature != _SIGNATURE:
+            continue
+        record_number = first_record_number + index
+        base = index * record_size
+        end = base + record_size
+
+        standard_info = None
+        file_names = []
+        data_attributes = []
+
+        # Attribute walk with the bounds MFTParser._parse_attributes applies
+        offset = base + attr_offset
+        while offset < end - 4:
+            attr_type = unpack_uint32(block, offset)[0]
+            if attr_type == _ATTR_END or offset + 8 > end:
+                break
+            attr_length = unpack_uint32(block, offset + 4)[0]
+
+            if (attr_type == _ATTR_SI or attr_type == _ATTR_FN or attr_type == _ATTR_DATA) \
+                    and offset + 16 <= end and offset + attr_length <= end:
+                resident = block[offset + 8] == 0
+                value_start = value_end = None
+                if not resident:
+                    value_start = offset + 16
+                    value_end = max(value_start, offset + attr_length)
+                elif offset + 22 <= end:
+                    value_length, value_offset = unpack_resident(block, offset + 16)
+                    value_start = offset + value_offset
+                    value_end = value_start + value_length
+                    if value_end > end:
+                        value_start = value_end = offset
+                value_length = value_end - value_start if value_start is not None else -1
+
+                if attr_type == _ATTR_SI:
+                    if value_length >= 72:
+                        standard_info = unpack_si_extended(block, value_start)
+                    elif value_length >= 48:
+                        standard_info = unpack_si(block, value_start) + (0, 0, 0, 0)
+                elif attr_type == _ATTR_FN:
+                    if value_length >= 66:
+                        (parent_ref, created, modified, accessed, mft_modified, allocated_size,
+                         real_size, fn_flags, _, name_length, namespace) = unpack_fn(block, value_start)
+                        if value_length >= 66 + 2 * name_length:
+                            name_start = value_start + 66
+                            parent_record = parent_ref & 0xFFFFFFFFFFFF
+                            parent_sequence = parent_ref >> 48
+                            if parent_sequence == 0 and parent_record > 0:
+                                parent_sequence = 1
+                            file_names.append((
+                                block[name_start:name_start + 2 * name_length].decode('utf-16le', errors='replace'),
+                                parent_record, parent_sequence, namespace, fn_flags,
+                                created, modified, accessed, mft_modified, allocated_size, real_size
+                            ))
+                elif value_length >= 0:
+                    data_attributes.append((resident, value_length if resident else 0))
+
+            if attr_length == 0:
+                break
+            offset += attr_length
+
+        # Primary name: the first non-DOS name, else the first name
+        primary_filename = ""
+        if file_names:
+            primary_filename = file_names[0][0]
+            for file_name in file_names:
+                if file_name[3] != _DOS_NAMESPACE:
+                    primary_filename = file_name[0]
+                    break
+
+        # Every $DATA attribute counts as a stream, as in MFTParser
+        file_size = sum(size for resident, size in data_attributes if resident)
+        ads_count = len(data_attributes)
+        in_use = flags & NTFSConstants.RECORD_IN_USE
+        is_directory = flags & NTFSConstants.RECORD_IS_DIRECTORY
+
+        if standard_info is not None:
+            created = filetime_text(standard_info[0])
+            modified = filetime_text(standard_info[1])
+            accessed = filetime_text(standard_info[2])
+            mft_modified = filetime_text(standard_info[3])
+            file_attributes = standard_info[4]
+            rows.standard_info.append((
+                record_number, primary_filename, volume_letter,
+                created, modified, accessed, mft_modified) + standard_info[4:])
+        else:
+            created = modified = accessed = mft_modified = None
+            file_attributes = 0
+
+        rows.records.append((
+            record_number, primary_filename, volume_letter,
+            splitext(primary_filename)[1].lower().lstrip('.'), file_size,
+            1 if in_use else 0, 1 if is_directory else 0,
+            flags, sequence_number, 1 if ads_count else 0, ads_count,
+            created, modified, accessed, mft_modified, file_attributes
+        ))
+
+        for (file_name, parent_record, parent_sequence, namespace, fn_flags,
+             fn_created, fn_modified, fn_accessed, fn_mft_modified,
+             allocated_size, real_size) in file_names:
+            rows.file_names.append((
+                record_number, file_name, volume_letter, parent_record, parent_sequence,
+                namespace, fn_flags,
+                filetime_text(fn_created), filetime_text(fn_modified),
+                filetime_text(fn_accessed), filetime_text(fn_mft_modified),
+                allocated_size, real_size
+            ))
+
+        for resident, size in data_attributes:
+            rows.data_attributes.append((
+                record_number, primary_filename, volume_letter, "$DATA", 1 if resident else 0, size
+            ))
+
+        stats.records_parsed += 1
+        if in_use:
+            stats.in_use_records += 1
+        if is_directory:
+            stats.directory_records += 1
+        else:
+            stats.file_records += 1
+        if ads_count:
+            stats.ads_records += 1
+
+
+def insert_rows(connection: sqlite3.Connection, rows: MFTRowBatch):
+    """
+    Insert and commit a row batch.
+
+    Args:
+        connection: Connection to a database with the MFTParser schema
+        rows: Rows to insert
+
+    Raises:
+        DatabaseError: If the insert fails (the batch is rolled back)
+    """
+    if not rows:
+        return
+    try:
+        connection.executemany(_INSERT_RECORDS_SQL, rows.records)
+        if rows.standard_info:
+            connection.executemany(_INSERT_STANDARD_INFO_SQL, rows.standard_info)
+        if rows.file_names:
+            connection.executemany(_INSERT_FILE_NAMES_SQL, rows.file_names)
+        if rows.data_attributes:
+            connection.executemany(_INSERT_DATA_ATTRIBUTES_SQL, rows.data_attributes)
+        connection.commit()
+    except sqlite3.Error as e:
+        connection.rollback()
+        raise DatabaseError(f"Failed to bulk insert MFT records: {e}")
+
+
+def parse_mft_file(mft_path: str, connection: sqlite3.Connection, volume_letter: str = 'OFFLINE',
+                   start_record: int = 0, end_record: Optional[int] = None, batch_size: int = 1000,
+                   block_records: int = DEFAULT_BLOCK_RECORDS, record_size: int = MFT_RECORD_SIZE,
+                   progress_callback: Optional[Callable[[MFTBulkStatistics], None]] = None,
+                   cancel_event: Optional[Any] = None) -> MFTBulkStatistics:
+    """
+    Parse an offline $MFT file into an MFT database.
+
+    Args:
+        mft_path: Path of the $MFT file
+        connection: Connection to a database with the MFTParser schema
+        volume_letter: Volume letter stored with the rows
+        start_record: First record number to parse
+        end_record: Record number to stop at (None for the end of the file)
+        batch_size: Minimum number of records inserted per transaction
+        block_records: Number of records read and decoded together
+        record_size: Size of one record
+        progress_callback: Optional function called with the statistics after
+            every block
+        cancel_event: Optional event (e.g. threading.Event) that cancels the
+            parse when set; records of completed batches stay in the database
+
+    Returns:
+        MFTBulkStatistics of the parse
+
+    Raises:
+        DatabaseError: If inserting rows fails
+        ParsingCancelled: If cancel_event was set
+    """
+    stats = MFTBulkStatistics()
+    rows = MFTRowBatch()
+    block_records = max(1, block_records)
+
+    with open(mft_path, 'rb') as mft_file:
+        total_records = os.fstat(mft_file.fileno()).st_size // record_size
+        end_record = total_records if end_record is None else min(end_record, total_records)
+        if start_record >= end_record:
+            return stats
+
+        connection.execute("PRAGMA foreign_keys = OFF")
+        with mmap.mmap(mft_file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            view = memoryview(mapped)
+            try:
+                for first_record in range(start_record, end_record, block_records):
+                    if cancel_event is not None and cancel_event.is_set():
+                        raise ParsingCancelled(f"MFT parsing cancelled at record {first_record}")
+                    last_record = min(first_record + block_records, end_record)
+                    block = bytearray(view[first_record * record_size:last_record * record_size])
+
+                    headers = read_record_headers(block, record_size)
+                    stats.fixup_mismatches += apply_fixups(block, headers, record_size)
+                    decode_records(block, headers, first_record, volume_letter, rows, stats, record_size)
+                    stats.records_scanned += last_record - first_record
+
+                    if len(rows) >= batch_size:
+                        insert_rows(connection, rows)
+                        rows.clear()
+                    if progress_callback:
+                        progress_callback(stats)
+
+                insert_rows(connection, rows)
+            finally:
+                view.release()
+                connection.execute("PRAGMA foreign_keys = ON")
+
+    if stats.fixup_mismatches:
+        logger.debug(f"{stats.fixup_mismatches} MFT record sectors failed the update sequence check")
+    return stats
+
+
+def _available_cpus() -> int:
+    """Number of CPUs this process may run on"""
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+
+# Shared state of a shard worker process (see _init_shard_worker)
+_shard_progress = None
+_shard_cancel_event = None
+
+
+def _init_shard_worker(progress, cancel_event):
+    """Pool initializer: progress counters and cancel event shared with the parent"""
+    global _shard_progress, _shard_cancel_event
+    _shard_progress = progress
+    _shard_cancel_event = cancel_event
+
+
+def _parse_shard(task: Tuple) -> MFTBulkStatistics:
+    """Parse one shard of an $MFT file into its own database (runs in a worker process)"""
+    shard_index, mft_path, shard_path, volume_letter, start_record, end_record, batch_size, record_size = task
+
+    def report_progress(stats: MFTBulkStatistics):
+        _shard_progress[2 * shard_index] = stats.records_scanned
+        _shard_progress[2 * shard_index + 1] = stats.records_parsed
+
+    config = MFTClawConfig(
+        output_directory=os.path.dirname(shard_path),
+        database_name=os.path.basename(shard_path),
+        batch_size=batch_size,
+        enable_wal_mode=False
+    )
+    db_manager = DatabaseManager(config)
+    try:
+        # Shard databases are temporary, a failed parse discards them
+        db_manager.connection.execute("PRAGMA synchronous = OFF")
+        return parse_mft_file(mft_path, db_manager.connection, volume_letter, start_record, end_record,
+                              batch_size, record_size=record_size, progress_callback=report_progress,
+                              cancel_event=_shard_cancel_event)
+    finally:
+        db_manager.close()
+
+
+def merge_shard(connection: sqlite3.Connection, shard_path: str):
+    """
+    Append the rows of a shard database to an MFT database, in shard row order.
+
+    Args:
+        connection: Connection to the MFT database (no open transaction)
+        shard_path: Path of the shard database
+
+    Raises:
+        DatabaseError: If the merge fails (it is rolled back)
+    """
+    connection.execute("ATTACH DATABASE ? AS shard", (shard_path,))
+    try:
+        for table, columns in _MERGE_TABLES:
+            insert = "INSERT OR REPLACE" if table == 'mft_records' else "INSERT"
+            connection.execute(f"{insert} INTO main.{table} ({columns}) "
+                               f"SELECT {columns} FROM shard.{table} ORDER BY rowid")
+        connection.commit()
+    except sqlite3.Error as e:
+        connection.rollback()
+        raise DatabaseError(f"Failed to merge MFT shard {shard_path}: {e}")
+    finally:
+        connection.execute("DETACH DATABASE shard")
+
+
+def parse_mft_file_sharded(mft_path: str, connection: sqlite3.Connection, volume_letter: str = 'OFFLINE',
+                           workers: Optional[int] = None, batch_size: int = 1000,
+                           record_size: int = MFT_RECORD_SIZE,
+                           progress_callback: Optional[Callable[[MFTBulkStatistics], None]] = None,
+                           cancel_event: Optional[Any] = None,
+                           temp_directory: Optional[str] = None) -> MFTBulkStatistics:
+    """
+    Parse an offline $MFT file with worker processes.
+
+    The record range is split into shards that worker processes parse with
+    parse_mft_file(), each into its own temporary database. Shards are merged
+    into the MFT database in record order (ATTACH + INSERT ... SELECT) as they
+    complete, so the tables get the same rows in the same order as a single
+    parse_mft_file() call. Files too small to split are parsed in this process.
+
+    Args:
+        mft_path: Path of the $MFT file
+        connection: Connection to a database with the MFTParser schema
+        volume_letter: Volume letter stored with the rows
+        workers: Number of worker processes (None for one per CPU, at most
+            DEFAULT_MAX_WORKERS)
+        batch_size: Minimum number of records inserted per transaction
+        record_size: Size of one record
+        progress_callback: Optional function called with the statistics about
+            every PROGRESS_INTERVAL seconds; records_scanned and records_parsed
+            include shards that are still being parsed
+        cancel_event: Optional event (e.g. threading.Event) that cancels the
+            parse when set; shards merged so far stay in the database
+        temp_directory: Directory of the shard databases (system temp
+            directory if None)
+
+    Returns:
+        MFTBulkStatistics of the parse
+
+    Raises:
+        DatabaseError: If inserting or merging rows fails
+        ParsingCancelled: If cancel_event was set
+    """
+    total_records = os.path.getsize(mft_path) // record_size
+    workers = workers or min(_available_cpus(), DEFAULT_MAX_WORKERS)
+    shard_records = max(MIN_SHARD_RECORDS, -(-total_records // (workers * SHARDS_PER_WORKER)))
+    shard_records = -(-shard_records // DEFAULT_BLOCK_RECORDS) * DEFAULT_BLOCK_RECORDS
+
+    if workers <= 1 or total_records <= shard_records:
+        return parse_mft_file(mft_path, connection, volume_letter, batch_size=batch_size,
+                              record_size=record_size, progress_callback=progress_callback,
+                              cancel_event=cancel_event)
+
+    shard_directory = tempfile.mkdtemp(prefix='mft_shards_', dir=temp_directory)
+    tasks = [
+        (index, mft_path, os.path.join(shard_directory, f"shard_{index:05d}.db"), volume_letter,
+         start_record, min(start_record + shard_records, total_records), batch_size, record_size)
+        for index, start_record in enumerate(range(0, total_records, shard_records))
+    ]
+    logger.info(f"Parsing {total_records:,} MFT records in {len(tasks)} shards "
+                f"with {min(workers, len(tasks))} processes")
+
+    context = multiprocessing.get_context('spawn')
+    shard_progress = context.Array('q', 2 * len(tasks))
+    shard_cancel_event = context.Event()
+    stats = MFTBulkStatistics()
+
+    def report_progress():
+        if cancel_event is not None and cancel_event.is_set():
+            shard_cancel_event.set()
+            raise ParsingCancelled("MFT parsing cancelled")
+        if progress_callback:
+            counts = shard_progress[:]
+            progress_callback(replace(stats, records_scanned=sum(counts[0::2]),
+                                      records_parsed=sum(counts[1::2])))
+
+    pool = context.Pool(min(workers, len(tasks)), initializer=_init_shard_worker,
+                        initargs=(shard_progress, shard_cancel_event))
+    connection.execute("PRAGMA foreign_keys = OFF")
+    try:
+        results = pool.imap(_parse_shard, tasks)
+        for task in tasks:
+            while True:
+                try:
+                    shard_stats = results.next(timeout=PROGRESS_INTERVAL)
+                    break
+                except multiprocessing.TimeoutError:
+                    report_progress()
+            merge_shard(connection, task[2])
+            os.remove(task[2])
+            stats.add(shard_stats)
+            report_progress()
+        pool.close()
+    except BaseException:
+        shard_cancel_event.set()
+        pool.terminate()
+        raise
+    finally:
+        pool.join()
+        connection.execute("PRAGMA foreign_keys = ON")
+        shutil.rmtree(shard_directory, ignore_errors=True)
+
+    if stats.fixup_mismatches:
+        logger.debug(f"{stats.fixup_mismatches} MFT record sectors failed the update sequence check")
+    return stats
@@ -0,0 +1,263 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+MFT Path Resolver - Full path table of an MFT database
+
+Paths of MFT records used to be rebuilt by walking the parent chain of every
+record and caching only the path of the record the walk started from, so
+each directory was walked again for every one of its children. The resolver
+builds the paths of a whole volume at once:
+- only directories are kept in memory (name, parent reference, sequence)
+- a directory path is resolved once, memoizing every ancestor on the walk
+- parent references are checked against the sequence number of the parent
+  record, so entries of a directory record that was since reused are marked
+  orphaned instead of being placed under the new directory
+- all records are then streamed once and written to the paths table, which
+  correlation, timeline and search queries join on
+
+Paths keep the format of the MFT/USN correlator: names joined with "/" from
+the root (".") down, "[Unknown Parent: N]" when the parent record is missing,
+"[Orphaned Parent: N-S]" when the parent reference no longer matches the
+parent record and "[Parent Loop: N]" when the parent chain loops.
+"""
+
+import logging
+import sqlite3
+from typing import Dict, Iterator, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# MFT record of the root directory
+ROOT_RECORD = 5
+
+# Rows written per executemany() call
+_BATCH_SIZE = 10000
+
+_SCHEMA_SQL = """
+CREATE TABLE IF NOT EXISTS paths (
+    record_number INTEGER,
+    volume_letter TEXT,
+    file_name TEXT,
+    is_directory INTEGER,
+    parent_record INTEGER,
+    parent_sequence INTEGER,
+    full_path TEXT,
+    is_orphaned INTEGER DEFAULT 0,
+    PRIMARY KEY (record_number, volume_letter)
+);
+CREATE INDEX IF NOT EXISTS idx_paths_full_path ON paths(full_path);
+CREATE INDEX IF NOT EXISTS idx_mft_filenames_record ON mft_file_names(record_number);
+"""
+
+# Names of the records of a volume, the primary (non-DOS) name of each record first
+_NAMES_QUERY = """
+SELECT mr.record_number, mr.mft_sequence_number, mr.in_use, mr.is_directory,
+       fn.file_name, fn.parent_record, fn.parent_sequence
+FROM mft_records mr
+JOIN mft_file_names fn
+  ON fn.record_number = mr.record_number AND fn.volume_letter = mr.volume_letter
+WHERE mr.volume_letter = ? {condition}
+  AND fn.file_name IS NOT NULL AND fn.file_name NOT LIKE ':%'
+ORDER BY mr.record_number, fn.namespace = 2, fn.rowid
+"""
+
+_INSERT_SQL = """
+INSERT OR REPLACE INTO paths (
+    record_number, volume_letter, file_name, is_directory, parent_record, parent_sequence,
+    full_path, is_orphaned
+) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+# (sequence_number, in_use, file_name, parent_record, parent_sequence)
+DirectoryEntry = Tuple[Optional[int], int, str, Optional[int], Optional[int]]
+
+
+def _join(prefix: str, name: str) -> str:
+    if not name:
+        return prefix
+    return f"{prefix}/{name}" if prefix else name
+
+
+def _sequence_matches(directory: DirectoryEntry, parent_sequence: Optional[int]) -> bool:
+    """Whether a parent reference still refers to this directory record"""
+    sequence_number, in_use = directory[0], directory[1]
+    if parent_sequence is None or sequence_number is None or parent_sequence == sequence_number:
+        return True
+    # Deleting a record increments its sequence number
+    return not in_use and parent_sequence + 1 == sequence_number
+
+
+class DirectoryPathResolver:
+    """Memoized paths of the directories of one volume"""
+
+    def __init__(self):
+        self._directories: Dict[int, DirectoryEntry] = {}
+        self._paths: Dict[int, Tuple[str, bool]] = {}
+
+    def add_directory(self, record_number: int, sequence_number: Optional[int], in_use: int,
+                      file_name: str, parent_record: Optional[int], parent_sequence: Optional[int]):
+        """Register a directory record"""
+        self._directories[record_number] = (sequence_number, in_use, file_name, parent_record, parent_sequence)
+
+    def parent_path(self, parent_record: Optional[int], parent_sequence: Optional[int]) -> Tuple[str, bool]:
+        """
+        Path of the parent directory of an entry.
+
+        Args:
+            parent_record: Parent record number of the entry
+            parent_sequence: Parent sequence number of the entry
+
+        Returns:
+            Tuple (path, orphaned); the path is empty when there is no parent
+        """
+        if not parent_record:
+            return "", False
+        directory = self._directories.get(parent_record)
+        if directory is None:
+            return f"[Unknown Parent: {parent_record}]", True
+        if not _sequence_matches(directory, parent_sequence):
+            return f"[Orphaned Parent: {parent_record}-{parent_sequence}]", True
+        return self.directory_path(parent_record)
+
+    def directory_path(self, record_number: int) -> Tuple[str, bool]:
+        """
+        Path of a registered directory, memoizing every ancestor resolved on the way.
+
+        Returns:
+            Tuple (path, orphaned)
+        """
+        known = self._paths.get(record_number)
+        if known is not None:
+            return known
+
+        directories = self._directories
+        paths = self._paths
+        chain = []
+        on_chain = set()
+        current = record_number
+        while True:
+            chain.append(current)
+            on_chain.add(current)
+            _, _, _, parent_record, parent_sequence = directories[current]
+            if not parent_record or parent_record == current:
+                base = ("", False)
+                break
+            parent = directories.get(parent_record)
+            if parent is None:
+                base = (f"[Unknown Parent: {parent_record}]", True)
+                break
+            if not _sequence_matches(parent, parent_sequence):
+                base = (f"[Orphaned Parent: {parent_record}-{parent_sequence}]", True)
+                break
+            if parent_record in paths:
+                base = paths[parent_record]
+                break
+            if parent_record in on_chain:
+                base = (f"[Parent Loop: {parent_record}]", True)
+                break
+            current = parent_record
+
+        path, orphaned = base
+        for record in reversed(chain):
+            path = _join(path, directories[record][2])
+            paths[record] = (path, orphaned)
+        return paths[record_number]
+
+    def record_path(self, record_number: int, is_directory: int, file_name: str,
+                    parent_record: Optional[int], parent_sequence: Optional[int]) -> Tuple[str, bool]:
+        """
+        Full path of a record.
+
+        Returns:
+            Tuple (path, orphaned)
+        """
+        if is_directory and record_number in self._directories:
+            path, orphaned = self.directory_path(record_number)
+        elif parent_record == record_number:
+            path, orphaned = file_name or "", False
+        else:
+            prefix, orphaned = self.parent_path(parent_record, parent_sequence)
+            path = _join(prefix, file_name)
+
+        if not path:
+            path = "./" if record_number == ROOT_RECORD else "[Unknown]"
+        return path, orphaned
+
+
+def _primary_names(connection: sqlite3.Connection, volume_letter: str,
+                   directories_only: bool = False) -> Iterator[tuple]:
+    """Primary name row of each record of a volume, by record number"""
+    condition = "AND mr.is_directory = 1" if directories_only else ""
+    cursor = connection.execute(_NAMES_QUERY.format(condition=condition), (volume_letter,))
+    last_record = None
+    for row in cursor:
+        if row[0] != last_record:
+            last_record = row[0]
+            yield row
+
+
+def build_path_table(connection: sqlite3.Connection, volume_letter: Optional[str] = None) -> int:
+    """
+    (Re)build the paths table of an MFT database.
+
+    Args:
+        connection: Connection to a database with the MFTParser schema
+        volume_letter: Volume to build (None for every volume in mft_records)
+
+    Returns:
+        Number of paths written
+    """
+    connection.executescript(_SCHEMA_SQL)
+    if volume_letter is None:
+        volumes = [row[0] for row in connection.execute("SELECT DISTINCT volume_letter FROM mft_records")]
+    else:
+        volumes = [volume_letter]
+
+    written = 0
+    write_cursor = connection.cursor()
+    for volume in volumes:
+        write_cursor.execute("DELETE FROM paths WHERE volume_letter = ?", (volume,))
+
+        resolver = DirectoryPathResolver()
+        for record_number, sequence_number, in_use, _, file_name, parent_record, parent_sequence \
+                in _primary_names(connection, volume, directories_only=True):
+            resolver.add_directory(record_number, sequence_number, in_use, file_name,
+                                   parent_record, parent_sequence)
+
+        rows = []
+        orphaned_count = 0
+        for record_number, _, _, is_directory, file_name, parent_record, parent_sequence \
+                in _primary_names(connection, volume):
+            full_path, orphaned = resolver.record_path(record_number, is_directory, file_name,
+                                                       parent_record, parent_sequence)
+            orphaned_count += orphaned
+            rows.append((record_number, volume, file_name, is_directory, parent_record,
+                         parent_sequence, full_path, 1 if orphaned else 0))
+            if len(rows) >= _BATCH_SIZE:
+                write_cursor.executemany(_INSERT_SQL, rows)
+                written += len(rows)
+                rows.clear()
+        if rows:
+            write_cursor.executemany(_INSERT_SQL, rows)
+            written += len(rows)
+        logger.info(f"Resolved paths of volume {volume}: {orphaned_count:,} orphaned entries")
+
+    connection.commit()
+    return written
+
+
+def ensure_path_table(connection: sqlite3.Connection) -> int:
+    """
+    Build the paths table of an MFT database if it is missing or empty.
+
+    Returns:
+        Number of paths in the table
+    """
+    has_table = connection.execute(
+        "SELECT 1 FROM sqlite_master WHERE type='table' AND name='paths'").fetchone()
+    if has_table:
+        count = connection.execute("SELECT COUNT(*) FROM paths").fetchone()[0]
+        if count:
+            return count
+    return build_path_table(connection)
@@ -32,6 +32,8 @@ script_dir = os.path.dirname(os.path.abspath(__file__))
 if script_dir not in sys.path:
     sys.path.insert(0, script_dir)
 
+from mft_path_resolver import ensure_path_table
+
 try:
     from MFT_Claw import main as mft_claw_main
     from USN_Claw import main as usn_claw_main
@@ -505,36 +507,51 @@ class MFTUSNCorrelator:
         """)
     
     def _populate_correlated_data(self, mft_conn, usn_conn, corr_cursor):
-        """Populate the correlated table with joined data"""
+        """
+        Populate the correlated table with joined data.
+        
+        MFT records and USN events are both streamed in MFT record number order
+        and merge-joined, so neither source is loaded into memory.
+        """
         logger.info("Populating correlated data...")
         
         print(f"\n{COLOR_INFO}Retrieving MFT data...{COLOR_RESET}")
         # Get MFT data with reconstructed paths
-        mft_cursor = mft_conn.cursor()
-        mft_data = self._get_mft_data_with_paths(mft_cursor)
-        print(f"{COLOR_INFO}Retrieved {len(mft_data)} MFT records{COLOR_RESET}")
+        mft_count, mft_data = self._get_mft_data_with_paths(mft_conn.cursor())
+        print(f"{COLOR_INFO}Streaming {mft_count:,} MFT records{COLOR_RESET}")
         
         print(f"\n{COLOR_INFO}Retrieving USN data...{COLOR_RESET}")
         # Get USN journal data
-        usn_cursor = usn_conn.cursor()
-        usn_data, usn_select_columns = self._get_usn_data(usn_cursor)
-        print(f"{COLOR_INFO}Retrieved {len(usn_data)} USN journal events{COLOR_RESET}")
+        if usn_conn:
+            usn_count, usn_data, usn_select_columns = self._get_usn_data(usn_conn.cursor())
+        else:
+            usn_count, usn_data, usn_select_columns = 0, iter(()), []
+        print(f"{COLOR_INFO}Streaming {usn_count:,} USN journal events{COLOR_RESET}")
         
         # Correlate and insert data with column information
-        self._correlate_and_insert(mft_data, usn_data, usn_select_columns, corr_cursor)
+        self._correlate_and_insert(mft_data, usn_data, usn_select_columns, corr_cursor,
+                                   mft_count, usn_count)
     
     def _get_mft_data_with_paths(self, cursor):
         """
-        Get MFT data with reconstructed paths using optimized approach.
+        Get MFT data with reconstructed paths, streamed in record number order.
+        
+        One row is produced per record number (the first file name by namespace),
+        with the data attribute, standard information and file name counts of
+        the record. Counts are read from grouped queries ordered by record
+        number alongside the main query, so no per-record state is kept.
         
-        This method avoids complex SQL subqueries by fetching data in two phases:
-        1. Fetch all file names from mft_file_names table
-        2. Fetch basic MFT record information from mft_records table
-        3. Combine and process data in Python for better performance
+        Paths come from the paths table of the MFT database, which is built
+        first if it does not exist yet.
         
         Returns:
-            list: List of tuples containing MFT data with placeholders for missing columns
+            tuple: (record_count, rows) where rows is an iterator of tuples
+                   containing MFT data, ordered by record number
         """
+        print(f"{COLOR_INFO}Resolving MFT paths...{COLOR_RESET}")
+        path_count = ensure_path_table(cursor.connection)
+        print(f"{COLOR_INFO}Path table holds {path_count:,} MFT paths{COLOR_RESET}")
+        
         print(f"{COLOR_INFO}Executing MFT query... (this may take a few moments){COLOR_RESET}")
         
         # First, get the count to show progress
@@ -545,12 +562,6 @@ class MFTUSNCorrelator:
         # Optimize the query - remove subqueries and use simpler joins for better performance
         print(f"{COLOR_INFO}Fetching MFT data...{COLOR_RESET}")
         
-        # Start time for progress tracking
-        start_time = time.time()
-        
-        # Fetch all necessary data in a single, optimized query
-        print(f"{COLOR_INFO}Fetching and processing MFT data...{COLOR_RESET}")
-        
         query = """
         SELECT 
             mr.record_number,
@@ -573,10 +584,12 @@ class MFTUSNCorrelator:
             mfn.allocated_size,
             mfn.real_size,
             mfn.flags,
-            mfn.namespace
+            mfn.namespace,
+            p.full_path
         FROM mft_records mr
         LEFT JOIN mft_file_names mfn ON mr.record_number = mfn.record_number
         LEFT JOIN mft_standard_info si ON mr.record_number = si.record_number
+        LEFT JOIN paths p ON p.record_number = mr.record_number AND p.volume_letter = mr.volume_letter
         WHERE mfn.file_name IS NOT NULL 
         AND mfn.file_name NOT LIKE ':$DATA' 
         AND mfn.file_name NOT LIKE ':%'
@@ -584,51 +597,70 @@ class MFTUSNCorrelator:
         """
         
         cursor.execute(query)
-        all_rows = cursor.fetchall()
-        
-        # Process records, selecting the best file name for each record number
-        result = []
-        processed_records = set()
         
-        # Fetch data attributes counts and file names counts separately for efficiency
-        data_attributes_counts = self._get_counts(cursor, "mft_data_attributes", "record_number")
-        file_names_counts = self._get_counts(cursor, "mft_file_names", "record_number")
-
-        for row in all_rows:
-            record_number = row[0]
-            if record_number not in processed_records:
-                # Manually construct the row with the counts
+        # Counts per record, read in step with the main query
+        connection = cursor.connection
+        data_attributes_counts = self._get_counts(connection.cursor(), "mft_data_attributes", "record_number")
+        file_names_counts = self._get_counts(connection.cursor(), "mft_file_names", "record_number")
+        
+        def rows():
+            last_record = object()
+            for row in cursor:
+                record_number = row[0]
+                if record_number == last_record:
+                    # Only the first file name of each record number
+                    continue
+                last_record = record_number
+                
                 standard_info_present = 1 if row[7] is not None else 0 # si_created timestamp
                 
-                data_attributes_count = data_attributes_counts.get(record_number, 0)
-                file_names_count = file_names_counts.get(record_number, 0)
-
-                # Assemble the final row, including the namespace (last element)
-                final_row = row + (data_attributes_count, standard_info_present, file_names_count)
-                result.append(final_row)
-                processed_records.add(record_number)
-
-        print(f"{COLOR_SUCCESS}\nSuccessfully processed {len(result):,} MFT records in {time.time() - start_time:.2f} seconds{COLOR_RESET}")
-        return result
+                # Assemble the final row: namespace, counts, then the full path (last element)
+                yield row[:-1] + (data_attributes_counts(record_number), standard_info_present,
+                                  file_names_counts(record_number), row[-1])
+        
+        return total_records, rows()
     
     def _get_counts(self, cursor, table_name, column_name):
         """
-        Get counts of a given column from a table and return as a dictionary.
+        Get counts of a given column from a table as an ordered lookup.
+        
+        The grouped counts are read lazily in column order, so the returned
+        lookup must be called with non-decreasing values.
+        
+        Returns:
+            function: Count of a column value (0 if the value does not occur)
         """
-        query = f"SELECT {column_name}, COUNT(*) FROM {table_name} GROUP BY {column_name}"
+        query = (f"SELECT {column_name}, COUNT(*) FROM {table_name} "
+                 f"WHERE {column_name} IS NOT NULL GROUP BY {column_name} ORDER BY {column_name}")
         cursor.execute(query)
-        return dict(cursor.fetchall())
+        pending = cursor.fetchone()
+        
+        def count_of(value):
+            nonlocal pending
+            if value is None:
+                return 0
+            while pending is not None and pending[0] < value:
+                pending = cursor.fetchone()
+            if pending is not None and pending[0] == value:
+                return pending[1]
+            return 0
+        
+        return count_of
 
     def _get_usn_data(self, cursor):
         """
         Get USN journal data from journal_events table.
         
         This method retrieves data from the actual USN journal table structure
-        created by USN_Claw parser.
+        created by USN_Claw parser. Events are streamed ordered by the MFT
+        record number of their file reference number (then by USN); SQLite
+        sorts them and spills to temporary files on large journals. Events
+        without an MFT record number are left out.
         
         Returns:
-            tuple: (usn_data, select_columns) where:
-                - usn_data: List of USN journal records
+            tuple: (usn_count, usn_data, select_columns) where:
+                - usn_count: Number of USN journal records
+                - usn_data: Iterator of (mft_record_number, USN journal record)
                 - select_columns: List of column names used in the query
         """
         print(f"{COLOR_INFO}Fetching USN journal data...{COLOR_RESET}")
@@ -647,19 +679,23 @@ class MFTUSNCorrelator:
             "record_length"  # Record length (can be used as file_size proxy)
         ]
         
-        query = f"SELECT {', '.join(select_columns)} FROM journal_events ORDER BY usn"
-        
+        cursor.execute("SELECT COUNT(*) FROM journal_events")
+        usn_count = cursor.fetchone()[0]
+        
+        # Record numbers are extracted in Python, like for any other FRN lookup
+        cursor.connection.create_function("mft_record_number", 1, self._extract_mft_record_from_frn,
+                                          deterministic=True)
+        query = f"""
+        SELECT mft_record, {', '.join(select_columns)}
+        FROM (SELECT mft_record_number(frn) AS mft_record, {', '.join(select_columns)} FROM journal_events)
+        WHERE mft_record > 0
+        ORDER BY mft_record, usn
+        """
         cursor.execute(query)
-        usn_data = cursor.fetchall()
+        usn_data = ((row[0], row[1:]) for row in cursor)
         
-        # Show progress
-        total_usn = len(usn_data)
-        bar_length = 30
-        bar = '█' * bar_length
-        print(f"\r[{bar}] {100:6.1f}% | {total_usn:,}/{total_usn:,} USN records", flush=True)
-        
-        print(f"\nSuccessfully fetched {len(usn_data):,} USN journal records")
-        return usn_data, select_columns
+        print(f"Found {usn_count:,} USN journal records")
+        return usn_count, usn_data, select_columns
     
     def _extract_mft_record_from_frn(self, frn_string):
         """
@@ -694,81 +730,52 @@ class MFTUSNCorrelator:
         if flags_val & 0x2: flags.append("IS_DIRECTORY")
         return ", ".join(flags) if flags else str(flags_val)
 
-    def _correlate_and_insert(self, mft_data, usn_data, usn_select_columns, corr_cursor):
+    def _correlate_and_insert(self, mft_data, usn_data, usn_select_columns, corr_cursor,
+                              mft_count=0, usn_count=0):
         """
         Correlate MFT and USN data and insert into correlated table.
         
         This method performs the core correlation logic:
-        1. Builds lookup tables for MFT and USN data for fast access
-        2. Processes each MFT record to find matching USN events
-        3. Reconstructs file paths using parent-child relationships
-        4. Performs batch inserts for optimal performance
-        5. Tracks correlation statistics and progress
+        1. Merge-joins the MFT records with the USN events of the same record
+           number, both ordered by record number, holding one record's events
+        2. Takes file paths from the MFT paths table
+        3. Performs batch inserts for optimal performance
+        4. Tracks correlation statistics and progress
         
         Args:
-            mft_data (list): List of MFT records to correlate
-            usn_data (list): List of USN journal events to correlate
+            mft_data (iterable): MFT records to correlate, ordered by record number
+            usn_data (iterable): (mft_record_number, USN event) pairs, ordered by record number
+            usn_select_columns (list): Column names of the USN events
             corr_cursor: SQLite cursor for the correlated database
+            mft_count (int): Number of MFT records, for progress reporting
+            usn_count (int): Number of USN events, for progress reporting
         """
         logger.info("Correlating MFT and USN data...")
         start_time = time.time()
         last_update_time = time.time()  # For progress bar updates
         
-        # Create mapping for quick lookup - optimize with dictionaries
-        mft_by_record = {}
-        for row in mft_data:
-            record_num = row[0]
-            if record_num not in mft_by_record:
-                mft_by_record[record_num] = []
-            mft_by_record[record_num].append(row)
-        
-        # Create USN lookup by MFT record number for faster correlation
-        usn_by_mft_record = {}
-        if usn_data:  # Only process if we have USN data
-            # Find the correct index for file reference number in the select_columns
-            ref_num_index = None
-            for i, col_name in enumerate(usn_select_columns):
-                # Look for frn (File Reference Number) or file_reference variations
-                if col_name.lower() in ['frn', 'file_reference_number', 'file_reference']:
-                    ref_num_index = i
-                    break
-            
-            if ref_num_index is None:
-                print(f"{COLOR_WARNING}WARNING: No file_reference column found in USN data - correlation may fail{COLOR_RESET}")
-            else:
-                for usn_row in usn_data:
-                    try:
-                        ref_num = usn_row[ref_num_index]  # file_reference field
-                        if ref_num:
-                            # Extract MFT record number from file reference
-                            mft_record = self._extract_mft_record_from_frn(ref_num)
-                            if mft_record and mft_record not in usn_by_mft_record:
-                                usn_by_mft_record[mft_record] = []
-                            if mft_record:
-                                usn_by_mft_record[mft_record].append(usn_row)
-                    except (IndexError, TypeError):
-                        # Skip rows with missing or invalid file_reference
-                        continue
+        # Next USN event of the merge-join
+        usn_events = iter(usn_data)
+        pending_usn = next(usn_events, None)
         
         # Insert correlated data
         inserted_count = 0
-        total_records = len(mft_data)
+        total_records = max(mft_count, 1)
         matched_with_usn = 0
         
         # Use batch inserts for better performance
         batch_size = 5000  # Increased batch size for better performance
         insert_batch = []
         
-        print(f"Starting correlation of {total_records:,} MFT records with {len(usn_data):,} USN events...")
+        print(f"Starting correlation of {mft_count:,} MFT records with {usn_count:,} USN events...")
         
         # Process MFT data first
-        path_cache = {}
-        for i, mft_record_data in enumerate(mft_data):
+        for mft_record_data in mft_data:
             # mft_record_data is a tuple. Destructure for readability.
             # Tuple structure: (record_number, sequence_number, flags, is_directory, is_deleted, fn_filename, 
             # parent_record, parent_sequence, si_created, si_modified, si_accessed, si_mft_modified, si_file_attributes,
             # fn_created, fn_modified, fn_accessed, fn_mft_modified, fn_allocated_size, fn_real_size, fn_file_flags, namespace,
-            # data_attributes_count, standard_info_present, file_names_count)
+            # data_attributes_count, standard_info_present, file_names_count, full_path)
             record_num = mft_record_data[0]
             sequence_number = mft_record_data[1]
             flags = mft_record_data[2]
@@ -794,20 +801,25 @@ class MFTUSNCorrelator:
             standard_info_present = mft_record_data[22]
             file_names_count = mft_record_data[23]
 
-            # Reconstruct path using parent-child relationships
-            reconstructed_path = self._reconstruct_path(record_num, mft_by_record, path_cache)
+            # Full path from the MFT paths table
+            reconstructed_path = mft_record_data[24] or "[Unknown]"
             
             # Convert file attributes to text for better readability
             flags_text = self.flags_to_text(flags)
             si_file_attributes_text = file_attributes_to_text(si_file_attributes)
             fn_file_flags_text = file_attributes_to_text(fn_file_flags)
             
-            # Check if this record has matching USN entries
+            # Collect the USN events of this record, skipping events of records before it
             usn_events_to_process = []
+            if record_num is not None:
+                while pending_usn is not None and pending_usn[0] < record_num:
+                    pending_usn = next(usn_events, None)
+                while pending_usn is not None and pending_usn[0] == record_num:
+                    usn_events_to_process.append(pending_usn[1])
+                    pending_usn = next(usn_events, None)
             
             # Check if this MFT record has any corresponding USN events
-            if record_num in usn_by_mft_record and usn_by_mft_record[record_num]:
-                usn_events_to_process = usn_by_mft_record[record_num]
+            if usn_events_to_process:
                 matched_with_usn += 1
             else:
                 # If no USN events, still process once for MFT record
@@ -1068,54 +1080,6 @@ class MFTUSNCorrelator:
             except:
                 pass
 
-    def _reconstruct_path(self, record_num, mft_by_record, path_cache):
-        """
-        Iteratively reconstruct file path using a cache to avoid re-computation.
-        """
-        if record_num in path_cache:
-            return path_cache[record_num]
-
-        path_parts = []
-        current_record = record_num
-        visited = set()
-
-        while current_record is not None and current_record != 0 and current_record not in visited:
-            visited.add(current_record)
-            if current_record in mft_by_record:
-                record_data = mft_by_record[current_record][0]
-                filename = record_data[5]
-                parent_record = record_data[6]
-
-                if filename:
-                    path_parts.append(filename)
-                
-                if parent_record == current_record or parent_record is None or parent_record == 0:
-                    break
-
-                current_record = parent_record
-            else:
-                # Try to find the parent record in the MFT data to provide more context
-                parent_info = ""
-                if parent_record in mft_by_record:
-                    parent_data = mft_by_record[parent_record][0]
-                    parent_filename = parent_data[5]
-                    parent_info = f" (Filename: {parent_filename})"
-                
-                path_parts.append(f"[Unknown Parent: {current_record}{parent_info}]")
-                break
-        
-        # Handle root directory case
-        if not path_parts:
-            if record_num == 5:  # MFT record 5 is usually the root directory
-                reconstructed_path = "./"
-            else:
-                reconstructed_path = "[Unknown]"
-        else:
-            reconstructed_path = "/".join(reversed(path_parts))
-
-        path_cache[record_num] = reconstructed_path
-        return reconstructed_path
-    
     def _create_indexes(self, cursor):
         """
         Create database indexes for query performance optimization.
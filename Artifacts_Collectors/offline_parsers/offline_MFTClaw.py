@@ -8,7 +8,7 @@ allowing for the analysis of collected $MFT files from a case directory.
 
 import os
 import sys
-import logging
+import time
 
 # Add parent directory to path for imports
 parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -20,7 +20,7 @@ mft_dir = os.path.join(parent_dir, 'MFT and USN journal')
 if mft_dir not in sys.path:
     sys.path.insert(0, mft_dir)
 
-def run_offline_mft(case_path, mft_file_path=None, registry_hive_paths=None):
+def run_offline_mft(case_path, mft_file_path=None, registry_hive_paths=None, workers=None, cancel_event=None):
     """
     Run MFT analysis in offline mode.
     
@@ -30,6 +30,9 @@ def run_offline_mft(case_path, mft_file_path=None, registry_hive_paths=None):
                                        searches in case_path/live_acquisition/Target_Artifacts/mft/
         registry_hive_paths (dict, optional): DEPRECATED - Not used by this parser.
                                               Kept for backward compatibility only.
+        workers (int, optional): Number of parser processes. Defaults to one per CPU
+                                 (at most 8); 1 parses in this process.
+        cancel_event (threading.Event, optional): Cancels parsing when set.
     
     Note:
         MFT parser operates on $MFT file and does not require registry context.
@@ -43,6 +46,8 @@ def run_offline_mft(case_path, mft_file_path=None, registry_hive_paths=None):
     try:
         # Import MFT parser components
         from MFT_Claw import MFTClawConfig, MFTParser, OutputFormat, LogLevel, DatabaseManager
+        from mft_bulk_parser import parse_mft_file_sharded, ParsingCancelled
+        from mft_path_resolver import build_path_table
         
         # Determine MFT file path
         if not mft_file_path:
@@ -137,48 +142,51 @@ def run_offline_mft(case_path, mft_file_path=None, registry_hive_paths=None):
         # Create parser and database manager
         parser = MFTParser(config)
         
-        # Read and parse MFT file directly
+        # Parse the memory-mapped MFT file in blocks, sharded over worker processes
         print(f"[Offline MFT] Parsing MFT records...")
-        records_parsed = 0
-        batch_records = []
-        
-        with open(mft_file_path, 'rb') as mft_file:
-            record_num = 0
-            while True:
-                raw_record = mft_file.read(record_size)
-                if len(raw_record) < record_size:
-                    break
-                
-                try:
-                    # Parse the record using parser's internal method
-                    mft_record = parser._parse_mft_record(record_num, 'OFFLINE', raw_record)
-                    if mft_record:
-                        batch_records.append(mft_record)
-                        records_parsed += 1
-                        
-                        # Process batch when full
-                        if len(batch_records) >= config.batch_size:
-                            parser._process_record_batch(batch_records)
-                            batch_records.clear()
-                            parser.db_manager.commit()
-                        
-                        # Progress reporting - less frequent for better performance
-                        if records_parsed % 10000 == 0:
-                            progress = (records_parsed / estimated_records * 100) if estimated_records > 0 else 0
-                            print(f"\r[Offline MFT] Parsed {records_parsed:,} / {estimated_records:,} records ({progress:.1f}%)", end='', flush=True)
-                
-                except Exception as e:
-                    logging.debug(f"Error parsing record {record_num}: {e}")
-                
-                record_num += 1
-        
-        # Process remaining batch
-        if batch_records:
-            parser._process_record_batch(batch_records)
-            parser.db_manager.commit()
+        parser.volume_start_time = time.time()
+        parser.stats['total_records'] = estimated_records
+        parser.stats['total_mft_size_bytes'] = file_size
+        
+        def report_progress(stats):
+            parser.stats['processed_records'] = stats.records_scanned
+            progress = (stats.records_scanned / estimated_records * 100) if estimated_records > 0 else 0
+            parser._report_progress(progress, stats.records_scanned, estimated_records)
+        
+        try:
+            bulk_stats = parse_mft_file_sharded(
+                mft_file_path,
+                parser.db_manager.connection,
+                volume_letter='OFFLINE',
+                workers=workers,
+                batch_size=config.batch_size,
+                record_size=record_size,
+                progress_callback=report_progress,
+                cancel_event=cancel_event,
+                temp_directory=output_dir
+            )
+        except ParsingCancelled:
+            print(f"\n[Offline MFT] Parsing cancelled")
+            parser.cleanup()
+            return {"success": False, "error": "MFT parsing cancelled", "records": 0}
+        
+        records_parsed = bulk_stats.records_parsed
+        parser.stats.update({
+            'processed_records': bulk_stats.records_scanned,
+            'parsed_data_size_bytes': bulk_stats.records_parsed * record_size,
+            'in_use_records': bulk_stats.in_use_records,
+            'directory_records': bulk_stats.directory_records,
+            'file_records': bulk_stats.file_records,
+            'ads_records': bulk_stats.ads_records
+        })
+        parser._report_progress()
         
         print(f"\n[Offline MFT] Successfully parsed {records_parsed:,} MFT records")
         
+        # Full paths of all records, for correlation, timeline and search queries
+        path_count = build_path_table(parser.db_manager.connection)
+        print(f"[Offline MFT] Resolved {path_count:,} MFT paths")
+        
         # Cleanup
         parser.cleanup()
         
@@ -7,11 +7,16 @@ allowing for the analysis of collected $UsnJrnl files from a case directory.
 """
 
 import os
+import re
 import sys
+import mmap
 import logging
 import struct
 import datetime
 import sqlite3
+from contextlib import closing
+from dataclasses import dataclass
+from functools import lru_cache
 
 # Add parent directory to path for imports
 parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -23,7 +28,7 @@ utils_dir = os.path.join(os.path.dirname(parent_dir), 'utils')
 if utils_dir not in sys.path:
     sys.path.insert(0, utils_dir)
 
-from time_utils import get_current_forensic_timestamp
+from time_utils import get_current_forensic_timestamp, format_forensic_timestamp
 
 # Add USN parser directory to path
 usn_dir = os.path.join(parent_dir, 'MFT and USN journal')
@@ -33,9 +38,6 @@ if usn_dir not in sys.path:
 # Import reusable functions and structures from live parser
 try:
     from USN_Claw import (
-        # Core parsing
-        parse_record,
-        
         # Conversion utilities
         filetime_to_datetime,
         file_id_128_to_str,
@@ -80,6 +82,206 @@ except ImportError:
     print("Warning: tqdm not available - progress bar disabled")
 
 
+# USN records are QWORD aligned and never span a journal page; the rest of a
+# page that cannot hold the next record is zero-filled
+_RECORD_ALIGNMENT = 8
+_JOURNAL_PAGE_SIZE = 4096
+_MAX_RECORD_LENGTH = _JOURNAL_PAGE_SIZE
+
+# Zero-filled (sparse) regions of an extracted $J are skipped in blocks of this size
+_SPARSE_BLOCK_SIZE = 1024 * 1024
+_ZERO_BLOCK = bytes(_SPARSE_BLOCK_SIZE)
+_NON_ZERO_BYTE = re.compile(rb'[^\x00]')
+
+# Record length, major version
+_RECORD_HEADER = struct.Struct('<IH')
+
+# USN_RECORD_V2 / USN_RECORD_V3 from the record length up to FileNameOffset,
+# padded to sizeof() of the ctypes structures parse_record() reads
+_USN_RECORD_V2 = struct.Struct('<IHHQQqqIIIIHH4x')
+_USN_RECORD_V3 = struct.Struct('<IHHQQQQQqIIIIHH4x')
+
+_WINDOWS_EPOCH = datetime.datetime(1601, 1, 1, tzinfo=datetime.timezone.utc)
+
+_INSERT_EVENTS_SQL = (
+    "INSERT OR IGNORE INTO journal_events "
+    "(volume_letter, filename, usn, major_version, frn, parent_frn, "
+    "timestamp, reason, source_info, security_id, file_attributes, "
+    "record_length, inserted_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"
+)
+
+
+@dataclass
+class JournalScanStatistics:
+    """Counts of one journal scan"""
+    records_parsed: int = 0
+    records_excluded: int = 0
+    records_failed: int = 0
+    sparse_bytes: int = 0
+    skipped_bytes: int = 0
+
+
+@lru_cache(maxsize=65536)
+def _seconds_text(seconds):
+    """Database text of a whole number of seconds since 1601 (None if out of range)"""
+    try:
+        return format_forensic_timestamp(_WINDOWS_EPOCH + datetime.timedelta(seconds=seconds))
+    except (ValueError, OverflowError, OSError):
+        return None
+
+
+def _timestamp_text(filetime):
+    """Same text as filetime_to_datetime(), formatted once per distinct second"""
+    if filetime == 0:
+        return None
+    return _seconds_text(round(filetime / 10.0) // 1000000)
+
+
+@lru_cache(maxsize=None)
+def _reason_text(reason):
+    return reason_to_text(reason)
+
+
+@lru_cache(maxsize=None)
+def _source_info_text(source_info):
+    return sourceinfo_to_text(source_info)
+
+
+@lru_cache(maxsize=65536)
+def _is_excluded(filename):
+    return should_exclude_from_analysis(filename)
+
+
+def _next_non_zero_offset(buffer, offset, end):
+    """
+    Offset of the first record-aligned QWORD at or after offset that is not zero.
+
+    The rest of the current journal page is searched first; whole zero blocks
+    after it are skipped by comparing them against a zero block.
+
+    Returns:
+        int: Aligned offset, or end if the rest of the buffer is zero-filled
+    """
+    position = offset
+    while position < end:
+        block_end = min(position - position % _SPARSE_BLOCK_SIZE + _SPARSE_BLOCK_SIZE, end)
+        if position == offset:
+            # The padding at the end of a page is usually short
+            block_end = min(position - position % _JOURNAL_PAGE_SIZE + _JOURNAL_PAGE_SIZE, block_end)
+        elif block_end - position == _SPARSE_BLOCK_SIZE and buffer[position:block_end] == _ZERO_BLOCK:
+            position = block_end
+            continue
+        match = _NON_ZERO_BYTE.search(buffer, position, block_end)
+        if match:
+            start = match.start()
+            return start - start % _RECORD_ALIGNMENT
+        position = block_end
+    return end
+
+
+def scan_journal(buffer, volume_letter="OFFLINE", batch_size=BATCH_SIZE, stats=None):
+    """
+    Decode the USN records of a $UsnJrnl:$J buffer into journal_events rows.
+
+    Records are decoded in place with precompiled structs (the buffer is
+    typically a memory-mapped file), and zero-filled regions are skipped
+    without decoding, so the scan time follows the journal content rather
+    than the size of the sparse stream. Rows are filtered like the live
+    parser does (should_exclude_from_analysis) and carry the values of
+    parse_record().
+
+    Args:
+        buffer: Journal data (bytes, mmap or memoryview)
+        volume_letter (str): Volume identifier for database records
+        batch_size (int): Rows per yielded batch
+        stats (JournalScanStatistics, optional): Counts updated during the scan
+
+    Yields:
+        tuple: (rows, offset) - a batch of journal_events rows sharing one
+               inserted_at timestamp, and the buffer offset scanned so far
+    """
+    if stats is None:
+        stats = JournalScanStatistics()
+    view = memoryview(buffer).cast('B')
+    end = len(view)
+    header_unpack = _RECORD_HEADER.unpack_from
+    v2_unpack = _USN_RECORD_V2.unpack_from
+    v3_unpack = _USN_RECORD_V3.unpack_from
+    v2_size = _USN_RECORD_V2.size
+    v3_size = _USN_RECORD_V3.size
+
+    rows = []
+    inserted_at = get_current_forensic_timestamp()
+    offset = 0
+    try:
+        while offset + 8 <= end:
+            rec_len, major_version = header_unpack(view, offset)
+
+            if rec_len == 0:
+                next_offset = _next_non_zero_offset(buffer, offset, end)
+                stats.sparse_bytes += next_offset - offset
+                offset = next_offset
+                continue
+
+            if (rec_len % _RECORD_ALIGNMENT or rec_len > _MAX_RECORD_LENGTH
+                    or offset + rec_len > end):
+                # Not a record header - resynchronize on the next QWORD
+                stats.skipped_bytes += _RECORD_ALIGNMENT
+                offset += _RECORD_ALIGNMENT
+                continue
+
+            if major_version == 2 and offset + v2_size <= end:
+                (_, _, _, frn, parent_frn, usn, timestamp, reason, source_info, security_id,
+                 file_attributes, fn_len, fn_off) = v2_unpack(view, offset)
+                frn = str(frn)
+                parent_frn = str(parent_frn)
+            elif major_version == 3 and offset + v3_size <= end:
+                (_, _, _, frn_low, frn_high, parent_low, parent_high, usn, timestamp, reason,
+                 source_info, security_id, file_attributes, fn_len, fn_off) = v3_unpack(view, offset)
+                frn = f"{frn_high:016x}{frn_low:016x}"
+                parent_frn = f"{parent_high:016x}{parent_low:016x}"
+            else:
+                stats.records_failed += 1
+                offset += rec_len
+                continue
+
+            filename = ""
+            if fn_len and fn_off:
+                start = offset + fn_off
+                if start + fn_len <= end:
+                    filename = str(view[start:start + fn_len], "utf-16le", "replace")
+
+            if _is_excluded(filename):
+                stats.records_excluded += 1
+            else:
+                stats.records_parsed += 1
+                rows.append((
+                    volume_letter,
+                    filename,
+                    usn,
+                    major_version,
+                    frn,
+                    parent_frn,
+                    _timestamp_text(timestamp),
+                    _reason_text(reason),
+                    _source_info_text(source_info),
+                    security_id,
+                    file_attributes,
+                    rec_len,
+                    inserted_at
+                ))
+                if len(rows) >= batch_size:
+                    yield rows, offset + rec_len
+                    rows = []
+                    inserted_at = get_current_forensic_timestamp()
+
+            offset += rec_len
+
+        yield rows, end
+    finally:
+        view.release()
+
+
 def read_journal_file(file_path, cursor, conn, volume_letter="OFFLINE"):
     """
     Read and parse a USN journal file from disk.
@@ -120,11 +322,7 @@ def read_journal_file(file_path, cursor, conn, volume_letter="OFFLINE"):
     print(f"[Offline USN] Parsing USN journal file: {file_path}")
     print(f"[Offline USN] File size: {file_size:,} bytes ({file_size / (1024*1024):.2f} MB)")
     
-    record_count = 0
-    excluded_count = 0
-    failed_count = 0
-    batch_records = []
-    leftover_bytes = b""
+    stats = JournalScanStatistics()
     
     # Initialize progress bar if available
     if _HAS_TQDM:
@@ -134,129 +332,45 @@ def read_journal_file(file_path, cursor, conn, volume_letter="OFFLINE"):
         pbar = None
     
     try:
-        with open(file_path, 'rb') as usn_file:
+        with open(file_path, 'rb') as usn_file, \
+                mmap.mmap(usn_file.fileno(), 0, access=mmap.ACCESS_READ) as journal, \
+                closing(scan_journal(journal, volume_letter, BATCH_SIZE, stats)) as batches:
             bytes_processed = 0
             
-            while True:
-                # Read chunk
-                chunk = usn_file.read(BUFFER_SIZE)
-                if not chunk:
-                    break
-                
-                # Prepend leftover from previous chunk
-                data = leftover_bytes + chunk
-                bytes_processed += len(chunk)
-                
-                # Update progress bar
+            for batch_records, offset in batches:
                 if pbar:
-                    pbar.update(len(chunk))
+                    pbar.update(offset - bytes_processed)
+                bytes_processed = offset
                 
-                # Parse records from data
-                offset = 0
-                while offset + 8 <= len(data):
-                    try:
-                        # Read record length
-                        rec_len = struct.unpack_from("<I", data, offset)[0]
-                        
-                        # Check if we have complete record
-                        if rec_len <= 0 or offset + rec_len > len(data):
-                            # Incomplete record - save for next iteration
-                            leftover_bytes = data[offset:]
-                            break
-                        
-                        # Parse the record using reusable function
-                        rec = parse_record(data, offset)
-                        
-                        if rec:
-                            # Apply forensic filtering
-                            if should_exclude_from_analysis(rec["filename"]):
-                                excluded_count += 1
-                                offset += rec_len
-                                continue
-                            
-                            # Add to batch
-                            record_count += 1
-                            inserted_at = get_current_forensic_timestamp()
-                            
-                            batch_records.append((
-                                volume_letter,
-                                rec["filename"],
-                                rec["usn"],
-                                rec["major_version"],
-                                rec["frn"],
-                                rec["parent_frn"],
-                                rec["timestamp"],
-                                rec["reason"],
-                                rec["source_info"],
-                                rec["security_id"],
-                                rec["file_attributes"],
-                                rec["record_length"],
-                                inserted_at
-                            ))
-                            
-                            # Batch commit when batch size reached
-                            if len(batch_records) >= BATCH_SIZE:
-                                try:
-                                    with DatabaseTransaction(conn) as transaction:
-                                        cursor.executemany(
-                                            "INSERT OR IGNORE INTO journal_events "
-                                            "(volume_letter, filename, usn, major_version, frn, parent_frn, "
-                                            "timestamp, reason, source_info, security_id, file_attributes, "
-                                            "record_length, inserted_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
-                                            batch_records
-                                        )
-                                    batch_records.clear()
-                                    
-                                    # Memory cleanup if needed
-                                    if check_memory_usage(1024):
-                                        cleanup_memory()
-                                        
-                                except Exception as e:
-                                    print(f"[Offline USN] Database write error: {e}")
-                                    batch_records.clear()
-                        else:
-                            # Parse failed
-                            failed_count += 1
-                        
-                        offset += rec_len
+                if not batch_records:
+                    continue
+                
+                try:
+                    with DatabaseTransaction(conn) as transaction:
+                        cursor.executemany(_INSERT_EVENTS_SQL, batch_records)
+                    
+                    # Memory cleanup if needed
+                    if check_memory_usage(1024):
+                        cleanup_memory()
                         
-                    except Exception as e:
-                        # Log error and try to continue
-                        print(f"[Offline USN] Parse error at offset {offset}: {e}")
-                        failed_count += 1
-                        offset += 8  # Skip ahead and try next potential record
-                        if offset >= len(data):
-                            break
-                else:
-                    # Processed all complete records in this chunk
-                    leftover_bytes = b""
-        
-        # Final batch commit
-        if batch_records:
-            try:
-                with DatabaseTransaction(conn) as transaction:
-                    cursor.executemany(
-                        "INSERT OR IGNORE INTO journal_events "
-                        "(volume_letter, filename, usn, major_version, frn, parent_frn, "
-                        "timestamp, reason, source_info, security_id, file_attributes, "
-                        "record_length, inserted_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
-                        batch_records
-                    )
-                print(f"[Offline USN] Final batch: {len(batch_records)} records committed")
-            except Exception as e:
-                print(f"[Offline USN] Final batch write error: {e}")
+                except Exception as e:
+                    print(f"[Offline USN] Database write error: {e}")
         
         if pbar:
             pbar.close()
         
         print(f"[Offline USN] Parsing complete:")
-        print(f"[Offline USN]   Records parsed: {record_count:,}")
-        if excluded_count > 0:
-            print(f"[Offline USN]   Records excluded: {excluded_count:,}")
-        if failed_count > 0:
-            print(f"[Offline USN]   Parse failures: {failed_count:,}")
+        print(f"[Offline USN]   Records parsed: {stats.records_parsed:,}")
+        if stats.records_excluded > 0:
+            print(f"[Offline USN]   Records excluded: {stats.records_excluded:,}")
+        if stats.records_failed > 0:
+            print(f"[Offline USN]   Parse failures: {stats.records_failed:,}")
+        if stats.sparse_bytes > 0:
+            print(f"[Offline USN]   Sparse bytes skipped: {stats.sparse_bytes:,}")
+        if stats.skipped_bytes > 0:
+            print(f"[Offline USN]   Unparseable bytes skipped: {stats.skipped_bytes:,}")
         
-        return record_count
+        return stats.records_parsed
         
     except Exception as e:
         if pbar:
@@ -285,7 +399,6 @@ def run_offline_usn(case_path, usn_file_path=None):
         
         # Count records in existing database
         try:
-            import sqlite3
             conn = sqlite3.connect(existing_db)
             cursor = conn.cursor()
             cursor.execute("SELECT COUNT(*) FROM journal_events")
@@ -269,6 +269,7 @@ General_Requirements = [
     'PyQtWebEngine',
     'python-registry',
     'pandas',
+    'numpy',  # Vectorized timestamp parsing in the correlation engine (also installed with pandas)
     'streamlit',
     'altair',
     'olefile',
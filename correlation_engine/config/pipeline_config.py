@@ -41,6 +41,7 @@ class PipelineConfig:
     time_period_end: Optional[str] = None  # ISO format datetime string
     identity_filters: Optional[List[str]] = None  # List of identity patterns (for identity engine)
     identity_filter_case_sensitive: bool = False  # Case-sensitive identity matching
+    fuzzy_match_distance: int = 0  # Identity engine: merge identity keys within this edit distance (0 = off)
     
     # NEW: Semantic mapping and scoring configuration
     semantic_mapping_config: Optional[Dict[str, Any]] = None  # Semantic mapping settings
@@ -106,6 +107,7 @@ class PipelineConfig:
             'time_period_end': self.time_period_end,  # NEW
             'identity_filters': self.identity_filters,  # NEW
             'identity_filter_case_sensitive': self.identity_filter_case_sensitive,  # NEW
+            'fuzzy_match_distance': self.fuzzy_match_distance,
             'semantic_mapping_config': self.semantic_mapping_config,  # NEW
             'weighted_scoring_config': self.weighted_scoring_config,  # NEW (legacy)
             'identity_semantic_phase_enabled': self.identity_semantic_phase_enabled,  # Identity Semantic Phase
@@ -161,6 +163,8 @@ class PipelineConfig:
             data['identity_filters'] = None
         if 'identity_filter_case_sensitive' not in data:
             data['identity_filter_case_sensitive'] = False
+        if 'fuzzy_match_distance' not in data:
+            data['fuzzy_match_distance'] = 0
         if 'semantic_mapping_config' not in data:
             data['semantic_mapping_config'] = None
         if 'weighted_scoring_config' not in data:
@@ -1800,19 +1800,16 @@ class SemanticMappingManager:
         # Add global rules
         candidate_rules.extend(self.global_rules)
         
-        # Evaluate each rule
-        for rule in candidate_rules:
-            # Create a records dict for rule evaluation
-            # The rule expects: records[feather_id][field_name] = value
-            records = {
-                feather_id: identity_record
-            }
-            
-            # Evaluate the rule
-            matches, matched_conditions = rule.evaluate(records)
-            
-            if matches:
-                matching_rules.append(rule)
+        # Create a records dict for rule evaluation
+        # The rules expect: records[feather_id][field_name] = value
+        records = {
+            feather_id: identity_record
+        }
+        
+        # Evaluate all rules at once; shared predicates are evaluated once
+        from .semantic_rule_compiler import compile_rule_set
+        for rule, matched_conditions in compile_rule_set(candidate_rules).evaluate(records):
+            matching_rules.append(rule)
         
         # Sort by confidence (highest first)
         matching_rules.sort(key=lambda r: r.confidence, reverse=True)
@@ -0,0 +1,315 @@
+"""
+Compiled Semantic Rule Sets
+
+Evaluating a rule set condition by condition costs rules x conditions field
+lookups and regex searches per record, although large rule sets repeat the
+same few fields and often the same predicates. A CompiledRuleSet evaluates a
+list of SemanticRule objects with the same results as SemanticRule.evaluate,
+but:
+- identical predicates (feather_id, field, operator, value) across rules are
+  evaluated once per record
+- each (feather_id, field) is looked up once per record with the smart field
+  lookup, and all of its predicates are evaluated on that value
+- equals predicates of a field are a dictionary lookup; its regexes are
+  combined into one alternation of named groups that rejects a value with a
+  single search (regexes that cannot be combined, e.g. with backreferences,
+  are searched on their own)
+- field results are memoized per distinct value
+- rules are indexed by the feather ids (artifact types) they reference, so
+  rules that cannot match the records at hand are never looked at
+
+Usage:
+    >>> compiled = compile_rule_set(rules)
+    >>> for rule, matched_conditions in compiled.evaluate(records):
+    ...     print(rule.semantic_value, matched_conditions)
+"""
+
+import logging
+import re
+import threading
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from .semantic_mapping import SemanticCondition, SemanticRule, compile_pattern_cached
+
+logger = logging.getLogger(__name__)
+
+# Regex features that change meaning or fail inside a combined alternation
+_UNCOMBINABLE_REGEX = re.compile(r'\\[1-9]|\(\?P=|\(\?\(|^\(\?[aiLmsux]+\)')
+
+# Distinct values memoized per field before the memo is cleared
+FIELD_MEMO_SIZE = 4096
+
+# Compiled rule sets kept by compile_rule_set()
+COMPILED_CACHE_SIZE = 64
+
+
+def _predicate_key(condition: SemanticCondition) -> Tuple[str, str, str, str]:
+    """Normalized (feather_id, field, kind, value) with SemanticCondition.matches semantics."""
+    value = str(condition.value)
+    if value == "*" or condition.operator == "wildcard":
+        return condition.feather_id, condition.field_name, "wildcard", ""
+    if condition.operator == "contains":
+        return condition.feather_id, condition.field_name, "contains", value.lower()
+    if condition.operator == "regex":
+        return condition.feather_id, condition.field_name, "regex", value
+    # equals, and any unknown operator
+    return condition.feather_id, condition.field_name, "equals", value.lower()
+
+
+class FieldPredicates:
+    """
+    All distinct predicates on one (feather_id, field_name).
+
+    Also used on its own to evaluate a set of predicates on arbitrary text
+    (add_regex(), build_alternation(), then evaluate()).
+    """
+
+    __slots__ = ('field_name', 'equals', 'contains', 'wildcards', 'combined',
+                 'combined_groups', 'combined_regexes', 'separate_regexes', 'memo')
+
+    def __init__(self, field_name: str):
+        self.field_name = field_name
+        self.equals: Dict[str, List[int]] = {}
+        self.contains: List[Tuple[str, int]] = []
+        self.wildcards: List[int] = []
+        self.combined: Optional[re.Pattern] = None
+        self.combined_groups: Dict[str, int] = {}
+        self.combined_regexes: List[Tuple[re.Pattern, int]] = []
+        self.separate_regexes: List[Tuple[re.Pattern, int]] = []
+        self.memo: Dict[str, Tuple[int, ...]] = {}
+
+    def add_regex(self, pattern: str, predicate_id: int):
+        compiled = compile_pattern_cached(pattern)
+        if compiled is None:
+            return  # invalid or empty pattern never matches
+
+        if _UNCOMBINABLE_REGEX.search(pattern):
+            self.separate_regexes.append((compiled, predicate_id))
+            return
+        try:
+            re.compile(f"(?:{pattern})", re.IGNORECASE)
+        except re.error:
+            self.separate_regexes.append((compiled, predicate_id))
+            return
+        self.combined_regexes.append((compiled, predicate_id))
+
+    def build_alternation(self):
+        """Combine the combinable regexes into one pattern of named groups."""
+        if len(self.combined_regexes) < 2:
+            self.separate_regexes.extend(self.combined_regexes)
+            self.combined_regexes = []
+            return
+
+        alternatives = []
+        for compiled, predicate_id in self.combined_regexes:
+            group = f"_cr{predicate_id}"
+            self.combined_groups[group] = predicate_id
+            alternatives.append(f"(?P<{group}>{compiled.pattern})")
+        try:
+            self.combined = re.compile("|".join(alternatives), re.IGNORECASE)
+        except re.error:
+            # e.g. the same group name used by two user patterns
+            self.combined = None
+            self.combined_groups = {}
+            self.separate_regexes.extend(self.combined_regexes)
+            self.combined_regexes = []
+
+    def evaluate(self, value: Any) -> Tuple[int, ...]:
+        """Ids of the predicates that hold for a looked-up field value."""
+        if value is None:
+            return ()
+
+        text = str(value)
+        cached = self.memo.get(text)
+        if cached is not None:
+            return cached
+
+        true_ids = []
+        if self.wildcards and text.strip():
+            true_ids.extend(self.wildcards)
+
+        if self.equals or self.contains:
+            lower = text.lower()
+            true_ids.extend(self.equals.get(lower, ()))
+            for needle, predicate_id in self.contains:
+                if needle in lower:
+                    true_ids.append(predicate_id)
+
+        if self.combined is not None:
+            match = self.combined.search(text)
+            if match is not None:
+                # The first matching alternative is known; check the others
+                first_id = self.combined_groups.get(match.lastgroup)
+                for compiled, predicate_id in self.combined_regexes:
+                    if predicate_id == first_id or compiled.search(text):
+                        true_ids.append(predicate_id)
+
+        for compiled, predicate_id in self.separate_regexes:
+            if compiled.search(text):
+                true_ids.append(predicate_id)
+
+        result = tuple(true_ids)
+        if len(self.memo) >= FIELD_MEMO_SIZE:
+            self.memo.clear()
+        self.memo[text] = result
+        return result
+
+
+class CompiledRuleSet:
+    """
+    A rule list compiled into shared predicates.
+
+    Thread-safe for evaluation; the only shared mutable state is the per-field
+    memo, whose entries are immutable.
+    """
+
+    def __init__(self, rules: Sequence[SemanticRule]):
+        """
+        Compile a rule list.
+
+        Args:
+            rules: Rules in evaluation order (results keep this order)
+        """
+        self.rules = list(rules)
+
+        predicate_ids: Dict[Tuple[str, str, str, str], int] = {}
+        self._fields: Dict[str, Dict[str, FieldPredicates]] = {}
+
+        # Per rule: (predicate id, condition label) for each condition
+        self._rule_predicates: List[List[Tuple[int, str]]] = []
+        self._rule_feathers: List[frozenset] = []
+
+        for rule in self.rules:
+            compiled_conditions = []
+            for condition in rule.conditions:
+                key = _predicate_key(condition)
+                predicate_id = predicate_ids.get(key)
+                if predicate_id is None:
+                    predicate_id = len(predicate_ids)
+                    predicate_ids[key] = predicate_id
+                    self._add_predicate(key, predicate_id)
+                compiled_conditions.append((predicate_id, f"{condition.feather_id}.{condition.field_name}"))
+            self._rule_predicates.append(compiled_conditions)
+            self._rule_feathers.append(frozenset(condition.feather_id for condition in rule.conditions))
+
+        for fields in self._fields.values():
+            for predicates in fields.values():
+                predicates.build_alternation()
+
+        # Rules by the feather ids they reference
+        self._rules_by_feather: Dict[str, List[int]] = {}
+        self._unconditional_rules: List[int] = []
+        for index, feather_ids in enumerate(self._rule_feathers):
+            if not feather_ids:
+                self._unconditional_rules.append(index)
+            for feather_id in feather_ids:
+                self._rules_by_feather.setdefault(feather_id, []).append(index)
+
+        self.predicate_count = len(predicate_ids)
+        self.condition_count = sum(len(conditions) for conditions in self._rule_predicates)
+
+        logger.debug(
+            f"[Semantic Rules] Compiled {len(self.rules)} rules: {self.condition_count} conditions, "
+            f"{self.predicate_count} distinct predicates on "
+            f"{sum(len(fields) for fields in self._fields.values())} fields"
+        )
+
+    def _add_predicate(self, key: Tuple[str, str, str, str], predicate_id: int):
+        feather_id, field_name, kind, value = key
+        fields = self._fields.setdefault(feather_id, {})
+        predicates = fields.get(field_name)
+        if predicates is None:
+            predicates = fields[field_name] = FieldPredicates(field_name)
+
+        if kind == "wildcard":
+            predicates.wildcards.append(predicate_id)
+        elif kind == "equals":
+            predicates.equals.setdefault(value, []).append(predicate_id)
+        elif kind == "contains":
+            predicates.contains.append((value, predicate_id))
+        else:
+            predicates.add_regex(value, predicate_id)
+
+    def evaluate(self, records: Dict[str, Dict[str, Any]]) -> List[Tuple[SemanticRule, List[str]]]:
+        """
+        Evaluate all rules against records from multiple feathers.
+
+        Args:
+            records: Dict mapping feather_id to record data
+
+        Returns:
+            (rule, matched_conditions) for every matching rule, in rule order;
+            matched_conditions is what SemanticRule.evaluate returns
+        """
+        present = [feather_id for feather_id in self._fields if feather_id in records]
+
+        # Rules that can match: AND rules need all of their feathers,
+        # OR rules at least one
+        candidates = set(self._unconditional_rules)
+        for feather_id in present:
+            for index in self._rules_by_feather[feather_id]:
+                if index in candidates:
+                    continue
+                if self.rules[index].logic_operator == "AND" and not self._rule_feathers[index] <= records.keys():
+                    continue
+                candidates.add(index)
+
+        if not candidates:
+            return []
+
+        # Evaluate every distinct predicate of the present feathers once
+        true_predicates = set()
+        for feather_id in present:
+            record = records[feather_id]
+            for field_name, predicates in self._fields[feather_id].items():
+                value = SemanticCondition._smart_field_lookup(record, field_name)
+                true_predicates.update(predicates.evaluate(value))
+
+        results = []
+        for index in sorted(candidates):
+            rule = self.rules[index]
+            compiled_conditions = self._rule_predicates[index]
+            if not compiled_conditions:
+                results.append((rule, []))
+                continue
+
+            matched = [label for predicate_id, label in compiled_conditions if predicate_id in true_predicates]
+            if rule.logic_operator == "AND":
+                is_match = len(matched) == len(compiled_conditions)
+            else:
+                is_match = len(matched) > 0
+            if is_match:
+                results.append((rule, matched))
+
+        return results
+
+
+_compiled_cache: Dict[Tuple[int, ...], CompiledRuleSet] = {}
+_compiled_cache_lock = threading.Lock()
+
+
+def compile_rule_set(rules: Sequence[SemanticRule]) -> CompiledRuleSet:
+    """
+    Compiled form of a rule list, cached by rule identity.
+
+    The cache key is the ids of the rule objects; a cached set keeps its rules
+    alive, so a key cannot be reused by different rules. Rules edited in place
+    must be recompiled with CompiledRuleSet directly.
+
+    Args:
+        rules: Rules in evaluation order
+
+    Returns:
+        CompiledRuleSet for the rules
+    """
+    key = tuple(id(rule) for rule in rules)
+    compiled = _compiled_cache.get(key)
+    if compiled is not None:
+        return compiled
+
+    compiled = CompiledRuleSet(rules)
+    with _compiled_cache_lock:
+        if len(_compiled_cache) >= COMPILED_CACHE_SIZE:
+            _compiled_cache.clear()
+        _compiled_cache[key] = compiled
+    return compiled
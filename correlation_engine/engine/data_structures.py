@@ -322,6 +322,15 @@ class CorrelationStatistics:
     performance_improvement_factor: float = 0.0  # How much faster new approach is
     performance_improvement_percentage: float = 0.0  # Percentage improvement
     
+    # Identity normalization cache (memoized identity extraction)
+    normalization_cache_hits: int = 0
+    normalization_cache_misses: int = 0
+    normalization_cache_hit_rate: float = 0.0
+    normalization_seconds_saved: float = 0.0  # Estimated from the cost of the misses
+    
+    # Fuzzy identity consolidation
+    fuzzy_merged_identities: int = 0  # Identities merged into a fuzzy match
+    
     def calculate_performance_comparison(self):
         """
         Calculate performance comparison between old and new semantic matching approaches.
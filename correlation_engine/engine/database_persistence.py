@@ -14,19 +14,88 @@ Author: Crow-Eye Team
 
 import sqlite3
 import json
+import queue
+import threading
+import time
+import zlib
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 from datetime import datetime
 
 from .correlation_result import CorrelationResult, CorrelationMatch
+from .match_payload import MatchPayloadCodec
+from .match_fts import MatchFtsIndex, MERGE_INTERVAL_TRANSACTIONS
+
+# Pragmas of the streaming connection: WAL lets viewers read while the scan
+# writes; NORMAL sync is safe in WAL mode and avoids an fsync per commit
+STREAMING_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-65536",  # 64 MB page cache
+    "PRAGMA wal_autocheckpoint=10000"
+)
+
+# Full batches that may wait for the writer thread before write_match() blocks
+DEFAULT_QUEUE_BATCHES = 16
+
+# Rows the writer thread inserts per transaction when batches are queued up
+DEFAULT_TRANSACTION_ROWS = 50000
+
+# Queue item that stops the writer thread
+_STOP = object()
+
+
+@dataclass
+class StreamingWriterStatistics:
+    """Backpressure and throughput counters of a StreamingMatchWriter"""
+    matches_queued: int = 0
+    matches_written: int = 0
+    batches_written: int = 0
+    transactions_committed: int = 0
+    max_queue_depth: int = 0
+    producer_waits: int = 0  # write_match() calls that blocked on a full queue
+    producer_wait_seconds: float = 0.0
+    writer_busy_seconds: float = 0.0
+    started_at: float = field(default_factory=time.time)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        elapsed = time.time() - self.started_at
+        return {
+            'matches_queued': self.matches_queued,
+            'matches_written': self.matches_written,
+            'batches_written': self.batches_written,
+            'transactions_committed': self.transactions_committed,
+            'max_queue_depth': self.max_queue_depth,
+            'producer_waits': self.producer_waits,
+            'producer_wait_seconds': self.producer_wait_seconds,
+            'writer_busy_seconds': self.writer_busy_seconds,
+            'matches_per_second': self.matches_written / elapsed if elapsed > 0 else 0.0,
+            'writer_matches_per_second': (self.matches_written / self.writer_busy_seconds
+                                          if self.writer_busy_seconds > 0 else 0.0)
+        }
 
 
 class StreamingMatchWriter:
     """
     Efficient streaming writer for correlation matches.
     
-    Batches match inserts for better performance and lower memory usage.
-    Matches are written directly to the database without holding them in memory.
+    write_match() only appends the match to a batch; full batches go through
+    a bounded queue to a background thread that serializes them and inserts
+    them with executemany, combining queued batches into large transactions.
+    The engine thread is only held up when the queue is full (backpressure),
+    which keeps memory bounded while matches are written at disk speed.
+    
+    With maintain_fts the writer also keeps the matches_fts index current
+    (see match_fts): inserted matches are indexed in the same transaction,
+    and every few transactions the index segments are merged incrementally,
+    so the semantic phase can query the index as soon as the scan finishes.
+    
+    A match must not be modified after write_match() until flush() returns.
+    The connection (self.conn) may be used by the calling thread for other
+    statements; the writer thread only touches it while holding self.lock,
+    and is idle after flush().
     
     Usage:
         >>> writer = StreamingMatchWriter(db_path, batch_size=1000)
@@ -37,24 +106,69 @@ class StreamingMatchWriter:
         >>> writer.close()
     """
     
-    def __init__(self, db_path: str, batch_size: int = 1000):
+    # Insert statement and row layout (see _serialize_match)
+    MATCH_INSERT_SQL = """
+        INSERT INTO matches (
+            match_id, result_id, timestamp, match_score, confidence_score,
+            confidence_category, feather_count, time_spread_seconds,
+            anchor_feather_id, anchor_artifact_type, matched_application,
+            matched_file_path, matched_event_id, is_duplicate,
+            weighted_score_value, weighted_score_interpretation,
+            feather_records, score_breakdown,
+            anchor_start_time, anchor_end_time, anchor_record_count,
+            semantic_data
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """
+    
+    def __init__(self, db_path: str, batch_size: int = 1000,
+                 queue_batches: int = DEFAULT_QUEUE_BATCHES,
+                 transaction_rows: int = DEFAULT_TRANSACTION_ROWS,
+                 maintain_fts: bool = True):
         """
         Initialize streaming writer.
         
         Args:
             db_path: Path to SQLite database
-            batch_size: Number of matches to batch before writing
+            batch_size: Number of matches to batch before handing them to the writer thread
+            queue_batches: Full batches that may be queued before write_match() blocks
+            transaction_rows: Most rows inserted in one transaction
+            maintain_fts: Index written matches in matches_fts
         """
         self.db_path = db_path
-        self.batch_size = batch_size
-        self.conn = sqlite3.connect(db_path)
-        self.conn.execute("PRAGMA journal_mode=WAL")  # Better concurrent access
-        self.conn.execute("PRAGMA synchronous=NORMAL")  # Faster writes
-        self._batch = []
+        self.batch_size = max(1, batch_size)
+        self.transaction_rows = max(transaction_rows, self.batch_size)
+        self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        for pragma in STREAMING_PRAGMAS:
+            self.conn.execute(pragma)
+        self.lock = threading.RLock()
+        self.statistics = StreamingWriterStatistics()
+        self._batch: List[Tuple[int, CorrelationMatch]] = []
         self._total_written = 0
+        self._writer_error: Optional[BaseException] = None
+        
+        # feather_records are stored in the compact payload format
+        self.payload_codec = MatchPayloadCodec(self.conn)
+        
+        # Set by _ensure_schema() when the matches_fts index is maintained
+        self.maintain_fts = maintain_fts
+        self.fts_index: Optional[MatchFtsIndex] = None
         
         # Ensure schema exists
         self._ensure_schema()
+        
+        self._queue: queue.Queue = queue.Queue(maxsize=max(1, queue_batches))
+        self._thread = threading.Thread(target=self._writer_loop, name="StreamingMatchWriter", daemon=True)
+        self._thread.start()
+    
+    @property
+    def database_path(self) -> str:
+        """Path of the database matches are written to"""
+        return str(self.db_path)
+    
+    @property
+    def total_matches_written(self) -> int:
+        """Matches committed to the database so far"""
+        return self._total_written
     
     def _ensure_schema(self):
         """Ensure required tables exist for streaming writes"""
@@ -156,8 +270,14 @@ class StreamingMatchWriter:
         # Create indexes
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_results_execution ON results(execution_id)")
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_matches_result ON matches(result_id)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_matches_result_timestamp ON matches(result_id, timestamp)")
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_feather_metadata_result ON feather_metadata(result_id)")
         
+        if self.maintain_fts:
+            fts_index = MatchFtsIndex(self.conn)
+            if fts_index.ensure_table():
+                self.fts_index = fts_index
+        
         self.conn.commit()
     
     def create_result(self, execution_id: int, wing_id: str, wing_name: str,
@@ -175,6 +295,12 @@ class StreamingMatchWriter:
         Returns:
             result_id: Database ID for this result
         """
+        with self.lock:
+            return self._insert_result(execution_id, wing_id, wing_name,
+                                       feathers_processed, total_records_scanned)
+    
+    def _insert_result(self, execution_id: int, wing_id: str, wing_name: str,
+                       feathers_processed: int, total_records_scanned: int) -> int:
         cursor = self.conn.cursor()
         cursor.execute("""
             INSERT INTO results (
@@ -195,6 +321,14 @@ class StreamingMatchWriter:
             result_id: Parent result ID
             match: CorrelationMatch to write
         """
+        self._batch.append((result_id, match))
+        
+        # Hand full batches to the writer thread
+        if len(self._batch) >= self.batch_size:
+            self._enqueue_batch()
+    
+    def _serialize_match(self, result_id: int, match: CorrelationMatch) -> tuple:
+        """Row for MATCH_INSERT_SQL (runs on the writer thread)"""
         # Extract weighted score information
         weighted_score_value = None
         weighted_score_interpretation = None
@@ -210,8 +344,7 @@ class StreamingMatchWriter:
         # Extract semantic data
         semantic_data = getattr(match, 'semantic_data', None)
         
-        # Add to batch
-        self._batch.append((
+        return (
             match.match_id,
             result_id,
             match.timestamp,
@@ -228,44 +361,123 @@ class StreamingMatchWriter:
             match.is_duplicate,
             weighted_score_value,
             weighted_score_interpretation,
-            json.dumps(match.feather_records),
+            self.payload_codec.encode(match.feather_records),
             json.dumps(match.score_breakdown) if match.score_breakdown else None,
             anchor_start_time,
             anchor_end_time,
             anchor_record_count,
             json.dumps(semantic_data) if semantic_data else None
-        ))
-        
-        # Flush if batch is full
-        if len(self._batch) >= self.batch_size:
-            self._flush_batch()
+        )
     
-    def _flush_batch(self):
-        """Write batch to database"""
+    def _enqueue_batch(self):
+        """Queue the current batch, blocking while the writer thread is behind"""
+        self._raise_writer_error()
         if not self._batch:
             return
         
-        cursor = self.conn.cursor()
-        cursor.executemany("""
-            INSERT INTO matches (
-                match_id, result_id, timestamp, match_score, confidence_score,
-                confidence_category, feather_count, time_spread_seconds,
-                anchor_feather_id, anchor_artifact_type, matched_application,
-                matched_file_path, matched_event_id, is_duplicate,
-                weighted_score_value, weighted_score_interpretation,
-                feather_records, score_breakdown,
-                anchor_start_time, anchor_end_time, anchor_record_count,
-                semantic_data
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, self._batch)
-        self.conn.commit()
+        batch, self._batch = self._batch, []
+        self.statistics.matches_queued += len(batch)
+        try:
+            self._queue.put_nowait(batch)
+        except queue.Full:
+            wait_start = time.time()
+            self._queue.put(batch)
+            self.statistics.producer_waits += 1
+            self.statistics.producer_wait_seconds += time.time() - wait_start
+        self.statistics.max_queue_depth = max(self.statistics.max_queue_depth, self._queue.qsize())
+    
+    def _writer_loop(self):
+        """Writer thread: serialize and insert queued batches until stopped"""
+        while True:
+            batches = [self._queue.get()]
+            stop = batches[0] is _STOP
+            rows = 0 if stop else len(batches[0])
+            
+            # Combine batches that are already waiting into one transaction
+            while not stop and rows < self.transaction_rows:
+                try:
+                    batch = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                batches.append(batch)
+                if batch is _STOP:
+                    stop = True
+                else:
+                    rows += len(batch)
+            
+            try:
+                self._write_batches([batch for batch in batches if batch is not _STOP])
+            except BaseException as e:
+                if self._writer_error is None:
+                    self._writer_error = e
+            finally:
+                for _ in batches:
+                    self._queue.task_done()
+            
+            if stop:
+                return
+    
+    def _write_batches(self, batches: List[List[Tuple[int, CorrelationMatch]]]):
+        """Insert batches in one transaction"""
+        if not batches:
+            return
+        
+        write_start = time.time()
         
-        self._total_written += len(self._batch)
-        self._batch = []
+        with self.lock:
+            try:
+                # Serialized under the lock: encoding may add payload column sets
+                rows = [self._serialize_match(result_id, match) for batch in batches for result_id, match in batch]
+                self.conn.executemany(self.MATCH_INSERT_SQL, rows)
+                if self.fts_index is not None:
+                    last_rowid = self.conn.execute("SELECT last_insert_rowid()").fetchone()[0]
+                    self.fts_index.add_inserted(
+                        last_rowid,
+                        [(match.match_id, match.feather_records) for batch in batches for _, match in batch]
+                    )
+                self.conn.commit()
+            except BaseException:
+                self.conn.rollback()
+                self.payload_codec.reset()
+                raise
+            
+            # Merge index segments as the scan goes instead of at the end
+            if self.fts_index is not None and (self.statistics.transactions_committed + 1) % MERGE_INTERVAL_TRANSACTIONS == 0:
+                try:
+                    self.fts_index.merge()
+                    self.conn.commit()
+                except sqlite3.Error as e:
+                    self.conn.rollback()
+                    print(f"[Database] Warning: matches_fts merge failed: {e}")
+        
+        self._total_written += len(rows)
+        self.statistics.matches_written += len(rows)
+        self.statistics.batches_written += len(batches)
+        self.statistics.transactions_committed += 1
+        self.statistics.writer_busy_seconds += time.time() - write_start
+    
+    def _raise_writer_error(self):
+        """Re-raise a failure of the writer thread on the calling thread"""
+        if self._writer_error is not None:
+            error, self._writer_error = self._writer_error, None
+            raise error
     
     def flush(self):
-        """Flush any remaining matches in the batch"""
-        self._flush_batch()
+        """Flush any remaining matches in the batch and wait until all are committed"""
+        if self._thread.is_alive():
+            self._enqueue_batch()
+            self._queue.join()
+        elif self._batch:
+            # Writer thread stopped (closed writer): write on the calling thread
+            batch, self._batch = self._batch, []
+            self._write_batches([batch])
+        self._raise_writer_error()
+    
+    def get_statistics(self) -> Dict[str, Any]:
+        """Backpressure and throughput counters"""
+        stats = self.statistics.to_dict()
+        stats['queue_depth'] = self._queue.qsize()
+        return stats
     
     def update_result_count(self, result_id: int, total_matches: int, 
                            execution_duration: float = 0.0,
@@ -281,6 +493,8 @@ class StreamingMatchWriter:
             duplicates_prevented: Number of duplicates prevented
             feather_metadata: Feather metadata dictionary
         """
+        # Counts refer to committed matches
+        self.flush()
         cursor = self.conn.cursor()
         
         # Serialize feather_metadata to JSON if provided
@@ -344,6 +558,7 @@ class StreamingMatchWriter:
             status: Execution status (COMPLETED, PAUSED, FAILED)
             progress_info: Additional progress information for resume capability
         """
+        self.flush()
         cursor = self.conn.cursor()
         
         # Convert progress_info to JSON string if provided
@@ -400,10 +615,17 @@ class StreamingMatchWriter:
         return paused_executions
     
     def close(self):
-        """Close database connection"""
-        self.flush()
-        if self.conn:
+        """Write remaining matches, stop the writer thread and close the connection"""
+        if not self.conn:
+            return
+        try:
+            self.flush()
+        finally:
+            if self._thread.is_alive():
+                self._queue.put(_STOP)
+                self._thread.join()
             self.conn.close()
+            self.conn = None
     
     def __enter__(self):
         return self
@@ -441,6 +663,7 @@ class ResultsDatabase:
         self.db_path = Path(db_path)
         self.conn = None
         self._create_schema()
+        self.payload_codec = MatchPayloadCodec(self.conn)
     
     def _create_schema(self):
         """Create database schema if it doesn't exist"""
@@ -550,6 +773,7 @@ class ResultsDatabase:
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_results_execution ON results(execution_id)")
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_results_wing ON results(wing_id)")
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_matches_result ON matches(result_id)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_matches_result_timestamp ON matches(result_id, timestamp)")
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_matches_timestamp ON matches(timestamp)")
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_matches_score ON matches(match_score)")
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_matches_application ON matches(matched_application)")
@@ -1077,14 +1301,12 @@ class ResultsDatabase:
     
     def save_match(self, result_id: int, match: CorrelationMatch):
         """
-        Save a single correlation match with compression for large feather_records.
+        Save a single correlation match (feather_records in the compact payload format).
         
         Args:
             result_id: Parent result ID
             match: CorrelationMatch object to save
         """
-        import gzip
-        
         cursor = self.conn.cursor()
         
         # Extract weighted score information
@@ -1094,19 +1316,10 @@ class ResultsDatabase:
             weighted_score_value = match.weighted_score.get('score')
             weighted_score_interpretation = match.weighted_score.get('interpretation')
         
-        # Serialize feather_records
-        feather_records_json = json.dumps(match.feather_records)
-        feather_records_size = len(feather_records_json.encode('utf-8'))
-        
-        # Compress if larger than 1MB
+        # Serialize feather_records (the compact payload is always compressed
+        # as a whole; the compressed flag only marks legacy gzip JSON)
+        feather_records_data = self.payload_codec.encode(match.feather_records)
         compressed = False
-        if feather_records_size > 1024 * 1024:  # 1MB threshold
-            feather_records_data = gzip.compress(feather_records_json.encode('utf-8'))
-            compressed = True
-            if self.debug_mode:
-                print(f"[Database] Compressed feather_records: {feather_records_size:,} bytes -> {len(feather_records_data):,} bytes")
-        else:
-            feather_records_data = feather_records_json
         
         cursor.execute("""
             INSERT INTO matches (
@@ -1351,13 +1564,18 @@ class ResultsDatabase:
         columns = [desc[0] for desc in cursor.description]
         return [dict(zip(columns, row)) for row in cursor.fetchall()]
     
-    def get_matches(self, result_id: int, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+    def get_matches(self, result_id: int, limit: Optional[int] = None,
+                    offset: int = 0) -> List[Dict[str, Any]]:
         """
         Get matches for a specific result.
         
+        Pages are read in (result_id, timestamp) index order, so a page costs
+        the same at any offset instead of sorting the whole result.
+        
         Args:
             result_id: Result ID to query
             limit: Optional limit on number of matches
+            offset: Number of matches to skip (with limit, for pagination)
         
         Returns:
             List of match dictionaries
@@ -1374,11 +1592,16 @@ class ResultsDatabase:
             WHERE result_id = ?
             ORDER BY timestamp
         """
+        params = [result_id]
         
         if limit:
-            query += f" LIMIT {limit}"
+            query += " LIMIT ? OFFSET ?"
+            params.extend([int(limit), int(offset)])
+        elif offset:
+            query += " LIMIT -1 OFFSET ?"
+            params.append(int(offset))
         
-        cursor.execute(query, (result_id,))
+        cursor.execute(query, params)
         
         columns = [desc[0] for desc in cursor.description]
         return [dict(zip(columns, row)) for row in cursor.fetchall()]
@@ -1407,7 +1630,7 @@ class ResultsDatabase:
         
         # Parse JSON fields
         if match_dict.get('feather_records'):
-            match_dict['feather_records'] = json.loads(match_dict['feather_records'])
+            match_dict['feather_records'] = self.payload_codec.decode(match_dict['feather_records'])
         if match_dict.get('score_breakdown'):
             match_dict['score_breakdown'] = json.loads(match_dict['score_breakdown'])
         
@@ -1450,36 +1673,13 @@ class ResultsDatabase:
         for match_row in cursor.fetchall():
             match_data = dict(zip(match_columns, match_row))
             
-            # Parse JSON fields with decompression support
+            # Decode feather_records (compact payload, JSON or legacy gzip JSON)
             feather_records = {}
             if match_data.get('feather_records'):
-                import gzip
-                
-                # Check if data is compressed
-                is_compressed = match_data.get('compressed', False)
-                feather_records_data = match_data['feather_records']
-                
-                if is_compressed:
-                    # Decompress the data
-                    try:
-                        if isinstance(feather_records_data, bytes):
-                            decompressed = gzip.decompress(feather_records_data)
-                        else:
-                            # Handle case where it's stored as string
-                            decompressed = gzip.decompress(feather_records_data.encode('latin1'))
-                        feather_records = json.loads(decompressed.decode('utf-8'))
-                        if self.debug_mode:
-                            print(f"[Database] Decompressed feather_records for match {match_data['match_id']}")
-                    except Exception as e:
-                        print(f"[Database] Error decompressing feather_records: {e}")
-                        # Try to parse as regular JSON as fallback
-                        try:
-                            feather_records = json.loads(feather_records_data)
-                        except:
-                            feather_records = {}
-                else:
-                    # Regular JSON parsing
-                    feather_records = json.loads(feather_records_data)
+                try:
+                    feather_records = self.payload_codec.decode(match_data['feather_records'])
+                except (ValueError, OSError, zlib.error) as e:
+                    print(f"[Database] Error decoding feather_records for match {match_data['match_id']}: {e}")
             
             score_breakdown = {}
             if match_data.get('score_breakdown'):
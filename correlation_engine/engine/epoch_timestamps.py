@@ -0,0 +1,278 @@
+"""
+Pre-normalized Epoch Timestamp Columns for Feathers
+
+Feather timestamp columns hold whatever the source tool wrote: ISO strings,
+"YYYY-MM-DD HH:MM:SS" strings, Unix seconds or milliseconds, FILETIME values.
+Range predicates on those raw values depend on guessing the format at query
+time and compare strings lexicographically.
+
+When a feather is created, every detected timestamp column <col> gets a
+companion INTEGER column <col>_epoch_us holding microseconds since
+1970-01-01 UTC (NULL when the value cannot be parsed). The companion columns
+are indexed and listed in feather_metadata under the key 'epoch_columns'
+(JSON object mapping source column -> epoch column). Engines that find this
+entry filter time ranges with integer comparisons on the epoch columns and
+skip format detection entirely.
+"""
+
+import json
+import sqlite3
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional
+
+from .timestamp_parser import ResilientTimestampParser, TimestampFormat, TimestampValidationRule
+
+EPOCH_COLUMN_SUFFIX = '_epoch_us'
+EPOCH_COLUMNS_METADATA_KEY = 'epoch_columns'
+
+# Value of OptimizedFeatherQuery.timestamp_format when epoch columns are used
+EPOCH_TIMESTAMP_FORMAT = 'epoch_us'
+
+# Declared column types that are always treated as timestamps
+TIMESTAMP_COLUMN_TYPES = {'DATETIME', 'DATE', 'TIMESTAMP'}
+
+# Same name-based exclusions as the engine's sampling detection
+NON_TIMESTAMP_NAME_PARTS = ('id', 'count', 'size', 'length', 'hash', 'key', 'flag')
+
+TIMESTAMP_SAMPLE_SIZE = 100
+
+# Numeric formats need a value this large to count during detection; the
+# parser happily reads small counters and version numbers as 1970 dates
+NUMERIC_TIMESTAMP_FORMATS = {
+    TimestampFormat.UNIX_SECONDS,
+    TimestampFormat.UNIX_MILLISECONDS,
+    TimestampFormat.UNIX_MICROSECONDS,
+    TimestampFormat.WINDOWS_FILETIME,
+    TimestampFormat.EPOCH_DAYS
+}
+MIN_NUMERIC_TIMESTAMP = 1e8
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_ONE_MICROSECOND = timedelta(microseconds=1)
+
+
+def epoch_column_name(column: str) -> str:
+    """Name of the epoch companion column of a timestamp column"""
+    return f"{column}{EPOCH_COLUMN_SUFFIX}"
+
+
+def is_epoch_column(column: str) -> bool:
+    """True for epoch companion columns (internal to the engines, never shown in matches)"""
+    return column.endswith(EPOCH_COLUMN_SUFFIX)
+
+
+def without_epoch_columns(record: Dict[str, Any]) -> Dict[str, Any]:
+    """Record without its epoch companion columns (the record itself if it has none)"""
+    if not any(is_epoch_column(key) for key in record):
+        return record
+    return {key: value for key, value in record.items() if not is_epoch_column(key)}
+
+
+def to_epoch_microseconds(value: datetime) -> int:
+    """
+    Convert a datetime to microseconds since 1970-01-01 UTC.
+
+    Naive datetimes are taken as UTC, as the timestamp parser does.
+    """
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return (value - _EPOCH) // _ONE_MICROSECOND
+
+
+def from_epoch_microseconds(value: int) -> datetime:
+    """Convert microseconds since 1970-01-01 UTC to an aware UTC datetime"""
+    return _EPOCH + timedelta(microseconds=value)
+
+
+class EpochTimestampNormalizer:
+    """
+    Detects the timestamp columns of a batch of records and converts their
+    values to epoch microseconds.
+    """
+
+    def __init__(self, parser: Optional[ResilientTimestampParser] = None):
+        self.parser = parser or ResilientTimestampParser(
+            validation_rules=TimestampValidationRule(min_year=1970, max_year=2100)
+        )
+        # Most common format per column, tried first when normalizing
+        self.column_formats: Dict[str, TimestampFormat] = {}
+
+    def detect_timestamp_columns(self, records: List[Dict[str, Any]],
+                                 columns: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Pick the timestamp columns out of a column mapping configuration.
+
+        A column qualifies if its declared type is DATETIME/DATE/TIMESTAMP, or
+        if at least half of a sample of its non-empty values parse as
+        timestamps (small numbers read as 1970 dates do not count).
+
+        Args:
+            records: Records about to be inserted (keyed by 'original' names)
+            columns: Column mapping configuration
+
+        Returns:
+            The column configurations that hold timestamps
+        """
+        timestamp_columns = []
+
+        for col in columns:
+            if col['original'] == '[ROW_COUNT]':
+                continue
+
+            declared_type = str(col.get('type', 'TEXT')).upper()
+            samples = self._sample_values(records, col['original'])
+
+            format_counts: Dict[TimestampFormat, int] = {}
+            for value in samples:
+                result = self.parser.parse_timestamp(value)
+                if result.success and self._is_plausible(value, result.detected_format):
+                    format_counts[result.detected_format] = format_counts.get(result.detected_format, 0) + 1
+
+            if format_counts:
+                self.column_formats[col['original']] = max(format_counts, key=format_counts.get)
+
+            if declared_type in TIMESTAMP_COLUMN_TYPES:
+                timestamp_columns.append(col)
+                continue
+
+            name_lower = str(col['feather']).lower()
+            if any(part in name_lower for part in NON_TIMESTAMP_NAME_PARTS):
+                continue
+
+            if samples and sum(format_counts.values()) >= len(samples) * 0.5:
+                timestamp_columns.append(col)
+
+        return timestamp_columns
+
+    def normalize(self, value: Any, column: Optional[str] = None) -> Optional[int]:
+        """
+        Convert one timestamp value to epoch microseconds.
+
+        Args:
+            value: Raw timestamp value
+            column: Source column name, used to try its detected format first
+
+        Returns:
+            Microseconds since 1970-01-01 UTC, or None if the value is not a timestamp
+        """
+        if value is None or (isinstance(value, str) and not value.strip()):
+            return None
+
+        result = self.parser.parse_timestamp(value, hint_format=self.column_formats.get(column))
+        if not result.success or result.datetime_value is None:
+            return None
+
+        return to_epoch_microseconds(result.datetime_value)
+
+    def normalize_many(self, values: List[Any], column: Optional[str] = None) -> List[Optional[int]]:
+        """
+        Convert a whole column to epoch microseconds with the parser's batch API.
+
+        Args:
+            values: Raw timestamp values
+            column: Source column name, whose detected format is used as hint
+
+        Returns:
+            Microseconds since 1970-01-01 UTC per value (None where not a timestamp)
+        """
+        epochs, valid = self.parser.parse_many(values, format_hint=self.column_formats.get(column))
+        return [int(epoch) if ok else None for epoch, ok in zip(epochs, valid)]
+
+    @staticmethod
+    def _is_plausible(value: Any, detected_format: TimestampFormat) -> bool:
+        if detected_format not in NUMERIC_TIMESTAMP_FORMATS:
+            return True
+        try:
+            return abs(float(value)) >= MIN_NUMERIC_TIMESTAMP
+        except (TypeError, ValueError):
+            return False
+
+    @staticmethod
+    def _sample_values(records: List[Dict[str, Any]], key: str) -> List[Any]:
+        samples = []
+        for record in records:
+            value = record.get(key)
+            if value is None or (isinstance(value, str) and not value.strip()):
+                continue
+            samples.append(value)
+            if len(samples) >= TIMESTAMP_SAMPLE_SIZE:
+                break
+        return samples
+
+
+def read_epoch_columns(connection: sqlite3.Connection, table: str) -> Dict[str, str]:
+    """
+    Read the epoch column mapping recorded at feather creation.
+
+    Only entries whose source and epoch columns both exist in `table` are
+    returned, so a feather whose table was replaced or altered falls back to
+    format detection.
+
+    Args:
+        connection: Open feather database connection
+        table: Data table the engine queries
+
+    Returns:
+        Dict mapping timestamp column -> epoch column (empty if none recorded)
+    """
+    try:
+        cursor = connection.cursor()
+        cursor.execute("SELECT value FROM feather_metadata WHERE key = ?", (EPOCH_COLUMNS_METADATA_KEY,))
+        row = cursor.fetchone()
+        if not row or not row[0]:
+            return {}
+
+        mapping = json.loads(row[0])
+        if not isinstance(mapping, dict):
+            return {}
+
+        cursor.execute(f'PRAGMA table_info("{table}")')
+        table_columns = {info[1] for info in cursor.fetchall()}
+    except (sqlite3.Error, ValueError, TypeError):
+        return {}
+
+    return {
+        column: epoch_column
+        for column, epoch_column in mapping.items()
+        if column in table_columns and epoch_column in table_columns
+    }
+
+
+def write_epoch_columns(cursor: sqlite3.Cursor, mapping: Dict[str, str]):
+    """Record the epoch column mapping in feather_metadata (merged with any existing entry)"""
+    cursor.execute("SELECT value FROM feather_metadata WHERE key = ?", (EPOCH_COLUMNS_METADATA_KEY,))
+    row = cursor.fetchone()
+
+    merged: Dict[str, str] = {}
+    if row and row[0]:
+        try:
+            existing = json.loads(row[0])
+            if isinstance(existing, dict):
+                merged.update(existing)
+        except ValueError:
+            pass
+    merged.update(mapping)
+
+    cursor.execute('''
+        INSERT OR REPLACE INTO feather_metadata (key, value)
+        VALUES (?, ?)
+    ''', (EPOCH_COLUMNS_METADATA_KEY, json.dumps(merged)))
+
+
+def has_leading_index(connection: sqlite3.Connection, table: str, column: str) -> bool:
+    """True if some index on `table` has `column` as its first column"""
+    try:
+        cursor = connection.cursor()
+        cursor.execute(f'PRAGMA index_list("{table}")')
+        index_names = [row[1] for row in cursor.fetchall()]
+
+        for index_name in index_names:
+            cursor.execute(f'PRAGMA index_info("{index_name}")')
+            index_columns = sorted(cursor.fetchall())
+            if index_columns and index_columns[0][2] == column:
+                return True
+    except sqlite3.Error:
+        pass
+
+    return False
+
@@ -5,7 +5,7 @@ Loads feather databases and provides query interface with identifier extraction
 
 import logging
 import sqlite3
-from typing import List, Dict, Any, Optional, Iterator
+from typing import List, Dict, Any, Optional, Iterable, Iterator
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
@@ -75,7 +75,7 @@ class FeatherLoader:
         'access_date', 'creation_date', 'modification_date'
     ]
     
-    def __init__(self, database_path: str, config=None, timestamp_parser=None):
+    def __init__(self, database_path: str, config=None, timestamp_parser=None, read_only: bool = False):
         """
         Initialize feather loader.
         
@@ -83,8 +83,10 @@ class FeatherLoader:
             database_path: Path to the feather database
             config: Optional Wings configuration for identifier extraction
             timestamp_parser: Optional timestamp parser for parsing timestamps
+            read_only: Open the database read-only (used by parallel worker processes)
         """
         self.database_path = database_path
+        self.read_only = read_only
         self.connection = None
         self.artifact_type = None
         self.metadata = {}
@@ -101,7 +103,10 @@ class FeatherLoader:
         if not Path(self.database_path).exists():
             raise FileNotFoundError(f"Feather database not found: {self.database_path}")
         
-        self.connection = sqlite3.connect(self.database_path)
+        if self.read_only:
+            self.connection = sqlite3.connect(f"file:{self.database_path}?mode=ro", uri=True)
+        else:
+            self.connection = sqlite3.connect(self.database_path)
         self.connection.row_factory = sqlite3.Row  # Access columns by name
         
         # Check if metadata table exists
@@ -176,9 +181,10 @@ class FeatherLoader:
         """
         cursor = self.connection.cursor()
         
-        # Get all tables except feather_metadata
+        # Get all tables except feather_metadata and the time histogram side table
         cursor.execute(
-            "SELECT name FROM sqlite_master WHERE type='table' AND name != 'feather_metadata'"
+            "SELECT name FROM sqlite_master WHERE type='table' "
+            "AND name NOT IN ('feather_metadata', 'feather_time_histogram')"
         )
         data_tables = [row[0] for row in cursor.fetchall()]
         
@@ -236,9 +242,16 @@ class FeatherLoader:
             cursor: Database cursor
             tables: List of table names to union
         """
+        # Read-only connections cannot change the schema, so they build a
+        # connection-local TEMP view (it shadows any persisted one)
+        view_kind = "TEMP VIEW" if self.read_only else "VIEW"
+        
         try:
             # Drop view if it exists
-            cursor.execute("DROP VIEW IF EXISTS amcache_union_view")
+            if self.read_only:
+                cursor.execute("DROP VIEW IF EXISTS temp.amcache_union_view")
+            else:
+                cursor.execute("DROP VIEW IF EXISTS amcache_union_view")
             
             # Get common columns across all tables
             # We'll use a subset of columns that are likely to exist in most tables
@@ -276,7 +289,7 @@ class FeatherLoader:
             
             # Create UNION ALL view
             union_query = " UNION ALL ".join(select_statements)
-            create_view_sql = f"CREATE VIEW amcache_union_view AS {union_query}"
+            create_view_sql = f"CREATE {view_kind} amcache_union_view AS {union_query}"
             
             cursor.execute(create_view_sql)
             self.connection.commit()
@@ -405,7 +418,7 @@ class FeatherLoader:
         all_tables = [row[0] for row in cursor.fetchall()]
         
         # Filter out system tables
-        system_tables = {'sqlite_sequence', 'feather_metadata', 'import_history', 'data_lineage'}
+        system_tables = {'sqlite_sequence', 'feather_metadata', 'import_history', 'data_lineage', 'feather_time_histogram'}
         data_tables = [t for t in all_tables if t not in system_tables and not t.startswith('sqlite_')]
         
         if not data_tables:
@@ -877,7 +890,7 @@ class FeatherLoader:
             tables = [row[0] for row in cursor.fetchall()]
             
             # Filter out metadata and system tables
-            data_tables = [t for t in tables if t not in ['feather_metadata', 'sqlite_sequence', 'import_history', 'data_lineage']]
+            data_tables = [t for t in tables if t not in ['feather_metadata', 'sqlite_sequence', 'import_history', 'data_lineage', 'feather_time_histogram']]
             
             if not data_tables:
                 logger.warning(f"No data tables found in {self.database_path}")
@@ -1101,7 +1114,7 @@ class FeatherLoader:
                 # If feather_data doesn't exist, check for any data tables
                 cursor.execute(
                     "SELECT name FROM sqlite_master WHERE type='table' "
-                    "AND name NOT IN ('feather_metadata', 'sqlite_sequence', 'import_history', 'data_lineage')"
+                    "AND name NOT IN ('feather_metadata', 'sqlite_sequence', 'import_history', 'data_lineage', 'feather_time_histogram')"
                 )
                 data_tables = cursor.fetchall()
                 if not data_tables:
@@ -1116,7 +1129,7 @@ class FeatherLoader:
     
     @staticmethod
     def create_feather_with_metadata(db_path: str, feather_name: str, 
-                                     table_name: str, data: List[Dict[str, Any]],
+                                     table_name: str, data: Iterable[Dict[str, Any]],
                                      columns: List[Dict[str, Any]], 
                                      artifact_type: str,
                                      source_path: str = None,
@@ -1127,12 +1140,15 @@ class FeatherLoader:
         
         This is a convenience method that creates a feather database and ensures
         all metadata is properly populated for query-based semantic evaluation.
+        Timestamp columns also get indexed epoch-microsecond companion columns
+        (see FeatherDatabase.insert_data).
         
         Args:
             db_path: Directory path for database
             feather_name: Name of the feather database
             table_name: Name of the data table to create
-            data: List of data records to insert
+            data: Records to insert; any iterable (e.g. a generator over the
+                source) or a sqlite3 cursor, streamed by FeatherDatabase.insert_data
             columns: Column mapping configuration
             artifact_type: Type of forensic artifact (e.g., 'prefetch', 'srum')
             source_path: Optional path to source data file
@@ -1196,7 +1212,7 @@ class FeatherLoader:
                 f"Created feather '{feather_name}' with metadata:\n"
                 f"  - Artifact Type: {artifact_type}\n"
                 f"  - Table Name: {table_name}\n"
-                f"  - Record Count: {len(data)}\n"
+                f"  - Record Count: {feather_db.last_import_stats.rows_inserted}\n"
                 f"  - Columns: {len(columns)}\n"
                 f"  - Indexed Columns: {indexed_columns or 'None'}"
             )
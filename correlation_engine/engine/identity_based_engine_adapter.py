@@ -11,9 +11,11 @@ from datetime import datetime
 from typing import List, Dict, Any, Optional, Tuple
 
 from .base_engine import BaseCorrelationEngine, EngineMetadata, FilterConfig
-from .identity_correlation_engine import IdentityCorrelationEngine
+from .identity_correlation_engine import IdentityCorrelationEngine, IdentityMatcher
 from .correlation_result import CorrelationResult, CorrelationMatch
 from .weighted_scoring import WeightedScoringEngine
+from .epoch_timestamps import epoch_column_name, to_epoch_microseconds
+from .identity_columnar_index import ColumnarIdentityIndex
 from .progress_tracking import ProgressTracker, ProgressListener, ProgressEvent, ProgressEventType, CorrelationProgressReporter, CorrelationStallMonitor, CorrelationStallException
 from ..integration.semantic_mapping_integration import SemanticMappingIntegration, SemanticMappingStats
 from ..integration.weighted_scoring_integration import WeightedScoringIntegration
@@ -88,6 +90,12 @@ class IdentityBasedEngineAdapter(BaseCorrelationEngine):
             debug_mode=self.debug_mode
         )
         
+        # Optional fuzzy consolidation of identity keys within this edit
+        # distance (PipelineConfig.fuzzy_match_distance; 0 disables it)
+        self.fuzzy_match_distance = int(getattr(config, 'fuzzy_match_distance', 0) or 0)
+        self.identity_matcher = IdentityMatcher(debug_mode=self.debug_mode)
+        self.fuzzy_merged_identities = 0
+        
         # Verify semantic integration health (only log if verbose)
         if not self.semantic_integration.is_healthy() and self.verbose_logging:
             logger.warning("Semantic mapping integration health check failed - some features may not work correctly")
@@ -233,6 +241,7 @@ class IdentityBasedEngineAdapter(BaseCorrelationEngine):
             total_identities = 0
             total_match_count = 0  # Track total matches even when streaming
             all_feather_stats = {}  # Collect feather stats from all wings
+            self.fuzzy_merged_identities = 0
             
             for wing_idx, wing_config in enumerate(wing_configs, 1):
                 wing_name = getattr(wing_config, 'wing_name', 'Unknown')
@@ -358,14 +367,15 @@ class IdentityBasedEngineAdapter(BaseCorrelationEngine):
                 # This avoids loading all matches into memory which causes resource leaks
                 from pathlib import Path
                 from .database_persistence import ResultsDatabase
+                from .match_payload import MatchPayloadCodec
                 import sqlite3
-                import json
                 
                 db_path = Path(self._output_dir) / "correlation_results.db"
                 try:
                     # Use direct SQL connection for efficient aggregation
                     conn = sqlite3.connect(str(db_path), timeout=30.0)
                     cursor = conn.cursor()
+                    payload_codec = MatchPayloadCodec(conn)
                     
                     # Get result_ids for this execution
                     cursor.execute("""
@@ -403,12 +413,12 @@ class IdentityBasedEngineAdapter(BaseCorrelationEngine):
                                     continue
                                 
                                 try:
-                                    feather_records = json.loads(feather_records_str)
+                                    feather_records = payload_codec.decode(feather_records_str)
                                     for feather_key in feather_records.keys():
                                         # Extract base feather name (remove _0, _1 suffixes)
                                         feather_id = feather_key.split('_')[0] if '_' in feather_key else feather_key
                                         matches_per_feather[feather_id] = matches_per_feather.get(feather_id, 0) + 1
-                                except (json.JSONDecodeError, AttributeError):
+                                except (ValueError, AttributeError):
                                     pass
                             
                             offset += batch_size
@@ -533,7 +543,9 @@ class IdentityBasedEngineAdapter(BaseCorrelationEngine):
                 'semantic_mappings_applied': semantic_stats.mappings_applied,
                 'weighted_scoring_stats': scoring_stats_dict,
                 'duplicate_rate': 0.0,  # Identity-based engine has minimal duplicates
-                'streaming_mode': streaming_enabled
+                'streaming_mode': streaming_enabled,
+                'identity_normalization': self.core_engine.get_normalization_statistics(),
+                'fuzzy_merged_identities': self.fuzzy_merged_identities
             }
             
             # Log final statistics
@@ -850,7 +862,7 @@ class IdentityBasedEngineAdapter(BaseCorrelationEngine):
         
         matches = []  # Only used if streaming is disabled
         match_count = 0  # Track total matches for both modes
-        identity_index = {}  # identity_key -> list of records
+        identity_index = ColumnarIdentityIndex()  # identity -> rows, records fetched back by rowid
         total_records = 0
         feathers_with_records = []
         
@@ -877,7 +889,6 @@ class IdentityBasedEngineAdapter(BaseCorrelationEngine):
         
         # Track per-feather extraction statistics
         feather_stats = {}  # feather_id -> {total, extracted, identities}
-        identity_feathers = {}  # identity_key -> set of feather_ids
         
         feather_count = 0
         for feather_id, db_path in feather_paths.items():
@@ -899,7 +910,6 @@ class IdentityBasedEngineAdapter(BaseCorrelationEngine):
                           f"path_col={feather_metadata.get('path_column')}")
                 
                 conn = sqlite3.connect(db_path)
-                conn.row_factory = sqlite3.Row
                 cursor = conn.cursor()
                 
                 # Get all tables in the database
@@ -930,12 +940,14 @@ class IdentityBasedEngineAdapter(BaseCorrelationEngine):
                         continue
                     
                     try:
-                        cursor.execute(f"SELECT * FROM {table}")
-                        rows = cursor.fetchall()
-                        columns = [desc[0] for desc in cursor.description]
+                        source_id = identity_index.add_source(feather_id, db_path, table)
+                        cursor.execute(f'SELECT rowid, * FROM "{table}"')
+                        columns = [desc[0] for desc in cursor.description][1:]
                         
-                        for row in rows:
-                            record = dict(zip(columns, row))
+                        # Rows stream from the cursor and are only held while their identity
+                        # is extracted; the index keeps (identity, timestamp, source, rowid)
+                        for row in cursor:
+                            record = dict(zip(columns, row[1:]))
                             record['_feather_id'] = feather_id
                             record['_table'] = table
                             
@@ -958,41 +970,41 @@ class IdentityBasedEngineAdapter(BaseCorrelationEngine):
                                 # Track if this is a new identity for this feather
                                 is_new_identity = identity_key not in feather_stats[feather_id]['identities']
                                 
-                                if identity_key not in identity_index:
+                                identity_id = identity_index.get_identity_id(identity_key)
+                                if identity_id is None:
                                     # Create new identity entry with sub-identity tracking
-                                    identity_index[identity_key] = {
+                                    identity_id = identity_index.add_identity(identity_key, {
                                         'base_name': base_name,  # Base name without suffix
                                         'name': name,  # Original full name
                                         'path': path,
                                         'hash': hash_val,
-                                        'records': [],
                                         'sub_identities': []  # Track all versions/variants
-                                    }
-                                    identity_feathers[identity_key] = set()
+                                    })
+                                identity_data = identity_index.identities[identity_id]
                                 
                                 # Track sub-identity if it has a suffix (version/date/number)
                                 if suffix:
                                     # Check if this sub-identity already exists
                                     sub_identity_exists = any(
                                         sub['full_name'] == name and sub['suffix'] == suffix
-                                        for sub in identity_index[identity_key]['sub_identities']
+                                        for sub in identity_data['sub_identities']
                                     )
                                     
                                     if not sub_identity_exists:
-                                        identity_index[identity_key]['sub_identities'].append({
+                                        identity_data['sub_identities'].append({
                                             'full_name': name,
                                             'suffix': suffix,
                                             'record_count': 0
                                         })
                                     
                                     # Increment record count for this sub-identity
-                                    for sub in identity_index[identity_key]['sub_identities']:
+                                    for sub in identity_data['sub_identities']:
                                         if sub['full_name'] == name and sub['suffix'] == suffix:
                                             sub['record_count'] += 1
                                             break
                                 
-                                identity_index[identity_key]['records'].append(record)
-                                identity_feathers[identity_key].add(feather_id)
+                                timestamp, epoch_us = self._extract_record_timestamp(record)
+                                identity_index.add_row(identity_id, source_id, row[0], timestamp, epoch_us)
                                 feather_stats[feather_id]['identities'].add(identity_key)
                                 feather_stats[feather_id]['extracted'] += 1
                                 feather_records += 1
@@ -1035,8 +1047,11 @@ class IdentityBasedEngineAdapter(BaseCorrelationEngine):
         
         print(f"\n[Identity Engine] Identity Extraction Summary:")
         print(f"  Total Records Processed: {total_records:,}")
-        print(f"  Unique Identities Found: {len(identity_index):,}")
+        print(f"  Unique Identities Found: {identity_index.identity_count:,}")
         print(f"  Identities Filtered: {total_filtered:,}")
+        normalization_stats = self.core_engine.normalization_stats
+        print(f"  Normalization Cache: {normalization_stats.hit_rate:.1%} hit rate "
+              f"(~{normalization_stats.estimated_seconds_saved:.2f}s saved)")
         
         print(f"\n[Identity Engine] Extraction Statistics by Feather:")
         print(f"  {'Feather':<30} {'Records':<15} {'Extracted':<15} {'Filtered':<15} {'Identities':<15}")
@@ -1061,7 +1076,7 @@ class IdentityBasedEngineAdapter(BaseCorrelationEngine):
         # print(f"\n[Identity Engine] 🔗 Cross-Feather Correlations (identities in 2+ feathers):")
         
         # Requirement 3.4: Filter to show only identities in 2+ feathers
-        multi_feather = [(k, v) for k, v in identity_feathers.items() if len(v) > 1]
+        # multi_feather = [(k, v) for k, v in identity_feathers.items() if len(v) > 1]
         # multi_feather.sort(key=lambda x: len(x[1]), reverse=True)
         
         # if multi_feather:
@@ -1099,12 +1114,23 @@ class IdentityBasedEngineAdapter(BaseCorrelationEngine):
         # 
         # print(f"[Identity Engine] Cross-Feather Summary: {len(multi_feather)} identities across {len(all_unique_feathers)} unique feathers")
         
-        print(f"\n[Identity Engine]   Correlating {len(identity_index):,} identities...")
+        # Optional fuzzy consolidation of near-identical identities
+        if self.fuzzy_match_distance > 0:
+            self._merge_fuzzy_identities(identity_index)
+        
+        # Group rows by (identity, timestamp) before correlating
+        identity_index.finalize()
+        if self.debug_mode:
+            print(f"[Identity Engine]   Identity index: {len(identity_index):,} rows, "
+                  f"{identity_index.memory_bytes() / (1024 * 1024):.1f} MB")
+        
+        print(f"\n[Identity Engine]   Correlating {identity_index.identity_count:,} identities...")
         
         min_matches = 1  # Show ALL identities
         time_window_minutes = 180  # Time window for anchor clustering (default: 3 hours)
         
         # Diagnostic counters
+        missing_rows = 0
         single_record_identities = 0
         single_feather_identities = 0
         multi_feather_identities = 0
@@ -1114,7 +1140,7 @@ class IdentityBasedEngineAdapter(BaseCorrelationEngine):
         # Task 8.2: Initialize progress reporter for identity processing
         # Requirements: 4.1, 4.2, 4.3, 4.4
         # PERFORMANCE: Use less frequent reporting for large datasets to reduce overhead
-        total_identities = len(identity_index)
+        total_identities = identity_index.identity_count
         
         # Adaptive progress reporting based on dataset size
         if total_identities > 100000:
@@ -1154,7 +1180,7 @@ class IdentityBasedEngineAdapter(BaseCorrelationEngine):
         processed_count = 0
         cancellation_check_interval = 15000 if total_identities > 100000 else 10000  # Less frequent checks for large datasets
         
-        for identity_key, identity_data in identity_index.items():
+        for identity_key, identity_data, positions, anchor_bounds in identity_index.iter_identities(time_window_minutes):
             # Check for cancellation less frequently for better performance
             if processed_count % cancellation_check_interval == 0:
                 try:
@@ -1189,6 +1215,8 @@ class IdentityBasedEngineAdapter(BaseCorrelationEngine):
                         streaming_writer.close()
                         print(f"[Identity Engine] ✓ Partial results saved - can resume later")
                     
+                    identity_index.close()
+                    
                     # Return partial results for immediate display
                     return matches, processed_count, feather_stats
             
@@ -1203,13 +1231,18 @@ class IdentityBasedEngineAdapter(BaseCorrelationEngine):
                         f"Last operation: {diagnostics['last_successful_operation']}"
                     )
             
-            records = identity_data['records']
+            # Read this identity's rows back; only one identity is held as dicts at a time
+            # (None marks rows removed from their feather since they were indexed)
+            records = identity_index.fetch_records(positions)
+            present_records = [r for r in records if r is not None]
+            if len(present_records) < len(records):
+                missing_rows += len(records) - len(present_records)
             
             # Get unique feathers for this identity
-            feather_ids = list(set(r.get('_feather_id', '') for r in records))
+            feather_ids = list(set(r.get('_feather_id', '') for r in present_records))
             
             # Count by category
-            if len(records) == 1:
+            if len(present_records) == 1:
                 single_record_identities += 1
             elif len(feather_ids) == 1:
                 single_feather_identities += 1
@@ -1217,17 +1250,17 @@ class IdentityBasedEngineAdapter(BaseCorrelationEngine):
                 multi_feather_identities += 1
             
             # Create anchors for this identity using temporal clustering
-            if len(records) >= min_matches:
+            if len(present_records) >= min_matches:
                 # Log hash processing for first few identities or periodically
                 if self.debug_mode and (processed_count < 5 or processed_count % 1000 == 0):
-                    print(f"[Identity Engine] Processing identity {processed_count}: {len(records)} records, {len(feather_ids)} feathers")
+                    print(f"[Identity Engine] Processing identity {processed_count}: {len(present_records)} records, {len(feather_ids)} feathers")
                     print(f"[Identity Engine] Identity key: {identity_key[:50]}...")
                     print(f"[Identity Engine] About to create temporal anchors (will trigger hash calculations)")
                 
                 identity_anchors = self._create_temporal_anchors(
                     records, 
+                    anchor_bounds,
                     identity_data, 
-                    time_window_minutes,
                     feather_paths,
                     match_counter_start=match_counter
                 )
@@ -1243,9 +1276,8 @@ class IdentityBasedEngineAdapter(BaseCorrelationEngine):
                     # Task 1.1: Apply scoring to each match before writing to database
                     # Requirements: 1.1, 1.2, 1.3, 1.4
                     # NO semantic mappings during correlation - will be applied in Identity Semantic Phase
-                    for match in identity_anchors:
-                        # Apply weighted scoring (NO semantic mappings during correlation)
-                        scored_match = self._apply_scoring_to_single_match(match, wing_config)
+                    # Apply weighted scoring once per identity (NO semantic mappings during correlation)
+                    for scored_match in self._apply_scoring_to_matches(identity_anchors, wing_config):
                         streaming_writer.write_match(result_id, scored_match)
                         match_count += 1
                 else:
@@ -1273,10 +1305,16 @@ class IdentityBasedEngineAdapter(BaseCorrelationEngine):
         # Requirements: 4.1, 4.5
         progress_reporter.force_report()
         
+        identity_index.close()
+        
         # Flush any remaining matches in streaming mode
         if streaming_enabled and streaming_writer:
             print(f"[Identity Engine]   Flushing {match_count:,} matches to database...")
             streaming_writer.flush()
+            writer_stats = streaming_writer.get_statistics()
+            print(f"[Identity Engine]   Writer: {writer_stats['matches_per_second']:,.0f} matches/s, "
+                  f"{writer_stats['producer_waits']:,} backpressure waits "
+                  f"({writer_stats['producer_wait_seconds']:.1f}s)")
             
             # Update result record with final counts
             # Note: feather_metadata will be calculated and saved later in execute() method
@@ -1297,6 +1335,9 @@ class IdentityBasedEngineAdapter(BaseCorrelationEngine):
         
         # Show completion
         print(f"[Identity Engine]   Created {total_anchors:,} anchors")
+        if missing_rows:
+            print(f"[Identity Engine] ⚠️ {missing_rows:,} indexed rows were no longer in their feathers and were skipped")
+            logger.warning(f"[Identity Engine] {missing_rows} indexed rows missing from their feathers during correlation")
         
         if self.debug_mode:
             print(f"[Identity Engine]   Breakdown:")
@@ -1320,128 +1361,88 @@ class IdentityBasedEngineAdapter(BaseCorrelationEngine):
         
         return matches, total_identities, feather_stats
     
-    def _create_temporal_anchors(self, records: List[Dict[str, Any]], identity_data: Dict[str, Any],
-                                time_window_minutes: int, feather_paths: Dict[str, str],
+    def _merge_fuzzy_identities(self, identity_index: ColumnarIdentityIndex):
+        """
+        Merge identities whose keys are within fuzzy_match_distance edits.
+        
+        Each merge group keeps the identity with the most rows; the keys of
+        the others are recorded in its 'fuzzy_merged_keys'.
+        
+        Args:
+            identity_index: Index of the wing, before finalize()
+        """
+        groups = self.identity_matcher.find_fuzzy_groups(
+            identity_index.identity_keys, max_distance=self.fuzzy_match_distance
+        )
+        merged_count = identity_index.merge_identities(groups)
+        self.fuzzy_merged_identities += merged_count
+        
+        fuzzy_stats = self.identity_matcher.last_fuzzy_statistics
+        print(f"[Identity Engine] Fuzzy matching: merged {merged_count} identities into {len(groups)} groups "
+              f"({fuzzy_stats.candidate_pairs:,} candidate pairs compared)")
+    
+    def _extract_record_timestamp(self, record: Dict[str, Any]) -> Tuple[Any, Optional[int]]:
+        """
+        Find the timestamp used to place a record in temporal anchors.
+        
+        Args:
+            record: Record to inspect
+            
+        Returns:
+            Tuple (raw_value, epoch_us): the first populated timestamp field, and
+            its epoch column value when the feather has one (None otherwise)
+        """
+        for ts_field in self.core_engine.timestamp_field_patterns:
+            if ts_field in record and record[ts_field]:
+                epoch_value = record.get(epoch_column_name(ts_field))
+                return record[ts_field], epoch_value if isinstance(epoch_value, int) else None
+        return None, None
+    
+    def _create_temporal_anchors(self, records: List[Dict[str, Any]], anchor_bounds: List[Tuple[int, int]],
+                                identity_data: Dict[str, Any], feather_paths: Dict[str, str],
                                 match_counter_start: int = 0) -> List[CorrelationMatch]:
         """
-        Create temporal anchors by clustering records into time windows.
+        Create temporal anchors from clustered records.
+        
+        The columnar identity index clusters the timestamped records of all
+        identities in one batch (a new anchor wherever the gap to the previous
+        record exceeds the time window), so each anchor is a slice of the
+        time-sorted records. Records after the last anchor have no parseable
+        timestamp and form one separate anchor.
         
         Args:
-            records: List of records for this identity
+            records: List of records for this identity, timestamped records first in time order
+                (None for rows no longer in their feather; they are left out of the anchors)
+            anchor_bounds: (start, end) offsets into records of each timestamped anchor
             identity_data: Identity metadata (name, path, hash)
-            time_window_minutes: Time window size for clustering
             feather_paths: Dictionary of feather paths
             
         Returns:
             List of CorrelationMatch objects (one per anchor)
         """
-        # PERFORMANCE FIX: Import dateutil parser ONCE at the top, not in the loop
-        try:
-            from dateutil import parser as date_parser
-            has_dateutil = True
-        except ImportError:
-            has_dateutil = False
-        
-        # Step 1: Extract timestamps and sort records
-        records_with_timestamps = []
-        records_without_timestamps = []
-        
-        for record in records:
-            timestamp = None
-            for ts_field in self.core_engine.timestamp_field_patterns:
-                if ts_field in record and record[ts_field]:
-                    try:
-                        # Try to parse timestamp
-                        ts_str = str(record[ts_field])
-                        # Store both string and parsed datetime
-                        timestamp = ts_str
-                        break
-                    except:
-                        pass
-            
-            if timestamp:
-                records_with_timestamps.append((timestamp, record))
-            else:
-                records_without_timestamps.append(record)
-        
-        # Sort records by timestamp
-        records_with_timestamps.sort(key=lambda x: x[0])
-        
-        # Step 2: Cluster records into temporal anchors based on time proximity
         anchors = []
-        current_anchor_records = []
-        current_anchor_start = None
-        current_anchor_end = None
-        
-        for timestamp, record in records_with_timestamps:
-            if not current_anchor_records:
-                # Start first anchor
-                current_anchor_records = [record]
-                current_anchor_start = timestamp
-                current_anchor_end = timestamp
-            else:
-                # Check if record is within time window of current anchor
-                # Parse timestamps and calculate time difference
-                should_create_new_anchor = False
-                
-                if has_dateutil:
-                    try:
-                        dt_current = date_parser.parse(timestamp)
-                        dt_anchor_end = date_parser.parse(current_anchor_end)
-                        
-                        # Calculate time difference in minutes
-                        time_diff = (dt_current - dt_anchor_end).total_seconds() / 60
-                        
-                        # If time difference exceeds window, create new anchor
-                        if abs(time_diff) > time_window_minutes:
-                            should_create_new_anchor = True
-                    except:
-                        # If parsing fails, try simple string comparison
-                        # If timestamps are different, might be different time periods
-                        if timestamp != current_anchor_end:
-                            # For safety, keep in same anchor if can't parse
-                            pass
-                else:
-                    # dateutil not available, use simple heuristic
-                    # If timestamps are very different strings, might be different periods
-                    pass
-                
-                if should_create_new_anchor:
-                    # Create anchor from current records
-                    anchor_match = self._create_anchor_match(
-                        current_anchor_records,
-                        identity_data,
-                        current_anchor_start,
-                        current_anchor_end,
-                        feather_paths,
-                        match_counter=match_counter_start + len(anchors)
-                    )
-                    if anchor_match:
-                        anchors.append(anchor_match)
-                    
-                    # Start new anchor
-                    current_anchor_records = [record]
-                    current_anchor_start = timestamp
-                    current_anchor_end = timestamp
-                else:
-                    # Add to current anchor
-                    current_anchor_records.append(record)
-                    current_anchor_end = timestamp
         
-        # Add last anchor
-        if current_anchor_records:
+        # Step 1: One anchor per cluster slice
+        for start, end in anchor_bounds:
+            anchor_records = [record for record in records[start:end] if record is not None]
+            if not anchor_records:
+                continue
             anchor_match = self._create_anchor_match(
-                current_anchor_records,
+                anchor_records,
                 identity_data,
-                current_anchor_start,
-                current_anchor_end,
+                str(self._extract_record_timestamp(anchor_records[0])[0]),
+                str(self._extract_record_timestamp(anchor_records[-1])[0]),
                 feather_paths,
                 match_counter=match_counter_start + len(anchors)
             )
             if anchor_match:
                 anchors.append(anchor_match)
         
-        # Step 3: Handle records without timestamps (create separate anchor)
+        # Step 2: Handle records without timestamps (create separate anchor)
+        records_without_timestamps = [
+            record for record in (records[anchor_bounds[-1][1]:] if anchor_bounds else records)
+            if record is not None
+        ]
         if records_without_timestamps:
             anchor_match = self._create_anchor_match(
                 records_without_timestamps,
@@ -2074,17 +2075,26 @@ class IdentityBasedEngineAdapter(BaseCorrelationEngine):
         if self.verbose_logging:
             logger.info(f"Applying weighted scoring to {len(matches)} correlation matches")
         
-        for match in matches:
+        # Find appropriate wing config for the matches
+        wing_config = wing_configs[0] if wing_configs else None  # Simplified
+        
+        # Score all matches in one batch
+        weighted_scores = [None] * len(matches)
+        if wing_config:
+            try:
+                weighted_scores = self.scoring_integration.calculate_batch_match_scores(
+                    [match.feather_records for match in matches], wing_config, case_id
+                )
+            except Exception as e:
+                # If weighted scoring fails, fall back to simple scoring
+                if self.verbose_logging:
+                    logger.warning(f"Weighted scoring failed for {len(matches)} matches: {e}")
+                    logger.info("Falling back to simple count-based scoring")
+                return self._apply_simple_count_scoring(matches, wing_configs)
+        
+        for match, weighted_score in zip(matches, weighted_scores):
             try:
-                # Find appropriate wing config for this match
-                wing_config = wing_configs[0] if wing_configs else None  # Simplified
-                
                 if wing_config:
-                    # Calculate weighted score using integration layer
-                    weighted_score = self.scoring_integration.calculate_match_scores(
-                        match.feather_records, wing_config, case_id
-                    )
-                    
                     # Update match with scoring information
                     scored_match = CorrelationMatch(
                         match_id=match.match_id,
@@ -2170,51 +2180,86 @@ class IdentityBasedEngineAdapter(BaseCorrelationEngine):
                                        wing_config: Any) -> CorrelationMatch:
         """
         Apply weighted scoring to a single match.
+        
+        Args:
+            match: Correlation match to process
+            wing_config: Wing configuration for context
+            
+        Returns:
+            Match with scoring applied (NO semantic data during correlation)
+        """
+        return self._apply_scoring_to_matches([match], wing_config)[0]
+    
+    def _apply_scoring_to_matches(self, 
+                                  matches: List[CorrelationMatch], 
+                                  wing_config: Any) -> List[CorrelationMatch]:
+        """
+        Apply weighted scoring to the matches (anchors) of one identity.
         Used in streaming mode to score matches before writing to database.
         
+        All matches are scored in one batch (see calculate_batch_match_scores).
+        
         Task 1.1: Remove semantic mapping from correlation processing
         Requirements: 1.1, 1.2, 1.3, 1.4
         Semantic matching will be applied AFTER correlation reaches 100% in Identity Semantic Phase
         
         Args:
-            match: Correlation match to process
+            matches: Correlation matches to process
             wing_config: Wing configuration for context
             
         Returns:
-            Match with scoring applied (NO semantic data during correlation)
+            Matches with scoring applied (NO semantic data during correlation), in order
         """
-        try:
-            case_id = getattr(self.config, 'case_id', None)
-            
-            # Task 1.1: NO semantic mapping during correlation
-            # Semantic data will be applied in Identity Semantic Phase after 100% completion
-            semantic_data = None
+        if not matches:
+            return []
+        
+        weighted_scores = None
+        if self.scoring_integration.is_enabled() and wing_config:
+            try:
+                case_id = getattr(self.config, 'case_id', None)
+                weighted_scores = self.scoring_integration.calculate_batch_match_scores(
+                    [match.feather_records for match in matches], wing_config, case_id
+                )
+            except Exception as e:
+                if getattr(self, 'verbose_logging', False):
+                    logger.warning(f"Weighted scoring failed for {len(matches)} matches: {e}")
+                # Fall back to simple scoring
+        
+        scored_matches = []
+        for index, match in enumerate(matches):
+            if weighted_scores is not None:
+                scored_matches.append(self._create_scored_match(match, weighted_scores[index], weighted=True))
+            else:
+                scored_matches.append(self._create_scored_match(
+                    match, self._calculate_simple_score(match, wing_config), weighted=False
+                ))
+        return scored_matches
+    
+    def _create_scored_match(self, 
+                             match: CorrelationMatch, 
+                             weighted_score: Any, 
+                             weighted: bool) -> CorrelationMatch:
+        """
+        Copy of a match with a scoring result applied.
+        
+        Args:
+            match: Correlation match
+            weighted_score: Weighted or simple scoring result for the match
+            weighted: Whether weighted_score comes from weighted scoring
+                (only weighted results set breakdown, score and category)
             
-            # Apply weighted scoring if enabled
-            weighted_score = None
+        Returns:
+            Scored match WITHOUT semantic data (will be added in Identity Semantic Phase)
+        """
+        try:
             score_breakdown = None
             confidence_score = None
             confidence_category = None
+            if weighted and isinstance(weighted_score, dict):
+                score_breakdown = weighted_score.get('breakdown')
+                confidence_score = weighted_score.get('score')
+                confidence_category = weighted_score.get('interpretation')
             
-            if self.scoring_integration.is_enabled() and wing_config:
-                try:
-                    weighted_score = self.scoring_integration.calculate_match_scores(
-                        match.feather_records, wing_config, case_id
-                    )
-                    if isinstance(weighted_score, dict):
-                        score_breakdown = weighted_score.get('breakdown')
-                        confidence_score = weighted_score.get('score')
-                        confidence_category = weighted_score.get('interpretation')
-                except Exception as e:
-                    if getattr(self, 'verbose_logging', False):
-                        logger.warning(f"Weighted scoring failed for match {match.match_id}: {e}")
-                    # Fall back to simple scoring
-                    weighted_score = self._calculate_simple_score(match, wing_config)
-            else:
-                # Use simple scoring
-                weighted_score = self._calculate_simple_score(match, wing_config)
-            
-            # Create scored match WITHOUT semantic data (will be added in Identity Semantic Phase)
             scored_match = CorrelationMatch(
                 match_id=match.match_id,
                 timestamp=match.timestamp,
@@ -2232,7 +2277,7 @@ class IdentityBasedEngineAdapter(BaseCorrelationEngine):
                 confidence_category=confidence_category or match.confidence_category,
                 weighted_score=weighted_score if isinstance(weighted_score, dict) else None,
                 is_duplicate=match.is_duplicate,
-                semantic_data=semantic_data
+                semantic_data=None
             )
             
             # Copy anchor metadata
@@ -2548,15 +2593,29 @@ class IdentityBasedEngineAdapter(BaseCorrelationEngine):
         if self.filters.time_period_start or self.filters.time_period_end:
             # Extract timestamp from record
             timestamp = None
+            epoch_value = None
             for ts_field in self.core_engine.timestamp_field_patterns:
                 if ts_field in record and record[ts_field]:
+                    # Feathers created with epoch columns carry the parsed value already
+                    epoch_value = record.get(epoch_column_name(ts_field))
+                    if isinstance(epoch_value, int):
+                        break
+                    epoch_value = None
+                    
                     # Use base engine's timestamp parsing method
                     timestamp = self._parse_timestamp(record[ts_field])
                     if timestamp:
                         break
             
+            if epoch_value is not None:
+                # Integer comparison in epoch microseconds
+                if self.filters.time_period_start and epoch_value < to_epoch_microseconds(self.filters.time_period_start):
+                    return True  # Filter out (too early)
+                if self.filters.time_period_end and epoch_value > to_epoch_microseconds(self.filters.time_period_end):
+                    return True  # Filter out (too late)
+            
             # If we have a timestamp, check if it's within the filter range
-            if timestamp:
+            elif timestamp:
                 if self.filters.time_period_start and timestamp < self.filters.time_period_start:
                     return True  # Filter out (too early)
                 if self.filters.time_period_end and timestamp > self.filters.time_period_end:
@@ -12,33 +12,95 @@ This module provides the core identity correlation functionality:
 """
 
 import re
+import time
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any, Tuple
 from pathlib import Path
 from dataclasses import dataclass
 
 from .data_structures import Identity, Anchor, EvidenceRow, CorrelationResults, CorrelationStatistics
+from .anchor_clustering import (
+    gap_cluster_offsets,
+    start_cluster_offsets,
+    group_clusters_by_key,
+    naive_epoch_microseconds,
+    window_microseconds
+)
 from .cancellation_support import EnhancedCancellationManager
+from .identity_fuzzy_matching import (
+    FuzzyMatchStatistics,
+    basename_block_key,
+    bounded_edit_distance,
+    fuzzy_merge_groups
+)
+from .identity_normalization_cache import (
+    IdentityNormalizationCache,
+    NormalizationCacheStatistics,
+    get_shared_normalization_cache
+)
 from .semantic_rule_evaluator import SemanticRuleEvaluator
 
+# Column role plans kept per engine before the plans are rebuilt
+MAX_COLUMN_ROLE_PLANS = 1024
+
+# Kinds of results memoized in the identity normalization cache
+NORMALIZATION_KINDS = ('identity_fields', 'identity_name', 'identity_key', 'primary_name')
+
+# Key terms of smart field discovery
+SMART_NAME_TERMS = ('name', 'file', 'exe', 'app', 'program', 'process', 'source', 'target', 'image', 'binary', 'module')
+SMART_PATH_TERMS = ('path', 'location', 'directory', 'folder', 'dir', 'full', 'reconstructed')
+
+_MISSING = object()
+
+
+class _ColumnRolePlan:
+    """
+    Identity fields of one record schema (artifact type and column names).
+    
+    Candidates are (exact_key, exact_label, ci_key, ci_label) tuples in
+    priority order: the column matching a field pattern exactly and the
+    column matching it case-insensitively, with the field name passed to the
+    validator for each (None for validation without field context).
+    """
+    
+    __slots__ = ('artifact_candidates', 'generic_candidates', 'smart_keys')
+    
+    def __init__(self):
+        self.artifact_candidates: Optional[Dict[str, List[Tuple]]] = None
+        self.generic_candidates: Dict[str, List[Tuple]] = {}
+        self.smart_keys: Dict[str, List[Tuple[str, int]]] = {}
+
 
 class IdentityCorrelationEngine:
     """
     Core engine for identity-based correlation.
     
     Implements identity-first clustering followed by temporal anchor creation.
+    
+    Identity extraction is memoized: column roles are resolved once per record
+    schema, and normalization results are kept in an IdentityNormalizationCache
+    shared with the other engines of the process (bypassed in debug mode).
     """
     
-    def __init__(self, debug_mode: bool = False):
+    def __init__(self, debug_mode: bool = False,
+                 normalization_cache: Optional[IdentityNormalizationCache] = None):
         """
         Initialize identity correlation engine.
         
         Args:
             debug_mode: Enable debug logging
+            normalization_cache: Cache of normalization results (the
+                process-wide shared cache if None)
         """
         self.debug_mode = debug_mode
         self.identity_index: Dict[str, Identity] = {}  # Hash index for O(1) lookup
         
+        # Memoized identity extraction
+        self.normalization_cache = normalization_cache or get_shared_normalization_cache()
+        self._normalization_memos = {kind: self.normalization_cache.memo(kind) for kind in NORMALIZATION_KINDS}
+        self.normalization_stats = NormalizationCacheStatistics(hits={kind: 0 for kind in NORMALIZATION_KINDS})
+        self._column_plans: Dict[Tuple, _ColumnRolePlan] = {}
+        
         # Initialize identity validator for filtering invalid values
         # Requirements: 1.1, 1.2, 1.5, 1.6
         from .identity_validator import IdentityValidator
@@ -420,8 +482,10 @@ class IdentityCorrelationEngine:
         if not name:
             return name, ""
         
-        import re
-        
+        return self._cached_normalization('identity_name', name, self._split_identity_name, name)
+    
+    def _split_identity_name(self, name: str) -> Tuple[str, str]:
+        """Uncached normalize_identity_name()."""
         # Pattern 1: Date suffix (DD.MM.YYYY, YYYY-MM-DD, YYYYMMDD, DD-MM-YYYY)
         date_patterns = [
             r'[-_]?\d{2}\.\d{2}\.\d{4}$',  # 23.09.2024, _23.09.2024
@@ -500,8 +564,12 @@ class IdentityCorrelationEngine:
         
         Requirements: 1.2, 5.1
         """
-        import re
-        
+        return self._cached_normalization(
+            'identity_key', (name, path, hash_value), self._build_identity_key, name, path, hash_value
+        )
+    
+    def _build_identity_key(self, name: str, path: str, hash_value: str) -> str:
+        """Uncached normalize_identity_key()."""
         # ENHANCEMENT: Aggressive normalization for grouping
         if name:
             # Step 1: Remove version/date suffixes using existing logic
@@ -602,117 +670,82 @@ class IdentityCorrelationEngine:
         
         # Get artifact type from record (normalize spaces and case variations)
         artifact_type = record.get('artifact', '')
-        artifact_type_normalized = artifact_type.replace(' ', '')
         
-        # Build lowercase key map for case-insensitive lookup
-        record_keys_lower = {k.lower(): k for k in record.keys()}
+        # Identity columns of this record schema, resolved once per schema
+        plan = self._get_column_role_plan(record, artifact_type)
         
         # STEP 1: Try artifact-specific field mappings if name/path not found yet
         # Requirements: 8.5 - Field prioritization
-        if artifact_type_normalized in self.artifact_field_mappings:
-            mapping = self.artifact_field_mappings[artifact_type_normalized]
-            
-            # Extract name using artifact-specific fields (prioritized order)
-            for field in mapping.get('name', []):
-                # Try exact match first
-                if field in record and record[field]:
-                    extracted_value = str(record[field])
-                    is_valid, reason = self.identity_validator.is_valid_identity(extracted_value, field_name=field)
-                    extraction_attempts.append((field, extracted_value, is_valid, reason))
-                    
-                    if is_valid:
-                        name = extracted_value
-                        break
-                    elif self.debug_mode:
-                        print(f"[Identity Engine] ⚠️ Rejected field '{field}': '{extracted_value}' (reason: {reason})")
-                    continue
-                    
-                # Try case-insensitive match
-                if field.lower() in record_keys_lower:
-                    actual_key = record_keys_lower[field.lower()]
-                    if record.get(actual_key):
-                        extracted_value = str(record[actual_key])
-                        is_valid, reason = self.identity_validator.is_valid_identity(extracted_value, field_name=actual_key)
-                        extraction_attempts.append((actual_key, extracted_value, is_valid, reason))
-                        
-                        if is_valid:
-                            name = extracted_value
-                            break
-                        elif self.debug_mode:
-                            print(f"[Identity Engine] ⚠️ Rejected field '{actual_key}': '{extracted_value}' (reason: {reason})")
-            
-            # Extract path using artifact-specific fields
-            for field in mapping.get('path', []):
-                if field in record and record[field]:
-                    extracted_value = str(record[field])
-                    is_valid, reason = self.identity_validator.is_valid_identity(extracted_value, field_name=field)
-                    extraction_attempts.append((field, extracted_value, is_valid, reason))
-                    
-                    if is_valid:
-                        path = extracted_value
-                        break
-                    elif self.debug_mode:
-                        print(f"[Identity Engine] ⚠️ Rejected field '{field}': '{extracted_value}' (reason: {reason})")
-                    continue
-                    
-                if field.lower() in record_keys_lower:
-                    actual_key = record_keys_lower[field.lower()]
-                    if record.get(actual_key):
-                        extracted_value = str(record[actual_key])
-                        is_valid, reason = self.identity_validator.is_valid_identity(extracted_value, field_name=actual_key)
-                        extraction_attempts.append((actual_key, extracted_value, is_valid, reason))
-                        
-                        if is_valid:
-                            path = extracted_value
-                            break
-                        elif self.debug_mode:
-                            print(f"[Identity Engine] ⚠️ Rejected field '{actual_key}': '{extracted_value}' (reason: {reason})")
-            
-            # Extract hash using artifact-specific fields
-            for field in mapping.get('hash', []):
-                if field in record and record[field]:
-                    extracted_value = str(record[field])
-                    is_valid, reason = self.identity_validator.is_valid_identity(extracted_value)
-                    extraction_attempts.append((field, extracted_value, is_valid, reason))
-                    
-                    if is_valid:
-                        hash_value = extracted_value
-                        break
-                    elif self.debug_mode:
-                        print(f"[Identity Engine] ⚠️ Rejected field '{field}': '{extracted_value}' (reason: {reason})")
-                    continue
-                    
-                if field.lower() in record_keys_lower:
-                    actual_key = record_keys_lower[field.lower()]
-                    if record.get(actual_key):
-                        extracted_value = str(record[actual_key])
-                        is_valid, reason = self.identity_validator.is_valid_identity(extracted_value)
-                        extraction_attempts.append((actual_key, extracted_value, is_valid, reason))
-                        
-                        if is_valid:
-                            hash_value = extracted_value
-                            break
-                        elif self.debug_mode:
-                            print(f"[Identity Engine] ⚠️ Rejected field '{actual_key}': '{extracted_value}' (reason: {reason})")
+        if plan.artifact_candidates is not None:
+            # Extract name, path and hash using artifact-specific fields (prioritized order)
+            name = self._extract_first_valid(record, plan.artifact_candidates['name'], extraction_attempts) or name
+            path = self._extract_first_valid(record, plan.artifact_candidates['path'], extraction_attempts) or path
+            hash_value = self._extract_first_valid(record, plan.artifact_candidates['hash'], extraction_attempts)
         
         # STEP 2: Fall back to generic patterns with prioritization
         # Requirements: 8.5 - Prioritize fields in order
         if not name:
-            name = self._extract_with_prioritization(record, record_keys_lower, self.name_field_patterns, extraction_attempts)
+            name = self._extract_first_valid(record, plan.generic_candidates['name'], extraction_attempts)
         
         if not path:
-            path = self._extract_with_prioritization(record, record_keys_lower, self.path_field_patterns, extraction_attempts)
+            path = self._extract_first_valid(record, plan.generic_candidates['path'], extraction_attempts)
         
         if not hash_value:
-            hash_value = self._extract_with_prioritization(record, record_keys_lower, self.hash_field_patterns, extraction_attempts)
+            hash_value = self._extract_first_valid(record, plan.generic_candidates['hash'], extraction_attempts)
         
         # STEP 3: Smart field discovery - look for fields containing key terms
         if not name:
-            name = self._smart_field_discovery(record, record_keys_lower, 'name')
+            name = self._smart_field_discovery(record, plan.smart_keys['name'], 'name')
         
         if not path:
-            path = self._smart_field_discovery(record, record_keys_lower, 'path')
+            path = self._smart_field_discovery(record, plan.smart_keys['path'], 'path')
         
+        # STEPS 4-6 only depend on the extracted values and are memoized
+        fields_key = (name, path, hash_value)
+        resolved = self._normalization_memos['identity_fields'].entries.get(fields_key, _MISSING) if not self.debug_mode else _MISSING
+        if resolved is _MISSING:
+            resolved = self._cached_normalization('identity_fields', fields_key, self._resolve_identity_fields, name, path, hash_value)
+        else:
+            self.normalization_stats.hits['identity_fields'] += 1
+            # Replay the validation statistics of the cached result
+            for reason in resolved[4]:
+                self.identity_validator.record_filtered(reason)
+        name, path, hash_value, identity_type, _filtered_reasons = resolved
+        
+        # STEP 7: Check if all fields are invalid - skip record
+        # Requirements: 8.6 - Skip records with all-invalid fields
+        if not any([name, path, hash_value]):
+            # Log validation failure with field details
+            # Requirements: 8.8 - Validation logging with field names and reasons
+            if self.debug_mode:
+                print(f"[Identity Engine] ⚠️ Skipped record: No valid identity fields")
+                print(f"    Artifact: {artifact_type}")
+                print(f"    Extraction attempts:")
+                for field_name, value, is_valid, reason in extraction_attempts[:5]:  # Show first 5
+                    status = "✓" if is_valid else "✗"
+                    print(f"      {status} {field_name}: '{value[:50]}...' {f'({reason})' if not is_valid else ''}")
+            
+            # Return empty values to signal skip
+            return "", "", "", "name"
+        
+        if self.debug_mode:
+            print(f"[DEBUG] Extracted identity: name='{name}', path='{path}', hash='{hash_value}', type='{identity_type}' (artifact={artifact_type})")
+        
+        return name, path, hash_value, identity_type
+    
+    def _resolve_identity_fields(self, name: str, path: str, hash_value: str) -> Tuple[str, str, str, str, Tuple[str, ...]]:
+        """
+        Steps 4-6 of extract_identity_info(): derive and validate the final values.
+        
+        Args:
+            name: Extracted name
+            path: Extracted path
+            hash_value: Extracted hash
+        
+        Returns:
+            Tuple of (name, path, hash, identity_type, reasons of the values
+            filtered by the validator)
+        """
         # STEP 4: Extract filename from path if path is too generic
         # Requirements: 8.3 - Path-to-filename extraction for generic paths
         if path and not name:
@@ -730,76 +763,144 @@ class IdentityCorrelationEngine:
         
         # STEP 6: Final validation of extracted values
         # Requirements: 8.2 - Apply validation rules
-        if name:
-            validated_name = self.identity_validator.validate_and_filter(
-                name, 
-                log_filtered=self.debug_mode
-            )
-            if validated_name is None:
-                name = ""  # Clear invalid name
+        filtered_reasons = []
+        validated = []
+        for value in (name, path, hash_value):
+            if value:
+                is_valid, reason = self.identity_validator.is_valid_identity(value)
+                if not is_valid:
+                    self.identity_validator.record_filtered(reason, value, log_filtered=self.debug_mode)
+                    filtered_reasons.append(reason)
+                    value = ""  # Clear invalid value
+            validated.append(value)
+        name, path, hash_value = validated
         
-        if path:
-            validated_path = self.identity_validator.validate_and_filter(
-                path,
-                log_filtered=self.debug_mode
-            )
-            if validated_path is None:
-                path = ""  # Clear invalid path
+        # Determine identity type based on available fields
+        identity_type = self._determine_identity_type(name, path, hash_value)
         
-        if hash_value:
-            validated_hash = self.identity_validator.validate_and_filter(
-                hash_value,
-                log_filtered=self.debug_mode
-            )
-            if validated_hash is None:
-                hash_value = ""  # Clear invalid hash
+        return name, path, hash_value, identity_type, tuple(filtered_reasons)
+    
+    def _get_column_role_plan(self, record: Dict[str, Any], artifact_type: str) -> _ColumnRolePlan:
+        """Column role plan of a record's schema (built on first use)."""
+        plan_key = (artifact_type, tuple(record))
+        plan = self._column_plans.get(plan_key)
+        if plan is None:
+            if len(self._column_plans) >= MAX_COLUMN_ROLE_PLANS:
+                self._column_plans.clear()
+            plan = self._build_column_role_plan(artifact_type, list(record))
+            self._column_plans[plan_key] = plan
+        return plan
+    
+    def _build_column_role_plan(self, artifact_type: str, columns: List[str]) -> _ColumnRolePlan:
+        """
+        Resolve which columns of a schema can hold the identity name, path and hash.
         
-        # STEP 7: Check if all fields are invalid - skip record
-        # Requirements: 8.6 - Skip records with all-invalid fields
-        if not any([name, path, hash_value]):
-            # Log validation failure with field details
-            # Requirements: 8.8 - Validation logging with field names and reasons
-            if self.debug_mode:
-                print(f"[Identity Engine] ⚠️ Skipped record: No valid identity fields")
-                print(f"    Artifact: {artifact_type}")
-                print(f"    Extraction attempts:")
-                for field_name, value, is_valid, reason in extraction_attempts[:5]:  # Show first 5
-                    status = "✓" if is_valid else "✗"
-                    print(f"      {status} {field_name}: '{value[:50]}...' {f'({reason})' if not is_valid else ''}")
-            
-            # Return empty values to signal skip
-            return "", "", "", "name"
+        Args:
+            artifact_type: 'artifact' value of the records
+            columns: Column names of the records
         
-        # Determine identity type based on available fields
-        identity_type = self._determine_identity_type(name, path, hash_value)
+        Returns:
+            _ColumnRolePlan of the schema
+        """
+        present = set(columns)
+        # Lowercase key map for case-insensitive lookup
+        record_keys_lower = {column.lower(): column for column in columns}
+        
+        def candidates(field_patterns: List[str], with_field_name: bool = True) -> List[Tuple]:
+            resolved = []
+            for field in field_patterns:
+                exact_key = field if field in present else None
+                ci_key = record_keys_lower.get(field.lower())
+                if ci_key == exact_key:
+                    # Only reached when the exact column is empty
+                    ci_key = None
+                if exact_key is None and ci_key is None:
+                    continue
+                resolved.append((
+                    exact_key, exact_key if with_field_name else None,
+                    ci_key, ci_key if with_field_name else None
+                ))
+            return resolved
+        
+        plan = _ColumnRolePlan()
+        
+        mapping = self.artifact_field_mappings.get(artifact_type.replace(' ', ''))
+        if mapping is not None:
+            plan.artifact_candidates = {
+                'name': candidates(mapping.get('name', [])),
+                'path': candidates(mapping.get('path', [])),
+                # Artifact hash fields are validated without field context
+                'hash': candidates(mapping.get('hash', []), with_field_name=False)
+            }
+        
+        plan.generic_candidates = {
+            'name': candidates(self.name_field_patterns),
+            'path': candidates(self.path_field_patterns),
+            'hash': candidates(self.hash_field_patterns)
+        }
         
+        # Score each field name by the key terms it contains
+        for field_type, terms in (('name', SMART_NAME_TERMS), ('path', SMART_PATH_TERMS)):
+            plan.smart_keys[field_type] = [
+                (actual_key, 10 * sum(1 for term in terms if term in key_lower))
+                for key_lower, actual_key in record_keys_lower.items()
+            ]
+        
+        return plan
+    
+    def _cached_normalization(self, kind: str, key: Any, compute, *args) -> Any:
+        """
+        Result of compute(*args), memoized under key in the normalization cache.
+        
+        Args:
+            kind: Kind of result (one of NORMALIZATION_KINDS)
+            key: Raw values the result only depends on
+            compute: Uncached computation
+            *args: Arguments of compute
+        """
         if self.debug_mode:
-            print(f"[DEBUG] Extracted identity: name='{name}', path='{path}', hash='{hash_value}', type='{identity_type}' (artifact={artifact_type})")
+            return compute(*args)
         
-        return name, path, hash_value, identity_type
+        memo = self._normalization_memos[kind]
+        value = memo.entries.get(key, _MISSING)
+        if value is not _MISSING:
+            self.normalization_stats.hits[kind] += 1
+            return value
+        
+        started = time.perf_counter()
+        value = compute(*args)
+        self.normalization_stats.record_miss(kind, time.perf_counter() - started)
+        return memo.store(key, value)
     
-    def _smart_field_discovery(self, record: Dict[str, Any], record_keys_lower: Dict[str, str], field_type: str) -> str:
+    def get_normalization_statistics(self) -> Dict[str, Any]:
+        """
+        Get identity normalization cache statistics.
+        
+        Returns:
+            Dictionary with hits, misses, hit_rate, estimated_seconds_saved,
+            per-kind counts, column_role_plans and cached_entries
+        """
+        stats = self.normalization_stats.to_dict()
+        stats['column_role_plans'] = len(self._column_plans)
+        stats['cached_entries'] = self.normalization_cache.entry_count()
+        return stats
+    
+    def _smart_field_discovery(self, record: Dict[str, Any], key_scores: List[Tuple[str, int]], field_type: str) -> str:
         """
         Smart field discovery - find fields by analyzing field names for key terms.
         
         Args:
             record: The record to search
-            record_keys_lower: Lowercase key mapping
+            key_scores: (column, field name score) of the record's columns
+                (from the column role plan)
             field_type: 'name' or 'path'
         
         Returns:
             Extracted value or empty string
         """
-        # Key terms that indicate name fields
-        name_terms = ['name', 'file', 'exe', 'app', 'program', 'process', 'source', 'target', 'image', 'binary', 'module']
-        # Key terms that indicate path fields
-        path_terms = ['path', 'location', 'directory', 'folder', 'dir', 'full', 'reconstructed']
-        
-        terms = name_terms if field_type == 'name' else path_terms
-        
         # Score each field by how likely it contains identity info
         candidates = []
-        for key_lower, actual_key in record_keys_lower.items():
+        for actual_key, key_score in key_scores:
             value = record.get(actual_key)
             if not value or not isinstance(value, str):
                 continue
@@ -809,10 +910,7 @@ class IdentityCorrelationEngine:
                 continue
             
             # Score based on field name
-            score = 0
-            for term in terms:
-                if term in key_lower:
-                    score += 10
+            score = key_score
             
             # For name fields, prefer values that look like filenames
             if field_type == 'name':
@@ -859,10 +957,9 @@ class IdentityCorrelationEngine:
         
         return ""
     
-    def _extract_with_prioritization(self, record: Dict[str, Any], record_keys_lower: Dict[str, str], 
-                                    field_patterns: List[str], extraction_attempts: List) -> str:
+    def _extract_first_valid(self, record: Dict[str, Any], candidates: List[Tuple], extraction_attempts: List) -> str:
         """
-        Extract value from record using prioritized field patterns with validation.
+        Extract value from record using prioritized field candidates with validation.
         
         ENHANCED: Now passes field names to validator for context-aware validation.
         
@@ -870,38 +967,36 @@ class IdentityCorrelationEngine:
         
         Args:
             record: Record to extract from
-            record_keys_lower: Lowercase key mapping
-            field_patterns: List of field patterns in priority order
+            candidates: (exact_key, exact_label, ci_key, ci_label) of the
+                field patterns in priority order (from the column role plan)
             extraction_attempts: List to track extraction attempts
         
         Returns:
             Extracted and validated value, or empty string
         """
-        for field_pattern in field_patterns:
+        for exact_key, exact_label, ci_key, ci_label in candidates:
             # Try exact match
-            if field_pattern in record and record[field_pattern]:
-                extracted_value = str(record[field_pattern])
-                is_valid, reason = self.identity_validator.is_valid_identity(extracted_value, field_name=field_pattern)
-                extraction_attempts.append((field_pattern, extracted_value, is_valid, reason))
+            if exact_key is not None and record[exact_key]:
+                extracted_value = str(record[exact_key])
+                is_valid, reason = self.identity_validator.is_valid_identity(extracted_value, field_name=exact_label)
+                extraction_attempts.append((exact_key, extracted_value, is_valid, reason))
                 
                 if is_valid:
                     return extracted_value
                 elif self.debug_mode:
-                    print(f"[Identity Engine] ⚠️ Rejected field '{field_pattern}': '{extracted_value}' (reason: {reason})")
+                    print(f"[Identity Engine] ⚠️ Rejected field '{exact_key}': '{extracted_value}' (reason: {reason})")
                 continue
                 
             # Try case-insensitive match
-            if field_pattern.lower() in record_keys_lower:
-                actual_key = record_keys_lower[field_pattern.lower()]
-                if record.get(actual_key):
-                    extracted_value = str(record[actual_key])
-                    is_valid, reason = self.identity_validator.is_valid_identity(extracted_value, field_name=actual_key)
-                    extraction_attempts.append((actual_key, extracted_value, is_valid, reason))
-                    
-                    if is_valid:
-                        return extracted_value
-                    elif self.debug_mode:
-                        print(f"[Identity Engine] ⚠️ Rejected field '{actual_key}': '{extracted_value}' (reason: {reason})")
+            if ci_key is not None and record[ci_key]:
+                extracted_value = str(record[ci_key])
+                is_valid, reason = self.identity_validator.is_valid_identity(extracted_value, field_name=ci_label)
+                extraction_attempts.append((ci_key, extracted_value, is_valid, reason))
+                
+                if is_valid:
+                    return extracted_value
+                elif self.debug_mode:
+                    print(f"[Identity Engine] ⚠️ Rejected field '{ci_key}': '{extracted_value}' (reason: {reason})")
         
         return ""
     
@@ -1103,6 +1198,10 @@ class IdentityCorrelationEngine:
         Returns:
             Primary display name (normalized application name)
         """
+        return self._cached_normalization('primary_name', (name, path), self._derive_primary_name, name, path)
+    
+    def _derive_primary_name(self, name: str, path: str) -> str:
+        """Uncached extract_primary_name()."""
         raw_name = ""
         
         # If we have a direct name, use it
@@ -1335,6 +1434,9 @@ class IdentityMatcher:
     Flexible identity matching with multiple strategies.
     
     Implements exact match, partial path match, hash match, and fuzzy name matching.
+    
+    Fuzzy matching of many identities is done in bulk by find_fuzzy_groups(),
+    which only compares blocked candidates (see identity_fuzzy_matching).
     """
     
     def __init__(self, debug_mode: bool = False):
@@ -1345,6 +1447,7 @@ class IdentityMatcher:
             debug_mode: Enable debug logging
         """
         self.debug_mode = debug_mode
+        self.last_fuzzy_statistics: Optional[FuzzyMatchStatistics] = None
     
     def calculate_path_similarity(self, path1: str, path2: str) -> float:
         """
@@ -1388,19 +1491,25 @@ class IdentityMatcher:
         
         return similarity
     
-    def calculate_edit_distance(self, str1: str, str2: str) -> int:
+    def calculate_edit_distance(self, str1: str, str2: str, max_distance: Optional[int] = None) -> int:
         """
         Calculate Levenshtein edit distance between two strings.
         
         Args:
             str1: First string
             str2: Second string
+            max_distance: Optional bound; the computation stops once the
+                distance exceeds it
         
         Returns:
-            Edit distance (number of edits needed)
+            Edit distance (number of edits needed), or max_distance + 1 if
+            it exceeds max_distance
         
         Requirements: 5.4
         """
+        if max_distance is not None:
+            return bounded_edit_distance(str1 or "", str2 or "", max_distance)
+        
         if not str1:
             return len(str2)
         if not str2:
@@ -1429,6 +1538,37 @@ class IdentityMatcher:
                     )
         
         return dp[m][n]
+    
+    def find_fuzzy_groups(self, values: List[str], max_distance: int = 2,
+                          by_basename: bool = False, min_length: int = 5) -> List[List[str]]:
+        """
+        Group identity names or paths within an edit distance of each other.
+        
+        Args:
+            values: Distinct identity names or paths
+            max_distance: Largest edit distance between two merged values
+            by_basename: Only compare paths with the same file name
+            min_length: Shorter values are only merged when equal after
+                normalization (short names are too close to each other)
+        
+        Returns:
+            Merge groups of two or more values
+        """
+        stats = FuzzyMatchStatistics()
+        groups = fuzzy_merge_groups(
+            values,
+            max_distance=max_distance,
+            block_key=basename_block_key if by_basename else None,
+            min_length=min_length,
+            stats=stats
+        )
+        self.last_fuzzy_statistics = stats
+        
+        if self.debug_mode:
+            print(f"[DEBUG] Fuzzy matching: {stats.distinct_values} values, {stats.blocks} blocks, "
+                  f"{stats.candidate_pairs} candidate pairs, {stats.merge_groups} merge groups")
+        
+        return groups
 
 
 
@@ -1448,7 +1588,8 @@ class IdentityBasedCorrelationEngine:
     
     def __init__(self, time_window_minutes: int = 180, debug_mode: bool = False, 
                  semantic_mapper: Optional[Any] = None, scoring_engine: Optional[Any] = None,
-                 semantic_rule_evaluator: Optional[SemanticRuleEvaluator] = None):
+                 semantic_rule_evaluator: Optional[SemanticRuleEvaluator] = None,
+                 fuzzy_match_distance: int = 0):
         """
         Initialize Identity-Based Correlation Engine.
         
@@ -1458,9 +1599,12 @@ class IdentityBasedCorrelationEngine:
             semantic_mapper: Optional semantic mapping integration for enriching evidence
             scoring_engine: Optional weighted scoring engine for calculating match scores
             semantic_rule_evaluator: Optional semantic rule evaluator for identity-level semantic results
+            fuzzy_match_distance: Merge identities whose keys are within this
+                edit distance (0 disables fuzzy consolidation)
         """
         self.time_window_minutes = time_window_minutes
         self.debug_mode = debug_mode
+        self.fuzzy_match_distance = fuzzy_match_distance
         
         # Core components
         self.identity_engine = IdentityCorrelationEngine(debug_mode=debug_mode)
@@ -1556,6 +1700,10 @@ class IdentityBasedCorrelationEngine:
             self._extract_and_cluster_identities(records)
             print(f"[Identity Engine] Step 1: Extracted {len(self.identities)} unique identities")
             
+            # Optional fuzzy consolidation of near-identical identities
+            if self.fuzzy_match_distance > 0:
+                self._merge_fuzzy_identities()
+            
             # Check for cancellation after identity extraction
             self.check_cancellation()
             
@@ -1745,6 +1893,9 @@ class IdentityBasedCorrelationEngine:
         print(f"  Total Records Processed: {processed_count:,}")
         print(f"  Records Skipped (no identity): {skipped_no_identity:,}")
         print(f"  Unique Identities Found: {len(self.identities):,}")
+        normalization_stats = self.identity_engine.normalization_stats
+        print(f"  Normalization Cache: {normalization_stats.hit_rate:.1%} hit rate "
+              f"(~{normalization_stats.estimated_seconds_saved:.2f}s saved)")
         
         # Report filtering statistics with validation details
         # Requirements: 8.7 - Validation logging with counts
@@ -1880,6 +2031,41 @@ class IdentityBasedCorrelationEngine:
         self.stats.total_identities = len(self.identities)
         self.stats.total_evidence = processed_count
     
+    def _merge_fuzzy_identities(self):
+        """
+        Merge identities whose keys are within fuzzy_match_distance edits.
+        
+        Each merge group keeps the identity with the most evidence; the
+        evidence of the others is moved to it and their keys are recorded
+        in its metadata.
+        """
+        groups = self.identity_matcher.find_fuzzy_groups(
+            list(self.identities.keys()), max_distance=self.fuzzy_match_distance
+        )
+        
+        merged_count = 0
+        for group in groups:
+            survivor_key = max(group, key=lambda key: self.identities[key].total_evidence)
+            survivor = self.identities[survivor_key]
+            merged_keys = []
+            for key in group:
+                if key == survivor_key:
+                    continue
+                for evidence in self.identities.pop(key).all_evidence:
+                    evidence.match_method = "fuzzy"
+                    survivor.add_evidence(evidence)
+                merged_keys.append(key)
+            survivor.match_method = "fuzzy"
+            survivor.metadata.setdefault('fuzzy_merged_keys', []).extend(merged_keys)
+            merged_count += len(merged_keys)
+        
+        self.stats.fuzzy_merged_identities = merged_count
+        self.stats.total_identities = len(self.identities)
+        
+        fuzzy_stats = self.identity_matcher.last_fuzzy_statistics
+        print(f"[Identity Engine] Fuzzy matching: merged {merged_count} identities into {len(groups)} groups "
+              f"({fuzzy_stats.candidate_pairs:,} candidate pairs compared)")
+    
     def _create_evidence_row(self, record: Dict[str, Any], identity: Identity) -> EvidenceRow:
         """
         Create an EvidenceRow from a forensic record.
@@ -2114,38 +2300,14 @@ class IdentityBasedCorrelationEngine:
             print(f"[Identity Engine] Clustering {len(all_timestamped_evidence)} timestamped records")
             
             # Step 3: Create time-based clusters (global time windows)
-            time_clusters = []
-            current_cluster = []
-            cluster_start_time = None
-            
-            for evidence in all_timestamped_evidence:
-                if not current_cluster:
-                    # Start new cluster
-                    current_cluster = [evidence]
-                    cluster_start_time = evidence.timestamp
-                else:
-                    # Check if evidence fits in current cluster's time window
-                    try:
-                        time_diff = (evidence.timestamp - cluster_start_time).total_seconds() / 60.0
-                    except TypeError:
-                        # Skip this evidence if timestamp comparison fails
-                        continue
-                    
-                    if time_diff <= self.time_window_minutes:
-                        # Add to current cluster
-                        current_cluster.append(evidence)
-                    else:
-                        # Save current cluster and start new one
-                        if current_cluster:
-                            time_clusters.append(current_cluster)
-                        current_cluster = [evidence]
-                        cluster_start_time = evidence.timestamp
-            
-            # Don't forget the last cluster
-            if current_cluster:
-                time_clusters.append(current_cluster)
+            # Each cluster spans the time window from its first record; boundaries
+            # are found by binary search on epoch microseconds
+            timestamps_us = naive_epoch_microseconds([evidence.timestamp for evidence in all_timestamped_evidence])
+            cluster_starts, cluster_ends = start_cluster_offsets(
+                timestamps_us, window_microseconds(self.time_window_minutes)
+            )
             
-            print(f"[Identity Engine] Created {len(time_clusters)} time clusters")
+            print(f"[Identity Engine] Created {len(cluster_starts)} time clusters")
             
         except Exception as e:
             print(f"[Identity Engine] ERROR in temporal anchor creation: {type(e).__name__}: {str(e)}")
@@ -2158,55 +2320,43 @@ class IdentityBasedCorrelationEngine:
         total_anchors = 0
         multi_feather_anchors = 0
         
-        for cluster in time_clusters:
-            # Group evidence in this cluster by identity
-            identity_groups = {}
-            for evidence in cluster:
-                evidence_id = id(evidence)
-                identity = identity_map.get(evidence_id)
-                if identity:
-                    if identity.identity_id not in identity_groups:
-                        identity_groups[identity.identity_id] = {
-                            'identity': identity,
-                            'evidence': []
-                        }
-                    identity_groups[identity.identity_id]['evidence'].append(evidence)
-            
-            # Create an anchor for each identity in this time cluster
-            for identity_id, group in identity_groups.items():
-                identity = group['identity']
-                evidence_list = group['evidence']
-                
-                if not evidence_list:
-                    continue
-                
-                # Sort evidence by timestamp within the group
-                evidence_list.sort(key=lambda e: e.timestamp)
+        # Integer code per identity, then one batched split of every cluster by identity
+        identity_codes = {}
+        evidence_identities = []
+        for evidence in all_timestamped_evidence:
+            identity = identity_map[id(evidence)]
+            evidence_identities.append(identity_codes.setdefault(identity.identity_id, len(identity_codes)))
+        
+        for group in group_clusters_by_key(evidence_identities, cluster_starts, cluster_ends):
+            # Group members keep their time order
+            evidence_list = [all_timestamped_evidence[index] for index in group]
+            identity = identity_map[id(evidence_list[0])]
+            identity_id = identity.identity_id
+            
+            # Create anchor
+            anchor = Anchor(
+                identity_id=identity_id,
+                start_time=evidence_list[0].timestamp,
+                end_time=evidence_list[-1].timestamp
+            )
                 
-                # Create anchor
-                anchor = Anchor(
-                    identity_id=identity_id,
-                    start_time=evidence_list[0].timestamp,
-                    end_time=evidence_list[-1].timestamp
-                )
+            # Add all evidence to anchor
+            feathers_in_anchor = set()
+            for evidence in evidence_list:
+                anchor.add_evidence(evidence)
+                evidence.anchor_id = anchor.anchor_id
+                if hasattr(evidence, 'feather_id'):
+                    feathers_in_anchor.add(evidence.feather_id)
                 
-                # Add all evidence to anchor
-                feathers_in_anchor = set()
-                for evidence in evidence_list:
-                    anchor.add_evidence(evidence)
-                    evidence.anchor_id = anchor.anchor_id
-                    if hasattr(evidence, 'feather_id'):
-                        feathers_in_anchor.add(evidence.feather_id)
+            # Store feathers in anchor
+            anchor.feather_ids = list(feathers_in_anchor)
+            if len(feathers_in_anchor) > 1:
+                multi_feather_anchors += 1
                 
-                # Store feathers in anchor
-                anchor.feather_ids = list(feathers_in_anchor)
-                if len(feathers_in_anchor) > 1:
-                    multi_feather_anchors += 1
-                
-                # Add anchor to identity
-                identity.anchors.append(anchor)
-                identity.total_anchors = len(identity.anchors)
-                total_anchors += 1
+            # Add anchor to identity
+            identity.anchors.append(anchor)
+            identity.total_anchors = len(identity.anchors)
+            total_anchors += 1
         
         self.stats.total_anchors = total_anchors
         
@@ -2216,6 +2366,9 @@ class IdentityBasedCorrelationEngine:
         """
         Cluster evidence by time windows to create anchors.
         
+        A new anchor starts wherever the gap to the previous evidence exceeds
+        the time window; boundaries come from one vectorized diff.
+        
         Args:
             evidence_list: Sorted list of timestamped evidence
             identity_id: ID of the identity this evidence belongs to
@@ -2226,38 +2379,21 @@ class IdentityBasedCorrelationEngine:
         if not evidence_list:
             return []
         
-        anchors = []
-        current_anchor = None
-        
-        for evidence in evidence_list:
-            if current_anchor is None:
-                # Start new anchor
-                current_anchor = Anchor(
-                    identity_id=identity_id,
-                    start_time=evidence.timestamp,
-                    end_time=evidence.timestamp
-                )
-                current_anchor.add_evidence(evidence)
-            else:
-                # Check if evidence fits in current anchor's time window
-                time_diff = (evidence.timestamp - current_anchor.end_time).total_seconds() / 60.0
-                
-                if time_diff <= self.time_window_minutes:
-                    # Add to current anchor
-                    current_anchor.add_evidence(evidence)
-                else:
-                    # Close current anchor and start new one
-                    anchors.append(current_anchor)
-                    current_anchor = Anchor(
-                        identity_id=identity_id,
-                        start_time=evidence.timestamp,
-                        end_time=evidence.timestamp
-                    )
-                    current_anchor.add_evidence(evidence)
+        timestamps_us = naive_epoch_microseconds([evidence.timestamp for evidence in evidence_list])
+        anchor_starts, anchor_ends = gap_cluster_offsets(
+            timestamps_us, [0, len(evidence_list)], window_microseconds(self.time_window_minutes)
+        )
         
-        # Add final anchor
-        if current_anchor:
-            anchors.append(current_anchor)
+        anchors = []
+        for start, end in zip(anchor_starts, anchor_ends):
+            anchor = Anchor(
+                identity_id=identity_id,
+                start_time=evidence_list[start].timestamp,
+                end_time=evidence_list[start].timestamp
+            )
+            for evidence in evidence_list[start:end]:
+                anchor.add_evidence(evidence)
+            anchors.append(anchor)
         
         return anchors
     
@@ -2671,6 +2807,13 @@ class IdentityBasedCorrelationEngine:
             elif self.debug_mode:
                 print(f"[Identity Engine] 📊 Total feather data size: {size_mb:.2f} MB")
         
+        # Identity normalization cache effectiveness
+        normalization_stats = self.identity_engine.normalization_stats
+        self.stats.normalization_cache_hits = normalization_stats.total_hits
+        self.stats.normalization_cache_misses = normalization_stats.total_misses
+        self.stats.normalization_cache_hit_rate = normalization_stats.hit_rate
+        self.stats.normalization_seconds_saved = normalization_stats.estimated_seconds_saved
+        
         # Update correlation results with final statistics
         self.correlation_results.statistics = self.stats
 
@@ -2805,7 +2948,8 @@ class IdentityBasedEngineAdapter:
             time_window_minutes=time_window_minutes,
             debug_mode=debug_mode,
             semantic_mapper=mapping_integration,
-            scoring_engine=scoring_integration
+            scoring_engine=scoring_integration,
+            fuzzy_match_distance=int(getattr(config, 'fuzzy_match_distance', 0) or 0)
         )
         
         # Store last result
@@ -2961,7 +3105,9 @@ class IdentityBasedEngineAdapter:
             'identities_found': stats.total_identities,
             'anchors_created': stats.total_anchors,
             'evidence_with_anchors': stats.evidence_with_anchors,
-            'evidence_without_anchors': stats.evidence_without_anchors
+            'evidence_without_anchors': stats.evidence_without_anchors,
+            'normalization_cache_hit_rate': stats.normalization_cache_hit_rate,
+            'normalization_seconds_saved': stats.normalization_seconds_saved
         }
     
     def _load_records_from_wing(self, wing) -> List[Dict[str, Any]]:
@@ -0,0 +1,263 @@
+"""
+Blocked Fuzzy Identity Matching
+
+Comparing every pair of distinct identities with a full edit distance is
+quadratic in the number of identities and in the string lengths, which rules
+out fuzzy consolidation on cases with hundreds of thousands of executable
+paths. fuzzy_merge_groups() only compares candidates that can still be within
+the distance:
+- values are split into blocks (e.g. by normalized basename for paths) and
+  are only compared within their block
+- inside a block, a q-gram inverted index finds candidates: two strings
+  within edit distance k share a q-gram among the first k*q+1 q-grams of
+  each, with q-grams ordered from rare to frequent (prefix filtering), so
+  only these prefixes are indexed and common q-grams like "c:/" are mostly
+  left out
+- strings too short to have such a prefix are compared within a length band
+- candidates are verified with bounded_edit_distance(), a banded Levenshtein
+  distance that stops as soon as the distance exceeds the bound
+
+Matching pairs are joined with a union-find and returned as merge groups.
+"""
+
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Sequence
+
+# q-gram length of the candidate index
+DEFAULT_QGRAM = 3
+
+
+def normalize_fuzzy_value(value: str) -> str:
+    """Lowercase a name or path and use forward slashes"""
+    return value.replace("\\", "/").lower().strip().strip("/")
+
+
+def basename_block_key(value: str) -> str:
+    """Block key of a normalized path: its last component"""
+    return value.rsplit("/", 1)[-1]
+
+
+def bounded_edit_distance(str1: str, str2: str, max_distance: int) -> int:
+    """
+    Levenshtein distance, computed only up to a bound.
+
+    Args:
+        str1: First string
+        str2: Second string
+        max_distance: Largest distance of interest
+
+    Returns:
+        The edit distance, or max_distance + 1 if it exceeds max_distance
+    """
+    if str1 == str2:
+        return 0
+    cutoff = max_distance + 1
+    if abs(len(str1) - len(str2)) > max_distance:
+        return cutoff
+
+    # Common prefix and suffix do not change the distance
+    start = 0
+    end1, end2 = len(str1), len(str2)
+    while start < end1 and start < end2 and str1[start] == str2[start]:
+        start += 1
+    while end1 > start and end2 > start and str1[end1 - 1] == str2[end2 - 1]:
+        end1 -= 1
+        end2 -= 1
+    str1, str2 = str1[start:end1], str2[start:end2]
+    if len(str1) > len(str2):
+        str1, str2 = str2, str1
+    m, n = len(str1), len(str2)
+    if m == 0:
+        return n if n <= max_distance else cutoff
+
+    # Only cells within max_distance of the diagonal can stay within the bound
+    previous = [j if j <= max_distance else cutoff for j in range(n + 1)]
+    for i in range(1, m + 1):
+        current = [cutoff] * (n + 1)
+        if i <= max_distance:
+            current[0] = i
+        row_min = current[0]
+        char1 = str1[i - 1]
+        for j in range(max(1, i - max_distance), min(n, i + max_distance) + 1):
+            value = previous[j - 1] if char1 == str2[j - 1] else previous[j - 1] + 1
+            if previous[j] + 1 < value:
+                value = previous[j] + 1
+            if current[j - 1] + 1 < value:
+                value = current[j - 1] + 1
+            current[j] = value if value < cutoff else cutoff
+            if value < row_min:
+                row_min = value
+        if row_min > max_distance:
+            return cutoff
+        previous = current
+
+    return previous[n] if previous[n] <= max_distance else cutoff
+
+
+def _qgrams(value: str, q: int) -> List[str]:
+    """q-grams of a string, numbered by occurrence so that each is unique"""
+    seen: Dict[str, int] = {}
+    grams = []
+    for i in range(len(value) - q + 1):
+        gram = value[i:i + q]
+        occurrence = seen.get(gram, 0)
+        seen[gram] = occurrence + 1
+        grams.append(f"{gram}{occurrence}" if occurrence else gram)
+    return grams
+
+
+class _UnionFind:
+    """Disjoint sets over value indices"""
+
+    __slots__ = ('parent',)
+
+    def __init__(self, size: int):
+        self.parent = list(range(size))
+
+    def find(self, index: int) -> int:
+        parent = self.parent
+        while parent[index] != index:
+            parent[index] = parent[parent[index]]
+            index = parent[index]
+        return index
+
+    def union(self, first: int, second: int) -> bool:
+        root1, root2 = self.find(first), self.find(second)
+        if root1 == root2:
+            return False
+        if root2 < root1:
+            root1, root2 = root2, root1
+        self.parent[root2] = root1
+        return True
+
+
+@dataclass
+class FuzzyMatchStatistics:
+    """Work done by one fuzzy_merge_groups() call"""
+    values: int = 0
+    distinct_values: int = 0
+    blocks: int = 0
+    candidate_pairs: int = 0
+    verified_pairs: int = 0
+    merge_groups: int = 0
+
+
+def fuzzy_merge_groups(values: Sequence[str], max_distance: int = 2,
+                       block_key: Optional[Callable[[str], str]] = None,
+                       q: int = DEFAULT_QGRAM, min_length: int = 1,
+                       stats: Optional[FuzzyMatchStatistics] = None) -> List[List[str]]:
+    """
+    Group values that are within an edit distance of each other.
+
+    Values are compared after normalize_fuzzy_value(); groups are transitive
+    (a ~ b and b ~ c puts a, b and c in one group).
+
+    Args:
+        values: Identity names or paths
+        max_distance: Largest edit distance between two merged values
+        block_key: Function of a normalized value; only values with the same
+            key are compared (None compares all values)
+        q: q-gram length of the candidate index
+        min_length: Normalized values shorter than this are only merged with
+            values they equal after normalization
+        stats: Optional statistics updated with the work done
+
+    Returns:
+        Merge groups of two or more original values, each in input order,
+        ordered by their first value
+    """
+    stats = stats if stats is not None else FuzzyMatchStatistics()
+    stats.values += len(values)
+
+    # Values equal after normalization are merged without comparison
+    normalized_index: Dict[str, int] = {}
+    value_slots: List[int] = []
+    distinct: List[str] = []
+    for value in values:
+        normalized = normalize_fuzzy_value(value or "")
+        slot = normalized_index.get(normalized)
+        if slot is None:
+            slot = normalized_index[normalized] = len(distinct)
+            distinct.append(normalized)
+        value_slots.append(slot)
+    stats.distinct_values += len(distinct)
+
+    union_find = _UnionFind(len(distinct))
+    if max_distance > 0:
+        blocks: Dict[str, List[int]] = defaultdict(list)
+        for slot, normalized in enumerate(distinct):
+            if len(normalized) >= max(min_length, 1):
+                blocks[block_key(normalized) if block_key else ""].append(slot)
+        for members in blocks.values():
+            if len(members) > 1:
+                stats.blocks += 1
+                _match_block(distinct, members, max_distance, q, union_find, stats)
+
+    grouped: Dict[int, List[str]] = {}
+    for value, slot in zip(values, value_slots):
+        grouped.setdefault(union_find.find(slot), []).append(value)
+    groups = [members for members in grouped.values() if len(members) > 1]
+    stats.merge_groups += len(groups)
+    return groups
+
+
+def _match_block(distinct: List[str], members: List[int], max_distance: int, q: int,
+                 union_find: _UnionFind, stats: FuzzyMatchStatistics):
+    """Union the members of one block that are within max_distance"""
+    prefix_length = max_distance * q + 1
+    member_grams = {slot: _qgrams(distinct[slot], q) for slot in members}
+
+    # Rare q-grams first, so that prefixes avoid the common ones
+    frequency: Dict[str, int] = defaultdict(int)
+    for grams in member_grams.values():
+        for gram in grams:
+            frequency[gram] += 1
+
+    short_members: List[int] = []
+    index: Dict[str, List[int]] = defaultdict(list)
+    for slot in members:
+        grams = member_grams[slot]
+        if len(grams) < prefix_length:
+            # Within the distance without a common q-gram: compare by length
+            short_members.append(slot)
+            continue
+        grams.sort(key=lambda gram: (frequency[gram], gram))
+        candidates = set()
+        for gram in grams[:prefix_length]:
+            postings = index[gram]
+            candidates.update(postings)
+            postings.append(slot)
+        _verify(distinct, slot, candidates, max_distance, union_find, stats)
+
+    if short_members:
+        # Short strings against every member of a close enough length
+        by_length: Dict[int, List[int]] = defaultdict(list)
+        for slot in members:
+            by_length[len(distinct[slot])].append(slot)
+        short_set = set(short_members)
+        for slot in short_members:
+            length = len(distinct[slot])
+            candidates = set()
+            for other_length in range(max(0, length - max_distance), length + max_distance + 1):
+                for other in by_length.get(other_length, ()):
+                    # Pairs of two short strings are compared once
+                    if other != slot and (other not in short_set or other < slot):
+                        candidates.add(other)
+            _verify(distinct, slot, candidates, max_distance, union_find, stats)
+
+
+def _verify(distinct: List[str], slot: int, candidates, max_distance: int,
+            union_find: _UnionFind, stats: FuzzyMatchStatistics):
+    """Union a value with the candidates within max_distance"""
+    value = distinct[slot]
+    for other in candidates:
+        if union_find.find(other) == union_find.find(slot):
+            continue
+        other_value = distinct[other]
+        if abs(len(other_value) - len(value)) > max_distance:
+            continue
+        stats.candidate_pairs += 1
+        if bounded_edit_distance(value, other_value, max_distance) <= max_distance:
+            stats.verified_pairs += 1
+            union_find.union(slot, other)
@@ -0,0 +1,155 @@
+"""
+Identity Normalization Cache
+
+Identity extraction runs the same string processing and regexes on every
+record, although the same names and paths recur across Prefetch, Amcache,
+ShimCache, LNK and SRUM feathers and across wings. IdentityCorrelationEngine
+memoizes these results in an IdentityNormalizationCache:
+- one bounded memo per kind of result (e.g. 'identity_key'), keyed by the
+  raw values it is computed from (name, path, hash)
+- memos are cleared when full, like the other per-value memos of the engine
+- result strings are interned, so identity keys shared by many records and
+  wings are stored once
+- by default all engines of a process share one cache (see
+  get_shared_normalization_cache())
+
+Cached results must only depend on their key; engines bypass the cache in
+debug mode so that per-record debug output is unchanged.
+
+Each engine counts its own hits and misses in NormalizationCacheStatistics,
+which also estimates the time saved from the measured cost of the misses.
+"""
+
+import sys
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Dict, Hashable
+
+# Entries kept per kind before the memo is cleared
+NORMALIZATION_CACHE_SIZE = 200000
+
+
+def intern_result(value: Any) -> Any:
+    """Intern the strings of a result (a string or a tuple of values)"""
+    if isinstance(value, str):
+        return sys.intern(value)
+    if isinstance(value, tuple):
+        return tuple(sys.intern(item) if isinstance(item, str) else item for item in value)
+    return value
+
+
+class NormalizationMemo:
+    """Bounded memo of one kind of normalization result"""
+
+    __slots__ = ('kind', 'entries', 'max_entries')
+
+    def __init__(self, kind: str, max_entries: int):
+        self.kind = kind
+        self.entries: Dict[Hashable, Any] = {}
+        self.max_entries = max_entries
+
+    def store(self, key: Hashable, value: Any) -> Any:
+        """Store a computed result and return it interned"""
+        value = intern_result(value)
+        if len(self.entries) >= self.max_entries:
+            self.entries.clear()
+        self.entries[key] = value
+        return value
+
+
+class IdentityNormalizationCache:
+    """
+    Normalization results shared by identity correlation engines.
+
+    Lookups and stores are plain dictionary operations, so engines running
+    in different threads can share a cache.
+    """
+
+    def __init__(self, max_entries: int = NORMALIZATION_CACHE_SIZE):
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries: Entries kept per kind before its memo is cleared
+        """
+        self.max_entries = max(1, max_entries)
+        self._memos: Dict[str, NormalizationMemo] = {}
+        self._lock = threading.Lock()
+
+    def memo(self, kind: str) -> NormalizationMemo:
+        """Memo of one kind of result (created on first use)"""
+        memo = self._memos.get(kind)
+        if memo is None:
+            with self._lock:
+                memo = self._memos.setdefault(kind, NormalizationMemo(kind, self.max_entries))
+        return memo
+
+    def entry_count(self) -> int:
+        """Results currently cached, over all kinds"""
+        return sum(len(memo.entries) for memo in list(self._memos.values()))
+
+    def clear(self):
+        """Drop all cached results"""
+        for memo in list(self._memos.values()):
+            memo.entries.clear()
+
+
+@dataclass
+class NormalizationCacheStatistics:
+    """Hits and misses of one engine's normalization lookups, per kind"""
+    hits: Dict[str, int] = field(default_factory=dict)
+    misses: Dict[str, int] = field(default_factory=dict)
+    miss_seconds: Dict[str, float] = field(default_factory=dict)
+
+    def record_miss(self, kind: str, seconds: float):
+        self.misses[kind] = self.misses.get(kind, 0) + 1
+        self.miss_seconds[kind] = self.miss_seconds.get(kind, 0.0) + seconds
+
+    @property
+    def total_hits(self) -> int:
+        return sum(self.hits.values())
+
+    @property
+    def total_misses(self) -> int:
+        return sum(self.misses.values())
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups answered from the cache"""
+        lookups = self.total_hits + self.total_misses
+        return self.total_hits / lookups if lookups else 0.0
+
+    @property
+    def estimated_seconds_saved(self) -> float:
+        """Hits times the average cost of computing a result, per kind"""
+        saved = 0.0
+        for kind, hits in self.hits.items():
+            misses = self.misses.get(kind, 0)
+            if hits and misses:
+                saved += hits * self.miss_seconds[kind] / misses
+        return saved
+
+    def reset(self):
+        self.hits.clear()
+        self.misses.clear()
+        self.miss_seconds.clear()
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'hits': self.total_hits,
+            'misses': self.total_misses,
+            'hit_rate': self.hit_rate,
+            'estimated_seconds_saved': self.estimated_seconds_saved,
+            'by_kind': {
+                kind: {'hits': self.hits.get(kind, 0), 'misses': self.misses.get(kind, 0)}
+                for kind in sorted(set(self.hits) | set(self.misses))
+            }
+        }
+
+
+_shared_cache = IdentityNormalizationCache()
+
+
+def get_shared_normalization_cache() -> IdentityNormalizationCache:
+    """The cache shared by all engines of this process"""
+    return _shared_cache
@@ -167,17 +167,31 @@ class IdentityValidator:
         is_valid, reason = self.is_valid_identity(value, field_name=field_name)
         
         if not is_valid:
-            self.filtered_count += 1
-            self.filtered_reasons[reason] = self.filtered_reasons.get(reason, 0) + 1
-            
-            if log_filtered:
-                field_info = f" from field '{field_name}'" if field_name else ""
-                print(f"[Identity Engine] Filtered invalid identity{field_info}: '{value}' (reason: {reason})")
-            
+            self.record_filtered(reason, value, log_filtered=log_filtered, field_name=field_name)
             return None
         
         return value
     
+    def record_filtered(self, reason: str, value: str = None, log_filtered: bool = False, field_name: str = None):
+        """
+        Count a filtered identity.
+        
+        Used by validate_and_filter() and by callers that replay a cached
+        validation result.
+        
+        Args:
+            reason: Reason the identity was filtered
+            value: Filtered value (for logging)
+            log_filtered: If True, log the filtered value to console
+            field_name: Optional field the value came from (for logging)
+        """
+        self.filtered_count += 1
+        self.filtered_reasons[reason] = self.filtered_reasons.get(reason, 0) + 1
+        
+        if log_filtered:
+            field_info = f" from field '{field_name}'" if field_name else ""
+            print(f"[Identity Engine] Filtered invalid identity{field_info}: '{value}' (reason: {reason})")
+    
     def get_statistics(self) -> Dict[str, any]:
         """
         Get filtering statistics.
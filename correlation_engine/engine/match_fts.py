@@ -0,0 +1,263 @@
+"""
+Incremental FTS5 Index of Match Feather Records
+
+The semantic phase narrows matches to candidates with an FTS5 full-text
+index over feather_records. Building that index at the end of a run means
+decoding and tokenizing every match in one long blocking step, so the index
+is maintained incrementally instead:
+- matches_fts is a contentless FTS5 table keyed by the matches rowid; it
+  stores only the index, not a second copy of the records (matches hold the
+  compact payload BLOB, not the indexed JSON, so the index cannot read its
+  text from them)
+- StreamingMatchWriter adds the rows it inserts to the index in the same
+  transaction as the matches, and runs bounded incremental merges of the
+  index segments every few transactions
+- matches written by other paths (ResultsDatabase.save_match, databases from
+  earlier versions) are caught up by catch_up() before the index is queried
+
+The indexed text of a match is its feather records as JSON, which is what
+feather_records_json() returns for a stored row (see match_payload). Rows
+that are deleted or whose feather_records change go through remove_matches()
+/ replace_match(): with contentless_delete=1 (SQLite 3.43+) they are deleted
+by rowid, otherwise the 'delete' command is given the exact text the row was
+indexed with.
+
+Indexed rowids are read from the index's docsize shadow table, so a database
+always knows which matches still need indexing.
+"""
+
+import json
+import logging
+import sqlite3
+from typing import Any, Iterable, Optional, Sequence, Tuple
+
+from .match_payload import MatchPayloadCodec
+
+logger = logging.getLogger(__name__)
+
+MATCH_FTS_TABLE = 'matches_fts'
+
+MATCH_FTS_TOKENIZE = 'porter unicode61 remove_diacritics 1'
+
+# Index pages merged by one incremental merge
+MERGE_PAGES = 2000
+
+# Writer transactions between incremental merges
+MERGE_INTERVAL_TRANSACTIONS = 16
+
+_CREATE_SQL = f"""
+    CREATE VIRTUAL TABLE {MATCH_FTS_TABLE} USING fts5(
+        match_id UNINDEXED,
+        feather_records,
+        content='',{{options}}
+        tokenize='{MATCH_FTS_TOKENIZE}'
+    )
+"""
+
+# Deletes by rowid without the indexed text (SQLite 3.43+)
+_CONTENTLESS_DELETE_OPTION = "\n        contentless_delete=1,"
+
+
+def _is_contentless(sql: Optional[str]) -> bool:
+    return "content=''" in (sql or '')
+
+
+def match_fts_text(feather_records: Any) -> str:
+    """Indexed text of a match's feather records (as feather_records_json() returns it)"""
+    return json.dumps(feather_records)
+
+
+class MatchFtsIndex:
+    """
+    Maintains the matches_fts index on one connection.
+
+    Methods write without committing, so index changes are committed with
+    the match rows they belong to.
+
+    Usage:
+        >>> fts = MatchFtsIndex(conn)
+        >>> if fts.ensure_table():
+        ...     fts.catch_up(execution_id)
+        ...     conn.commit()
+    """
+
+    def __init__(self, connection: sqlite3.Connection):
+        """
+        Initialize the index maintainer.
+
+        Args:
+            connection: Connection to the results database
+        """
+        self.conn = connection
+        self._functions_registered = False
+        self._contentless_delete: Optional[bool] = None
+
+    def _table_sql(self) -> Optional[str]:
+        row = self.conn.execute(
+            "SELECT sql FROM sqlite_master WHERE type = 'table' AND name = ?", (MATCH_FTS_TABLE,)
+        ).fetchone()
+        return None if row is None else (row[0] or '')
+
+    def ensure_table(self) -> bool:
+        """
+        Create matches_fts if needed, replacing the full-content and
+        external-content indexes of earlier versions (they are rebuilt by
+        catch_up()).
+
+        Returns:
+            True if the index is available, False if SQLite lacks FTS5
+        """
+        sql = self._table_sql()
+        if _is_contentless(sql):
+            return True
+
+        try:
+            if sql is not None:
+                logger.info("[FTS5] Replacing matches_fts with a contentless index")
+                self.conn.execute(f"DROP TABLE {MATCH_FTS_TABLE}")
+            try:
+                self.conn.execute(_CREATE_SQL.format(options=_CONTENTLESS_DELETE_OPTION))
+            except sqlite3.OperationalError:
+                # contentless_delete is not supported by this SQLite version
+                self.conn.execute(_CREATE_SQL.format(options=''))
+        except sqlite3.OperationalError as e:
+            logger.warning(f"[FTS5] matches_fts index not available: {e}")
+            return False
+        self._contentless_delete = None
+        return True
+
+    def exists(self) -> bool:
+        """True if the database has a contentless matches_fts index"""
+        return _is_contentless(self._table_sql())
+
+    def _deletes_by_rowid(self) -> bool:
+        """True if the index was created with contentless_delete=1"""
+        if self._contentless_delete is None:
+            self._contentless_delete = 'contentless_delete=1' in (self._table_sql() or '')
+        return self._contentless_delete
+
+    def add_inserted(self, last_rowid: int, matches: Sequence[Tuple[str, Any]]):
+        """
+        Index matches that were just inserted with consecutive rowids.
+
+        Args:
+            last_rowid: Rowid of the last inserted match (last_insert_rowid())
+            matches: (match_id, feather_records) of the inserted matches, in
+                insertion order
+        """
+        first_rowid = last_rowid - len(matches) + 1
+        self.conn.executemany(
+            f"INSERT INTO {MATCH_FTS_TABLE}(rowid, match_id, feather_records) VALUES (?, ?, ?)",
+            [
+                (first_rowid + offset, match_id, match_fts_text(feather_records))
+                for offset, (match_id, feather_records) in enumerate(matches)
+            ]
+        )
+
+    def replace_match(self, rowid: int, match_id: str, old_text: Optional[str], feather_records: Any):
+        """
+        Re-index a match whose feather_records change.
+
+        Args:
+            rowid: Rowid of the match
+            match_id: Match ID
+            old_text: Text the match is indexed with (feather_records_json()
+                of the stored value before the change)
+            feather_records: New feather records
+        """
+        if self._deletes_by_rowid():
+            self.conn.execute(f"DELETE FROM {MATCH_FTS_TABLE} WHERE rowid = ?", (rowid,))
+        elif self._is_indexed(rowid):
+            self.conn.execute(
+                f"INSERT INTO {MATCH_FTS_TABLE}({MATCH_FTS_TABLE}, rowid, match_id, feather_records) "
+                f"VALUES ('delete', ?, ?, ?)",
+                (rowid, match_id, old_text)
+            )
+        self.conn.execute(
+            f"INSERT INTO {MATCH_FTS_TABLE}(rowid, match_id, feather_records) VALUES (?, ?, ?)",
+            (rowid, match_id, match_fts_text(feather_records))
+        )
+
+    def remove_matches(self, where_sql: str, params: Iterable = ()) -> int:
+        """
+        Remove matches from the index before they are deleted.
+
+        Args:
+            where_sql: Condition on matches (alias m) selecting the rows
+            params: Parameters of where_sql
+
+        Returns:
+            Number of matches removed from the index
+        """
+        if self._deletes_by_rowid():
+            cursor = self.conn.execute(f"""
+                DELETE FROM {MATCH_FTS_TABLE}
+                WHERE rowid IN (
+                    SELECT m.rowid FROM matches m
+                    WHERE ({where_sql})
+                      AND m.rowid IN (SELECT id FROM {MATCH_FTS_TABLE}_docsize)
+                )
+            """, tuple(params))
+            return cursor.rowcount
+
+        self._register_functions()
+        cursor = self.conn.execute(f"""
+            INSERT INTO {MATCH_FTS_TABLE}({MATCH_FTS_TABLE}, rowid, match_id, feather_records)
+            SELECT 'delete', m.rowid, m.match_id, feather_records_json(m.feather_records)
+            FROM matches m
+            WHERE ({where_sql})
+              AND m.rowid IN (SELECT id FROM {MATCH_FTS_TABLE}_docsize)
+        """, tuple(params))
+        return cursor.rowcount
+
+    def catch_up(self, execution_id: Optional[int] = None) -> int:
+        """
+        Index matches that are not in the index yet.
+
+        Args:
+            execution_id: Only index matches of this execution (all if None)
+
+        Returns:
+            Number of matches indexed
+        """
+        self._register_functions()
+        if execution_id is None:
+            scope, params = "", ()
+        else:
+            scope = "AND m.result_id IN (SELECT result_id FROM results WHERE execution_id = ?)"
+            params = (execution_id,)
+
+        cursor = self.conn.execute(f"""
+            INSERT INTO {MATCH_FTS_TABLE}(rowid, match_id, feather_records)
+            SELECT m.rowid, m.match_id, feather_records_json(m.feather_records)
+            FROM matches m
+            WHERE m.rowid NOT IN (SELECT id FROM {MATCH_FTS_TABLE}_docsize)
+              {scope}
+        """, params)
+        return cursor.rowcount
+
+    def merge(self, pages: int = MERGE_PAGES):
+        """Run a bounded incremental merge of the index segments"""
+        self.conn.execute(
+            f"INSERT INTO {MATCH_FTS_TABLE}({MATCH_FTS_TABLE}, rank) VALUES ('merge', ?)", (pages,)
+        )
+
+    def optimize(self):
+        """Merge the whole index into one segment (blocking; for idle databases)"""
+        self.conn.execute(f"INSERT INTO {MATCH_FTS_TABLE}({MATCH_FTS_TABLE}) VALUES ('optimize')")
+
+    def _is_indexed(self, rowid: int) -> bool:
+        return self.conn.execute(
+            f"SELECT 1 FROM {MATCH_FTS_TABLE}_docsize WHERE id = ?", (rowid,)
+        ).fetchone() is not None
+
+    def _register_functions(self):
+        if self._functions_registered:
+            return
+        try:
+            # Already registered on this connection (re-registering fails
+            # while statements are active)
+            self.conn.execute("SELECT feather_records_json(NULL)").fetchone()
+        except sqlite3.OperationalError:
+            MatchPayloadCodec(self.conn).register_functions()
+        self._functions_registered = True
@@ -0,0 +1,296 @@
+"""
+Compact Match Payload Encoding
+
+Every stored match carries the full feather records it was built from. As
+JSON text each record repeats all of its column names, and result databases
+of large cases grow to several GB, most of it feather_records.
+
+The compact format stores feather_records as a BLOB:
+- column names are kept once per database in a match_payload_columns table;
+  a record is stored as a column set id and a list of values
+- the resulting body is compressed (zlib by default, zstd when the
+  zstandard package is installed and selected)
+
+Layout: MAGIC (4 bytes) | version (1 byte) | compression (1 byte) | body.
+The body is compact JSON: [1, entries] for a dict of feathers, where each
+entry is [key, kind, data], or [0, value] for anything else.
+
+Readers do not need to know which format a row uses: decode() accepts the
+compact BLOB, legacy JSON text and the legacy gzip-compressed JSON written
+for very large records. SQL consumers (FTS5 index builds) call the
+feather_records_json() function registered by register_functions().
+"""
+
+import gzip
+import json
+import sqlite3
+import zlib
+from typing import Any, Dict, List, Optional, Tuple
+
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
+PAYLOAD_MAGIC = b'CEMP'
+PAYLOAD_VERSION = 1
+_HEADER_SIZE = len(PAYLOAD_MAGIC) + 2
+
+COMPRESSION_NONE = 0
+COMPRESSION_ZLIB = 1
+COMPRESSION_ZSTD = 2
+
+_COMPRESSION_CODES = {
+    'none': COMPRESSION_NONE,
+    'zlib': COMPRESSION_ZLIB,
+    'zstd': COMPRESSION_ZSTD
+}
+
+DEFAULT_COMPRESSION = 'zlib'
+
+# Bodies shorter than this are stored uncompressed
+MIN_COMPRESS_BYTES = 128
+
+# Entry kinds of a feather in the body
+_KIND_RECORD = 'r'   # one record dict
+_KIND_RECORDS = 'l'  # list of record dicts
+_KIND_VALUE = 'v'    # anything else, stored as is
+
+_GZIP_MAGIC = b'\x1f\x8b'
+
+
+def _json_key(key: Any) -> str:
+    """Dictionary key as json.dumps writes it"""
+    return key if isinstance(key, str) else json.dumps(key).strip('"')
+
+
+def is_compact_payload(value: Any) -> bool:
+    """True if a feather_records column value uses the compact format"""
+    return isinstance(value, (bytes, memoryview)) and bytes(value[:len(PAYLOAD_MAGIC)]) == PAYLOAD_MAGIC
+
+
+class MatchPayloadCodec:
+    """
+    Encodes and decodes the feather_records column of one results database.
+
+    The codec caches the database's column sets. Use one codec per
+    connection; a codec may be used from the thread that owns the
+    connection only.
+
+    Usage:
+        >>> codec = MatchPayloadCodec(conn)
+        >>> blob = codec.encode(match.feather_records)   # writer side
+        >>> records = codec.decode(row['feather_records'])  # any format
+    """
+
+    def __init__(self, connection: sqlite3.Connection, compression: str = DEFAULT_COMPRESSION,
+                 level: Optional[int] = None):
+        """
+        Initialize the codec.
+
+        Args:
+            connection: Connection to the results database
+            compression: 'zlib', 'zstd' or 'none' (used for encoding only)
+            level: Compression level (codec default if None)
+        """
+        if compression not in _COMPRESSION_CODES:
+            raise ValueError(f"Unknown payload compression: {compression}")
+        if compression == 'zstd' and not ZSTD_AVAILABLE:
+            print("[MatchPayload] zstandard not installed - using zlib compression")
+            compression = 'zlib'
+
+        self.conn = connection
+        self.compression = compression
+        self.level = level
+
+        self._column_set_ids: Dict[Tuple[str, ...], int] = {}
+        self._column_sets: Dict[int, List[str]] = {}
+        self._table_ready = False
+
+        self._zstd_compressor = None
+        self._zstd_decompressor = None
+
+    # ------------------------------------------------------------------
+    # Encoding
+    # ------------------------------------------------------------------
+
+    def encode(self, feather_records: Any, default=None) -> bytes:
+        """
+        Encode feather records in the compact format.
+
+        New column sets are inserted into match_payload_columns on the
+        codec's connection without committing, so they are committed with
+        the match rows that use them.
+
+        Args:
+            feather_records: Feather records of a match (normally
+                feather_id -> record dict or list of record dicts)
+            default: json.dumps default for values that are not JSON types
+
+        Returns:
+            Payload bytes
+        """
+        if isinstance(feather_records, dict):
+            body = [1, [self._encode_entry(_json_key(key), value) for key, value in feather_records.items()]]
+        else:
+            body = [0, feather_records]
+
+        raw = json.dumps(body, separators=(',', ':'), ensure_ascii=False, default=default).encode('utf-8')
+
+        compression = _COMPRESSION_CODES[self.compression]
+        if compression == COMPRESSION_NONE or len(raw) < MIN_COMPRESS_BYTES:
+            compression, data = COMPRESSION_NONE, raw
+        elif compression == COMPRESSION_ZSTD:
+            if self._zstd_compressor is None:
+                self._zstd_compressor = zstandard.ZstdCompressor(level=self.level or 3)
+            data = self._zstd_compressor.compress(raw)
+        else:
+            data = zlib.compress(raw, 6 if self.level is None else self.level)
+
+        return PAYLOAD_MAGIC + bytes((PAYLOAD_VERSION, compression)) + data
+
+    def _encode_entry(self, key: Any, value: Any) -> list:
+        if isinstance(value, dict):
+            return [key, _KIND_RECORD, self._encode_record(value)]
+        if isinstance(value, list) and value and all(isinstance(record, dict) for record in value):
+            return [key, _KIND_RECORDS, [self._encode_record(record) for record in value]]
+        return [key, _KIND_VALUE, value]
+
+    def _encode_record(self, record: Dict[str, Any]) -> list:
+        columns = tuple(_json_key(key) for key in record)
+        return [self._column_set_id(columns), list(record.values())]
+
+    def _column_set_id(self, columns: Tuple[str, ...]) -> int:
+        column_set_id = self._column_set_ids.get(columns)
+        if column_set_id is not None:
+            return column_set_id
+
+        self._ensure_table()
+        columns_json = json.dumps(list(columns), ensure_ascii=False)
+        self.conn.execute("INSERT OR IGNORE INTO match_payload_columns (columns) VALUES (?)", (columns_json,))
+        row = self.conn.execute("SELECT column_set_id FROM match_payload_columns WHERE columns = ?",
+                                (columns_json,)).fetchone()
+        column_set_id = row[0]
+
+        self._column_set_ids[columns] = column_set_id
+        self._column_sets[column_set_id] = list(columns)
+        return column_set_id
+
+    def reset(self):
+        """Forget cached column sets (after a rollback discarded new ones)"""
+        self._column_set_ids.clear()
+        self._column_sets.clear()
+        self._table_ready = False
+
+    def _ensure_table(self):
+        if self._table_ready:
+            return
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS match_payload_columns (
+                column_set_id INTEGER PRIMARY KEY,
+                columns TEXT NOT NULL UNIQUE
+            )
+        """)
+        self._table_ready = True
+
+    # ------------------------------------------------------------------
+    # Decoding
+    # ------------------------------------------------------------------
+
+    def decode(self, value: Any) -> Any:
+        """
+        Decode a feather_records column value of any format.
+
+        Args:
+            value: Compact BLOB, legacy JSON text or legacy gzip-compressed JSON
+
+        Returns:
+            Feather records ({} for an empty value)
+        """
+        if value is None or value == '' or value == b'':
+            return {}
+
+        if isinstance(value, str):
+            return json.loads(value)
+
+        value = bytes(value)
+        if value[:len(PAYLOAD_MAGIC)] == PAYLOAD_MAGIC:
+            return self._decode_compact(value)
+        if value[:2] == _GZIP_MAGIC:
+            return json.loads(gzip.decompress(value).decode('utf-8'))
+        return json.loads(value.decode('utf-8'))
+
+    def decode_json(self, value: Any) -> Optional[str]:
+        """
+        Feather records as JSON text (legacy text is returned unchanged).
+
+        Used for FTS5 indexing and for consumers that expect the JSON column.
+        """
+        if value is None or isinstance(value, str):
+            return value
+        return json.dumps(self.decode(value))
+
+    def _decode_compact(self, value: bytes) -> Any:
+        version, compression = value[len(PAYLOAD_MAGIC)], value[len(PAYLOAD_MAGIC) + 1]
+        if version != PAYLOAD_VERSION:
+            raise ValueError(f"Unsupported match payload version: {version}")
+
+        data = value[_HEADER_SIZE:]
+        if compression == COMPRESSION_ZLIB:
+            data = zlib.decompress(data)
+        elif compression == COMPRESSION_ZSTD:
+            if not ZSTD_AVAILABLE:
+                raise ValueError("Match payload is zstd-compressed but zstandard is not installed")
+            if self._zstd_decompressor is None:
+                self._zstd_decompressor = zstandard.ZstdDecompressor()
+            data = self._zstd_decompressor.decompress(data)
+        elif compression != COMPRESSION_NONE:
+            raise ValueError(f"Unknown match payload compression: {compression}")
+
+        is_dict, content = json.loads(data)
+        if not is_dict:
+            return content
+
+        feather_records = {}
+        for key, kind, entry in content:
+            if kind == _KIND_RECORD:
+                feather_records[key] = self._decode_record(entry)
+            elif kind == _KIND_RECORDS:
+                feather_records[key] = [self._decode_record(record) for record in entry]
+            else:
+                feather_records[key] = entry
+        return feather_records
+
+    def _decode_record(self, record: list) -> Dict[str, Any]:
+        column_set_id, values = record
+        columns = self._column_sets.get(column_set_id)
+        if columns is None:
+            columns = self._load_column_set(column_set_id)
+        return dict(zip(columns, values))
+
+    def _load_column_set(self, column_set_id: int) -> List[str]:
+        # Load every column set added since the last lookup in one query
+        known = max(self._column_sets) if self._column_sets else 0
+        rows = self.conn.execute(
+            "SELECT column_set_id, columns FROM match_payload_columns WHERE column_set_id > ? OR column_set_id = ?",
+            (known, column_set_id)
+        ).fetchall()
+        for row_id, columns_json in rows:
+            columns = json.loads(columns_json)
+            self._column_sets[row_id] = columns
+            self._column_set_ids[tuple(columns)] = row_id
+
+        if column_set_id not in self._column_sets:
+            raise ValueError(f"Match payload references unknown column set {column_set_id}")
+        return self._column_sets[column_set_id]
+
+    def register_functions(self):
+        """
+        Register feather_records_json(value) on the codec's connection.
+
+        SQL that copies feather_records into text (FTS5 index builds) selects
+        feather_records_json(m.feather_records) to index decoded records.
+        """
+        self.conn.create_function('feather_records_json', 1, self.decode_json, deterministic=True)
+        return self
@@ -4,11 +4,16 @@ Parallel Window Processor for Time-Window Scanning Engine
 This module provides parallel processing capabilities for time windows in the
 Time-Window Scanning Correlation Engine. It implements thread pool management,
 advanced load balancing, and comprehensive resource management for concurrent window processing.
+
+Two backends are available: "thread" runs the caller's window function in a
+thread pool, "process" correlates windows in a process pool (see
+window_process_worker) so the work is not serialized by the GIL.
 """
 
 import time
 import threading
-from concurrent.futures import ThreadPoolExecutor, as_completed, Future
+import multiprocessing
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, Executor, as_completed, Future
 from typing import List, Dict, Any, Optional, Callable, Tuple
 from dataclasses import dataclass
 from datetime import datetime
@@ -427,7 +432,7 @@ class ParallelWindowProcessor:
     Processes multiple time windows in parallel with advanced load balancing and resource management.
     
     Features:
-    - Thread pool management with configurable worker count
+    - Thread or process pool management with configurable worker count
     - Advanced load balancing with multiple algorithms (round-robin, least-loaded, adaptive)
     - Dynamic load rebalancing based on performance metrics
     - Resource monitoring and management (CPU, memory)
@@ -443,29 +448,45 @@ class ParallelWindowProcessor:
                  batch_size: int = 100,
                  memory_limit_mb: int = 500,
                  load_balancing_algorithm: str = "adaptive",
-                 resource_monitoring_enabled: bool = True):
+                 resource_monitoring_enabled: bool = True,
+                 backend: str = "thread"):
         """
         Initialize parallel window processor with enhanced resource management.
         
         Args:
-            max_workers: Maximum number of worker threads
+            max_workers: Maximum number of worker threads or processes
             enable_load_balancing: Enable intelligent load balancing
             batch_size: Number of windows to process in each batch
             memory_limit_mb: Memory limit for parallel processing
             load_balancing_algorithm: Algorithm for load balancing ("round_robin", "least_loaded", "adaptive")
             resource_monitoring_enabled: Enable resource monitoring for workers
+            backend: "thread" or "process"
         """
+        if backend not in ("thread", "process"):
+            raise ValueError(f"Unknown parallel backend: {backend}")
+        
         self.max_workers = max_workers
         self.enable_load_balancing = enable_load_balancing
         self.batch_size = batch_size
         self.memory_limit_mb = memory_limit_mb
         self.load_balancing_algorithm = load_balancing_algorithm
         self.resource_monitoring_enabled = resource_monitoring_enabled
+        self.backend = backend
         
-        # Thread pool and load balancer
-        self.executor: Optional[ThreadPoolExecutor] = None
+        # Worker pool and load balancer
+        self.executor: Optional[Executor] = None
         self.load_balancer: Optional[WorkerLoadBalancer] = None
         
+        # Process backend: worker spec for the current run and the
+        # pool process id -> load balancer worker id binding
+        self._worker_spec: Optional[Any] = None
+        self._process_worker_ids: Dict[int, str] = {}
+        self._process_handles: Dict[int, Any] = {}
+        
+        # Optional window -> (record_count, feather_count) estimate used to size
+        # tasks before windows are populated (e.g. from feather time histograms)
+        self.window_record_estimator: Optional[Callable[[TimeWindow], Optional[Tuple[int, int]]]] = None
+        
         # Processing state
         self.is_processing = False
         self.cancellation_requested = False
@@ -491,15 +512,18 @@ class ParallelWindowProcessor:
                                 windows: List[TimeWindow],
                                 wing: Wing,
                                 window_processor_func: Callable[[TimeWindow, Wing], List[CorrelationMatch]],
-                                progress_callback: Optional[Callable] = None) -> List[CorrelationMatch]:
+                                progress_callback: Optional[Callable] = None,
+                                worker_spec: Optional[Any] = None) -> List[CorrelationMatch]:
         """
         Process windows in parallel with load balancing and resource management.
         
         Args:
             windows: List of TimeWindow objects to process
             wing: Wing configuration
-            window_processor_func: Function to process individual windows
+            window_processor_func: Function to process individual windows (thread backend)
             progress_callback: Optional callback for progress updates
+            worker_spec: WindowWorkerSpec for the worker processes (required by the
+                process backend, which correlates windows itself)
             
         Returns:
             List of all correlation matches found across all windows
@@ -507,6 +531,10 @@ class ParallelWindowProcessor:
         if not windows:
             return []
         
+        if self.backend == "process" and worker_spec is None:
+            raise ValueError("The process backend requires a worker_spec")
+        
+        self._worker_spec = worker_spec
         self.progress_callback = progress_callback
         self.is_processing = True
         self.cancellation_requested = False
@@ -524,12 +552,16 @@ class ParallelWindowProcessor:
             total_tasks = len(tasks)
             processed_count = 0
             
-            for batch_start in range(0, len(tasks), self.optimal_batch_size):
+            # optimal_batch_size may be adjusted by resource monitoring while
+            # running, so advance by the size of each batch actually taken
+            batch_start = 0
+            while batch_start < len(tasks):
                 if self.cancellation_requested:
                     break
                 
                 batch_end = min(batch_start + self.optimal_batch_size, len(tasks))
                 batch_tasks = tasks[batch_start:batch_end]
+                batch_start = batch_end
                 
                 # Process batch
                 batch_matches = self._process_batch_parallel(batch_tasks, wing, window_processor_func)
@@ -552,6 +584,14 @@ class ParallelWindowProcessor:
                         'load_balancing_algorithm': self.load_balancing_algorithm
                     })
             
+            if self.backend == "process":
+                # Tasks are scheduled by complexity; return matches in window order
+                all_matches = [
+                    match
+                    for result in sorted(self._completed_results, key=lambda r: r.task_id)
+                    for match in result.matches
+                ]
+            
             # Finalize statistics
             self._finalize_processing_stats(len(all_matches))
             
@@ -562,12 +602,24 @@ class ParallelWindowProcessor:
             self.is_processing = False
     
     def _initialize_parallel_processing(self):
-        """Initialize thread pool, load balancer, and resource monitoring"""
-        # Create thread pool
-        self.executor = ThreadPoolExecutor(
-            max_workers=self.max_workers,
-            thread_name_prefix="WindowProcessor"
-        )
+        """Initialize worker pool, load balancer, and resource monitoring"""
+        if self.backend == "process":
+            from .window_process_worker import initialize_window_worker
+            
+            # 'spawn' like the rest of the application: safe with the Qt GUI
+            self.executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context('spawn'),
+                initializer=initialize_window_worker,
+                initargs=(self._worker_spec,)
+            )
+            self._process_worker_ids.clear()
+        else:
+            # Create thread pool
+            self.executor = ThreadPoolExecutor(
+                max_workers=self.max_workers,
+                thread_name_prefix="WindowProcessor"
+            )
         
         # Create load balancer if enabled
         if self.enable_load_balancing:
@@ -630,8 +682,10 @@ class ParallelWindowProcessor:
                 memory_info = current_process.memory_info()
                 memory_mb = memory_info.rss / (1024 * 1024)
                 
-                # Update load balancer with resource information
-                if self.load_balancer:
+                # Worker processes report their own usage
+                if self.load_balancer and self._process_worker_ids:
+                    self._update_process_worker_resources()
+                elif self.load_balancer:
                     # Distribute resource usage across workers (approximation)
                     per_worker_cpu = cpu_percent / self.max_workers
                     per_worker_memory = memory_mb / self.max_workers
@@ -653,6 +707,24 @@ class ParallelWindowProcessor:
                 # Continue monitoring even if there are errors
                 time.sleep(5.0)
     
+    def _update_process_worker_resources(self):
+        """Feed per-process CPU and memory of pool workers to the load balancer"""
+        for pid, worker_id in list(self._process_worker_ids.items()):
+            try:
+                # Keep the handle: cpu_percent() measures since the previous call
+                worker_process = self._process_handles.get(pid)
+                if worker_process is None:
+                    worker_process = psutil.Process(pid)
+                    self._process_handles[pid] = worker_process
+                self.load_balancer.update_worker_resources(
+                    worker_id,
+                    worker_process.cpu_percent(interval=None),
+                    worker_process.memory_info().rss / (1024 * 1024)
+                )
+            except Exception:
+                # Worker exited or is not accessible
+                continue
+    
     def _adjust_batch_size_based_on_resources(self, cpu_percent: float, memory_mb: float):
         """
         Dynamically adjust batch size based on resource utilization.
@@ -723,11 +795,18 @@ class ParallelWindowProcessor:
         
         # Adjust based on window characteristics
         total_records = window.get_total_record_count()
+        feather_count = window.get_feather_count()
+        
+        # Windows are usually not populated yet: ask the estimator instead
+        if total_records == 0 and self.window_record_estimator:
+            estimate = self.window_record_estimator(window)
+            if estimate is not None:
+                total_records, feather_count = estimate
+        
         if total_records > 0:
             # More records = higher complexity
             complexity += (total_records / 100.0) * 0.1
         
-        feather_count = window.get_feather_count()
         if feather_count > 2:
             # More feathers = more cross-correlations = higher complexity
             complexity += (feather_count - 2) * 0.2
@@ -749,6 +828,9 @@ class ParallelWindowProcessor:
         Returns:
             List of correlation matches from the batch
         """
+        if self.backend == "process":
+            return self._process_batch_in_processes(tasks)
+        
         # Submit tasks to thread pool
         future_to_task = {}
         
@@ -828,6 +910,111 @@ class ParallelWindowProcessor:
         
         return batch_matches
     
+    def _process_batch_in_processes(self, tasks: List[WindowProcessingTask]) -> List[CorrelationMatch]:
+        """
+        Process a batch of tasks in the process pool.
+        
+        Only compact window descriptors are sent to the workers, which query
+        their own read-only feather connections. Matches are returned in window
+        order so the output is the same as the sequential path.
+        
+        Args:
+            tasks: List of WindowProcessingTask objects
+            
+        Returns:
+            List of correlation matches from the batch
+        """
+        from .window_process_worker import encode_window_task, process_window_task, decode_matches
+        
+        future_to_task = {}
+        task_worker_ids: Dict[int, Optional[str]] = {}
+        
+        for task_index, task in enumerate(tasks):
+            if self.cancellation_requested:
+                break
+            
+            # The pool decides which process runs a task; the balancer still
+            # tracks the outstanding load it was assigned
+            worker_id = None
+            if self.load_balancer:
+                worker_id = self.load_balancer.get_optimal_worker(task.estimated_complexity)
+                if worker_id:
+                    self.load_balancer.update_worker_load(worker_id, task.estimated_complexity)
+            task_worker_ids[task_index] = worker_id
+            
+            future = self.executor.submit(process_window_task, encode_window_task(task_index, task.window))
+            future_to_task[future] = (task_index, task)
+            self._active_futures.append(future)
+        
+        results_by_index: Dict[int, WindowProcessingResult] = {}
+        
+        for future in as_completed(future_to_task.keys()):
+            if self.cancellation_requested:
+                break
+            
+            task_index, task = future_to_task[future]
+            assigned_worker_id = task_worker_ids[task_index]
+            
+            try:
+                _, worker_pid, payload, processing_time, error = future.result()
+                worker_id = self._bind_process_worker(worker_pid) or assigned_worker_id
+                matches = decode_matches(payload) if payload is not None else []
+                task_completed = True
+            except Exception as e:
+                # Worker process crashed or the result could not be transferred
+                worker_id = assigned_worker_id
+                processing_time = 0.0
+                error = str(e)
+                matches = []
+                task_completed = False
+            
+            result = WindowProcessingResult(
+                task_id=task.task_id,
+                window=task.window,
+                matches=matches,
+                processing_time_seconds=processing_time,
+                error=error,
+                worker_id=worker_id
+            )
+            results_by_index[task_index] = result
+            self._completed_results.append(result)
+            
+            if task_completed:
+                self.stats.total_windows_processed += 1
+                self.stats.total_matches_found += len(matches)
+                self.stats.total_processing_time += processing_time
+            
+            # Load goes back to the slot it was charged to; timing is credited
+            # to the process that actually ran the window
+            if self.load_balancer:
+                if assigned_worker_id:
+                    self.load_balancer.update_worker_load(assigned_worker_id, -task.estimated_complexity)
+                if worker_id:
+                    self.load_balancer.record_task_completion(
+                        worker_id, processing_time, success=(error is None)
+                    )
+            
+            if future in self._active_futures:
+                self._active_futures.remove(future)
+        
+        batch_matches = []
+        for task_index in sorted(results_by_index):
+            batch_matches.extend(results_by_index[task_index].matches)
+        
+        return batch_matches
+    
+    def _bind_process_worker(self, pid: int) -> Optional[str]:
+        """Map a pool process id to a stable load balancer worker id"""
+        if not self.load_balancer:
+            return None
+        
+        worker_id = self._process_worker_ids.get(pid)
+        if worker_id is None:
+            worker_id = f"worker_{len(self._process_worker_ids) % self.max_workers}"
+            self._process_worker_ids[pid] = worker_id
+        
+        return worker_id
+    
     def _process_window_with_tracking(self, 
                                     task: WindowProcessingTask,
                                     wing: Wing,
@@ -909,6 +1096,9 @@ class ParallelWindowProcessor:
         
         # Clear state
         self._active_futures.clear()
+        self._process_worker_ids.clear()
+        self._process_handles.clear()
+        self._worker_spec = None
         self.load_balancer = None
     
     def request_cancellation(self):
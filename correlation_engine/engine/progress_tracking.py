@@ -940,6 +940,23 @@ class ProgressTracker:
             )
             self._emit_event(event)
     
+    def record_skipped_windows(self, count: int):
+        """
+        Record windows that were skipped without being generated because an
+        index proved them empty (they never go through start/complete_window).
+        
+        Args:
+            count: Number of skipped windows
+        """
+        self.windows_processed += count
+        self.empty_windows_skipped += count
+        
+        if self.windows_processed > 0:
+            self.skip_rate_percentage = (self.empty_windows_skipped / self.windows_processed) * 100
+        
+        # Same estimate as complete_window: 50ms full processing vs 1ms quick check
+        self.time_saved_by_skipping_seconds = self.empty_windows_skipped * (0.050 - 0.001)
+    
     def complete_window(self, window_id: str, window_start_time: datetime, window_end_time: datetime,
                        records_found: int, matches_created: int, feathers_with_records: List[str],
                        memory_usage_mb: Optional[float] = None, is_empty_window: bool = False):
@@ -0,0 +1,305 @@
+"""
+Resumable Time-Window Scan Checkpoints
+
+A time-window scan of a large case can run for hours. The scan streams its
+matches to correlation_results.db, and this module records how far the scan
+has got in a scan_checkpoints table of the same database, so a cancelled or
+crashed scan continues where it stopped instead of starting over.
+
+A checkpoint holds:
+- the scan position: windows completed on the scanning grid and the start of
+  the next window in epoch microseconds (independent of query caches and
+  sweep-line buffers, which are simply rebuilt on resume)
+- the highest matches rowid committed with the checkpoint
+- partial statistics (match count, window counters)
+
+Checkpoints are keyed by a scan signature, a hash of everything that decides
+which windows exist and what they contain: wing, feather files (path, size,
+modification time), window size, scanning interval, time range and filters.
+A changed feather or configuration never resumes a stale scan.
+
+On resume, matches the crashed run wrote after its last checkpoint are
+deleted, so the windows after the checkpoint are processed exactly once.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+from .epoch_timestamps import to_epoch_microseconds
+from .match_fts import MatchFtsIndex
+
+STATUS_IN_PROGRESS = 'IN_PROGRESS'
+STATUS_COMPLETED = 'COMPLETED'
+
+
+@dataclass
+class ScanCheckpoint:
+    """Progress of one time-window scan"""
+    scan_signature: str
+    result_id: int
+    execution_id: Optional[int]
+    wing_id: str
+    windows_completed: int = 0
+    next_window_start_us: Optional[int] = None
+    last_match_rowid: int = 0
+    total_matches: int = 0
+    statistics: Dict[str, Any] = field(default_factory=dict)
+    status: str = STATUS_IN_PROGRESS
+
+
+def compute_scan_signature(wing_id: str, feather_paths: Dict[str, str],
+                           window_size_minutes: float, scanning_interval_minutes: float,
+                           start_time: datetime, end_time: datetime,
+                           filters: Any = None) -> str:
+    """
+    Hash the inputs that define a scan's windows and their contents.
+
+    Args:
+        wing_id: Wing being scanned
+        feather_paths: Dictionary mapping feather_id to database path
+        window_size_minutes: Window size
+        scanning_interval_minutes: Step between window starts
+        start_time: Start of the scanning range
+        end_time: End of the scanning range
+        filters: Filter configuration (anything with a stable repr or __dict__)
+
+    Returns:
+        Hex digest identifying the scan
+    """
+    feathers = []
+    for feather_id, path in sorted(feather_paths.items()):
+        try:
+            stat = os.stat(path)
+            feathers.append([feather_id, os.path.abspath(path), stat.st_size, stat.st_mtime_ns])
+        except OSError:
+            feathers.append([feather_id, os.path.abspath(path), None, None])
+
+    filter_state = vars(filters) if hasattr(filters, '__dict__') else filters
+
+    payload = json.dumps({
+        'wing_id': wing_id,
+        'feathers': feathers,
+        'window_size_minutes': window_size_minutes,
+        'scanning_interval_minutes': scanning_interval_minutes,
+        'start_us': to_epoch_microseconds(start_time),
+        'end_us': to_epoch_microseconds(end_time),
+        'filters': filter_state
+    }, sort_keys=True, default=str)
+
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+class ScanCheckpointStore:
+    """
+    Reads and writes scan checkpoints in the streaming results database.
+
+    The store shares the StreamingMatchWriter connection: the writer is
+    flushed before each checkpoint, so every match up to the checkpoint's
+    rowid is committed when the checkpoint is.
+
+    Usage:
+        >>> store = ScanCheckpointStore(writer.conn)
+        >>> checkpoint = store.find_resumable(signature)
+        >>> if checkpoint:
+        ...     store.rollback_uncommitted_matches(checkpoint)
+        >>> else:
+        ...     checkpoint = store.start(signature, result_id, execution_id, wing_id)
+        >>> store.save(checkpoint, windows_completed, next_window_start, total_matches)
+        >>> store.complete(checkpoint)  # or store.pause(checkpoint) when cancelled
+    """
+
+    def __init__(self, connection: sqlite3.Connection):
+        """
+        Initialize the store.
+
+        Args:
+            connection: Open connection to correlation_results.db (results and
+                matches tables must exist)
+        """
+        self.conn = connection
+        self._ensure_schema()
+
+    def _ensure_schema(self):
+        """Create the scan_checkpoints table if needed"""
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS scan_checkpoints (
+                scan_signature TEXT PRIMARY KEY,
+                result_id INTEGER NOT NULL,
+                execution_id INTEGER,
+                wing_id TEXT,
+                windows_completed INTEGER NOT NULL DEFAULT 0,
+                next_window_start_us INTEGER,
+                last_match_rowid INTEGER NOT NULL DEFAULT 0,
+                total_matches INTEGER NOT NULL DEFAULT 0,
+                statistics TEXT,
+                status TEXT NOT NULL,
+                updated_at TEXT
+            )
+        """)
+        self.conn.commit()
+
+    def find_resumable(self, scan_signature: str) -> Optional[ScanCheckpoint]:
+        """
+        Find an unfinished checkpoint for a scan whose result still exists.
+
+        Args:
+            scan_signature: Signature from compute_scan_signature()
+
+        Returns:
+            ScanCheckpoint, or None if the scan has to start from the beginning
+        """
+        cursor = self.conn.cursor()
+        cursor.execute("""
+            SELECT c.scan_signature, c.result_id, c.execution_id, c.wing_id,
+                   c.windows_completed, c.next_window_start_us, c.last_match_rowid,
+                   c.total_matches, c.statistics, c.status
+            FROM scan_checkpoints c
+            JOIN results r ON r.result_id = c.result_id
+            WHERE c.scan_signature = ? AND c.status = ?
+        """, (scan_signature, STATUS_IN_PROGRESS))
+        row = cursor.fetchone()
+        if not row:
+            return None
+
+        try:
+            statistics = json.loads(row[8]) if row[8] else {}
+        except ValueError:
+            statistics = {}
+
+        return ScanCheckpoint(
+            scan_signature=row[0],
+            result_id=row[1],
+            execution_id=row[2],
+            wing_id=row[3],
+            windows_completed=row[4],
+            next_window_start_us=row[5],
+            last_match_rowid=row[6],
+            total_matches=row[7],
+            statistics=statistics,
+            status=row[9]
+        )
+
+    def start(self, scan_signature: str, result_id: int, execution_id: Optional[int],
+              wing_id: str) -> ScanCheckpoint:
+        """
+        Record a new scan at window 0 (replaces any previous checkpoint of the signature).
+
+        Returns:
+            The new ScanCheckpoint
+        """
+        checkpoint = ScanCheckpoint(
+            scan_signature=scan_signature,
+            result_id=result_id,
+            execution_id=execution_id,
+            wing_id=wing_id,
+            last_match_rowid=self._max_match_rowid()
+        )
+        self._write(checkpoint)
+        return checkpoint
+
+    def save(self, checkpoint: ScanCheckpoint, windows_completed: int,
+             next_window_start: Optional[datetime], total_matches: int,
+             statistics: Optional[Dict[str, Any]] = None):
+        """
+        Record progress. The caller must have flushed the match writer.
+
+        Args:
+            checkpoint: Checkpoint to advance
+            windows_completed: Windows on the scanning grid that are fully processed
+            next_window_start: Start of the first unprocessed window
+            total_matches: Matches written so far (including earlier runs)
+            statistics: Partial scan statistics (JSON serializable)
+        """
+        checkpoint.windows_completed = windows_completed
+        checkpoint.next_window_start_us = (
+            to_epoch_microseconds(next_window_start) if next_window_start is not None else None
+        )
+        checkpoint.last_match_rowid = self._max_match_rowid()
+        checkpoint.total_matches = total_matches
+        if statistics is not None:
+            checkpoint.statistics = statistics
+        self._write(checkpoint)
+
+    def complete(self, checkpoint: ScanCheckpoint):
+        """Mark the scan finished so it is never resumed"""
+        checkpoint.status = STATUS_COMPLETED
+        self.conn.execute("UPDATE results SET status = 'COMPLETED', progress_info = NULL WHERE result_id = ?",
+                          (checkpoint.result_id,))
+        self._write(checkpoint)
+
+    def pause(self, checkpoint: ScanCheckpoint):
+        """Flag the scan's result as PAUSED (listed by get_paused_executions)"""
+        progress_info = json.dumps({
+            'scan_signature': checkpoint.scan_signature,
+            'windows_completed': checkpoint.windows_completed,
+            'next_window_start_us': checkpoint.next_window_start_us,
+            'total_matches': checkpoint.total_matches
+        })
+        self.conn.execute("UPDATE results SET status = 'PAUSED', progress_info = ? WHERE result_id = ?",
+                          (progress_info, checkpoint.result_id))
+        self.conn.commit()
+
+    def adopt(self, checkpoint: ScanCheckpoint, execution_id: Optional[int]):
+        """
+        Move a resumed scan's result under the current execution.
+
+        Args:
+            checkpoint: Checkpoint being resumed
+            execution_id: Execution the resumed run reports to
+        """
+        if execution_id is None or execution_id == checkpoint.execution_id:
+            return
+        self.conn.execute("UPDATE results SET execution_id = ? WHERE result_id = ?",
+                          (execution_id, checkpoint.result_id))
+        checkpoint.execution_id = execution_id
+        self._write(checkpoint)
+
+    def rollback_uncommitted_matches(self, checkpoint: ScanCheckpoint) -> int:
+        """
+        Delete matches of the checkpoint's result written after the checkpoint.
+
+        Returns:
+            Number of matches deleted
+        """
+        params = (checkpoint.result_id, checkpoint.last_match_rowid)
+
+        # The index must drop the rows while they still exist (it is given their text)
+        fts_index = MatchFtsIndex(self.conn)
+        if fts_index.exists():
+            fts_index.remove_matches("m.result_id = ? AND m.rowid > ?", params)
+
+        cursor = self.conn.cursor()
+        cursor.execute("DELETE FROM matches WHERE result_id = ? AND rowid > ?", params)
+        self.conn.commit()
+        return cursor.rowcount
+
+    def _max_match_rowid(self) -> int:
+        row = self.conn.execute("SELECT MAX(rowid) FROM matches").fetchone()
+        return row[0] or 0
+
+    def _write(self, checkpoint: ScanCheckpoint):
+        self.conn.execute("""
+            INSERT OR REPLACE INTO scan_checkpoints (
+                scan_signature, result_id, execution_id, wing_id, windows_completed,
+                next_window_start_us, last_match_rowid, total_matches, statistics,
+                status, updated_at
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """, (
+            checkpoint.scan_signature,
+            checkpoint.result_id,
+            checkpoint.execution_id,
+            checkpoint.wing_id,
+            checkpoint.windows_completed,
+            checkpoint.next_window_start_us,
+            checkpoint.last_match_rowid,
+            checkpoint.total_matches,
+            json.dumps(checkpoint.statistics, default=str),
+            checkpoint.status,
+            datetime.now().isoformat()
+        ))
+        self.conn.commit()
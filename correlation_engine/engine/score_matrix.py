@@ -0,0 +1,178 @@
+"""
+Batched Weighted Scoring
+
+A match's weighted score only depends on which of the wing's feathers it
+contains, so a batch of matches is scored as a whole:
+- the batch becomes a feather-presence bitmap matrix (one row per match, one
+  column per wing feather)
+- scores are one matrix-vector product of that matrix with the wing's
+  weight vector
+- interpretation levels are one sorted-threshold lookup over all scores
+- distinct matrix rows are the feather combinations of the batch; result
+  breakdowns are built once per combination instead of once per match
+
+Scores are the same as WeightedScoringEngine.calculate_match_score() gives
+match by match.
+"""
+
+from bisect import bisect_right
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+
+def _feather_spec_values(feather_spec: Any) -> Tuple[str, float, int, str]:
+    """(feather_id, weight, tier, tier_name) of a wing feather"""
+    if isinstance(feather_spec, dict):
+        return (feather_spec.get('feather_id', ''), feather_spec.get('weight', 0.0),
+                feather_spec.get('tier', 0), feather_spec.get('tier_name', ''))
+    return (getattr(feather_spec, 'feather_id', ''), getattr(feather_spec, 'weight', 0.0),
+            getattr(feather_spec, 'tier', 0), getattr(feather_spec, 'tier_name', ''))
+
+
+def _matched_feather_ids(match_records: Any) -> Iterable[str]:
+    """Feather IDs of a match's feather_records (a feather_id -> records dict)"""
+    return match_records.keys() if isinstance(match_records, dict) else ()
+
+
+class WingWeightVector:
+    """Weights of a wing's feathers, one column per feather in wing order"""
+
+    def __init__(self, wing_config: Any):
+        """
+        Read the feather weights of a wing.
+
+        Args:
+            wing_config: Wing configuration with feathers (dicts or objects)
+        """
+        self.feather_ids: List[str] = []
+        self.weights: List[float] = []
+        self.tiers: List[int] = []
+        self.tier_names: List[str] = []
+        self._columns: Dict[str, List[int]] = {}
+
+        for feather_spec in getattr(wing_config, 'feathers', []) or []:
+            feather_id, weight, tier, tier_name = _feather_spec_values(feather_spec)
+            self._columns.setdefault(feather_id, []).append(len(self.feather_ids))
+            self.feather_ids.append(feather_id)
+            self.weights.append(weight)
+            self.tiers.append(tier)
+            self.tier_names.append(tier_name)
+
+    def __len__(self) -> int:
+        return len(self.feather_ids)
+
+    def presence_matrix(self, match_records_list: Sequence[Any]):
+        """
+        Feather-presence bitmap of a batch of matches.
+
+        Args:
+            match_records_list: feather_records of each match (feather_id -> records)
+
+        Returns:
+            uint8 matrix of shape (matches, feathers), or a list of row
+            tuples when numpy is unavailable
+        """
+        columns = self._columns
+        if NUMPY_AVAILABLE:
+            row_indices: List[int] = []
+            column_indices: List[int] = []
+            for row, match_records in enumerate(match_records_list):
+                for feather_id in _matched_feather_ids(match_records):
+                    for column in columns.get(feather_id, ()):
+                        row_indices.append(row)
+                        column_indices.append(column)
+            matrix = np.zeros((len(match_records_list), len(self.feather_ids)), dtype=np.uint8)
+            matrix[row_indices, column_indices] = 1
+            return matrix
+
+        rows = []
+        for match_records in match_records_list:
+            row = [0] * len(self.feather_ids)
+            for feather_id in _matched_feather_ids(match_records):
+                for column in columns.get(feather_id, ()):
+                    row[column] = 1
+            rows.append(tuple(row))
+        return rows
+
+    def score_batch(self, match_records_list: Sequence[Any]) -> Tuple[List[float], List[int], List[Tuple[int, ...]]]:
+        """
+        Weighted scores of a batch of matches.
+
+        Args:
+            match_records_list: feather_records of each match
+
+        Returns:
+            Tuple (scores, pattern_ids, patterns): the unrounded score of each
+            match, the index of its feather combination, and the presence row
+            of each distinct combination
+        """
+        if not match_records_list:
+            return [], [], []
+        matrix = self.presence_matrix(match_records_list)
+
+        if NUMPY_AVAILABLE:
+            scores = matrix.astype(np.float64) @ np.asarray(self.weights, dtype=np.float64)
+            if len(self.feather_ids):
+                unique_rows, pattern_ids = np.unique(matrix, axis=0, return_inverse=True)
+                patterns = [tuple(int(bit) for bit in row) for row in unique_rows]
+                pattern_ids = pattern_ids.reshape(-1).tolist()
+            else:
+                patterns, pattern_ids = [()], [0] * len(match_records_list)
+            return scores.tolist(), pattern_ids, patterns
+
+        weights = self.weights
+        pattern_index: Dict[Tuple[int, ...], int] = {}
+        scores, pattern_ids = [], []
+        for row in matrix:
+            scores.append(sum(weight for bit, weight in zip(row, weights) if bit))
+            pattern_ids.append(pattern_index.setdefault(row, len(pattern_index)))
+        return scores, pattern_ids, list(pattern_index)
+
+    def breakdown(self, pattern: Sequence[int]) -> Dict[str, Dict[str, Any]]:
+        """Per-feather score breakdown of one feather combination"""
+        breakdown = {}
+        for column, feather_id in enumerate(self.feather_ids):
+            matched = bool(pattern[column])
+            weight = self.weights[column]
+            breakdown[feather_id] = {
+                'matched': matched,
+                'weight': weight,
+                'contribution': weight if matched else 0.0,
+                'tier': self.tiers[column],
+                'tier_name': self.tier_names[column]
+            }
+        return breakdown
+
+
+class ScoreThresholds:
+    """
+    Interpretation levels of a score_interpretation config, for lookups in bulk.
+
+    A score gets the level with the highest minimum it reaches; of levels
+    with the same minimum, the first configured one.
+    """
+
+    def __init__(self, interpretation_config: Optional[Dict[str, Dict[str, Any]]]):
+        first_level_by_min: Dict[float, str] = {}
+        for level, config in (interpretation_config or {}).items():
+            first_level_by_min.setdefault(config.get('min', 0.0), level)
+        ordered = sorted(first_level_by_min.items())
+        self.minimums: List[float] = [minimum for minimum, _ in ordered]
+        self.levels: List[str] = [level for _, level in ordered]
+
+    def lookup(self, scores: Iterable[float]) -> List[Optional[str]]:
+        """Level of each score (None when below every minimum)"""
+        if not self.levels:
+            return [None for _ in scores]
+        if NUMPY_AVAILABLE:
+            positions = np.searchsorted(np.asarray(self.minimums, dtype=np.float64),
+                                        np.asarray(list(scores), dtype=np.float64), side='right') - 1
+            positions = positions.tolist()
+        else:
+            positions = [bisect_right(self.minimums, score) - 1 for score in scores]
+        return [self.levels[position] if position >= 0 else None for position in positions]
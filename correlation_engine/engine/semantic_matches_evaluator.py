@@ -28,6 +28,8 @@ import json
 from typing import Dict, List, Any, Optional
 from dataclasses import dataclass
 
+from .match_payload import MatchPayloadCodec
+
 logger = logging.getLogger(__name__)
 
 
@@ -120,6 +122,7 @@ class SemanticMatchesEvaluator:
         """
         self.db_path = db_path
         self.connection = None
+        self.payload_codec: Optional[MatchPayloadCodec] = None
         self.use_query_based = use_query_based
         self.use_fts5 = use_fts5
         self.min_indicators_required = max(1, min_indicators_required)  # At least 1
@@ -195,7 +198,7 @@ class SemanticMatchesEvaluator:
             # Populate FTS5 table
             cursor.execute("""
                 INSERT INTO matches_fts5(match_id, feather_records, matched_application)
-                SELECT match_id, feather_records, matched_application
+                SELECT match_id, feather_records_json(feather_records), matched_application
                 FROM matches
             """)
             
@@ -212,6 +215,7 @@ class SemanticMatchesEvaluator:
         if not self.connection:
             self.connection = sqlite3.connect(self.db_path)
             self.connection.row_factory = sqlite3.Row
+            self.payload_codec = MatchPayloadCodec(self.connection).register_functions()
             logger.debug(f"Connected to database: {self.db_path}")
     
     def close(self):
@@ -257,7 +261,7 @@ class SemanticMatchesEvaluator:
                 continue
             
             try:
-                feather_records = json.loads(feather_records_json)
+                feather_records = self.payload_codec.decode(feather_records_json)
                 
                 # Filter out metadata records
                 filtered_records = self._filter_metadata_records(feather_records)
@@ -735,7 +739,7 @@ class SemanticMatchesEvaluator:
                 continue
             
             try:
-                feather_records = json.loads(feather_records_json)
+                feather_records = self.payload_codec.decode(feather_records_json)
                 
                 # Filter out metadata records
                 filtered_records = self._filter_metadata_records(feather_records)
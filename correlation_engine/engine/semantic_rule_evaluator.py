@@ -22,6 +22,7 @@ from dataclasses import dataclass, field
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
 from ..config.semantic_mapping import SemanticRule, SemanticCondition, SemanticMappingManager
+from ..config.semantic_rule_compiler import compile_rule_set
 
 logger = logging.getLogger(__name__)
 
@@ -1650,51 +1651,38 @@ class SemanticRuleEvaluator:
             logger.debug("No records found in identity data for in-memory evaluation")
             return []
         
-        # Evaluate each rule using existing in-memory logic
+        # Evaluate all rules through their compiled rule set
         matched_results = []
         
-        for rule in rules:
-            try:
-                # Use the rule's evaluate method (existing in-memory logic)
-                matches, matched_conditions = rule.evaluate(records)
-                
-                if matches:
-                    # Extract feather_ids from matched_conditions (format: "feather_id.field_name")
-                    matched_feather_ids = list(set(
-                        cond.split('.')[0] for cond in matched_conditions
-                    ))
-                    
-                    # Create semantic match result
-                    result = SemanticMatchResult(
-                        rule_id=rule.rule_id,
-                        rule_name=rule.name,
-                        semantic_value=rule.semantic_value,
-                        logic_operator=rule.logic_operator,
-                        matched_feathers=matched_feather_ids,  # Use extracted feather_ids
-                        conditions=[
-                            f"{c.feather_id}.{c.field_name} {c.operator} '{c.value}'"
-                            for c in rule.conditions
-                        ],
-                        confidence=rule.confidence,
-                        category=rule.category,
-                        severity=rule.severity,
-                        scope=rule.scope
-                    )
-                    matched_results.append(result)
-                    
-                    if self.debug_mode:
-                        logger.debug(
-                            f"In-memory evaluation: Rule '{rule.name}' matched with "
-                            f"feathers: {matched_conditions}"
-                        )
-                        
-            except Exception as e:
-                # Log error but continue with other rules
-                logger.error(
-                    f"Error evaluating rule '{rule.rule_id}' in fallback mode: {e}",
-                    exc_info=True
+        for rule, matched_conditions in self._match_rules(rules, records):
+            # Extract feather_ids from matched_conditions (format: "feather_id.field_name")
+            matched_feather_ids = list(set(
+                cond.split('.')[0] for cond in matched_conditions
+            ))
+            
+            # Create semantic match result
+            result = SemanticMatchResult(
+                rule_id=rule.rule_id,
+                rule_name=rule.name,
+                semantic_value=rule.semantic_value,
+                logic_operator=rule.logic_operator,
+                matched_feathers=matched_feather_ids,  # Use extracted feather_ids
+                conditions=[
+                    f"{c.feather_id}.{c.field_name} {c.operator} '{c.value}'"
+                    for c in rule.conditions
+                ],
+                confidence=rule.confidence,
+                category=rule.category,
+                severity=rule.severity,
+                scope=rule.scope
+            )
+            matched_results.append(result)
+            
+            if self.debug_mode:
+                logger.debug(
+                    f"In-memory evaluation: Rule '{rule.name}' matched with "
+                    f"feathers: {matched_conditions}"
                 )
-                continue
         
         logger.info(
             f"In-memory fallback evaluation completed: {len(matched_results)} rules matched "
@@ -1703,6 +1691,40 @@ class SemanticRuleEvaluator:
         
         return matched_results
     
+    def _match_rules(self, rules: List[SemanticRule],
+                     records: Dict[str, Dict[str, Any]]) -> List[Tuple[SemanticRule, List[str]]]:
+        """
+        Evaluate rules in memory through their compiled rule set.
+        
+        Identical predicates across the rules are evaluated once per record
+        (see config/semantic_rule_compiler.py). If the compiled evaluation
+        fails, the rules are evaluated one by one so a single bad rule only
+        skips itself.
+        
+        Args:
+            rules: Rules to evaluate
+            records: Dict mapping feather_id to record data
+            
+        Returns:
+            (rule, matched_conditions) for every matching rule, in rule order
+        """
+        try:
+            return compile_rule_set(rules).evaluate(records)
+        except Exception as e:
+            logger.error(f"Compiled rule evaluation failed, evaluating rules one by one: {e}", exc_info=True)
+        
+        matches = []
+        for rule in rules:
+            try:
+                is_match, matched_conditions = rule.evaluate(records)
+            except Exception as e:
+                # Log error but continue with other rules
+                logger.error(f"Error evaluating rule '{rule.rule_id}': {e}", exc_info=True)
+                continue
+            if is_match:
+                matches.append((rule, matched_conditions))
+        return matches
+    
     def _evaluate_identity_level_rules(self, identity_data: Dict[str, Any], 
                                        rules: List[SemanticRule]) -> List[SemanticMatchResult]:
         """
@@ -1792,47 +1814,34 @@ class SemanticRuleEvaluator:
             }
         }
         
-        # Evaluate each identity-level rule using existing in-memory logic
+        # Evaluate all identity-level rules through their compiled rule set
         matched_results = []
         
-        for rule in identity_rules:
-            try:
-                # Use the rule's evaluate method (existing in-memory logic)
-                matches, matched_conditions = rule.evaluate(records)
-                
-                if matches:
-                    # Create semantic match result
-                    result = SemanticMatchResult(
-                        rule_id=rule.rule_id,
-                        rule_name=rule.name,
-                        semantic_value=rule.semantic_value,
-                        logic_operator=rule.logic_operator,
-                        matched_feathers=["_identity"],  # Identity-level rules match against _identity
-                        conditions=[
-                            f"{c.feather_id}.{c.field_name} {c.operator} '{c.value}'"
-                            for c in rule.conditions
-                        ],
-                        confidence=rule.confidence,
-                        category=rule.category,
-                        severity=rule.severity,
-                        scope=rule.scope
-                    )
-                    matched_results.append(result)
-                    
-                    if self.debug_mode:
-                        logger.debug(
-                            f"Identity-level rule '{rule.name}' matched: {rule.semantic_value} "
-                            f"(identity_type={records['_identity']['identity_type']}, "
-                            f"identity_value={records['_identity']['identity_value']})"
-                        )
-                        
-            except Exception as e:
-                # Log error but continue with other rules
-                logger.error(
-                    f"Error evaluating identity-level rule '{rule.rule_id}': {e}",
-                    exc_info=True
+        for rule, matched_conditions in self._match_rules(identity_rules, records):
+            # Create semantic match result
+            result = SemanticMatchResult(
+                rule_id=rule.rule_id,
+                rule_name=rule.name,
+                semantic_value=rule.semantic_value,
+                logic_operator=rule.logic_operator,
+                matched_feathers=["_identity"],  # Identity-level rules match against _identity
+                conditions=[
+                    f"{c.feather_id}.{c.field_name} {c.operator} '{c.value}'"
+                    for c in rule.conditions
+                ],
+                confidence=rule.confidence,
+                category=rule.category,
+                severity=rule.severity,
+                scope=rule.scope
+            )
+            matched_results.append(result)
+            
+            if self.debug_mode:
+                logger.debug(
+                    f"Identity-level rule '{rule.name}' matched: {rule.semantic_value} "
+                    f"(identity_type={records['_identity']['identity_type']}, "
+                    f"identity_value={records['_identity']['identity_value']})"
                 )
-                continue
         
         logger.debug(
             f"Identity-level evaluation completed: {len(matched_results)} rules matched "
@@ -6,14 +6,13 @@ Instead of storing all matches in memory, matches are written directly to a SQLi
 for later retrieval and analysis.
 """
 
-import sqlite3
 import json
-import uuid
 from datetime import datetime
-from typing import Dict, Any, Optional, List, Tuple
+from typing import Dict, Any, List
 from pathlib import Path
 from dataclasses import dataclass
 
+from . import database_persistence
 from .correlation_result import CorrelationMatch
 
 
@@ -27,12 +26,26 @@ class StreamingConfig:
     memory_limit_mb: int = 500  # Memory limit that triggers streaming mode
 
 
-class StreamingMatchWriter:
+class StreamingMatchWriter(database_persistence.StreamingMatchWriter):
     """
     Writes correlation matches directly to SQLite database for streaming mode.
     
     This allows processing of very large result sets without running out of memory.
-    Matches are written in batches for optimal performance.
+    Uses the background writer of database_persistence.StreamingMatchWriter
+    (bounded queue, large executemany transactions, backpressure counters)
+    with the streaming_results / streaming_matches tables.
+    """
+    
+    MATCH_INSERT_SQL = """
+        INSERT INTO streaming_matches (
+            match_id, result_id, timestamp, match_score, feather_count,
+            time_spread_seconds, anchor_feather_id, anchor_artifact_type,
+            matched_application, matched_file_path, matched_event_id,
+            confidence_score, confidence_category, algorithm_version,
+            is_duplicate, feather_records, score_breakdown, weighted_score,
+            time_deltas, field_similarity_scores, candidate_counts,
+            semantic_data, duplicate_info
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
     """
     
     def __init__(self, config: StreamingConfig):
@@ -43,25 +56,15 @@ class StreamingMatchWriter:
             config: StreamingConfig with database path and settings
         """
         self.config = config
-        self.database_path = Path(config.database_path)
-        self.conn: Optional[sqlite3.Connection] = None
-        self.batch_buffer: List[Tuple[int, CorrelationMatch]] = []
-        self.total_matches_written = 0
         self.current_result_id = 0
         
         # Ensure database directory exists
-        self.database_path.parent.mkdir(parents=True, exist_ok=True)
+        Path(config.database_path).parent.mkdir(parents=True, exist_ok=True)
         
-        # Initialize database
-        self._initialize_database()
+        super().__init__(str(config.database_path), batch_size=config.batch_size)
     
-    def _initialize_database(self):
+    def _ensure_schema(self):
         """Initialize SQLite database with streaming tables."""
-        self.conn = sqlite3.connect(str(self.database_path))
-        
-        # Enable WAL mode for better concurrent access
-        self.conn.execute("PRAGMA journal_mode=WAL")
-        
         # Enable auto-vacuum if configured
         if self.config.auto_vacuum:
             self.conn.execute("PRAGMA auto_vacuum=INCREMENTAL")
@@ -151,102 +154,53 @@ class StreamingMatchWriter:
         Returns:
             result_id for this streaming session
         """
-        cursor = self.conn.cursor()
-        cursor.execute("""
-            INSERT INTO streaming_results 
-            (wing_id, wing_name, execution_time, filters_applied)
-            VALUES (?, ?, ?, ?)
-        """, (
-            wing_id,
-            wing_name,
-            datetime.now().isoformat(),
-            json.dumps(filters_applied or {})
-        ))
+        with self.lock:
+            cursor = self.conn.cursor()
+            cursor.execute("""
+                INSERT INTO streaming_results 
+                (wing_id, wing_name, execution_time, filters_applied)
+                VALUES (?, ?, ?, ?)
+            """, (
+                wing_id,
+                wing_name,
+                datetime.now().isoformat(),
+                json.dumps(filters_applied or {})
+            ))
         
-        result_id = cursor.lastrowid
-        self.current_result_id = result_id
-        self.conn.commit()
+            result_id = cursor.lastrowid
+            self.current_result_id = result_id
+            self.conn.commit()
         
         # print(f"[StreamingWriter] Created result session {result_id} for wing {wing_id}")
         return result_id
     
-    def write_match(self, result_id: int, match: CorrelationMatch):
-        """
-        Write a correlation match to the streaming database.
-        
-        Args:
-            result_id: Result session ID
-            match: CorrelationMatch to write
-        """
-        # Add to batch buffer
-        self.batch_buffer.append((result_id, match))
-        
-        # Write batch if buffer is full
-        if len(self.batch_buffer) >= self.config.batch_size:
-            self._flush_batch()
-    
-    def _flush_batch(self):
-        """Flush the current batch of matches to database."""
-        if not self.batch_buffer:
-            return
-        
-        # Prepare batch data
-        batch_data = []
-        for result_id, match in self.batch_buffer:
-            batch_data.append((
-                match.match_id,
-                result_id,
-                match.timestamp,
-                match.match_score,
-                match.feather_count,
-                match.time_spread_seconds,
-                match.anchor_feather_id,
-                match.anchor_artifact_type,
-                match.matched_application,
-                match.matched_file_path,
-                match.matched_event_id,
-                match.confidence_score,
-                match.confidence_category,
-                match.algorithm_version,
-                1 if match.is_duplicate else 0,
-                json.dumps(match.feather_records) if match.feather_records else '{}',
-                json.dumps(match.score_breakdown) if match.score_breakdown else None,
-                json.dumps(match.weighted_score) if match.weighted_score else None,
-                json.dumps(match.time_deltas) if match.time_deltas else None,
-                json.dumps(match.field_similarity_scores) if match.field_similarity_scores else None,
-                json.dumps(match.candidate_counts) if match.candidate_counts else None,
-                json.dumps(match.semantic_data) if match.semantic_data else None,
-                json.dumps(match.duplicate_info.to_dict() if hasattr(match.duplicate_info, 'to_dict') else match.duplicate_info) if match.duplicate_info else None
-            ))
-        
-        # Execute batch insert
-        self.conn.executemany("""
-            INSERT INTO streaming_matches (
-                match_id, result_id, timestamp, match_score, feather_count,
-                time_spread_seconds, anchor_feather_id, anchor_artifact_type,
-                matched_application, matched_file_path, matched_event_id,
-                confidence_score, confidence_category, algorithm_version,
-                is_duplicate, feather_records, score_breakdown, weighted_score,
-                time_deltas, field_similarity_scores, candidate_counts,
-                semantic_data, duplicate_info
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, batch_data)
-        
-        self.conn.commit()
-        
-        # Update statistics
-        self.total_matches_written += len(self.batch_buffer)
-        
-        # print(f"[StreamingWriter] Flushed batch of {len(self.batch_buffer)} matches "
-        #       f"(total: {self.total_matches_written})")
-        
-        # Clear buffer
-        self.batch_buffer.clear()
-    
-    def flush(self):
-        """Flush any remaining matches in the buffer."""
-        if self.batch_buffer:
-            self._flush_batch()
+    def _serialize_match(self, result_id: int, match: CorrelationMatch) -> tuple:
+        """Row for MATCH_INSERT_SQL (runs on the writer thread)"""
+        return (
+            match.match_id,
+            result_id,
+            match.timestamp,
+            match.match_score,
+            match.feather_count,
+            match.time_spread_seconds,
+            match.anchor_feather_id,
+            match.anchor_artifact_type,
+            match.matched_application,
+            match.matched_file_path,
+            match.matched_event_id,
+            match.confidence_score,
+            match.confidence_category,
+            match.algorithm_version,
+            1 if match.is_duplicate else 0,
+            json.dumps(match.feather_records) if match.feather_records else '{}',
+            json.dumps(match.score_breakdown) if match.score_breakdown else None,
+            json.dumps(match.weighted_score) if match.weighted_score else None,
+            json.dumps(match.time_deltas) if match.time_deltas else None,
+            json.dumps(match.field_similarity_scores) if match.field_similarity_scores else None,
+            json.dumps(match.candidate_counts) if match.candidate_counts else None,
+            json.dumps(match.semantic_data) if match.semantic_data else None,
+            json.dumps(match.duplicate_info.to_dict() if hasattr(match.duplicate_info, 'to_dict') else match.duplicate_info) if match.duplicate_info else None
+        )
     
     def finalize_result_session(self, result_id: int, execution_duration: float,
                               total_matches: int, feathers_processed: int,
@@ -262,50 +216,43 @@ class StreamingMatchWriter:
         self.flush()
         
         # Update result session
-        self.conn.execute("""
-            UPDATE streaming_results SET
-                execution_duration_seconds = ?,
-                total_matches = ?,
-                feathers_processed = ?,
-                total_records_scanned = ?,
-                duplicates_prevented = ?,
-                anchor_feather_id = ?,
-                anchor_selection_reason = ?,
-                feather_metadata = ?,
-                performance_metrics = ?,
-                errors = ?,
-                warnings = ?,
-                completed_at = CURRENT_TIMESTAMP,
-                status = 'completed'
-            WHERE result_id = ?
-        """, (
-            execution_duration,
-            total_matches,
-            feathers_processed,
-            total_records_scanned,
-            duplicates_prevented,
-            anchor_feather_id,
-            anchor_selection_reason,
-            json.dumps(feather_metadata or {}),
-            json.dumps(performance_metrics or {}),
-            json.dumps(errors or []),
-            json.dumps(warnings or []),
-            result_id
-        ))
+        with self.lock:
+            self.conn.execute("""
+                UPDATE streaming_results SET
+                    execution_duration_seconds = ?,
+                    total_matches = ?,
+                    feathers_processed = ?,
+                    total_records_scanned = ?,
+                    duplicates_prevented = ?,
+                    anchor_feather_id = ?,
+                    anchor_selection_reason = ?,
+                    feather_metadata = ?,
+                    performance_metrics = ?,
+                    errors = ?,
+                    warnings = ?,
+                    completed_at = CURRENT_TIMESTAMP,
+                    status = 'completed'
+                WHERE result_id = ?
+            """, (
+                execution_duration,
+                total_matches,
+                feathers_processed,
+                total_records_scanned,
+                duplicates_prevented,
+                anchor_feather_id,
+                anchor_selection_reason,
+                json.dumps(feather_metadata or {}),
+                json.dumps(performance_metrics or {}),
+                json.dumps(errors or []),
+                json.dumps(warnings or []),
+                result_id
+            ))
         
-        self.conn.commit()
+            self.conn.commit()
         
         # print(f"[StreamingWriter] Finalized result session {result_id}: "
         #       f"{total_matches} matches, {execution_duration:.2f}s")
     
-    def close(self):
-        """Close the database connection."""
-        if self.conn:
-            self.flush()  # Ensure all data is written
-            self.conn.close()
-            self.conn = None
-            # print(f"[StreamingWriter] Closed database connection")
-
 
 def create_streaming_manager(database_path: str, memory_limit_mb: int = 500) -> StreamingMatchWriter:
     """
@@ -0,0 +1,490 @@
+"""
+Sweep-Line Feather Scanner for Time-Window Scanning Engine
+
+Streams every feather exactly once in timestamp order and serves consecutive
+time windows from a sliding buffer, instead of issuing one range query per
+feather for every generated window.
+
+Per-window querying costs O(windows x feathers) SQLite queries.  The sweep
+line opens one ordered cursor per (feather, timestamp column) and advances it
+monotonically as windows move forward, so total I/O is O(records).
+
+Window membership reproduces the SQL semantics of
+OptimizedFeatherQuery.query_time_range exactly:
+- Bounds are converted with the feather's own _convert_datetime_for_query
+- SQLite type ordering (NULL < numbers < text < blob) is emulated in Python
+- Column affinity is applied to the bound values like SQLite does for
+  "column >= ?" comparisons
+- A record belongs to a window if ANY timestamp column falls in the range
+- Records are returned ordered by the primary timestamp column, ties by rowid
+"""
+
+import heapq
+import re
+import sqlite3
+import threading
+from collections import deque
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Deque, Dict, Iterator, List, Optional, Tuple
+
+
+# Rows fetched per cursor round trip while streaming
+STREAM_FETCH_SIZE = 2000
+
+_INTEGER_TEXT = re.compile(r'^\s*[+-]?\d+\s*$')
+_REAL_TEXT = re.compile(r'^\s*[+-]?(\d+\.?\d*|\.\d+)([eE][+-]?\d+)?\s*$')
+
+
+def sqlite_column_affinity(declared_type: Optional[str]) -> str:
+    """
+    Determine SQLite column affinity from a declared column type.
+
+    Follows the rules from section 3.1 of the SQLite datatype documentation.
+
+    Args:
+        declared_type: Declared type from PRAGMA table_info (may be empty)
+
+    Returns:
+        One of 'INTEGER', 'TEXT', 'BLOB', 'REAL', 'NUMERIC'
+    """
+    declared = (declared_type or '').upper()
+
+    if 'INT' in declared:
+        return 'INTEGER'
+    if 'CHAR' in declared or 'CLOB' in declared or 'TEXT' in declared:
+        return 'TEXT'
+    if not declared or 'BLOB' in declared:
+        return 'BLOB'
+    if 'REAL' in declared or 'FLOA' in declared or 'DOUB' in declared:
+        return 'REAL'
+    return 'NUMERIC'
+
+
+def sqlite_sort_key(value: Any) -> Tuple:
+    """
+    Build a Python sort key that orders values the way SQLite's BINARY
+    collation does: NULL < INTEGER/REAL < TEXT < BLOB.
+
+    Python compares str by code point, which is the same order as comparing
+    their UTF-8 encodings byte by byte.
+    """
+    if value is None:
+        return (0, 0)
+    if isinstance(value, (int, float)):
+        return (1, value)
+    if isinstance(value, str):
+        return (2, value)
+    return (3, bytes(value))
+
+
+def apply_comparison_affinity(value: Any, affinity: str) -> Any:
+    """
+    Convert a bound parameter the way SQLite does before comparing it with
+    a column of the given affinity.
+
+    Bound parameters have no affinity, so:
+    - TEXT columns convert numeric parameters to text
+    - INTEGER/REAL/NUMERIC columns convert well-formed numeric text to numbers
+    - BLOB (no affinity) columns compare the parameter unchanged
+    """
+    if affinity == 'TEXT':
+        if isinstance(value, bool):
+            return str(int(value))
+        if isinstance(value, int):
+            return str(value)
+        if isinstance(value, float):
+            text = '%.15g' % value
+            if '.' not in text and 'e' not in text and 'n' not in text:
+                text += '.0'
+            return text
+        return value
+
+    if affinity in ('INTEGER', 'REAL', 'NUMERIC') and isinstance(value, str):
+        if _INTEGER_TEXT.match(value):
+            return int(value)
+        if _REAL_TEXT.match(value):
+            return float(value)
+
+    return value
+
+
+@dataclass
+class SweepStatistics:
+    """Counters describing sweep-line scanning work."""
+    streams_opened: int = 0
+    records_streamed: int = 0
+    windows_served: int = 0
+    buffer_checks: int = 0
+    fallback_queries: int = 0
+    feathers_disabled: int = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'streams_opened': self.streams_opened,
+            'records_streamed': self.records_streamed,
+            'windows_served': self.windows_served,
+            'buffer_checks': self.buffer_checks,
+            'fallback_queries': self.fallback_queries,
+            'feathers_disabled': self.feathers_disabled
+        }
+
+
+class _ColumnStream:
+    """Ordered cursor over one timestamp column of one feather."""
+
+    def __init__(self, connection: sqlite3.Connection, table: str, column: str,
+                 affinity: str, stats: SweepStatistics):
+        self.column = column
+        self.affinity = affinity
+        self.stats = stats
+
+        # Rows are ordered by (column, rowid); with the timestamp index this is
+        # a plain index walk and ties come out in rowid order, matching the
+        # order an indexed range query returns them.
+        self._cursor = connection.cursor()
+        self._cursor.execute(f'''
+            SELECT rowid, * FROM "{table}"
+            WHERE "{column}" IS NOT NULL
+            ORDER BY "{column}", rowid
+        ''')
+        self.columns = [description[0] for description in self._cursor.description[1:]]
+        self._value_index = self.columns.index(column) + 1
+        self._batch: List[Tuple] = []
+        self._batch_pos = 0
+        self._exhausted = False
+        self.head: Optional[Tuple[Tuple, int, Tuple]] = None  # (key, rowid, row)
+        self._load_head()
+
+        stats.streams_opened += 1
+
+    def _load_head(self):
+        if self._batch_pos >= len(self._batch):
+            if self._exhausted:
+                self.head = None
+                return
+            self._batch = self._cursor.fetchmany(STREAM_FETCH_SIZE)
+            self._batch_pos = 0
+            if not self._batch:
+                self._exhausted = True
+                self.head = None
+                return
+
+        row = self._batch[self._batch_pos]
+        self._batch_pos += 1
+        self.head = (sqlite_sort_key(row[self._value_index]), row[0], row)
+
+    def pull_until(self, end_key: Tuple) -> Iterator[Tuple[Tuple, int, Tuple]]:
+        """Yield (key, rowid, row) entries with key <= end_key, advancing the cursor."""
+        while self.head is not None and self.head[0] <= end_key:
+            entry = self.head
+            self.stats.records_streamed += 1
+            self._load_head()
+            yield entry
+
+    def close(self):
+        try:
+            self._cursor.close()
+        except Exception:
+            pass
+
+
+class FeatherSweepState:
+    """
+    Sliding buffer for one feather.
+
+    Each timestamp column keeps a deque of (key, rowid) entries whose key is
+    at most the latest window end.  Entries are evicted once they fall before
+    the current window start.  Full records are stored once per rowid and
+    reference-counted across columns.
+    """
+
+    def __init__(self, feather_id: str, database_path: str, table: str,
+                 timestamp_columns: List[str], stats: SweepStatistics):
+        self.feather_id = feather_id
+        self.table = table
+        self.stats = stats
+
+        self._connection = sqlite3.connect(
+            f"file:{database_path}?mode=ro", uri=True, check_same_thread=False
+        )
+
+        cursor = self._connection.cursor()
+
+        # Views (e.g. union views over several tables) have no stable rowid
+        cursor.execute("SELECT type FROM sqlite_master WHERE name = ?", (table,))
+        row = cursor.fetchone()
+        if not row or row[0] != 'table':
+            self._connection.close()
+            raise ValueError(f"{table} is not a rowid table")
+
+        cursor.execute(f'PRAGMA table_info("{table}")')
+        declared_types = {row[1].lower(): (row[1], row[2]) for row in cursor.fetchall()}
+
+        self.columns: List[str] = []
+        affinities: List[str] = []
+        for column in timestamp_columns:
+            resolved = declared_types.get(column.lower())
+            if not resolved:
+                raise ValueError(f"Timestamp column '{column}' not found in {table}")
+            self.columns.append(resolved[0])
+            affinities.append(sqlite_column_affinity(resolved[1]))
+
+        self.streams = [
+            _ColumnStream(self._connection, table, column, affinity, stats)
+            for column, affinity in zip(self.columns, affinities)
+        ]
+        self.record_columns = self.streams[0].columns if self.streams else []
+        self._primary_index = self.record_columns.index(self.columns[0]) if self.columns else 0
+
+        self._buffers: List[Deque[Tuple[Tuple, int]]] = [deque() for _ in self.streams]
+        self._rows: Dict[int, Tuple] = {}
+        self._refcounts: Dict[int, int] = {}
+        self._last_start_keys: List[Optional[Tuple]] = [None for _ in self.streams]
+
+    def _bound_keys(self, bound_value: Any) -> List[Tuple]:
+        return [sqlite_sort_key(apply_comparison_affinity(bound_value, stream.affinity))
+                for stream in self.streams]
+
+    def can_serve(self, start_value: Any) -> bool:
+        """A window can be served only if its start does not move backwards."""
+        start_keys = self._bound_keys(start_value)
+        for start_key, last_key in zip(start_keys, self._last_start_keys):
+            if last_key is not None and start_key < last_key:
+                return False
+        return True
+
+    def advance(self, start_value: Any, end_value: Any) -> Tuple[List[Tuple], List[Tuple]]:
+        """Move the sweep line to [start_value, end_value] and return the column bound keys."""
+        start_keys = self._bound_keys(start_value)
+        end_keys = self._bound_keys(end_value)
+
+        for index, stream in enumerate(self.streams):
+            buffer = self._buffers[index]
+
+            # Evict entries that fell before the window start
+            start_key = start_keys[index]
+            while buffer and buffer[0][0] < start_key:
+                _, rowid = buffer.popleft()
+                self._release(rowid)
+
+            # Pull entries up to the window end.  Entries before the start are
+            # dropped right away; they can never belong to a later window.
+            for key, rowid, row in stream.pull_until(end_keys[index]):
+                if key < start_key:
+                    continue
+                buffer.append((key, rowid))
+                if rowid in self._refcounts:
+                    self._refcounts[rowid] += 1
+                else:
+                    self._refcounts[rowid] = 1
+                    self._rows[rowid] = row
+
+            self._last_start_keys[index] = start_key
+
+        return start_keys, end_keys
+
+    def _release(self, rowid: int):
+        remaining = self._refcounts[rowid] - 1
+        if remaining:
+            self._refcounts[rowid] = remaining
+        else:
+            del self._refcounts[rowid]
+            del self._rows[rowid]
+
+    def has_records(self, end_keys: List[Tuple]) -> bool:
+        """Check whether any buffered entry lies inside the current window."""
+        for index, buffer in enumerate(self._buffers):
+            if buffer and buffer[0][0] <= end_keys[index]:
+                return True
+        return False
+
+    def collect(self, end_keys: List[Tuple]) -> List[Dict[str, Any]]:
+        """
+        Return the records of the current window ordered like
+        "ORDER BY <primary timestamp column>" with ties broken by rowid.
+        """
+        primary_rowids: List[int] = []
+        seen = set()
+
+        # Primary column entries are already in (key, rowid) order
+        primary_end = end_keys[0]
+        for key, rowid in self._buffers[0]:
+            if key > primary_end:
+                break
+            primary_rowids.append(rowid)
+            seen.add(rowid)
+
+        # Records that matched only through secondary columns
+        extra: List[Tuple[Tuple, int]] = []
+        for index in range(1, len(self._buffers)):
+            column_end = end_keys[index]
+            for key, rowid in self._buffers[index]:
+                if key > column_end:
+                    break
+                if rowid not in seen:
+                    seen.add(rowid)
+                    primary_value = self._rows[rowid][self._primary_index + 1]
+                    extra.append((sqlite_sort_key(primary_value), rowid))
+
+        if extra:
+            extra.sort()
+            primary_entries = (
+                (sqlite_sort_key(self._rows[rowid][self._primary_index + 1]), rowid)
+                for rowid in primary_rowids
+            )
+            ordered_rowids = [rowid for _, rowid in heapq.merge(primary_entries, extra)]
+        else:
+            ordered_rowids = primary_rowids
+
+        columns = self.record_columns
+        return [dict(zip(columns, self._rows[rowid][1:])) for rowid in ordered_rowids]
+
+    def close(self):
+        for stream in self.streams:
+            stream.close()
+        self._buffers = [deque() for _ in self.streams]
+        self._rows.clear()
+        self._refcounts.clear()
+        try:
+            self._connection.close()
+        except Exception:
+            pass
+
+
+class SweepLineScanner:
+    """
+    Serves time windows for a set of feathers from single-pass ordered streams.
+
+    Windows must be requested with non-decreasing start times (which is how
+    the sequential scanner generates them).  Windows that move backwards, or
+    feathers whose streams cannot be opened, are answered by the feather's
+    regular per-window query so results never differ from the per-window path.
+    """
+
+    def __init__(self, feather_queries: Dict[str, Any], debug_mode: bool = False):
+        """
+        Initialize the scanner.
+
+        Args:
+            feather_queries: Dictionary mapping feather_id to OptimizedFeatherQuery
+            debug_mode: Enable debug logging
+        """
+        self.feather_queries = feather_queries
+        self.debug_mode = debug_mode
+        self.statistics = SweepStatistics()
+        self._states: Dict[str, FeatherSweepState] = {}
+        self._disabled: set = set()
+        self._lock = threading.Lock()
+        self._current_window: Optional[Tuple[datetime, datetime]] = None
+        self._current_bounds: Dict[str, Tuple[Any, Any, List[Tuple]]] = {}
+
+    def _get_state(self, feather_id: str) -> Optional[FeatherSweepState]:
+        if feather_id in self._disabled:
+            return None
+        state = self._states.get(feather_id)
+        if state is not None:
+            return state
+
+        query_manager = self.feather_queries[feather_id]
+        timestamp_columns = query_manager.get_range_columns()
+        if not timestamp_columns:
+            return None
+
+        try:
+            state = FeatherSweepState(
+                feather_id=feather_id,
+                database_path=query_manager.loader.database_path,
+                table=query_manager.loader.current_table,
+                timestamp_columns=timestamp_columns,
+                stats=self.statistics
+            )
+        except Exception as e:
+            # Fall back to per-window queries for this feather
+            self._disabled.add(feather_id)
+            self.statistics.feathers_disabled += 1
+            if self.debug_mode:
+                print(f"[SweepLineScanner] Streaming unavailable for {feather_id}, using per-window queries: {e}")
+            return None
+
+        self._states[feather_id] = state
+        return state
+
+    def _position(self, start_time: datetime, end_time: datetime) -> None:
+        """Advance every feather stream to the given window (idempotent per window)."""
+        if self._current_window == (start_time, end_time):
+            return
+
+        self._current_bounds = {}
+        for feather_id, query_manager in self.feather_queries.items():
+            state = self._get_state(feather_id)
+            if state is None:
+                continue
+
+            start_value = query_manager._convert_datetime_for_query(start_time)
+            end_value = query_manager._convert_datetime_for_query(end_time)
+            if not state.can_serve(start_value):
+                continue
+
+            _, end_keys = state.advance(start_value, end_value)
+            self._current_bounds[feather_id] = end_keys
+
+        self._current_window = (start_time, end_time)
+        self.statistics.windows_served += 1
+
+    def query_feather(self, feather_id: str, start_time: datetime, end_time: datetime) -> List[Dict[str, Any]]:
+        """
+        Get the records of one feather for a window.
+
+        Returns the same records, in the same order, as
+        OptimizedFeatherQuery.query_time_range(start_time, end_time).
+        """
+        query_manager = self.feather_queries[feather_id]
+        if not query_manager.timestamp_column:
+            return []
+
+        with self._lock:
+            self._position(start_time, end_time)
+            end_keys = self._current_bounds.get(feather_id)
+            if end_keys is not None:
+                return self._states[feather_id].collect(end_keys)
+
+        self.statistics.fallback_queries += 1
+        return query_manager.query_time_range(start_time, end_time)
+
+    def count_feather(self, feather_id: str, start_time: datetime, end_time: datetime) -> int:
+        """
+        Check one feather for records in a window without running a COUNT query.
+
+        Returns:
+            1 if the window has records, 0 if empty, -1 if the feather has no
+            timestamp columns (same contract as quick_count_in_range)
+        """
+        query_manager = self.feather_queries[feather_id]
+        if not query_manager.timestamp_column and not query_manager.timestamp_columns:
+            return -1
+
+        with self._lock:
+            self._position(start_time, end_time)
+            end_keys = self._current_bounds.get(feather_id)
+            if end_keys is not None:
+                self.statistics.buffer_checks += 1
+                return 1 if self._states[feather_id].has_records(end_keys) else 0
+
+        self.statistics.fallback_queries += 1
+        return query_manager.quick_count_in_range(start_time, end_time)
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Get sweep-line scanning statistics."""
+        stats = self.statistics.to_dict()
+        stats['streaming_feathers'] = len(self._states)
+        return stats
+
+    def close(self):
+        """Close all stream connections."""
+        with self._lock:
+            for state in self._states.values():
+                state.close()
+            self._states.clear()
+            self._current_window = None
+            self._current_bounds = {}
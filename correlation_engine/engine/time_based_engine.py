@@ -15,7 +15,7 @@ import logging
 import uuid
 import fnmatch
 from datetime import datetime, timedelta
-from typing import List, Dict, Any, Optional, Iterator, Tuple
+from typing import List, Dict, Any, Optional, Iterator, Tuple, Callable, TYPE_CHECKING
 from dataclasses import dataclass, field
 from pathlib import Path
 
@@ -53,7 +53,19 @@ CORE_IDENTITY_FIELDS = [
 ]
 from .memory_manager import WindowMemoryManager
 from .database_persistence import StreamingMatchWriter, ResultsDatabase
+from .match_payload import MatchPayloadCodec
 from .parallel_window_processor import ParallelWindowProcessor, ParallelProcessingStats
+from .sweep_line_scanner import SweepLineScanner
+from .time_bucket_histogram import TimeBucketHistogram, load_or_build_histogram
+from .scan_checkpoint import ScanCheckpoint, ScanCheckpointStore, compute_scan_signature
+from .epoch_timestamps import (
+    EPOCH_TIMESTAMP_FORMAT,
+    read_epoch_columns,
+    has_leading_index,
+    to_epoch_microseconds,
+    from_epoch_microseconds,
+    without_epoch_columns
+)
 from .progress_tracking import ProgressTracker, ProgressListener, ProgressEvent, ProgressEventType
 from .time_estimation import AdaptiveTimeEstimator
 from .cancellation_support import EnhancedCancellationManager
@@ -78,6 +90,9 @@ from ..optimization.optimization_components import (
 )
 from ..optimization.performance_config import PerformanceConfig
 
+if TYPE_CHECKING:
+    from .window_process_worker import WindowWorkerSpec
+
 # Initialize logger
 logger = logging.getLogger(__name__)
 
@@ -154,6 +169,9 @@ class OptimizedFeatherQuery:
         self.timestamp_columns = []  # List of timestamp column names
         self.timestamp_column = None  # Primary timestamp column (for backward compatibility)
         
+        # Timestamp column -> INTEGER epoch-microsecond column written at feather creation
+        self.epoch_columns: Dict[str, str] = {}
+        
         # Initialize resilient timestamp parser
         validation_rules = TimestampValidationRule(
             min_year=1970,
@@ -200,6 +218,9 @@ class OptimizedFeatherQuery:
         self._timestamp_range_cache: Optional[Tuple[Optional[datetime], Optional[datetime]]] = None
         self._timestamp_range_cached = False
         
+        # Persistent time-bucket histogram for O(1) range counts (see load_time_histogram)
+        self.time_histogram: Optional[TimeBucketHistogram] = None
+        
         # Cache for query results (for overlapping time windows) with LRU eviction
         self._query_result_cache: Dict[str, List[Dict[str, Any]]] = {}
         self._cache_access_order: List[str] = []  # Track access order for LRU eviction
@@ -230,6 +251,10 @@ class OptimizedFeatherQuery:
     
     def _detect_and_index_timestamps(self):
         """Detect timestamp columns and format, then ensure proper indexing with error handling"""
+        # Feathers created with epoch columns need no detection: ranges are integer scans
+        if self._load_epoch_columns():
+            return
+        
         def detect_operation(connection):
             # Try to detect timestamp columns using multiple methods
             # IMPORTANT: Run ALL methods and combine results for maximum coverage
@@ -437,6 +462,56 @@ class OptimizedFeatherQuery:
                 print(f"[OptimizedFeatherQuery] Failed to detect timestamps: {e}")
             # Continue without timestamp detection - queries will return empty results
     
+    def _load_epoch_columns(self) -> bool:
+        """
+        Use the epoch-microsecond columns recorded in feather metadata, if any.
+        
+        Returns:
+            True if the feather has epoch columns (timestamp columns are then
+            taken from the metadata instead of being detected)
+        """
+        def epoch_operation(connection):
+            return read_epoch_columns(connection, self.loader.current_table)
+        
+        try:
+            epoch_columns = self.error_handler.execute_with_retry(
+                operation=epoch_operation,
+                feather_id=getattr(self.loader, 'feather_id', 'unknown'),
+                database_path=self.loader.database_path,
+                operation_name="load_epoch_columns"
+            )
+        except Exception as e:
+            if self.debug_mode:
+                print(f"[OptimizedFeatherQuery] Could not read epoch columns: {e}")
+            return False
+        
+        if not epoch_columns:
+            return False
+        
+        self.epoch_columns = epoch_columns
+        self.timestamp_columns = list(epoch_columns)
+        self.timestamp_column = self.timestamp_columns[0]
+        self.timestamp_format = EPOCH_TIMESTAMP_FORMAT
+        
+        if self.debug_mode:
+            print(f"[OptimizedFeatherQuery] Using epoch columns: {epoch_columns}")
+        
+        return True
+    
+    def get_range_columns(self) -> List[str]:
+        """
+        Columns that time-range predicates filter on: the epoch columns when
+        the feather has them, otherwise the detected timestamp columns.
+        """
+        columns = self.timestamp_columns or ([self.timestamp_column] if self.timestamp_column else [])
+        return [self.epoch_columns.get(column, column) for column in columns]
+    
+    def _parse_range_value(self, value: Any) -> Optional[datetime]:
+        """Parse a value read from a range column"""
+        if self.epoch_columns:
+            return from_epoch_microseconds(value) if isinstance(value, int) else None
+        return self._parse_timestamp_value(value)
+    
     def _detect_timestamp_format_resilient(self, connection) -> str:
         """Detect timestamp format using resilient parser"""
         def format_detection_operation(conn):
@@ -724,39 +799,34 @@ class OptimizedFeatherQuery:
                 start_value = self._convert_datetime_for_query(start_time)
                 end_value = self._convert_datetime_for_query(end_time)
                 
+                # Epoch columns when available, so the predicates are integer range scans
+                range_columns = self.get_range_columns()
+                
                 # Build WHERE clause for multiple timestamp columns (OR condition)
                 # This allows records to match if ANY timestamp column falls in the range
-                if self.timestamp_columns and len(self.timestamp_columns) > 1:
+                if len(range_columns) > 1:
                     # Multiple timestamp columns - check all with OR
                     where_conditions = []
-                    for ts_col in self.timestamp_columns:
+                    for ts_col in range_columns:
                         where_conditions.append(f"({ts_col} >= ? AND {ts_col} <= ?)")
                     where_clause = " OR ".join(where_conditions)
                     
                     # Build parameter list (start, end for each column)
                     params = []
-                    for _ in self.timestamp_columns:
+                    for _ in range_columns:
                         params.extend([start_value, end_value])
                     
                     query = f"""
                         SELECT * FROM {self.loader.current_table}
                         WHERE {where_clause}
-                        ORDER BY {self.timestamp_columns[0]}
+                        ORDER BY {range_columns[0]}
                     """
-                elif self.timestamp_columns and len(self.timestamp_columns) == 1:
-                    # Single column in list
-                    query = f"""
-                        SELECT * FROM {self.loader.current_table}
-                        WHERE {self.timestamp_columns[0]} >= ? AND {self.timestamp_columns[0]} <= ?
-                        ORDER BY {self.timestamp_columns[0]}
-                    """
-                    params = [start_value, end_value]
-                elif self.timestamp_column:
-                    # Fallback to primary timestamp column
+                elif range_columns:
+                    # Single timestamp column
                     query = f"""
                         SELECT * FROM {self.loader.current_table}
-                        WHERE {self.timestamp_column} >= ? AND {self.timestamp_column} <= ?
-                        ORDER BY {self.timestamp_column}
+                        WHERE {range_columns[0]} >= ? AND {range_columns[0]} <= ?
+                        ORDER BY {range_columns[0]}
                     """
                     params = [start_value, end_value]
                 else:
@@ -831,6 +901,9 @@ class OptimizedFeatherQuery:
         CRITICAL: This must match the exact format stored in the database,
         otherwise range queries will fail to find records.
         """
+        if self.timestamp_format == EPOCH_TIMESTAMP_FORMAT:
+            return to_epoch_microseconds(dt)
+        
         if not self.timestamp_format or self.timestamp_format == 'unknown':
             # Try multiple formats to ensure we don't miss data
             # This is a fallback for when format detection fails
@@ -880,6 +953,20 @@ class OptimizedFeatherQuery:
             return self._timestamp_range_cache
         
         def range_operation(connection):
+            if self.epoch_columns:
+                # Epoch columns: exact conversion, no format guessing
+                epoch_column = self.get_range_columns()[0]
+                cursor = connection.cursor()
+                cursor.execute(f"""
+                    SELECT MIN({epoch_column}), MAX({epoch_column})
+                    FROM {self.loader.current_table}
+                    WHERE {epoch_column} IS NOT NULL
+                """)
+                result = cursor.fetchone()
+                if result and result[0] is not None:
+                    return self._parse_range_value(result[0]), self._parse_range_value(result[1])
+                return None, None
+            
             # OPTIMIZATION: Try to query numeric timestamps directly first (fast path)
             # This works for Unix timestamps (seconds/milliseconds) and is much faster
             try:
@@ -1239,6 +1326,11 @@ class OptimizedFeatherQuery:
         
         def check_index_operation(connection):
             try:
+                if self.epoch_columns:
+                    # Epoch columns are indexed at feather creation
+                    return has_leading_index(connection, self.loader.current_table,
+                                             self.get_range_columns()[0])
+                
                 cursor = connection.cursor()
                 index_name = f"idx_timewindow_{self.timestamp_column}"
                 
@@ -1352,6 +1444,9 @@ class OptimizedFeatherQuery:
         empty window detection. Supports multiple timestamp columns with OR logic.
         Target performance: <1ms per check.
         
+        When a time histogram is loaded the count comes from its prefix sums
+        instead: an upper bound that is 0 exactly when the range is empty.
+        
         CRITICAL: Returns -1 if no timestamp columns exist (can't check).
         Returns 1 on error to force full query (safer than assuming empty).
         
@@ -1367,41 +1462,41 @@ class OptimizedFeatherQuery:
                 print(f"[OptimizedFeatherQuery] Quick count skipped: no timestamp columns")
             return -1  # Return -1 to indicate "can't check" (not "has 1 record")
         
+        # Histogram fast path: O(1), never 0 when the range query has rows
+        histogram_count = self.estimate_count_in_range(start_time, end_time)
+        if histogram_count is not None:
+            return histogram_count
+        
         def count_operation(connection):
             try:
                 # Convert datetime objects to format that matches the database
                 start_value = self._convert_datetime_for_query(start_time)
                 end_value = self._convert_datetime_for_query(end_time)
                 
+                range_columns = self.get_range_columns()
+                
                 # Build WHERE clause for multiple timestamp columns (OR condition)
-                if self.timestamp_columns and len(self.timestamp_columns) > 1:
+                if len(range_columns) > 1:
                     # Multiple timestamp columns - check all with OR
                     where_conditions = []
-                    for ts_col in self.timestamp_columns:
+                    for ts_col in range_columns:
                         where_conditions.append(f"({ts_col} >= ? AND {ts_col} <= ?)")
                     where_clause = " OR ".join(where_conditions)
                     
                     # Build parameter list (start, end for each column)
                     params = []
-                    for _ in self.timestamp_columns:
+                    for _ in range_columns:
                         params.extend([start_value, end_value])
                     
                     query = f"""
                         SELECT COUNT(*) FROM {self.loader.current_table}
                         WHERE {where_clause}
                     """
-                elif self.timestamp_columns and len(self.timestamp_columns) == 1:
-                    # Single column in list
-                    query = f"""
-                        SELECT COUNT(*) FROM {self.loader.current_table}
-                        WHERE {self.timestamp_columns[0]} >= ? AND {self.timestamp_columns[0]} <= ?
-                    """
-                    params = [start_value, end_value]
-                elif self.timestamp_column:
-                    # Fallback to primary timestamp column
+                elif range_columns:
+                    # Single timestamp column
                     query = f"""
                         SELECT COUNT(*) FROM {self.loader.current_table}
-                        WHERE {self.timestamp_column} >= ? AND {self.timestamp_column} <= ?
+                        WHERE {range_columns[0]} >= ? AND {range_columns[0]} <= ?
                     """
                     params = [start_value, end_value]
                 else:
@@ -1423,7 +1518,7 @@ class OptimizedFeatherQuery:
                         print(f"[OptimizedFeatherQuery] WARNING: Quick count returned 0 but table has {total} records")
                         print(f"[OptimizedFeatherQuery]   Range: {start_time} to {end_time}")
                         print(f"[OptimizedFeatherQuery]   Format: {self.timestamp_format}")
-                        print(f"[OptimizedFeatherQuery]   Columns: {self.timestamp_columns if self.timestamp_columns else [self.timestamp_column]}")
+                        print(f"[OptimizedFeatherQuery]   Columns: {range_columns}")
                 
                 return count
             except Exception as e:
@@ -1647,6 +1742,13 @@ class OptimizedFeatherQuery:
         Returns:
             True if record is in range, False otherwise
         """
+        if self.epoch_columns:
+            # Integer comparison on the primary epoch column
+            epoch_value = record.get(self.get_range_columns()[0])
+            if not isinstance(epoch_value, int):
+                return False
+            return to_epoch_microseconds(start_time) <= epoch_value <= to_epoch_microseconds(end_time)
+        
         if self.timestamp_column not in record:
             return False
         
@@ -1658,6 +1760,61 @@ class OptimizedFeatherQuery:
         
         return start_time <= record_time <= end_time
     
+    def load_time_histogram(self, build: bool = True) -> bool:
+        """
+        Load the feather's time-bucket histogram, building and persisting it
+        if it is missing or stale.
+        
+        Once loaded, quick_count_in_range answers from the histogram instead
+        of running a COUNT query.
+        
+        Args:
+            build: Build the histogram if it is missing or stale
+            
+        Returns:
+            True if a histogram is available
+        """
+        columns = self.get_range_columns()
+        if not columns:
+            return False
+        
+        def histogram_operation(connection):
+            return load_or_build_histogram(
+                connection,
+                self.loader.current_table,
+                columns,
+                self.timestamp_format,
+                self._convert_datetime_for_query,
+                self._parse_range_value,
+                build=build,
+                debug_mode=self.debug_mode
+            )
+        
+        try:
+            self.time_histogram = self.error_handler.execute_with_retry(
+                operation=histogram_operation,
+                feather_id=getattr(self.loader, 'feather_id', 'unknown'),
+                database_path=self.loader.database_path,
+                operation_name="load_time_histogram"
+            )
+        except Exception as e:
+            if self.debug_mode:
+                print(f"[OptimizedFeatherQuery] Time histogram unavailable: {e}")
+            self.time_histogram = None
+        
+        return self.time_histogram is not None
+    
+    def estimate_count_in_range(self, start_time: datetime, end_time: datetime) -> Optional[int]:
+        """
+        Upper bound of records in the range from the time histogram.
+        
+        Returns:
+            Record count estimate, or None if no histogram is loaded
+        """
+        if self.time_histogram is None:
+            return None
+        return self.time_histogram.count_in_range(start_time, end_time)
+    
     def cleanup(self):
         """Cleanup database connections and resources"""
         if hasattr(self, 'error_handler'):
@@ -1705,22 +1862,7 @@ class WindowQueryManager:
             progress_tracker.report_database_query_start(window.window_id, total_feathers)
         
         for feather_id, query_manager in self.feather_queries.items():
-            # Create cache key
-            cache_key = f"{feather_id}_{window.start_time.isoformat()}_{window.end_time.isoformat()}"
-            
-            # Check cache first
-            if cache_key in self.query_cache:
-                records = self.query_cache[cache_key]
-                self.cache_hits += 1
-            else:
-                # Query feather
-                records = query_manager.query_time_range(window.start_time, window.end_time)
-                
-                # Cache results (limit cache size)
-                if len(self.query_cache) < 1000:  # Limit cache size
-                    self.query_cache[cache_key] = records
-                
-                self.cache_misses += 1
+            records = self._fetch_feather_records(feather_id, query_manager, window)
             
             # APPLY IDENTITY FILTERS
             if records and self.filters and self.filters.identity_filters:
@@ -1758,6 +1900,32 @@ class WindowQueryManager:
         
         return window
     
+    def _fetch_feather_records(self, feather_id: str, query_manager: OptimizedFeatherQuery,
+                               window: TimeWindow) -> List[Dict[str, Any]]:
+        """Get records of one feather for a window, using the query cache."""
+        # Create cache key
+        cache_key = f"{feather_id}_{window.start_time.isoformat()}_{window.end_time.isoformat()}"
+        
+        # Check cache first
+        if cache_key in self.query_cache:
+            self.cache_hits += 1
+            return self.query_cache[cache_key]
+        
+        # Query feather
+        records = query_manager.query_time_range(window.start_time, window.end_time)
+        
+        # Cache results (limit cache size)
+        if len(self.query_cache) < 1000:  # Limit cache size
+            self.query_cache[cache_key] = records
+        
+        self.cache_misses += 1
+        return records
+    
+    def _count_feather_records(self, feather_id: str, query_manager: OptimizedFeatherQuery,
+                               window: TimeWindow) -> int:
+        """Quick record count of one feather for a window (-1 if it has no timestamps)."""
+        return query_manager.quick_count_in_range(window.start_time, window.end_time)
+    
     def quick_check_window_has_records(self, window: TimeWindow) -> bool:
         """
         Quickly check if window has any records without performing full query.
@@ -1777,7 +1945,7 @@ class WindowQueryManager:
         
         for feather_id, query_manager in self.feather_queries.items():
             # Quick count query using index
-            count = query_manager.quick_count_in_range(window.start_time, window.end_time)
+            count = self._count_feather_records(feather_id, query_manager, window)
             
             # -1 means feather has no timestamp columns, skip it
             if count == -1:
@@ -1912,6 +2080,46 @@ class WindowQueryManager:
         return aggregated_stats
 
 
+class SweepLineWindowQueryManager(WindowQueryManager):
+    """
+    Window query manager backed by a single-pass sweep-line scanner.
+    
+    Instead of running query_time_range once per feather for every window,
+    each feather is streamed once in timestamp order and windows are served
+    from a sliding buffer. Empty window checks are answered from the same
+    buffer, so no COUNT queries are issued either.
+    
+    Results are identical to WindowQueryManager for windows requested in
+    chronological order; out-of-order windows fall back to per-window queries.
+    """
+    
+    def __init__(self, feather_queries: Dict[str, OptimizedFeatherQuery], 
+                 filters: Optional[FilterConfig] = None,
+                 debug_mode: bool = False):
+        super().__init__(feather_queries, filters=filters, debug_mode=debug_mode)
+        self.scanner = SweepLineScanner(feather_queries, debug_mode=debug_mode)
+    
+    def _fetch_feather_records(self, feather_id: str, query_manager: OptimizedFeatherQuery,
+                               window: TimeWindow) -> List[Dict[str, Any]]:
+        """Serve records from the sweep-line buffer (no per-window query cache needed)."""
+        return self.scanner.query_feather(feather_id, window.start_time, window.end_time)
+    
+    def _count_feather_records(self, feather_id: str, query_manager: OptimizedFeatherQuery,
+                               window: TimeWindow) -> int:
+        """Answer quick empty checks from the sweep-line buffer."""
+        return self.scanner.count_feather(feather_id, window.start_time, window.end_time)
+    
+    def get_cache_stats(self) -> Dict[str, int]:
+        """Get cache statistics including sweep-line scanning counters"""
+        stats = super().get_cache_stats()
+        stats['sweep_line'] = self.scanner.get_statistics()
+        return stats
+    
+    def close(self):
+        """Close sweep-line stream connections"""
+        self.scanner.close()
+
+
 class TimeWindowScanningEngine(BaseCorrelationEngine):
     """
     Time-Window Scanning Correlation Engine.
@@ -2151,6 +2359,12 @@ class TimeWindowScanningEngine(BaseCorrelationEngine):
         self._output_dir: Optional[str] = None
         self._execution_id: Optional[int] = None
         
+        # Resumable scan checkpoints (active while a sequential scan streams to the output directory)
+        self._scan_checkpoint: Optional[ScanCheckpoint] = None
+        self._scan_checkpoint_store: Optional[ScanCheckpointStore] = None
+        self._scan_checkpoint_time = 0.0
+        self._scan_matches_before_resume = 0
+        
         # Parallel processing configuration
         # Task 21: Apply parallel processing config from performance config (Requirement 8.2)
         self.enable_parallel_processing = self.performance_config.enable_parallel
@@ -2465,7 +2679,8 @@ class TimeWindowScanningEngine(BaseCorrelationEngine):
                                     max_workers: Optional[int] = None,
                                     batch_size: int = 100,
                                     enable_load_balancing: bool = True,
-                                    use_coordinator: bool = False):
+                                    use_coordinator: bool = False,
+                                    backend: Optional[str] = None):
         """
         Configure parallel processing settings.
         
@@ -2478,6 +2693,8 @@ class TimeWindowScanningEngine(BaseCorrelationEngine):
             batch_size: Number of windows to process in each batch
             enable_load_balancing: Enable intelligent load balancing
             use_coordinator: Use ParallelCoordinator instead of ParallelWindowProcessor
+            backend: ParallelWindowProcessor backend, "thread" or "process"
+                     (None = performance config's parallel_backend)
         """
         self.enable_parallel_processing = enable
         self.use_parallel_coordinator = use_coordinator
@@ -2511,12 +2728,14 @@ class TimeWindowScanningEngine(BaseCorrelationEngine):
                     max_workers=self.max_workers,
                     enable_load_balancing=enable_load_balancing,
                     batch_size=batch_size,
-                    memory_limit_mb=self.memory_limit_mb
+                    memory_limit_mb=self.memory_limit_mb,
+                    backend=backend or self.performance_config.parallel_backend
                 )
                 
                 if self.debug_mode:
                     print(f"[TimeWindow] Parallel processing enabled: {self.max_workers} workers, "
-                          f"batch_size={batch_size}, load_balancing={enable_load_balancing}")
+                          f"batch_size={batch_size}, load_balancing={enable_load_balancing}, "
+                          f"backend={self.parallel_processor.backend}")
         else:
             self.parallel_processor = None
             self.parallel_coordinator = None
@@ -3030,11 +3249,20 @@ class TimeWindowScanningEngine(BaseCorrelationEngine):
                     )
                 
                 # Create window query manager
-                self.window_query_manager = WindowQueryManager(
-                    self.feather_queries,
-                    filters=self.filters,
-                    debug_mode=self.debug_mode
-                )
+                # Sweep-line mode streams each feather once instead of querying per window
+                if self.performance_config.enable_sweep_line_scanning:
+                    self.window_query_manager = SweepLineWindowQueryManager(
+                        self.feather_queries,
+                        filters=self.filters,
+                        debug_mode=self.debug_mode
+                    )
+                    print("[Time-Window Engine]   ✓ Sweep-line scanning enabled (single pass per feather)")
+                else:
+                    self.window_query_manager = WindowQueryManager(
+                        self.feather_queries,
+                        filters=self.filters,
+                        debug_mode=self.debug_mode
+                    )
                 
                 # Initialize empty window detector (Requirements 3.1, 3.2, 3.3, 3.4, 3.5)
                 # Task 21: Only initialize if enabled in performance config
@@ -3184,6 +3412,13 @@ class TimeWindowScanningEngine(BaseCorrelationEngine):
             # Step 5: Generate and process time windows
             matches = []
             total_windows = self._calculate_total_windows(start_epoch, end_epoch)
+            use_parallel = bool(self.enable_parallel_processing and self.parallel_processor and total_windows > 10)
+            
+            # Sequential scans stream from the first window and can resume from a checkpoint
+            # (parallel windows complete out of order, so they are not checkpointed)
+            resumed_windows = 0
+            if not use_parallel:
+                resumed_windows = self._start_scan_checkpointing(wing, feather_paths, result, start_epoch, end_epoch)
             
             processing_mode = "parallel" if self.enable_parallel_processing else "sequential"
             print(f"\n[Time-Window Engine] 🔍 Step 5: Processing Time Windows")
@@ -3197,6 +3432,8 @@ class TimeWindowScanningEngine(BaseCorrelationEngine):
                 print(f"[Time-Window Engine] Streaming: ENABLED (memory-efficient mode)")
             
             print(f"[Time-Window Engine] Windows: {total_windows:,} to process")
+            if resumed_windows:
+                print(f"[Time-Window Engine] Resuming: {resumed_windows:,} windows already completed")
             print(f"[Time-Window Engine] ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━")
             
             sys.stdout.flush()
@@ -3222,12 +3459,13 @@ class TimeWindowScanningEngine(BaseCorrelationEngine):
             })
             
             # Choose processing method based on configuration
-            if self.enable_parallel_processing and self.parallel_processor and total_windows > 10:
+            if use_parallel:
                 # Use parallel processing for larger workloads
                 matches = self._process_windows_parallel(start_epoch, end_epoch, wing, result)
             else:
                 # Use sequential processing
-                matches = self._process_windows_sequential(start_epoch, end_epoch, wing, result, total_windows)
+                matches = self._process_windows_sequential(start_epoch, end_epoch, wing, result, total_windows,
+                                                           first_window=resumed_windows)
             
             # Task 23: Record memory checkpoint after processing (Requirements 1.2)
             if self._profiling_enabled:
@@ -3676,6 +3914,15 @@ class TimeWindowScanningEngine(BaseCorrelationEngine):
                     max_entries=100  # Keep default max entries
                 )
                 
+                # Time-bucket histogram: O(1) empty-window checks and window skipping
+                if self.performance_config.enable_time_histogram_index:
+                    if query_manager.load_time_histogram():
+                        histogram_stats = query_manager.time_histogram.get_statistics()
+                        action = "built" if histogram_stats['columns_built'] else "loaded"
+                        print(f"[Time-Window Engine]     ✓ Time histogram {action} "
+                              f"({histogram_stats['columns']} columns, {histogram_stats['buckets']:,} buckets)")
+                        sys.stdout.flush()
+                
                 self.feather_queries[feather_id] = query_manager
                 
                 result.feathers_processed += 1
@@ -4424,21 +4671,51 @@ class TimeWindowScanningEngine(BaseCorrelationEngine):
         total_minutes = (end_time - start_time).total_seconds() / 60
         return int(total_minutes / self.scanning_interval_minutes) + 1
     
-    def _generate_time_windows(self, start_time: datetime, end_time: datetime) -> Iterator[TimeWindow]:
+    def _generate_time_windows(self, start_time: datetime, end_time: datetime,
+                               on_windows_skipped: Optional[Callable[[int], None]] = None,
+                               first_window: int = 0) -> Iterator[TimeWindow]:
         """
         Generate time windows for scanning.
         
+        When every feather has a time histogram, spans the histograms prove
+        empty are jumped over: those windows are not generated (window ids keep
+        their position on the scanning grid) and are reported through
+        on_windows_skipped.
+        
         Args:
             start_time: Start of scanning range
             end_time: End of scanning range
+            on_windows_skipped: Optional callback receiving the number of skipped windows
+            first_window: Grid position to start at (windows before it are not generated)
             
         Yields:
             TimeWindow objects for processing
         """
-        current_time = start_time
-        window_counter = 0
+        window_size = timedelta(minutes=self.window_size_minutes)
+        scanning_interval = timedelta(minutes=self.scanning_interval_minutes)
+        current_time = start_time + scanning_interval * first_window
+        window_counter = first_window
+        skip_empty_spans = (self.performance_config.enable_empty_window_skipping and
+                            self.performance_config.enable_time_histogram_index)
         
         while current_time < end_time:
+            if skip_empty_spans:
+                answered, empty_until = self._histogram_empty_until(current_time)
+                if answered:
+                    if empty_until is None or empty_until > end_time:
+                        # No records in any remaining window
+                        skipped = -(-(end_time - current_time) // scanning_interval)
+                    else:
+                        # Windows ending before empty_until are empty
+                        skipped = max(0, -(-(empty_until - window_size - current_time) // scanning_interval))
+                    
+                    if skipped > 0:
+                        current_time += scanning_interval * skipped
+                        window_counter += skipped
+                        if on_windows_skipped:
+                            on_windows_skipped(skipped)
+                        continue
+            
             # Calculate window end
             window_end = current_time + timedelta(minutes=self.window_size_minutes)
             
@@ -4458,6 +4735,62 @@ class TimeWindowScanningEngine(BaseCorrelationEngine):
             current_time += timedelta(minutes=self.scanning_interval_minutes)
             window_counter += 1
     
+    def _histogram_empty_until(self, after: datetime) -> Tuple[bool, Optional[datetime]]:
+        """
+        Ask the feather time histograms how far the scan can jump.
+        
+        Args:
+            after: Start of the next window
+            
+        Returns:
+            (answered, empty_until): windows starting at or after `after` and
+            ending before empty_until have no records in any feather
+            (empty_until None = no records remain). answered is False unless
+            every feather that can return records has a histogram.
+        """
+        if not self.feather_queries:
+            return False, None
+        
+        earliest = None
+        for query_manager in self.feather_queries.values():
+            if not query_manager.timestamp_column:
+                continue  # Never returns records for a time range
+            
+            histogram = getattr(query_manager, 'time_histogram', None)
+            if histogram is None:
+                return False, None
+            
+            answered, empty_until = histogram.empty_until(after)
+            if not answered:
+                return False, None
+            if empty_until is not None and (earliest is None or empty_until < earliest):
+                earliest = empty_until
+        
+        return True, earliest
+    
+    def _estimate_window_record_count(self, window: TimeWindow) -> Optional[Tuple[int, int]]:
+        """
+        Estimate a window's size from the feather time histograms.
+        
+        Returns:
+            (record_count, feather_count) upper bounds, or None without histograms
+        """
+        total_records = 0
+        feathers_with_records = 0
+        
+        for query_manager in self.feather_queries.values():
+            if not query_manager.timestamp_column:
+                continue
+            
+            count = query_manager.estimate_count_in_range(window.start_time, window.end_time)
+            if count is None:
+                return None
+            if count > 0:
+                total_records += count
+                feathers_with_records += 1
+        
+        return total_records, feathers_with_records
+    
     def _normalize_identity(self, identity: str) -> str:
         """
         Normalize identity for grouping by removing symbols and numbers.
@@ -4684,7 +5017,11 @@ class TimeWindowScanningEngine(BaseCorrelationEngine):
                 match_feather_records = {}
                 for fid, records_list in feather_records.items():
                     # Include ALL records (metadata + actual data) - don't discard anything!
-                    match_feather_records[fid] = records_list if records_list else []
+                    # (except the engine's epoch companion columns)
+                    match_feather_records[fid] = [
+                        without_epoch_columns(record) if isinstance(record, dict) else record
+                        for record in records_list
+                    ] if records_list else []
                     
                     # Log record inclusion for verification (Requirement 6.3 - Debug only)
                     if records_list:
@@ -4915,7 +5252,8 @@ class TimeWindowScanningEngine(BaseCorrelationEngine):
                                   end_epoch: datetime, 
                                   wing: Wing, 
                                   result: CorrelationResult,
-                                  total_windows: int) -> List[CorrelationMatch]:
+                                  total_windows: int,
+                                  first_window: int = 0) -> List[CorrelationMatch]:
         """
         Process windows sequentially with time-window-specific progress tracking.
         
@@ -4925,12 +5263,14 @@ class TimeWindowScanningEngine(BaseCorrelationEngine):
             wing: Wing configuration
             result: CorrelationResult to update
             total_windows: Total number of windows to process
+            first_window: Windows already completed by a resumed scan
             
         Returns:
             List of all correlation matches found
         """
         matches = []
-        window_count = 0
+        window_count = first_window
+        scan_cancelled = False
         
         # Task 8.3: Initialize progress reporter for window processing
         # Requirements: 4.1, 4.2, 4.3, 4.4
@@ -4948,6 +5288,10 @@ class TimeWindowScanningEngine(BaseCorrelationEngine):
         # Detects stalls when no progress for 300 seconds (5 minutes)
         stall_monitor = CorrelationStallMonitor(stall_timeout_seconds=300)
         
+        # Windows completed before a resume count as processed
+        if first_window:
+            progress_reporter.update(items_processed=first_window)
+        
         # Report initial progress (0%)
         progress_reporter.force_report()
         
@@ -4961,7 +5305,24 @@ class TimeWindowScanningEngine(BaseCorrelationEngine):
         max_consecutive_empty_before_stop = 999999999  # Effectively disabled - never stop early
         found_any_data = False  # Track if we've found any data yet
         
-        for window in self._generate_time_windows(start_epoch, end_epoch):
+        def record_skipped_windows(count: int):
+            """Account for windows the time histograms proved empty (never generated)"""
+            nonlocal window_count
+            window_count += count
+            progress_reporter.update(items_processed=count)
+            self.progress_tracker.record_skipped_windows(count)
+            
+            if self.empty_window_detector:
+                self.empty_window_detector.statistics.total_windows_checked += count
+                self.empty_window_detector.statistics.empty_windows_found += count
+            
+            if self.scanning_config.track_empty_window_stats:
+                self.window_processing_stats.empty_windows_skipped += count
+                self.window_processing_stats.total_windows_generated += count
+                self.window_processing_stats.calculate_efficiency_metrics()
+        
+        for window in self._generate_time_windows(start_epoch, end_epoch, record_skipped_windows,
+                                                  first_window=first_window):
             # Task 9.3: Check for stall before processing each window
             # Requirements: 5.2, 5.3, 5.4
             if stall_monitor.check_for_stall():
@@ -4980,6 +5341,7 @@ class TimeWindowScanningEngine(BaseCorrelationEngine):
                 # Cancellation requested - break out of loop
                 if self.debug_mode:
                     print(f"[TimeWindow] Cancellation detected at window {window_count}")
+                scan_cancelled = True
                 break
             
             # Start window processing tracking with time-window-specific formatting
@@ -5130,12 +5492,12 @@ class TimeWindowScanningEngine(BaseCorrelationEngine):
                     memory_usage_mb=self.memory_manager.check_memory_pressure().current_memory_mb if self.memory_manager else None
                 )
             
+            # Apply scoring DURING correlation, once for the whole window (fast operation)
+            # Semantic mapping will be applied AFTER streaming completes (slow operation)
+            scored_matches = self._apply_scoring_to_matches(window_matches, wing)
+            
             # Add matches to result (handles streaming automatically)
-            for match in window_matches:
-                # Apply scoring DURING correlation (fast operation)
-                # Semantic mapping will be applied AFTER streaming completes (slow operation)
-                scored_match = self._apply_scoring_to_single_match(match, wing)
-                
+            for scored_match in scored_matches:
                 if self.streaming_mode_active and self.streaming_writer:
                     # Write match WITH scoring but WITHOUT semantic data during correlation
                     result.add_match(scored_match)
@@ -5148,6 +5510,9 @@ class TimeWindowScanningEngine(BaseCorrelationEngine):
             matches.extend(window_matches)
             window_count += 1
             
+            # Checkpoint once this window's matches are written
+            self._save_scan_checkpoint(result, start_epoch, window_count)
+            
             # Task 8.3: Update progress (will auto-report at 10%, 20%, 30%, etc.)
             # Requirements: 4.2, 4.3, 4.4
             progress_reporter.update(items_processed=1)
@@ -5215,6 +5580,8 @@ class TimeWindowScanningEngine(BaseCorrelationEngine):
                 print(f"[TimeWindow] Processed {window_count}/{total_windows} windows, "
                       f"{result.total_matches} matches found{memory_info}{streaming_info}")
         
+        self._finish_scan_checkpoint(result, start_epoch, window_count, completed=not scan_cancelled)
+        
         # Task 8.3: Report final progress (100%)
         # Requirements: 4.1, 4.5
         progress_reporter.force_report()
@@ -5264,12 +5631,21 @@ class TimeWindowScanningEngine(BaseCorrelationEngine):
             # Individual windows don't need to check memory pressure
             return self._process_window(window, wing_config)
         
+        # Size tasks from the time histograms (windows are not populated yet)
+        self.parallel_processor.window_record_estimator = self._estimate_window_record_count
+        
+        # Process backend: workers open their own read-only feather connections
+        worker_spec = None
+        if self.parallel_processor.backend == "process":
+            worker_spec = self._build_window_worker_spec(wing)
+        
         # Process windows in parallel
         all_matches = self.parallel_processor.process_windows_parallel(
             windows=windows,
             wing=wing,
             window_processor_func=process_window_with_context,
-            progress_callback=self._handle_parallel_progress_callback
+            progress_callback=self._handle_parallel_progress_callback,
+            worker_spec=worker_spec
         )
         
         # Add all matches to result
@@ -5278,6 +5654,31 @@ class TimeWindowScanningEngine(BaseCorrelationEngine):
         
         return all_matches
     
+    def _build_window_worker_spec(self, wing: Wing) -> 'WindowWorkerSpec':
+        """
+        Describe this engine's feathers and settings for process-pool workers.
+        
+        Args:
+            wing: Wing configuration
+            
+        Returns:
+            WindowWorkerSpec with feather database paths in query order
+        """
+        from .window_process_worker import WindowWorkerSpec
+        
+        feather_paths = {
+            feather_id: query_manager.loader.database_path
+            for feather_id, query_manager in self.feather_queries.items()
+        }
+        
+        return WindowWorkerSpec(
+            feather_paths=feather_paths,
+            wing=wing,
+            filters=self.filters,
+            debug_mode=self.debug_mode,
+            query_cache_size_mb=self.performance_config.query_cache_size_mb
+        )
+    
     def _process_windows_with_coordinator(self,
                                          windows: List[TimeWindow],
                                          wing: Wing,
@@ -5433,6 +5834,13 @@ class TimeWindowScanningEngine(BaseCorrelationEngine):
         """Cleanup feather query managers with comprehensive error handling"""
         cleanup_errors = []
         
+        # Close sweep-line stream connections before the feathers themselves
+        if self.window_query_manager and hasattr(self.window_query_manager, 'close'):
+            try:
+                self.window_query_manager.close()
+            except Exception as e:
+                cleanup_errors.append(f"Error closing sweep-line scanner: {str(e)}")
+        
         for feather_id, query_manager in self.feather_queries.items():
             try:
                 # Cleanup query manager's error handler
@@ -5621,6 +6029,174 @@ class TimeWindowScanningEngine(BaseCorrelationEngine):
         
         return str(db_path)
     
+    def _start_scan_checkpointing(self, wing: Wing, feather_paths: Dict[str, str],
+                                  result: CorrelationResult, start_epoch: datetime,
+                                  end_epoch: datetime) -> int:
+        """
+        Stream matches from the first window and resume an interrupted scan.
+        
+        Only active when the pipeline set an output directory and
+        enable_scan_checkpoints is on. A resumed scan reuses the result row of
+        the interrupted run (moved to the current execution) and drops matches
+        written after its last checkpoint. Matches committed before the
+        checkpoint stay in the database only: the result is flagged partial
+        (see result.warnings) and points to result.database_path.
+        
+        Args:
+            wing: Wing configuration
+            feather_paths: Dictionary mapping feather_id to database path
+            result: CorrelationResult of this scan
+            start_epoch: Start of the scanning range
+            end_epoch: End of the scanning range
+            
+        Returns:
+            Number of windows already completed (0 for a new scan)
+        """
+        self._scan_checkpoint = None
+        self._scan_checkpoint_store = None
+        self._scan_matches_before_resume = 0
+        
+        if not self.performance_config.enable_scan_checkpoints or not self._output_dir:
+            return 0
+        
+        try:
+            streaming_db_path = self._get_streaming_database_path(wing)
+            if not self.streaming_writer:
+                self.streaming_writer = StreamingMatchWriter(db_path=streaming_db_path, batch_size=1000)
+            
+            store = ScanCheckpointStore(self.streaming_writer.conn)
+            signature = compute_scan_signature(
+                wing.wing_id, feather_paths, self.window_size_minutes, self.scanning_interval_minutes,
+                start_epoch, end_epoch, getattr(self, 'filters', None)
+            )
+            
+            checkpoint = store.find_resumable(signature)
+            if checkpoint:
+                discarded = store.rollback_uncommitted_matches(checkpoint)
+                store.adopt(checkpoint, self._execution_id)
+                self._restore_scan_statistics(checkpoint)
+                print(f"[Time-Window Engine] ⏯️ Resuming interrupted scan at window {checkpoint.windows_completed:,} "
+                      f"({checkpoint.total_matches:,} matches kept, {discarded:,} uncommitted matches discarded)")
+            else:
+                result_id = self.streaming_writer.create_result(
+                    execution_id=self._execution_id if self._execution_id else 0,
+                    wing_id=wing.wing_id,
+                    wing_name=wing.wing_name,
+                    feathers_processed=result.feathers_processed,
+                    total_records_scanned=result.total_records_scanned
+                )
+                checkpoint = store.start(signature, result_id, self._execution_id, wing.wing_id)
+        except Exception as e:
+            print(f"[Time-Window Engine] ⚠️ Scan checkpoints unavailable: {e}")
+            return 0
+        
+        self._scan_checkpoint = checkpoint
+        self._scan_checkpoint_store = store
+        self._scan_checkpoint_time = time.time()
+        self._scan_matches_before_resume = checkpoint.total_matches
+        
+        result._result_id = checkpoint.result_id
+        result._streaming_writer = self.streaming_writer
+        result._streaming_db_path = streaming_db_path
+        
+        if checkpoint.windows_completed:
+            result.database_path = streaming_db_path
+            result.performance_metrics['resumed_from_window'] = checkpoint.windows_completed
+            result.performance_metrics['matches_in_memory_partial'] = True
+            result.warnings.append(
+                f"Resumed scan: result.matches only holds matches from window "
+                f"{checkpoint.windows_completed:,} on; the {checkpoint.total_matches:,} matches "
+                f"committed before the checkpoint are in {streaming_db_path} "
+                f"(result_id {checkpoint.result_id})"
+            )
+        
+        if not self.streaming_mode_active:
+            self.streaming_mode_active = True
+            if self.memory_manager:
+                self.memory_manager.activate_streaming_mode("Resumable scan checkpoints")
+        
+        return checkpoint.windows_completed
+    
+    def _restore_scan_statistics(self, checkpoint: ScanCheckpoint):
+        """Carry the window counters of the interrupted run over to this one"""
+        saved_stats = checkpoint.statistics.get('window_processing_stats', {})
+        self.window_processing_stats.total_windows_generated += saved_stats.get('total_windows_generated', 0)
+        self.window_processing_stats.windows_with_data += saved_stats.get('windows_with_data', 0)
+        self.window_processing_stats.empty_windows_skipped += saved_stats.get('empty_windows_skipped', 0)
+        self.window_processing_stats.calculate_efficiency_metrics()
+    
+    def _save_scan_checkpoint(self, result: CorrelationResult, start_epoch: datetime,
+                              windows_completed: int, force: bool = False):
+        """
+        Checkpoint scan progress every scan_checkpoint_interval_windows windows
+        or scan_checkpoint_interval_seconds seconds, whichever comes first.
+        
+        Args:
+            result: CorrelationResult of this scan
+            start_epoch: Start of the scanning range (window grid origin)
+            windows_completed: Windows fully processed and written
+            force: Checkpoint regardless of the interval
+        """
+        checkpoint = self._scan_checkpoint
+        if checkpoint is None or not self.streaming_writer:
+            return
+        
+        now = time.time()
+        if not force:
+            windows_due = (windows_completed - checkpoint.windows_completed >=
+                           self.performance_config.scan_checkpoint_interval_windows)
+            time_due = now - self._scan_checkpoint_time >= self.performance_config.scan_checkpoint_interval_seconds
+            if not (windows_due or time_due):
+                return
+        
+        try:
+            # Matches up to this window must be committed before the checkpoint
+            self.streaming_writer.flush()
+            self._scan_checkpoint_store.save(
+                checkpoint,
+                windows_completed=windows_completed,
+                next_window_start=start_epoch + timedelta(minutes=self.scanning_interval_minutes) * windows_completed,
+                total_matches=self._scan_matches_before_resume + result.total_matches,
+                statistics={
+                    'window_processing_stats': {
+                        'total_windows_generated': self.window_processing_stats.total_windows_generated,
+                        'windows_with_data': self.window_processing_stats.windows_with_data,
+                        'empty_windows_skipped': self.window_processing_stats.empty_windows_skipped
+                    },
+                    'window_errors': len(result.errors)
+                }
+            )
+            self._scan_checkpoint_time = now
+        except Exception as e:
+            print(f"[Time-Window Engine] ⚠️ Failed to save scan checkpoint: {e}")
+    
+    def _finish_scan_checkpoint(self, result: CorrelationResult, start_epoch: datetime,
+                                windows_completed: int, completed: bool):
+        """
+        Close the scan's checkpoint: COMPLETED after the last window, or
+        saved and flagged PAUSED when the scan was cancelled.
+        
+        Matches kept from the interrupted run are added to result.total_matches.
+        """
+        checkpoint = self._scan_checkpoint
+        if checkpoint is None:
+            return
+        
+        self._save_scan_checkpoint(result, start_epoch, windows_completed, force=True)
+        try:
+            if completed:
+                self._scan_checkpoint_store.complete(checkpoint)
+            else:
+                self._scan_checkpoint_store.pause(checkpoint)
+                print(f"[Time-Window Engine] ⏸️ Scan paused at window {windows_completed:,} - "
+                      f"the next run with the same wing and feathers resumes here")
+        except Exception as e:
+            print(f"[Time-Window Engine] ⚠️ Failed to close scan checkpoint: {e}")
+        
+        result.total_matches += self._scan_matches_before_resume
+        self._scan_checkpoint = None
+        self._scan_checkpoint_store = None
+    
     def _cleanup_memory_between_windows(self, window_count: int, memory_report: Optional[Any] = None):
         """
         Perform memory cleanup between windows to maintain efficiency.
@@ -5732,6 +6308,11 @@ class TimeWindowScanningEngine(BaseCorrelationEngine):
             
             total_written = self.streaming_writer.get_total_written()
             print(f"[Time-Window Engine]   ✓ {total_written:,} matches written to database")
+            writer_stats = self.streaming_writer.get_statistics()
+            print(f"[Time-Window Engine]   Writer: {writer_stats['matches_per_second']:,.0f} matches/s, "
+                  f"{writer_stats['transactions_committed']:,} transactions, "
+                  f"{writer_stats['producer_waits']:,} backpressure waits "
+                  f"({writer_stats['producer_wait_seconds']:.1f}s)")
             
             # Store streaming info in result
             result.streaming_database_path = getattr(result, '_streaming_db_path', None)
@@ -7238,43 +7819,18 @@ class TimeWindowScanningEngine(BaseCorrelationEngine):
         
         logger.info(f"Applying weighted scoring to {len(matches)} correlation matches")
         
-        for match in matches:
-            try:
-                # Calculate weighted score using integration layer
-                weighted_score = self.scoring_integration.calculate_match_scores(
-                    match.feather_records, wing, case_id
-                )
-                
-                # Create scored match with weighted scoring information
-                scored_match = CorrelationMatch(
-                    match_id=match.match_id,
-                    feather_records=match.feather_records,
-                    timestamp=match.timestamp,
-                    match_score=weighted_score.get('score', match.match_score) if isinstance(weighted_score, dict) else match.match_score,
-                    feather_count=match.feather_count,
-                    time_spread_seconds=match.time_spread_seconds,
-                    anchor_feather_id=match.anchor_feather_id,
-                    anchor_artifact_type=match.anchor_artifact_type,
-                    matched_application=match.matched_application,
-                    matched_file_path=match.matched_file_path,
-                    matched_event_id=match.matched_event_id,
-                    confidence_score=weighted_score.get('score', match.confidence_score) if isinstance(weighted_score, dict) else match.confidence_score,
-                    confidence_category=weighted_score.get('interpretation', match.confidence_category) if isinstance(weighted_score, dict) else match.confidence_category,
-                    weighted_score=weighted_score if isinstance(weighted_score, dict) else None,
-                    score_breakdown=weighted_score.get('breakdown', {}) if isinstance(weighted_score, dict) else {},
-                    semantic_data=match.semantic_data
-                )
-                
-                scored_matches.append(scored_match)
-                
-            except Exception as e:
-                # If weighted scoring fails for this match, fall back to simple scoring
-                logger.warning(f"Weighted scoring failed for match {match.match_id}: {e}")
+        # Score all matches in one batch
+        weighted_scores = self.scoring_integration.calculate_batch_match_scores(
+            [match.feather_records for match in matches], wing, case_id
+        )
+        
+        for match, weighted_score in zip(matches, weighted_scores):
+            if isinstance(weighted_score, dict):
+                scored_matches.append(self._create_scored_match(match, weighted_score))
+            else:
+                # If weighted scoring gave no result for this match, fall back to simple scoring
                 logger.info(f"Falling back to simple count-based scoring for match {match.match_id}")
-                
-                # Apply simple scoring to this match
-                simple_scored_match = self._apply_simple_count_scoring_to_match(match, wing)
-                scored_matches.append(simple_scored_match)
+                scored_matches.append(self._apply_simple_count_scoring_to_match(match, wing))
         
         # Log weighted scoring statistics
         scoring_stats = self.scoring_integration.get_scoring_statistics()
@@ -7392,8 +7948,6 @@ class TimeWindowScanningEngine(BaseCorrelationEngine):
         """
         Apply weighted scoring to a single match during correlation.
         
-        This is called during streaming to score matches before writing to database.
-        
         Args:
             match: Correlation match to score
             wing: Wing configuration for scoring context
@@ -7401,45 +7955,71 @@ class TimeWindowScanningEngine(BaseCorrelationEngine):
         Returns:
             Match with scoring applied
         """
+        return self._apply_scoring_to_matches([match], wing)[0]
+    
+    def _apply_scoring_to_matches(self, matches: List[CorrelationMatch], wing: Any) -> List[CorrelationMatch]:
+        """
+        Apply weighted scoring to the matches of one window during correlation.
+        
+        This is called during streaming to score matches before writing to database.
+        All matches are scored in one batch (see calculate_batch_match_scores).
+        
+        Args:
+            matches: Correlation matches to score
+            wing: Wing configuration for scoring context
+            
+        Returns:
+            Matches with scoring applied, in order
+        """
         # Check if scoring is enabled
-        if not self.scoring_integration.is_enabled():
-            return match
+        if not matches or not self.scoring_integration.is_enabled():
+            return list(matches)
         
         try:
             case_id = getattr(self.config, 'case_id', None)
             
-            # Calculate weighted score
-            weighted_score = self.scoring_integration.calculate_match_scores(
-                match.feather_records, wing, case_id
+            # Calculate weighted scores
+            weighted_scores = self.scoring_integration.calculate_batch_match_scores(
+                [match.feather_records for match in matches], wing, case_id
             )
-            
-            if isinstance(weighted_score, dict):
-                # Create scored match
-                scored_match = CorrelationMatch(
-                    match_id=match.match_id,
-                    feather_records=match.feather_records,
-                    timestamp=match.timestamp,
-                    match_score=weighted_score.get('score', match.match_score),
-                    feather_count=match.feather_count,
-                    time_spread_seconds=match.time_spread_seconds,
-                    anchor_feather_id=match.anchor_feather_id,
-                    anchor_artifact_type=match.anchor_artifact_type,
-                    matched_application=match.matched_application,
-                    matched_file_path=match.matched_file_path,
-                    matched_event_id=match.matched_event_id,
-                    confidence_score=weighted_score.get('score', match.confidence_score),
-                    confidence_category=weighted_score.get('interpretation', match.confidence_category),
-                    weighted_score=weighted_score,
-                    score_breakdown=weighted_score.get('breakdown', {}),
-                    semantic_data=match.semantic_data
-                )
-                return scored_match
-            else:
-                return match
-                
         except Exception as e:
-            logger.warning(f"Scoring failed for match {match.match_id}: {e}")
-            return match
+            logger.warning(f"Scoring failed for {len(matches)} matches: {e}")
+            return list(matches)
+        
+        return [
+            self._create_scored_match(match, weighted_score) if isinstance(weighted_score, dict) else match
+            for match, weighted_score in zip(matches, weighted_scores)
+        ]
+    
+    def _create_scored_match(self, match: CorrelationMatch, weighted_score: Dict[str, Any]) -> CorrelationMatch:
+        """
+        Copy of a match with a weighted scoring result applied.
+        
+        Args:
+            match: Correlation match
+            weighted_score: Result of the scoring integration for the match
+            
+        Returns:
+            Scored match
+        """
+        return CorrelationMatch(
+            match_id=match.match_id,
+            feather_records=match.feather_records,
+            timestamp=match.timestamp,
+            match_score=weighted_score.get('score', match.match_score),
+            feather_count=match.feather_count,
+            time_spread_seconds=match.time_spread_seconds,
+            anchor_feather_id=match.anchor_feather_id,
+            anchor_artifact_type=match.anchor_artifact_type,
+            matched_application=match.matched_application,
+            matched_file_path=match.matched_file_path,
+            matched_event_id=match.matched_event_id,
+            confidence_score=weighted_score.get('score', match.confidence_score),
+            confidence_category=weighted_score.get('interpretation', match.confidence_category),
+            weighted_score=weighted_score,
+            score_breakdown=weighted_score.get('breakdown', {}),
+            semantic_data=match.semantic_data
+        )
     
     def _calculate_score(self, match: CorrelationMatch, wing_config: Any) -> float:
         """
@@ -7705,6 +8285,7 @@ class TimeWindowScanningEngine(BaseCorrelationEngine):
             import sqlite3
             conn = sqlite3.connect(database_path, timeout=30.0)
             cursor = conn.cursor()
+            payload_codec = MatchPayloadCodec(conn)
             
             # Get all matches for this execution
             print(f"[Time-Window Engine] Loading matches from database...")
@@ -7731,16 +8312,22 @@ class TimeWindowScanningEngine(BaseCorrelationEngine):
             case_id = getattr(self.config, 'case_id', None)
             updates = []
             
+            # Parse feather records
+            parsed_matches = []
             for match_id, feather_records_json, old_confidence_score, old_confidence_category in matches_data:
                 try:
-                    # Parse feather records
-                    feather_records = json.loads(feather_records_json) if feather_records_json else []
-                    
-                    # Calculate weighted score
-                    weighted_score = self.scoring_integration.calculate_match_scores(
-                        feather_records, wing, case_id
-                    )
-                    
+                    feather_records = payload_codec.decode(feather_records_json) if feather_records_json else []
+                    parsed_matches.append((match_id, feather_records, old_confidence_score, old_confidence_category))
+                except Exception as e:
+                    logger.warning(f"Scoring failed for match {match_id}: {e}")
+            
+            # Calculate weighted scores in one batch
+            weighted_scores = self.scoring_integration.calculate_batch_match_scores(
+                [feather_records for _, feather_records, _, _ in parsed_matches], wing, case_id
+            )
+            
+            for (match_id, _, old_confidence_score, old_confidence_category), weighted_score in zip(parsed_matches, weighted_scores):
+                try:
                     if isinstance(weighted_score, dict):
                         # Extract score components
                         score = weighted_score.get('score', old_confidence_score)
@@ -0,0 +1,489 @@
+"""
+Time-Bucket Histogram Index for Time-Window Scanning Engine
+
+Stores, per feather and timestamp column, how many records fall in each fixed
+time bucket. Prefix sums over the buckets answer "how many records may lie in
+[start, end]" in O(1) without touching SQLite, which is what empty-window
+detection, window generation and parallel task sizing need.
+
+The histogram is built once and persisted in the feather database itself, in
+the side table feather_time_histogram (one row per table and timestamp column,
+with the bucket counts packed into a BLOB). It is rebuilt when the source table's row
+count or highest rowid changes.
+
+Counts follow the SQL semantics of OptimizedFeatherQuery.query_time_range:
+bucket boundaries are converted with the feather's _convert_datetime_for_query
+and values are placed with SQLite's type ordering and comparison affinity
+(see sweep_line_scanner). A range count is therefore exact when the range is
+bucket-aligned and otherwise an upper bound; a count of 0 always means the
+SQL range query returns no rows.
+
+All times are handled as aware UTC: bucket boundaries are UTC epoch offsets,
+and the times passed in are normalized to UTC. Naive times are taken as UTC,
+as to_epoch_microseconds and the engine's own UTC normalization do.
+"""
+
+import sys
+import sqlite3
+import logging
+from array import array
+from bisect import bisect_right
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from itertools import accumulate
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .sweep_line_scanner import sqlite_column_affinity, sqlite_sort_key, apply_comparison_affinity
+
+logger = logging.getLogger(__name__)
+
+HISTOGRAM_TABLE = 'feather_time_histogram'
+_PRIMARY_KEY = ('source_table', 'column_name')
+
+# Bucket width; widened automatically so a column never exceeds MAX_BUCKETS
+DEFAULT_BUCKET_SECONDS = 300
+MAX_BUCKETS = 1_000_000
+
+# Query formats whose converted values do not sort in time order
+# ('%m/%d/%Y' text compares month before year)
+NON_MONOTONIC_FORMATS = {'date_slash'}
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+# Errors of datetime arithmetic and conversions on out-of-range or mixed times
+_TIME_ERRORS = (TypeError, ValueError, OverflowError, OSError)
+
+
+def _to_utc(value: datetime) -> datetime:
+    """Aware UTC time of value (naive values are taken as UTC)"""
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+def _like(value: datetime, reference: datetime) -> datetime:
+    """value expressed in the timezone convention of reference (naive UTC for naive references)"""
+    if reference.tzinfo is None:
+        return value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value.astimezone(reference.tzinfo)
+
+
+@dataclass
+class HistogramStatistics:
+    """Counters describing histogram index usage."""
+    columns_loaded: int = 0
+    columns_built: int = 0
+    range_counts: int = 0
+    empty_ranges: int = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'columns_loaded': self.columns_loaded,
+            'columns_built': self.columns_built,
+            'range_counts': self.range_counts,
+            'empty_ranges': self.empty_ranges
+        }
+
+
+class ColumnHistogram:
+    """Bucket counts and prefix sums for one timestamp column."""
+
+    def __init__(self, column: str, origin_seconds: int, bucket_seconds: int,
+                 counts: array, below_count: int, above_count: int,
+                 query_key: Callable[[datetime], Tuple]):
+        """
+        Args:
+            column: Timestamp column name
+            origin_seconds: Start of bucket 0 in seconds since the UTC epoch
+            bucket_seconds: Bucket width in seconds
+            counts: Record count per bucket
+            below_count: Records sorting before bucket 0
+            above_count: Records sorting at or after the end of the last bucket
+            query_key: Maps a datetime to the sort key of its SQL bound value
+        """
+        self.column = column
+        self.origin_seconds = origin_seconds
+        self.origin = _EPOCH + timedelta(seconds=origin_seconds)
+        self.bucket_seconds = bucket_seconds
+        self.bucket_width = timedelta(seconds=bucket_seconds)
+        self.counts = counts
+        self.bucket_count = len(counts)
+        self.below_count = below_count
+        self.above_count = above_count
+        self.query_key = query_key
+
+        # prefix[i] = records in buckets [0, i)
+        self.prefix = array('q', [0])
+        self.prefix.extend(accumulate(counts))
+
+    def bucket_index(self, value: datetime) -> int:
+        """Index of the bucket containing value (negative before the origin)"""
+        return (_to_utc(value) - self.origin) // self.bucket_width
+
+    def bucket_start(self, index: int) -> datetime:
+        """Start of a bucket (aware UTC)"""
+        return self.origin + self.bucket_width * index
+
+    def count_in_range(self, start_time: datetime, end_time: datetime) -> int:
+        """
+        Upper bound of records with start_time <= value <= end_time (O(1)).
+        """
+        start_time = _to_utc(start_time)
+        end_time = _to_utc(end_time)
+        if end_time < start_time:
+            return 0
+
+        first = self.bucket_index(start_time)
+        last = self.bucket_index(end_time)
+
+        # The bound value of end_time may equal the next boundary's value
+        # when the query format is coarser than the bucket (e.g. whole seconds)
+        if 0 <= last + 1 <= self.bucket_count:
+            if self.query_key(end_time) >= self.query_key(self.bucket_start(last + 1)):
+                last += 1
+
+        total = 0
+        if first < 0:
+            total += self.below_count
+        if last >= self.bucket_count:
+            total += self.above_count
+
+        low = min(max(first, 0), self.bucket_count)
+        high = min(max(last + 1, 0), self.bucket_count)
+        if high > low:
+            total += self.prefix[high] - self.prefix[low]
+
+        return total
+
+    def empty_until(self, after: datetime) -> Optional[datetime]:
+        """
+        How far past `after` this column is provably empty.
+
+        Every range [s, e] with s >= after and e < the returned time counts 0
+        (one bucket of margin covers bound values that a coarse query format
+        rounds onto the next boundary).
+
+        Returns:
+            The time up to which ranges are empty (in the timezone convention
+            of `after`), or None if no records remain
+        """
+        index = self.bucket_index(after)
+
+        if index < 0:
+            if self.below_count:
+                return after
+            index = 0
+
+        if index < self.bucket_count:
+            # First bucket at or after index with a non-zero count
+            next_index = bisect_right(self.prefix, self.prefix[index]) - 1
+            if next_index < self.bucket_count:
+                return _like(self.bucket_start(next_index - 1), after)
+
+        if self.above_count:
+            return _like(self.bucket_start(self.bucket_count - 1), after)
+
+        return None
+
+
+class TimeBucketHistogram:
+    """
+    Histogram index of one feather, covering all of its timestamp columns.
+
+    A record matches a window if ANY timestamp column is in range, so range
+    counts add up the columns (an upper bound when columns overlap).
+    """
+
+    def __init__(self, columns: Dict[str, ColumnHistogram]):
+        self.columns = columns
+        self.stats = HistogramStatistics()
+
+    def count_in_range(self, start_time: datetime, end_time: datetime) -> Optional[int]:
+        """
+        Upper bound of records in [start_time, end_time], or None if the
+        range cannot be answered (e.g. out-of-range bounds).
+        """
+        try:
+            total = sum(h.count_in_range(start_time, end_time) for h in self.columns.values())
+        except _TIME_ERRORS:
+            return None
+
+        self.stats.range_counts += 1
+        if total == 0:
+            self.stats.empty_ranges += 1
+        return total
+
+    def empty_until(self, after: datetime) -> Tuple[bool, Optional[datetime]]:
+        """
+        How far past `after` the feather is provably empty (see
+        ColumnHistogram.empty_until).
+
+        Returns:
+            (answered, time): time is None when no records remain; answered is
+            False when the histogram cannot tell
+        """
+        try:
+            times = [h.empty_until(after) for h in self.columns.values()]
+        except _TIME_ERRORS:
+            return False, None
+
+        times = [t for t in times if t is not None]
+        return True, (min(times) if times else None)
+
+    def get_statistics(self) -> Dict[str, Any]:
+        stats = self.stats.to_dict()
+        stats['columns'] = len(self.columns)
+        stats['buckets'] = sum(h.bucket_count for h in self.columns.values())
+        return stats
+
+
+def load_or_build_histogram(connection: sqlite3.Connection,
+                            table: str,
+                            timestamp_columns: List[str],
+                            timestamp_format: Optional[str],
+                            convert_for_query: Callable[[datetime], Any],
+                            parse_value: Callable[[Any], Optional[datetime]],
+                            build: bool = True,
+                            bucket_seconds: int = DEFAULT_BUCKET_SECONDS,
+                            debug_mode: bool = False) -> Optional[TimeBucketHistogram]:
+    """
+    Load the persisted histogram of a feather, building it if missing or stale.
+
+    Args:
+        connection: Connection to the feather database
+        table: Data table queried by the engine
+        timestamp_columns: Timestamp columns used in range queries
+        timestamp_format: Detected timestamp format of the feather
+        convert_for_query: Converts a datetime to the SQL bound value
+        parse_value: Parses a raw column value to a datetime
+        build: Build (and persist) missing or stale histograms
+        bucket_seconds: Bucket width for newly built histograms
+        debug_mode: Print diagnostics
+
+    Returns:
+        TimeBucketHistogram, or None if the feather cannot be indexed
+    """
+    if not timestamp_columns or timestamp_format in NON_MONOTONIC_FORMATS:
+        return None
+
+    cursor = connection.cursor()
+
+    # Row counts and rowids are only meaningful for real tables (not views)
+    cursor.execute("SELECT type FROM sqlite_master WHERE name = ?", (table,))
+    row = cursor.fetchone()
+    if not row or row[0] != 'table':
+        return None
+
+    cursor.execute(f"PRAGMA table_info({table})")
+    declared_types = {info[1].lower(): info[2] for info in cursor.fetchall()}
+
+    cursor.execute(f"SELECT COUNT(*), MAX(rowid) FROM {table}")
+    row_count, max_rowid = cursor.fetchone()
+    max_rowid = max_rowid or 0
+
+    stored = _read_stored_histograms(cursor, table)
+    columns: Dict[str, ColumnHistogram] = {}
+    built = 0
+
+    for column in timestamp_columns:
+        if column.lower() not in declared_types:
+            return None
+
+        affinity = sqlite_column_affinity(declared_types[column.lower()])
+
+        def query_key(value: datetime, _affinity=affinity) -> Tuple:
+            return sqlite_sort_key(apply_comparison_affinity(convert_for_query(value), _affinity))
+
+        entry = stored.get(column)
+        if (entry and entry['timestamp_format'] == timestamp_format
+                and entry['column_affinity'] == affinity and entry['source_row_count'] == row_count
+                and entry['source_max_rowid'] == max_rowid):
+            columns[column] = _column_from_entry(column, entry, query_key)
+            continue
+
+        if not build:
+            return None
+
+        histogram = _build_column_histogram(
+            cursor, table, column, query_key, parse_value, bucket_seconds, debug_mode
+        )
+        if histogram is None:
+            return None
+
+        _store_column_histogram(
+            connection, table, histogram, timestamp_format, affinity, row_count, max_rowid
+        )
+        columns[column] = histogram
+        built += 1
+
+    result = TimeBucketHistogram(columns)
+    result.stats.columns_loaded = len(columns) - built
+    result.stats.columns_built = built
+    return result
+
+
+def _build_column_histogram(cursor: sqlite3.Cursor, table: str, column: str,
+                            query_key: Callable[[datetime], Tuple],
+                            parse_value: Callable[[Any], Optional[datetime]],
+                            bucket_seconds: int, debug_mode: bool) -> Optional[ColumnHistogram]:
+    """Count the records of one column per bucket with a single table scan."""
+    cursor.execute(f"SELECT MIN({column}), MAX({column}) FROM {table} WHERE {column} IS NOT NULL")
+    min_value, max_value = cursor.fetchone()
+
+    if min_value is None:
+        # Column is entirely NULL: no record can ever match it
+        return ColumnHistogram(column, 0, bucket_seconds, array('q'), 0, 0, query_key)
+
+    min_time = parse_value(min_value)
+    max_time = parse_value(max_value)
+    if min_time is None or max_time is None:
+        if debug_mode:
+            print(f"[TimeBucketHistogram] Cannot index {column}: unparseable range {min_value!r} - {max_value!r}")
+        return None
+
+    try:
+        min_time = _to_utc(min_time)
+        max_time = max(_to_utc(max_time), min_time)
+
+        # Align the origin to the bucket grid (in UTC epoch seconds) and widen
+        # buckets for long spans
+        width = timedelta(seconds=bucket_seconds)
+        origin_seconds = bucket_seconds * ((min_time - _EPOCH) // width)
+        while (max_time - _EPOCH - timedelta(seconds=origin_seconds)) // width + 1 > MAX_BUCKETS:
+            bucket_seconds *= 2
+            width = timedelta(seconds=bucket_seconds)
+            origin_seconds = bucket_seconds * ((min_time - _EPOCH) // width)
+
+        origin = _EPOCH + timedelta(seconds=origin_seconds)
+        bucket_count = (max_time - origin) // width + 1
+        boundary_keys = [query_key(origin + width * i) for i in range(bucket_count + 1)]
+    except _TIME_ERRORS as e:
+        if debug_mode:
+            print(f"[TimeBucketHistogram] Cannot index {column}: {e}")
+        return None
+
+    # The bound values must sort like time for buckets to be meaningful
+    if any(boundary_keys[i] > boundary_keys[i + 1] for i in range(bucket_count)):
+        if debug_mode:
+            print(f"[TimeBucketHistogram] Cannot index {column}: query values are not time-ordered")
+        return None
+
+    counts = array('q', bytes(8 * bucket_count))
+    below_count = 0
+    above_count = 0
+
+    cursor.execute(f"SELECT {column} FROM {table} WHERE {column} IS NOT NULL")
+    while True:
+        rows = cursor.fetchmany(5000)
+        if not rows:
+            break
+        for (value,) in rows:
+            index = bisect_right(boundary_keys, sqlite_sort_key(value)) - 1
+            if index < 0:
+                below_count += 1
+            elif index >= bucket_count:
+                above_count += 1
+            else:
+                counts[index] += 1
+
+    return ColumnHistogram(column, origin_seconds, bucket_seconds, counts, below_count, above_count, query_key)
+
+
+def _histogram_table_state(cursor: sqlite3.Cursor) -> str:
+    """
+    State of the side table: 'missing', 'current', or 'outdated' when it was
+    written by an older layout (its histograms are rebuilt).
+    """
+    cursor.execute(f"PRAGMA table_info({HISTOGRAM_TABLE})")
+    info = cursor.fetchall()
+    if not info:
+        return 'missing'
+
+    columns = {row[1] for row in info}
+    primary_key = tuple(row[1] for row in sorted(info, key=lambda row: row[5]) if row[5])
+    if 'origin_seconds' in columns and primary_key == _PRIMARY_KEY:
+        return 'current'
+    return 'outdated'
+
+
+def _read_stored_histograms(cursor: sqlite3.Cursor, table: str) -> Dict[str, Dict[str, Any]]:
+    """Stored histograms of one table, by column name"""
+    if _histogram_table_state(cursor) != 'current':
+        return {}
+
+    cursor.execute(f"""
+        SELECT column_name, source_table, timestamp_format, column_affinity, origin_seconds,
+               bucket_seconds, below_count, above_count, counts,
+               source_row_count, source_max_rowid
+        FROM {HISTOGRAM_TABLE}
+        WHERE source_table = ?
+    """, (table,))
+    keys = ('column_name', 'source_table', 'timestamp_format', 'column_affinity', 'origin_seconds',
+            'bucket_seconds', 'below_count', 'above_count', 'counts',
+            'source_row_count', 'source_max_rowid')
+    return {row[0]: dict(zip(keys, row)) for row in cursor.fetchall()}
+
+
+def _column_from_entry(column: str, entry: Dict[str, Any],
+                       query_key: Callable[[datetime], Tuple]) -> ColumnHistogram:
+    counts = array('q')
+    counts.frombytes(entry['counts'])
+    if sys.byteorder != 'little':
+        counts.byteswap()
+
+    return ColumnHistogram(
+        column,
+        entry['origin_seconds'],
+        entry['bucket_seconds'],
+        counts,
+        entry['below_count'],
+        entry['above_count'],
+        query_key
+    )
+
+
+def _store_column_histogram(connection: sqlite3.Connection, table: str, histogram: ColumnHistogram,
+                            timestamp_format: Optional[str], affinity: str,
+                            row_count: int, max_rowid: int):
+    """Persist one column histogram (counts stored as little-endian int64)."""
+    counts = array('q', histogram.counts)
+    if sys.byteorder != 'little':
+        counts.byteswap()
+
+    try:
+        if _histogram_table_state(connection.cursor()) == 'outdated':
+            connection.execute(f"DROP TABLE {HISTOGRAM_TABLE}")
+        connection.execute(f"""
+            CREATE TABLE IF NOT EXISTS {HISTOGRAM_TABLE} (
+                column_name TEXT NOT NULL,
+                source_table TEXT NOT NULL,
+                timestamp_format TEXT,
+                column_affinity TEXT NOT NULL,
+                origin_seconds INTEGER NOT NULL,
+                bucket_seconds INTEGER NOT NULL,
+                bucket_count INTEGER NOT NULL,
+                below_count INTEGER NOT NULL,
+                above_count INTEGER NOT NULL,
+                counts BLOB NOT NULL,
+                source_row_count INTEGER NOT NULL,
+                source_max_rowid INTEGER NOT NULL,
+                created_at TEXT NOT NULL,
+                PRIMARY KEY (source_table, column_name)
+            )
+        """)
+        connection.execute(f"""
+            INSERT OR REPLACE INTO {HISTOGRAM_TABLE}
+            (column_name, source_table, timestamp_format, column_affinity, origin_seconds,
+             bucket_seconds, bucket_count, below_count, above_count, counts,
+             source_row_count, source_max_rowid, created_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """, (
+            histogram.column, table, timestamp_format, affinity, histogram.origin_seconds,
+            histogram.bucket_seconds, histogram.bucket_count, histogram.below_count,
+            histogram.above_count, counts.tobytes(), row_count, max_rowid,
+            datetime.now().isoformat()
+        ))
+        connection.commit()
+    except sqlite3.Error as e:
+        # Read-only or locked database: keep the in-memory histogram only
+        logger.warning(f"Could not persist time histogram for {histogram.column}: {e}")
@@ -11,6 +11,7 @@ Features:
 - Timestamp validation and error reporting
 - Format detection and automatic conversion
 - Timezone handling and normalization
+- Vectorized batch parsing of whole columns (parse_many, requires NumPy)
 """
 
 import re
@@ -21,6 +22,20 @@ from dataclasses import dataclass
 from enum import Enum
 import calendar
 
+# Optional import for vectorized batch parsing (parse_many)
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+
+# Offset between the Windows FILETIME epoch (1601-01-01) and the Unix epoch
+FILETIME_EPOCH_OFFSET_SECONDS = 11644473600
+
+# Values sampled to detect a column's format in parse_many()
+BATCH_FORMAT_SAMPLE_SIZE = 100
+
 
 class TimestampFormat(Enum):
     """Supported timestamp formats"""
@@ -61,6 +76,30 @@ class TimestampValidationRule:
     max_future_days: int = 365
 
 
+# Divisor from the stored number to seconds, per numeric format (parse_many)
+_BATCH_NUMERIC_SCALES = {
+    TimestampFormat.UNIX_SECONDS: 1.0,
+    TimestampFormat.UNIX_MILLISECONDS: 1000.0,
+    TimestampFormat.UNIX_MICROSECONDS: 1000000.0
+}
+
+# Fixed string layouts parse_many converts in bulk, per format:
+# (date/time separators, trailing 'Z' allowed, accepted fraction digit counts).
+# Only layouts the scalar parser accepts on every supported Python version.
+_BATCH_STRING_LAYOUTS = {
+    TimestampFormat.ISO8601: ('T', True, (0, 1, 2, 3, 4, 5, 6)),
+    TimestampFormat.ISO8601_ZULU: ('T ', True, (0, 3, 6)),
+    TimestampFormat.DATETIME_STRING: (' ', False, (0, 1, 2, 3, 4, 5, 6)),
+}
+
+
+def _datetime_to_epoch_microseconds(value: datetime) -> int:
+    """Microseconds since 1970-01-01 UTC (naive datetimes are taken as UTC)"""
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return (value - datetime(1970, 1, 1, tzinfo=timezone.utc)) // timedelta(microseconds=1)
+
+
 class ResilientTimestampParser:
     """
     Robust timestamp parser with multiple format support and error resilience.
@@ -178,6 +217,213 @@ class ResilientTimestampParser:
             confidence=0.0
         )
     
+    def parse_many(self,
+                   values: List[Any],
+                   format_hint: Optional[TimestampFormat] = None) -> Tuple[Any, Any]:
+        """
+        Parse a whole column of timestamp values.
+        
+        The column format is detected once from a sample (or taken from
+        format_hint) and every value is converted in bulk with NumPy: Unix
+        seconds/milliseconds/microseconds and FILETIME numbers, and fixed-layout
+        "YYYY-MM-DD[T ]HH:MM:SS[.ffffff][Z]" strings sliced by position. Values
+        the bulk path cannot handle go through parse_timestamp() with the
+        detected format as hint, so results are the same as parsing each value
+        on its own.
+        
+        Args:
+            values: Timestamp values (any mix of types, None for missing)
+            format_hint: Optional column format; detected from a sample if omitted
+            
+        Returns:
+            Tuple (epoch_microseconds, valid): an int64 array of microseconds
+            since 1970-01-01 UTC and a boolean validity mask (plain lists when
+            NumPy is not installed); invalid entries hold 0
+        """
+        values = list(values)
+        column_format = format_hint or self._detect_column_format(values)
+        
+        if not NUMPY_AVAILABLE:
+            epochs, valid = [], []
+            for value in values:
+                result = self.parse_timestamp(value, hint_format=column_format)
+                epochs.append(_datetime_to_epoch_microseconds(result.datetime_value) if result.success else 0)
+                valid.append(result.success)
+            return epochs, valid
+        
+        epochs = np.zeros(len(values), dtype=np.int64)
+        valid = np.zeros(len(values), dtype=bool)
+        
+        if column_format in _BATCH_NUMERIC_SCALES or column_format == TimestampFormat.WINDOWS_FILETIME:
+            self._parse_numeric_batch(values, column_format, epochs, valid)
+        elif column_format in _BATCH_STRING_LAYOUTS:
+            self._parse_string_batch(values, column_format, epochs, valid)
+        
+        bulk_parsed = int(valid.sum())
+        self.parse_attempts += bulk_parsed
+        self.successful_parses += bulk_parsed
+        
+        # Everything the bulk path did not accept gets the full resilient treatment
+        for index in np.flatnonzero(~valid):
+            result = self.parse_timestamp(values[index], hint_format=column_format)
+            if result.success:
+                epochs[index] = _datetime_to_epoch_microseconds(result.datetime_value)
+                valid[index] = True
+        
+        return epochs, valid
+    
+    def _detect_column_format(self, values: List[Any]) -> TimestampFormat:
+        """Most common format among a sample of a column's non-empty values"""
+        format_counts: Dict[TimestampFormat, int] = {}
+        sampled = 0
+        
+        for value in values:
+            if value is None or (isinstance(value, str) and value.strip() == ''):
+                continue
+            result = self.parse_timestamp(value)
+            if result.success:
+                format_counts[result.detected_format] = format_counts.get(result.detected_format, 0) + 1
+            sampled += 1
+            if sampled >= BATCH_FORMAT_SAMPLE_SIZE:
+                break
+        
+        if not format_counts:
+            return TimestampFormat.UNKNOWN
+        return max(format_counts, key=format_counts.get)
+    
+    def _valid_epoch_range(self) -> Tuple[int, int]:
+        """Inclusive epoch-microsecond bounds accepted by _validate_datetime"""
+        rules = self.validation_rules
+        lower = _datetime_to_epoch_microseconds(datetime(max(rules.min_year, 1), 1, 1, tzinfo=timezone.utc))
+        if rules.max_year >= 9999:
+            upper = _datetime_to_epoch_microseconds(datetime(9999, 12, 31, 23, 59, 59, 999999, tzinfo=timezone.utc))
+        else:
+            upper = _datetime_to_epoch_microseconds(datetime(rules.max_year + 1, 1, 1, tzinfo=timezone.utc)) - 1
+        
+        now = datetime.now(tz=timezone.utc)
+        if not rules.allow_future_dates:
+            upper = min(upper, _datetime_to_epoch_microseconds(now))
+        if rules.max_future_days > 0:
+            upper = min(upper, _datetime_to_epoch_microseconds(now + timedelta(days=rules.max_future_days)))
+        
+        return lower, upper
+    
+    def _parse_numeric_batch(self, values: List[Any], column_format: TimestampFormat,
+                             epochs: 'np.ndarray', valid: 'np.ndarray'):
+        """
+        Bulk version of the Unix and FILETIME parsers.
+        
+        Mirrors their float arithmetic and datetime.fromtimestamp()'s
+        round-half-even to the microsecond, so results match exactly.
+        """
+        numbers = np.full(len(values), np.nan)
+        is_filetime = column_format == TimestampFormat.WINDOWS_FILETIME
+        
+        for index, value in enumerate(values):
+            if value is None or isinstance(value, bool):
+                continue
+            try:
+                # FILETIME parsing starts with int(value), the Unix parsers with float(value)
+                numbers[index] = float(int(value)) if is_filetime else float(value)
+            except (TypeError, ValueError, OverflowError):
+                continue
+        
+        if is_filetime:
+            seconds = numbers / 10000000.0 - FILETIME_EPOCH_OFFSET_SECONDS
+        else:
+            seconds = numbers / _BATCH_NUMERIC_SCALES[column_format]
+        
+        lower, upper = self._valid_epoch_range()
+        in_range = np.isfinite(seconds) & (seconds >= lower / 1e6 - 1) & (seconds <= upper / 1e6 + 1)
+        seconds = np.where(in_range, seconds, 0.0)
+        
+        whole = np.trunc(seconds)
+        micros = np.rint((seconds - whole) * 1e6)
+        carry = micros >= 1e6
+        whole = np.where(carry, whole + 1.0, whole)
+        micros = np.where(carry, micros - 1e6, micros)
+        
+        result = whole.astype(np.int64) * 1000000 + micros.astype(np.int64)
+        accepted = in_range & (result >= lower) & (result <= upper)
+        
+        epochs[accepted] = result[accepted]
+        valid[accepted] = True
+    
+    def _parse_string_batch(self, values: List[Any], column_format: TimestampFormat,
+                            epochs: 'np.ndarray', valid: 'np.ndarray'):
+        """
+        Bulk version of the ISO 8601 / datetime string parsers for fixed-layout
+        values: characters are checked and converted by position across the
+        whole column at once.
+        """
+        separators, allow_zulu, fraction_digits = _BATCH_STRING_LAYOUTS[column_format]
+        
+        positions = [index for index, value in enumerate(values)
+                     if isinstance(value, str) and 19 <= len(value) <= 27 and value.isascii()]
+        if not positions:
+            return
+        
+        raw = np.array([values[index] for index in positions], dtype='S27')
+        chars = raw.view(np.uint8).reshape(len(positions), 27).astype(np.int64)
+        lengths = np.char.str_len(raw)
+        digits = chars - ord('0')
+        is_digit = (digits >= 0) & (digits <= 9)
+        
+        def number(start: int, width: int) -> 'np.ndarray':
+            result = np.zeros(len(positions), dtype=np.int64)
+            for offset in range(start, start + width):
+                result = result * 10 + digits[:, offset]
+            return result
+        
+        # Fixed "YYYY-MM-DD?HH:MM:SS" prefix
+        ok = is_digit[:, [0, 1, 2, 3, 5, 6, 8, 9, 11, 12, 14, 15, 17, 18]].all(axis=1)
+        ok &= (chars[:, 4] == ord('-')) & (chars[:, 7] == ord('-'))
+        ok &= (chars[:, 13] == ord(':')) & (chars[:, 16] == ord(':'))
+        ok &= np.isin(chars[:, 10], [ord(separator) for separator in separators])
+        
+        # Optional trailing Z
+        has_zulu = chars[np.arange(len(positions)), lengths - 1] == ord('Z')
+        if not allow_zulu:
+            ok &= ~has_zulu
+        body_lengths = lengths - has_zulu
+        
+        # Optional ".f..." fraction: 19 = none, 21-26 = 1-6 digits
+        fraction_count = np.where(body_lengths == 19, 0, body_lengths - 20)
+        ok &= (body_lengths == 19) | ((body_lengths >= 21) & (chars[:, 19] == ord('.')))
+        ok &= np.isin(fraction_count, fraction_digits)
+        
+        fraction = np.zeros(len(positions), dtype=np.int64)
+        for offset in range(6):
+            present = fraction_count > offset
+            ok &= ~present | is_digit[:, 20 + offset]
+            fraction += np.where(present, digits[:, 20 + offset], 0) * 10 ** (5 - offset)
+        
+        year, month, day = number(0, 4), number(5, 2), number(8, 2)
+        hour, minute, second = number(11, 2), number(14, 2), number(17, 2)
+        
+        leap = (year % 4 == 0) & ((year % 100 != 0) | (year % 400 == 0))
+        days_in_month = np.array([0, 31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31])[np.clip(month, 0, 12)]
+        days_in_month = days_in_month + ((month == 2) & leap)
+        ok &= (year >= 1) & (month >= 1) & (month <= 12) & (day >= 1) & (day <= days_in_month)
+        ok &= (hour <= 23) & (minute <= 59) & (second <= 59)
+        
+        # Days since 1970-01-01 of the civil date (proleptic Gregorian)
+        shifted_year = year - (month <= 2)
+        era = shifted_year // 400
+        year_of_era = shifted_year - era * 400
+        day_of_year = (153 * np.where(month > 2, month - 3, month + 9) + 2) // 5 + day - 1
+        day_of_era = year_of_era * 365 + year_of_era // 4 - year_of_era // 100 + day_of_year
+        days = era * 146097 + day_of_era - 719468
+        
+        result = ((days * 86400 + hour * 3600 + minute * 60 + second) * 1000000) + fraction
+        
+        lower, upper = self._valid_epoch_range()
+        ok &= (result >= lower) & (result <= upper)
+        
+        accepted = np.asarray(positions)[ok]
+        epochs[accepted] = result[ok]
+        valid[accepted] = True
+    
     def _detect_format(self, value: Any) -> TimestampFormat:
         """
         Detect timestamp format from value.
@@ -6,7 +6,9 @@ Provides sophisticated scoring for correlation matches using configurable weight
 """
 
 import logging
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, Sequence
+
+from .score_matrix import ScoreThresholds, WingWeightVector
 
 logger = logging.getLogger(__name__)
 
@@ -91,6 +93,50 @@ class WeightedScoringEngine:
             'total_feathers': len(breakdown)
         }
     
+    def calculate_batch_scores(self,
+                               match_records_list: Sequence[Dict[str, Dict]],
+                               wing_config: Any) -> List[Dict[str, Any]]:
+        """
+        Calculate weighted scores for a batch of matches at once.
+        
+        Gives the same results as calculate_match_score() for each match, from
+        one feather-presence matrix product and one threshold lookup; matches
+        with the same feathers share their breakdown.
+        
+        Args:
+            match_records_list: feather_records (feather_id -> record) of each match
+            wing_config: Wing configuration with weights
+            
+        Returns:
+            Score result of each match, in order
+        """
+        scoring_config = getattr(wing_config, 'scoring', {})
+        if not scoring_config.get('enabled', False):
+            return [self.calculate_match_score(match_records, wing_config)
+                    for match_records in match_records_list]
+        
+        weight_vector = WingWeightVector(wing_config)
+        scores, pattern_ids, patterns = weight_vector.score_batch(match_records_list)
+        
+        breakdowns = [weight_vector.breakdown(pattern) for pattern in patterns]
+        matched_counts = [sum(1 for details in breakdown.values() if details['matched'])
+                          for breakdown in breakdowns]
+        
+        interpretation_config = scoring_config.get('score_interpretation', {})
+        levels = ScoreThresholds(interpretation_config).lookup(scores)
+        
+        results = []
+        for score, pattern_id, level in zip(scores, pattern_ids, levels):
+            breakdown = breakdowns[pattern_id]
+            results.append({
+                'score': round(score, 2),
+                'interpretation': interpretation_config[level].get('label', level) if level is not None else "Unknown",
+                'breakdown': breakdown,
+                'matched_feathers': matched_counts[pattern_id],
+                'total_feathers': len(breakdown)
+            })
+        return results
+    
     def _interpret_score(self, score: float, 
                         interpretation_config: Dict) -> str:
         """
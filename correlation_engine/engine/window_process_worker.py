@@ -0,0 +1,252 @@
+"""
+Process-Pool Worker for Time-Window Correlation
+
+Window correlation groups records by identity with pure-Python dict and set
+work, so a thread pool serializes on the GIL. This module lets
+ParallelWindowProcessor run windows in separate processes instead.
+
+Data crossing the process boundary is kept compact:
+- A task descriptor is a tuple (task_index, window_id, start_us, end_us,
+  utc_offset_seconds) - the window bounds as wall-clock microseconds since
+  1970-01-01, never the window's records.
+- A result payload lists each distinct record column layout once and carries
+  every record as a tuple of values referencing its layout.
+
+Each worker opens its own read-only connections to the feather databases in
+the pool initializer and correlates windows with the same code as the
+sequential path, so both produce the same matches.
+"""
+
+import os
+import time
+import uuid
+import logging
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional, Tuple
+
+from .base_engine import FilterConfig
+from .feather_loader import FeatherLoader
+from .correlation_result import CorrelationMatch
+from .two_phase_correlation import TimeWindow
+from .time_based_engine import (
+    OptimizedFeatherQuery,
+    WindowQueryManager,
+    TimeWindowScanningEngine
+)
+from ..optimization.optimization_components import PerformanceProfiler
+from ..wings.core.wing_model import Wing
+
+logger = logging.getLogger(__name__)
+
+_EPOCH = datetime(1970, 1, 1)
+_ONE_MICROSECOND = timedelta(microseconds=1)
+
+# Per-process worker state, created by initialize_window_worker()
+_worker_correlator: Optional['WindowCorrelationWorker'] = None
+
+
+@dataclass
+class WindowWorkerSpec:
+    """Everything a worker process needs to correlate windows on its own"""
+    feather_paths: Dict[str, str]  # feather_id -> database path, in query order
+    wing: Wing
+    filters: Optional[FilterConfig] = None
+    debug_mode: bool = False
+    query_cache_size_mb: int = 512
+
+
+class WindowCorrelationWorker:
+    """
+    Engine-free window correlator used inside worker processes.
+
+    Borrows the identity grouping methods of TimeWindowScanningEngine so that
+    windows are correlated exactly as in the sequential path, without
+    constructing a full engine in every worker.
+    """
+
+    _normalize_identity = TimeWindowScanningEngine._normalize_identity
+    _extract_identity_from_record = TimeWindowScanningEngine._extract_identity_from_record
+    _correlate_window_records = TimeWindowScanningEngine._correlate_window_records
+
+    def __init__(self, spec: WindowWorkerSpec):
+        self.wing = spec.wing
+        self.debug_mode = spec.debug_mode
+        self.profiler = PerformanceProfiler(enabled=False)
+
+        feather_queries: Dict[str, OptimizedFeatherQuery] = {}
+        for feather_id, db_path in spec.feather_paths.items():
+            try:
+                loader = FeatherLoader(db_path, read_only=True)
+                loader.feather_id = feather_id
+                loader.connect()
+
+                query_manager = OptimizedFeatherQuery(loader, debug_mode=spec.debug_mode)
+                query_manager.configure_cache(max_size_mb=spec.query_cache_size_mb, max_entries=100)
+                feather_queries[feather_id] = query_manager
+            except Exception as e:
+                # Same policy as the engine: an unreadable feather is skipped
+                logger.warning(f"[WindowWorker {os.getpid()}] Skipping feather {feather_id}: {e}")
+
+        self.window_query_manager = WindowQueryManager(
+            feather_queries, filters=spec.filters, debug_mode=spec.debug_mode
+        )
+
+    def process_window(self, window: TimeWindow) -> List[CorrelationMatch]:
+        """Query and correlate one window (mirrors TimeWindowScanningEngine._process_window)"""
+        populated_window = self.window_query_manager.query_window(window)
+
+        minimum_feathers = self.wing.correlation_rules.minimum_matches
+        if populated_window.is_empty() or not populated_window.has_minimum_feathers(minimum_feathers):
+            return []
+
+        return self._correlate_window_records(populated_window, self.wing)
+
+    def close(self):
+        """Close the worker's feather connections"""
+        for query_manager in self.window_query_manager.feather_queries.values():
+            try:
+                query_manager.loader.disconnect()
+            except Exception:
+                pass
+
+
+def encode_window_task(task_index: int, window: TimeWindow) -> Tuple:
+    """
+    Build the compact task descriptor for a window.
+
+    Args:
+        task_index: Position of the task in submission order
+        window: TimeWindow to describe (its records are not transferred)
+
+    Returns:
+        Tuple (task_index, window_id, start_us, end_us, utc_offset_seconds)
+    """
+    offset = window.start_time.utcoffset()
+    return (
+        task_index,
+        window.window_id,
+        _to_wall_microseconds(window.start_time),
+        _to_wall_microseconds(window.end_time),
+        offset.total_seconds() if offset is not None else None
+    )
+
+
+def decode_window_task(descriptor: Tuple) -> TimeWindow:
+    """Rebuild an empty TimeWindow from a task descriptor"""
+    _, window_id, start_us, end_us, offset_seconds = descriptor
+    tzinfo = timezone(timedelta(seconds=offset_seconds)) if offset_seconds is not None else None
+    return TimeWindow(
+        start_time=_from_wall_microseconds(start_us, tzinfo),
+        end_time=_from_wall_microseconds(end_us, tzinfo),
+        window_id=window_id
+    )
+
+
+def _to_wall_microseconds(value: datetime) -> int:
+    return (value.replace(tzinfo=None) - _EPOCH) // _ONE_MICROSECOND
+
+
+def _from_wall_microseconds(microseconds: int, tzinfo) -> datetime:
+    value = _EPOCH + timedelta(microseconds=microseconds)
+    return value.replace(tzinfo=tzinfo) if tzinfo is not None else value
+
+
+def encode_matches(matches: List[CorrelationMatch]) -> Tuple:
+    """
+    Serialize window matches into a compact payload.
+
+    Returns:
+        Tuple (column_layouts, match_rows): column_layouts is a tuple of column
+        name tuples; each match row holds the match fields followed by
+        ((feather_id, ((layout_index, values), ...)), ...)
+    """
+    layout_index: Dict[Tuple[str, ...], int] = {}
+    match_rows = []
+
+    for match in matches:
+        feather_entries = []
+        for feather_id, records in match.feather_records.items():
+            encoded_records = []
+            for record in records:
+                columns = tuple(record.keys())
+                index = layout_index.get(columns)
+                if index is None:
+                    index = len(layout_index)
+                    layout_index[columns] = index
+                encoded_records.append((index, tuple(record.values())))
+            feather_entries.append((feather_id, tuple(encoded_records)))
+
+        match_rows.append((
+            match.timestamp,
+            match.match_score,
+            match.feather_count,
+            match.time_spread_seconds,
+            match.anchor_feather_id,
+            match.anchor_artifact_type,
+            match.matched_application,
+            match.confidence_score,
+            match.confidence_category,
+            tuple(feather_entries)
+        ))
+
+    return tuple(layout_index), tuple(match_rows)
+
+
+def decode_matches(payload: Tuple) -> List[CorrelationMatch]:
+    """Rebuild CorrelationMatch objects from an encode_matches() payload"""
+    column_layouts, match_rows = payload
+    matches = []
+
+    for (timestamp, match_score, feather_count, time_spread_seconds, anchor_feather_id,
+         anchor_artifact_type, matched_application, confidence_score, confidence_category,
+         feather_entries) in match_rows:
+        feather_records = {
+            feather_id: [dict(zip(column_layouts[index], values)) for index, values in records]
+            for feather_id, records in feather_entries
+        }
+        matches.append(CorrelationMatch(
+            match_id=str(uuid.uuid4()),
+            timestamp=timestamp,
+            feather_records=feather_records,
+            match_score=match_score,
+            feather_count=feather_count,
+            time_spread_seconds=time_spread_seconds,
+            anchor_feather_id=anchor_feather_id,
+            anchor_artifact_type=anchor_artifact_type,
+            matched_application=matched_application,
+            confidence_score=confidence_score,
+            confidence_category=confidence_category,
+            semantic_data=None
+        ))
+
+    return matches
+
+
+def initialize_window_worker(spec: WindowWorkerSpec):
+    """Process-pool initializer: open this worker's read-only feather connections"""
+    global _worker_correlator
+    _worker_correlator = WindowCorrelationWorker(spec)
+
+
+def process_window_task(descriptor: Tuple) -> Tuple[int, int, Optional[Tuple], float, Optional[str]]:
+    """
+    Correlate one window inside a worker process.
+
+    Args:
+        descriptor: Task descriptor from encode_window_task()
+
+    Returns:
+        Tuple (task_index, worker_pid, match_payload, processing_time_seconds, error)
+    """
+    start_time = time.time()
+    task_index = descriptor[0]
+
+    try:
+        if _worker_correlator is None:
+            raise RuntimeError("Window worker process was not initialized")
+
+        matches = _worker_correlator.process_window(decode_window_task(descriptor))
+        return task_index, os.getpid(), encode_matches(matches), time.time() - start_time, None
+    except Exception as e:
+        return task_index, os.getpid(), None, time.time() - start_time, str(e)
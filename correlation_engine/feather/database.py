@@ -3,10 +3,38 @@ Feather Database Manager
 Handles creation and management of feather SQLite databases.
 """
 
+import itertools
+import logging
 import sqlite3
 import os
+import time
+from dataclasses import dataclass
 from datetime import datetime
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Callable, Iterable, Iterator, Optional
+
+from ..engine.epoch_timestamps import (
+    EpochTimestampNormalizer,
+    epoch_column_name,
+    write_epoch_columns
+)
+
+logger = logging.getLogger(__name__)
+
+# Records inserted per executemany() and commit during an import
+INSERT_CHUNK_SIZE = 50000
+
+
+@dataclass
+class ImportStatistics:
+    """Counters of the last FeatherDatabase.insert_data() call"""
+    rows_inserted: int = 0
+    chunks: int = 0
+    deferred_indexes: int = 0
+    elapsed_seconds: float = 0.0
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows_inserted / self.elapsed_seconds if self.elapsed_seconds > 0 else 0.0
 
 
 class FeatherDatabase:
@@ -25,6 +53,7 @@ class FeatherDatabase:
         self.full_path = os.path.join(db_path, f"{feather_name}.db")
         self.connection = None
         self.cursor = None
+        self.last_import_stats = ImportStatistics()
     
     def connect(self):
         """Connect to the feather database."""
@@ -76,7 +105,8 @@ class FeatherDatabase:
             )
         ''')
         
-        # Create data lineage table
+        # Create data lineage table (one row per inserted range of records;
+        # the *_end columns are NULL for single-record lineage rows)
         self.cursor.execute('''
             CREATE TABLE IF NOT EXISTS data_lineage (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -86,9 +116,12 @@ class FeatherDatabase:
                 source_row_id INTEGER,
                 transformation_applied TEXT,
                 import_id INTEGER,
+                feather_record_id_end INTEGER,
+                source_row_id_end INTEGER,
                 FOREIGN KEY (import_id) REFERENCES import_history(id)
             )
         ''')
+        self._ensure_lineage_range_columns()
         
         self.connection.commit()
     
@@ -228,21 +261,49 @@ class FeatherDatabase:
         
         return type_mapping.get(original_type.upper(), 'TEXT')
     
-    def insert_data(self, table_name: str, data: List[Dict[str, Any]], 
-                   source_info: Dict[str, Any], columns: List[Dict[str, Any]]):
+    def insert_data(self, table_name: str, data: Iterable[Dict[str, Any]], 
+                   source_info: Dict[str, Any], columns: List[Dict[str, Any]],
+                   progress_callback: Optional[Callable[[int, float], None]] = None,
+                   chunk_size: int = INSERT_CHUNK_SIZE):
         """
         Insert data into feather table and populate metadata.
         
+        The data is streamed: records are read from any iterable (a list, a
+        generator, or a sqlite3 cursor over the source table) in chunks of
+        chunk_size, each chunk is inserted with one executemany() and
+        committed, and lineage is recorded as one row range per chunk.
+        When the table is empty, its secondary indexes are dropped for the
+        load and rebuilt once at the end.
+        
+        Every timestamp column also gets an indexed INTEGER companion column
+        <column>_epoch_us (microseconds since 1970-01-01 UTC), recorded in
+        feather_metadata under 'epoch_columns' so engines can run integer
+        range scans instead of detecting the timestamp format. Timestamp
+        columns are detected on the first chunk.
+        
         Args:
             table_name: Name of the feather table
-            data: List of data records to insert
+            data: Records to insert (keyed by 'original' column names) or a
+                sqlite3 cursor whose column names are the 'original' names
             source_info: Information about data source
             columns: Column mapping configuration
+            progress_callback: Optional callback(rows_inserted, rows_per_second)
+                called after every chunk
+            chunk_size: Records per executemany() and commit
+            
+        Returns:
+            Tuple of (success, error_message); counters of the import are
+            left in self.last_import_stats
         """
         # Sanitize table name
         table_name = self.sanitize_identifier(table_name)
         
-        # Record import in history
+        stats = ImportStatistics()
+        self.last_import_stats = stats
+        started = time.perf_counter()
+        import_timestamp = datetime.now().isoformat()
+        
+        # Record import in history (the record count is filled in at the end)
         self.cursor.execute('''
             INSERT INTO import_history 
             (source_type, source_path, import_timestamp, records_imported, columns_imported, status)
@@ -250,16 +311,18 @@ class FeatherDatabase:
         ''', (
             source_info['source_type'],
             source_info['source_path'],
-            datetime.now().isoformat(),
-            len(data),
+            import_timestamp,
+            0,
             len(columns),
             'in_progress'
         ))
         
         import_id = self.cursor.lastrowid
+        deferred_indexes = []
         
         try:
-            # Prepare column names (excluding generated fields) and sanitize them
+            # Map the columns once for the whole import
+            source_columns = [col['original'] for col in columns if col['original'] != '[ROW_COUNT]']
             data_columns = [self.sanitize_identifier(col['feather']) for col in columns if col['original'] != '[ROW_COUNT]']
             
             # Add base fields
@@ -268,76 +331,224 @@ class FeatherDatabase:
                 'artifact_type', 'source_path'
             ] + data_columns
             
-            placeholders = ', '.join(['?' for _ in all_columns])
-            columns_str = ', '.join([f'"{col}"' for col in all_columns])
+            base_values = (
+                source_info.get('source_tool', 'Unknown'),
+                import_timestamp,
+                import_timestamp,
+                source_info.get('artifact_type', 'imported'),
+                source_info['source_path']
+            )
+            
+            chunks = self._iter_chunks(data, chunk_size)
+            first_chunk = next(chunks, [])
+            
+            # Normalized epoch companion columns for the timestamp columns
+            normalizer = EpochTimestampNormalizer()
+            timestamp_columns = normalizer.detect_timestamp_columns(first_chunk, columns)
+            epoch_columns = {
+                self.sanitize_identifier(col['feather']): epoch_column_name(self.sanitize_identifier(col['feather']))
+                for col in timestamp_columns
+            }
+            self._add_epoch_columns(table_name, epoch_columns, normalizer)
+            
+            insert_columns = all_columns + list(epoch_columns.values())
+            placeholders = ', '.join(['?' for _ in insert_columns])
+            columns_str = ', '.join([f'"{col}"' for col in insert_columns])
             
             insert_sql = f'''
                 INSERT INTO "{table_name}" ({columns_str})
                 VALUES ({placeholders})
             '''
             
-            # Insert each record
-            for row_idx, record in enumerate(data):
-                # Base values
-                base_values = [
-                    source_info.get('source_tool', 'Unknown'),
-                    datetime.now().isoformat(),
-                    datetime.now().isoformat(),
-                    source_info.get('artifact_type', 'imported'),
-                    source_info['source_path']
-                ]
-                
-                # Data values
-                data_values = []
-                for col in columns:
-                    if col['original'] == '[ROW_COUNT]':
-                        continue
-                    
-                    value = record.get(col['original'], '')
-                    data_values.append(value)
+            self._ensure_lineage_range_columns()
+            deferred_indexes = self._drop_secondary_indexes(table_name)
+            stats.deferred_indexes = len(deferred_indexes)
+            
+            # Schema changes and the history entry are kept if a chunk fails
+            self.connection.commit()
+            
+            for chunk in itertools.chain([first_chunk], chunks):
+                if not chunk:
+                    continue
                 
-                all_values = base_values + data_values
+                # Build the chunk column by column; timestamp columns are
+                # converted in bulk rather than row by row
+                value_columns = [[record.get(column, '') for record in chunk] for column in source_columns]
+                value_columns += [
+                    normalizer.normalize_many([record.get(col['original']) for record in chunk], col['original'])
+                    for col in timestamp_columns
+                ]
+                if value_columns:
+                    rows = [base_values + values for values in zip(*value_columns)]
+                else:
+                    rows = [base_values] * len(chunk)
                 
-                self.cursor.execute(insert_sql, all_values)
+                self.cursor.executemany(insert_sql, rows)
+                last_record_id = self.cursor.execute('SELECT last_insert_rowid()').fetchone()[0]
                 
-                # Record lineage
-                feather_record_id = self.cursor.lastrowid
+                # Record lineage for the whole chunk
                 self.cursor.execute('''
                     INSERT INTO data_lineage 
-                    (feather_record_id, original_source, source_row_id, import_id)
-                    VALUES (?, ?, ?, ?)
+                    (feather_record_id, feather_record_id_end, original_source,
+                     source_row_id, source_row_id_end, import_id)
+                    VALUES (?, ?, ?, ?, ?, ?)
                 ''', (
-                    feather_record_id,
+                    last_record_id - len(rows) + 1,
+                    last_record_id,
                     source_info['source_path'],
-                    row_idx + 1,
+                    stats.rows_inserted + 1,
+                    stats.rows_inserted + len(rows),
                     import_id
                 ))
+                
+                self.connection.commit()
+                
+                stats.rows_inserted += len(rows)
+                stats.chunks += 1
+                stats.elapsed_seconds = time.perf_counter() - started
+                self._report_progress(table_name, stats, progress_callback)
             
             # Update import status
             self.cursor.execute('''
                 UPDATE import_history 
-                SET status = 'completed'
+                SET status = 'completed', records_imported = ?
                 WHERE id = ?
-            ''', (import_id,))
+            ''', (stats.rows_inserted, import_id))
+            
+            # Rebuild the indexes dropped for the load
+            self._restore_indexes(deferred_indexes)
+            deferred_indexes = []
+            
+            # Index the epoch columns and record them for the engines
+            if epoch_columns:
+                self.create_indexes(table_name, list(epoch_columns.values()))
+                write_epoch_columns(self.cursor, epoch_columns)
             
             # Update feather_metadata with table information
-            self._update_metadata_after_insert(table_name, data, all_columns, source_info)
+            self._update_metadata_after_insert(table_name, stats.rows_inserted, all_columns, source_info)
             
             self.connection.commit()
+            
+            stats.elapsed_seconds = time.perf_counter() - started
+            logger.info(
+                f"Imported {stats.rows_inserted:,} records into {table_name} in "
+                f"{stats.elapsed_seconds:.1f}s ({stats.rows_per_second:,.0f} rows/sec)"
+            )
             return True, None
             
         except Exception as e:
+            # Discard the partial chunk; committed chunks keep their lineage
+            self.connection.rollback()
+            
+            try:
+                self._restore_indexes(deferred_indexes)
+            except sqlite3.Error as index_error:
+                logger.error(f"Failed to rebuild indexes of {table_name}: {index_error}")
+            
             # Update import status with error
             self.cursor.execute('''
                 UPDATE import_history 
-                SET status = 'failed', error_message = ?
+                SET status = 'failed', error_message = ?, records_imported = ?
                 WHERE id = ?
-            ''', (str(e), import_id))
+            ''', (str(e), stats.rows_inserted, import_id))
             
             self.connection.commit()
             return False, str(e)
     
-    def _update_metadata_after_insert(self, table_name: str, data: List[Dict[str, Any]], 
+    @staticmethod
+    def _iter_chunks(data: Iterable[Dict[str, Any]], chunk_size: int) -> Iterator[List[Dict[str, Any]]]:
+        """Yield lists of up to chunk_size records from an iterable or a sqlite3 cursor."""
+        if isinstance(data, sqlite3.Cursor):
+            names = [description[0] for description in data.description]
+            while True:
+                rows = data.fetchmany(chunk_size)
+                if not rows:
+                    return
+                yield [dict(zip(names, row)) for row in rows]
+        
+        iterator = iter(data)
+        while True:
+            chunk = list(itertools.islice(iterator, chunk_size))
+            if not chunk:
+                return
+            yield chunk
+    
+    def _report_progress(self, table_name: str, stats: ImportStatistics,
+                         progress_callback: Optional[Callable[[int, float], None]]):
+        """Log import throughput and forward it to the caller's callback."""
+        logger.info(
+            f"Inserted {stats.rows_inserted:,} records into {table_name} "
+            f"({stats.rows_per_second:,.0f} rows/sec)"
+        )
+        if progress_callback:
+            progress_callback(stats.rows_inserted, stats.rows_per_second)
+    
+    def _ensure_lineage_range_columns(self):
+        """Add the row range columns to data_lineage tables created before they existed."""
+        self.cursor.execute('PRAGMA table_info(data_lineage)')
+        existing_columns = {row[1] for row in self.cursor.fetchall()}
+        
+        for column in ('feather_record_id_end', 'source_row_id_end'):
+            if column not in existing_columns:
+                self.cursor.execute(f'ALTER TABLE data_lineage ADD COLUMN {column} INTEGER')
+    
+    def _drop_secondary_indexes(self, table_name: str) -> List[str]:
+        """
+        Drop the indexes of an empty table so a bulk load does not maintain them.
+        
+        Args:
+            table_name: Sanitized name of the feather table
+            
+        Returns:
+            CREATE INDEX statements to rebuild them with (empty if the table
+            already holds rows and its indexes were kept)
+        """
+        if self.cursor.execute(f'SELECT 1 FROM "{table_name}" LIMIT 1').fetchone():
+            return []
+        
+        indexes = self.cursor.execute(
+            "SELECT name, sql FROM sqlite_master WHERE type = 'index' AND tbl_name = ? AND sql IS NOT NULL",
+            (table_name,)
+        ).fetchall()
+        
+        for index_name, _ in indexes:
+            self.cursor.execute(f'DROP INDEX IF EXISTS "{index_name}"')
+        
+        return [index_sql for _, index_sql in indexes]
+    
+    def _restore_indexes(self, index_statements: List[str]):
+        """Rebuild indexes dropped by _drop_secondary_indexes."""
+        for index_sql in index_statements:
+            self.cursor.execute(index_sql)
+    
+    def _add_epoch_columns(self, table_name: str, epoch_columns: Dict[str, str],
+                           normalizer: EpochTimestampNormalizer):
+        """
+        Add missing epoch companion columns, backfilling rows already in the table.
+        
+        Args:
+            table_name: Sanitized name of the feather table
+            epoch_columns: Mapping of timestamp column -> epoch column
+            normalizer: Normalizer used for the new rows
+        """
+        self.cursor.execute(f'PRAGMA table_info("{table_name}")')
+        existing_columns = {row[1] for row in self.cursor.fetchall()}
+        
+        for column, epoch_column in epoch_columns.items():
+            if epoch_column in existing_columns:
+                continue
+            
+            self.cursor.execute(f'ALTER TABLE "{table_name}" ADD COLUMN "{epoch_column}" INTEGER')
+            
+            if column in existing_columns:
+                rows = self.cursor.execute(f'SELECT rowid, "{column}" FROM "{table_name}"').fetchall()
+                epochs = normalizer.normalize_many([value for _, value in rows])
+                self.cursor.executemany(
+                    f'UPDATE "{table_name}" SET "{epoch_column}" = ? WHERE rowid = ?',
+                    [(epoch, rowid) for epoch, (rowid, _) in zip(epochs, rows)]
+                )
+    
+    def _update_metadata_after_insert(self, table_name: str, record_count: int, 
                                      all_columns: List[str], source_info: Dict[str, Any]):
         """
         Update feather_metadata table after data insertion.
@@ -350,7 +561,7 @@ class FeatherDatabase:
         
         Args:
             table_name: Name of the table that was populated
-            data: List of data records that were inserted
+            record_count: Number of records that were inserted
             all_columns: List of all column names in the table
             source_info: Information about data source including artifact_type
         """
@@ -361,7 +572,7 @@ class FeatherDatabase:
             ('artifact_type', source_info.get('artifact_type', 'Unknown')),
             ('table_name', table_name),
             ('columns', json.dumps(all_columns)),
-            ('record_count', str(len(data)))
+            ('record_count', str(record_count))
         ]
         
         # Insert or update each metadata entry
@@ -4,7 +4,7 @@ Handles data type conversion, validation, and transformation.
 """
 
 from datetime import datetime
-from typing import Any, List, Dict
+from typing import Any, List, Dict, Iterable, Iterator, Optional
 import re
 
 
@@ -109,11 +109,31 @@ class DataTransformer:
         Returns:
             (valid_records, invalid_records, errors)
         """
-        valid_records = []
         invalid_records = []
         errors = []
+        valid_records = list(DataTransformer.iter_valid_records(data, columns, errors, invalid_records))
         
-        for idx, record in enumerate(data):
+        return valid_records, invalid_records, errors
+    
+    @staticmethod
+    def iter_valid_records(data: Iterable[Dict[str, Any]], columns: List[Dict[str, Any]],
+                           errors: List[Dict[str, Any]],
+                           invalid_records: Optional[List[Dict[str, Any]]] = None,
+                           start: int = 0) -> Iterator[Dict[str, Any]]:
+        """
+        Validate records lazily so an import can stream them into a feather.
+        
+        Args:
+            data: Records to validate (any iterable)
+            columns: Column mapping configuration
+            errors: List that receives one error entry per failed value
+            invalid_records: Optional list that receives the rejected records
+            start: Number of records already validated (offsets error row numbers)
+            
+        Yields:
+            Validated records with converted values
+        """
+        for idx, record in enumerate(data, start):
             is_valid = True
             validated_record = {}
             
@@ -141,11 +161,9 @@ class DataTransformer:
                     })
             
             if is_valid:
-                valid_records.append(validated_record)
-            else:
+                yield validated_record
+            elif invalid_records is not None:
                 invalid_records.append(record)
-        
-        return valid_records, invalid_records, errors
     
     @staticmethod
     def clean_data(data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
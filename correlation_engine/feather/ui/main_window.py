@@ -4,15 +4,17 @@ Professional cyberpunk-styled PyQt5 interface for data import and normalization.
 """
 
 import os
+from itertools import chain, islice
+from typing import Iterator
 from PyQt5.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
     QTabWidget, QLabel, QLineEdit, QPushButton, 
     QFileDialog, QMenuBar, QMenu, QAction, QStatusBar,
-    QMessageBox, QProgressDialog, QInputDialog
+    QMessageBox, QProgressDialog, QInputDialog, QApplication
 )
 from PyQt5.QtCore import Qt, QThread, pyqtSignal
 from PyQt5.QtGui import QFont
-from ..database import FeatherDatabase
+from ..database import FeatherDatabase, INSERT_CHUNK_SIZE
 from ..transformer import DataTransformer
 
 # Import config system
@@ -696,19 +698,25 @@ class FeatherBuilderWindow(QMainWindow):
             self.feather_db.create_feather_table(table_name, config['columns'])
             progress.setValue(30)
             
-            # Prepare data
+            # Prepare data (records are read from the source while inserting)
             progress.setLabelText("Preparing data...")
             data = self.prepare_import_data(config)
             progress.setValue(50)
             
-            # Validate and transform data
+            # Validate the first chunk before anything is inserted
             progress.setLabelText("Validating data...")
             transformer = DataTransformer()
-            valid_data, invalid_data, errors = transformer.validate_data(data, config['columns'])
+            errors = []
+            first_chunk = list(islice(data, INSERT_CHUNK_SIZE))
+            first_valid = list(transformer.iter_valid_records(first_chunk, config['columns'], errors))
             progress.setValue(70)
             
             if errors:
-                error_msg = f"Found {len(errors)} validation errors. Continue with {len(valid_data)} valid records?"
+                skipped_rows = len({error['row'] for error in errors})
+                error_msg = (
+                    f"Found {len(errors)} validation errors in {skipped_rows} of the first "
+                    f"{len(first_chunk)} records. Continue and skip records with validation errors?"
+                )
                 reply = QMessageBox.question(
                     self, "Validation Errors", error_msg,
                     QMessageBox.Yes | QMessageBox.No
@@ -717,6 +725,12 @@ class FeatherBuilderWindow(QMainWindow):
                     progress.close()
                     return
             
+            # Validate and transform the remaining records as they are streamed
+            valid_data = chain(
+                first_valid,
+                transformer.iter_valid_records(data, config['columns'], errors, start=len(first_chunk))
+            )
+            
             # Insert data
             progress.setLabelText("Inserting data into feather...")
             source_info = {
@@ -726,9 +740,18 @@ class FeatherBuilderWindow(QMainWindow):
                 'artifact_type': config['source_type']
             }
             
+            def report_progress(rows_inserted, rows_per_second):
+                progress.setLabelText(
+                    f"Inserting data into feather... {rows_inserted:,} records "
+                    f"({rows_per_second:,.0f} rows/sec)"
+                )
+                QApplication.processEvents()
+            
             success, error = self.feather_db.insert_data(
-                table_name, valid_data, source_info, config['columns']
+                table_name, valid_data, source_info, config['columns'],
+                progress_callback=report_progress
             )
+            record_count = self.feather_db.last_import_stats.rows_inserted
             progress.setValue(100)
             
             if success:
@@ -742,16 +765,22 @@ class FeatherBuilderWindow(QMainWindow):
                     progress.close()
                     return
                 
+                skipped_msg = ""
+                if errors:
+                    skipped_rows = len({error['row'] for error in errors})
+                    skipped_msg = f"Skipped {skipped_rows} records with validation errors.\n\n"
+                
                 QMessageBox.information(
                     self, "Import Complete",
-                    f"Successfully imported {len(valid_data)} records into feather database.\n\n"
+                    f"Successfully imported {record_count} records into feather database.\n\n"
+                    f"{skipped_msg}"
                     f"Artifact Type: {self.artifact_type}\n"
                     f"This metadata will be used when adding this feather to Wings."
                 )
-                self.status_bar.showMessage(f"Import complete: {len(valid_data)} records imported")
+                self.status_bar.showMessage(f"Import complete: {record_count} records imported")
                 
                 # Auto-save configuration after successful import
-                self._auto_save_config_after_import(config, table_name, len(valid_data))
+                self._auto_save_config_after_import(config, table_name, record_count)
                 
                 # Auto-register feather if service is available
                 self._auto_register_feather_if_available()
@@ -768,18 +797,18 @@ class FeatherBuilderWindow(QMainWindow):
         finally:
             progress.close()
     
-    def prepare_import_data(self, config: dict) -> list:
-        """Prepare data for import based on source type."""
+    def prepare_import_data(self, config: dict) -> Iterator[dict]:
+        """Prepare data for import based on source type (records are yielded lazily)."""
         if config['source_type'] == 'database':
             return self.prepare_database_data(config)
         elif config['source_type'] == 'csv':
             return self.prepare_csv_data(config)
         elif config['source_type'] == 'json':
             return self.prepare_json_data(config)
-        return []
+        return iter([])
     
-    def prepare_database_data(self, config: dict) -> list:
-        """Prepare database data for import."""
+    def prepare_database_data(self, config: dict) -> Iterator[dict]:
+        """Prepare database data for import, streaming rows from the source cursor."""
         connection = config['connection']
         table_name = config['table_name']
         columns = config['columns']
@@ -791,38 +820,31 @@ class FeatherBuilderWindow(QMainWindow):
         col_str = ', '.join(col_names)
         
         cursor.execute(f"SELECT {col_str} FROM {table_name}")
-        rows = cursor.fetchall()
-        
-        # Convert to list of dicts
-        data = []
-        for row in rows:
-            record = dict(zip(col_names, row))
-            data.append(record)
         
-        return data
+        # Convert to dicts batch by batch instead of loading the whole table
+        while True:
+            rows = cursor.fetchmany(10000)
+            if not rows:
+                break
+            for row in rows:
+                yield dict(zip(col_names, row))
     
-    def prepare_csv_data(self, config: dict) -> list:
+    def prepare_csv_data(self, config: dict) -> Iterator[dict]:
         """Prepare CSV data for import."""
         data = config['data']
         headers = config['headers']
-        columns = config['columns']
         
         # Convert rows to dicts
-        result = []
         for row in data:
             if len(row) == len(headers):
-                record = dict(zip(headers, row))
-                result.append(record)
-        
-        return result
+                yield dict(zip(headers, row))
     
-    def prepare_json_data(self, config: dict) -> list:
+    def prepare_json_data(self, config: dict) -> Iterator[dict]:
         """Prepare JSON data for import."""
         data = config['data']
         columns = config['columns']
         
         # Flatten nested JSON if needed
-        result = []
         for item in data:
             record = {}
             for col in columns:
@@ -833,9 +855,7 @@ class FeatherBuilderWindow(QMainWindow):
                 value = self.get_nested_json_value(item, col['original'])
                 record[col['original']] = value
             
-            result.append(record)
-        
-        return result
+            yield record
     
     def get_nested_json_value(self, obj: dict, key_path: str):
         """Get value from nested JSON using dot notation."""
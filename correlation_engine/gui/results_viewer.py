@@ -669,6 +669,7 @@ from .ui_styling import CorrelationEngineStyles
 
 
 from ..engine.correlation_result import CorrelationResult, CorrelationMatch
+from ..engine.match_payload import MatchPayloadCodec
 from .scoring_breakdown_widget import ScoringBreakdownWidget
 from .results_tab_widget import ResultsTabWidget
 from .results_exporter import show_export_dialog, export_results_with_progress
@@ -2356,6 +2357,7 @@ class DynamicResultsTabWidget(QWidget):
             
             conn = sqlite3.connect(database_path)
             cursor = conn.cursor()
+            payload_codec = MatchPayloadCodec(conn)
             
             # Load matches for this execution (including semantic_data for Task 1)
             cursor.execute("""
@@ -2386,7 +2388,7 @@ class DynamicResultsTabWidget(QWidget):
                 
                 # Parse JSON fields
                 import json
-                feather_records = json.loads(feather_records_json) if feather_records_json else {}
+                feather_records = payload_codec.decode(feather_records_json) if feather_records_json else {}
                 
                 # Parse semantic_data if present (Task 1 fix)
                 semantic_data = None
@@ -2538,6 +2540,7 @@ class DynamicResultsTabWidget(QWidget):
             
             conn = sqlite3.connect(database_path)
             cursor = conn.cursor()
+            payload_codec = MatchPayloadCodec(conn)
             
             # Load matches for this execution (including semantic_data for Task 1)
             cursor.execute("""
@@ -2568,7 +2571,7 @@ class DynamicResultsTabWidget(QWidget):
                 
                 # Parse JSON fields
                 import json
-                feather_records = json.loads(feather_records_json) if feather_records_json else {}
+                feather_records = payload_codec.decode(feather_records_json) if feather_records_json else {}
                 
                 # Parse semantic_data if present (Task 1 fix)
                 semantic_data = None
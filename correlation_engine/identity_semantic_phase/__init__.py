@@ -11,6 +11,7 @@ from .identity_semantic_controller import (
 )
 from .identity_aggregator import IdentityAggregator
 from .identity_registry import IdentityRegistry, IdentityRecord, RecordReference
+from .spilling_identity_registry import SpillingIdentityRegistry
 from .identity_level_semantic_processor import IdentityLevelSemanticProcessor, IdentityProcessorStatistics
 from .semantic_mapping_controller import SemanticMappingController
 from .semantic_data_propagator import SemanticDataPropagator, PropagationStatistics
@@ -23,6 +24,7 @@ __all__ = [
     'IdentityRegistry',
     'IdentityRecord',
     'RecordReference',
+    'SpillingIdentityRegistry',
     'IdentityLevelSemanticProcessor',
     'IdentityProcessorStatistics',
     'SemanticMappingController',
@@ -10,14 +10,19 @@ This component aggregates already-extracted identities from final results.
 """
 
 import logging
-from typing import Dict, List, Any, Optional, Tuple
+from typing import Callable, Dict, List, Any, Optional, Tuple
 from pathlib import Path
 from dataclasses import dataclass, field
 
 from .identity_registry import IdentityRegistry, IdentityRecord, RecordReference
+from ..engine.match_payload import MatchPayloadCodec
+from ..engine.match_fts import MatchFtsIndex
 
 logger = logging.getLogger(__name__)
 
+# Match rows fetched per round trip when aggregating from a streaming database
+STREAMING_FETCH_BATCH_SIZE = 1000
+
 
 @dataclass
 class AggregationStatistics:
@@ -45,19 +50,28 @@ class IdentityAggregator:
     Property 7: Error Handling and Graceful Degradation
     """
     
-    def __init__(self, debug_mode: bool = False):
+    def __init__(self, debug_mode: bool = False,
+                 registry_factory: Optional[Callable[[], IdentityRegistry]] = None):
         """
         Initialize Identity Aggregator.
         
         Args:
             debug_mode: Enable debug logging
+            registry_factory: Creates the registries identities are aggregated
+                into (in-memory IdentityRegistry if None)
         """
         self.debug_mode = debug_mode
         self.statistics = AggregationStatistics()
+        self.registry_factory = registry_factory
         
         if self.debug_mode:
             logger.info("[Identity Aggregator] Initialized")
     
+    def _new_registry(self) -> IdentityRegistry:
+        """Create an empty registry with the configured registry factory"""
+        if self.registry_factory:
+            return self.registry_factory()
+        return IdentityRegistry()
     
     def _validate_correlation_results(self, results, engine_type: str) -> Tuple[bool, str, List[str]]:
         """
@@ -151,7 +165,7 @@ class IdentityAggregator:
             self.statistics.malformed_results_encountered += 1
             
             # Return empty registry but don't crash
-            return IdentityRegistry()
+            return self._new_registry()
         
         # Log any validation warnings
         if validation_result[2]:
@@ -175,7 +189,7 @@ class IdentityAggregator:
                         error_msg = "Streaming mode enabled but database_path or execution_id is missing"
                         logger.error(f"[Identity Aggregator] {error_msg}")
                         self.statistics.error_details.append(error_msg)
-                        return IdentityRegistry()
+                        return self._new_registry()
                 else:
                     warning_msg = "Streaming mode enabled but database_path/execution_id attributes missing"
                     logger.warning(f"[Identity Aggregator] {warning_msg}")
@@ -228,7 +242,7 @@ class IdentityAggregator:
             self.statistics.malformed_results_encountered += 1
             
             # Return empty registry but don't crash
-            return IdentityRegistry()
+            return self._new_registry()
     
     def extract_identities_from_multiple_results(self, 
                                                  correlation_results_list: List[Any], 
@@ -266,7 +280,7 @@ class IdentityAggregator:
             )
         
         # Create consolidated registry
-        consolidated_registry = IdentityRegistry()
+        consolidated_registry = self._new_registry()
         
         # Track per-wing statistics
         wings_processed = 0
@@ -319,6 +333,9 @@ class IdentityAggregator:
                         f"{wing_registry.get_unique_identity_count()} unique identities"
                     )
                 
+                # The wing registry is merged; release its storage
+                wing_registry.close()
+                
             except Exception as e:
                 # Handle unexpected errors gracefully
                 wing_id = getattr(correlation_results, 'wing_id', f'wing_{idx}') if correlation_results else f'wing_{idx}'
@@ -388,7 +405,7 @@ class IdentityAggregator:
         Property 5: Engine-Specific Identity Extraction
         Property 7: Error Handling and Graceful Degradation
         """
-        registry = IdentityRegistry()
+        registry = self._new_registry()
         
         if self.debug_mode:
             logger.info("[Identity Aggregator] Aggregating from Identity-Based engine")
@@ -502,7 +519,7 @@ class IdentityAggregator:
         Property 5: Engine-Specific Identity Extraction
         Property 7: Error Handling and Graceful Degradation
         """
-        registry = IdentityRegistry()
+        registry = self._new_registry()
         
         if self.debug_mode:
             logger.info("[Identity Aggregator] Aggregating from Time-Based engine")
@@ -603,7 +620,7 @@ class IdentityAggregator:
         Property 12: Streaming Mode Compatibility
         Property 7: Error Handling and Graceful Degradation
         """
-        registry = IdentityRegistry()
+        registry = self._new_registry()
         
         if self.debug_mode:
             logger.info(f"[Identity Aggregator] Aggregating from streaming database: {database_path}")
@@ -618,7 +635,6 @@ class IdentityAggregator:
         
         # Import required modules
         import sqlite3
-        import json
         from pathlib import Path
         
         # Check if database file exists
@@ -639,6 +655,7 @@ class IdentityAggregator:
             try:
                 conn = sqlite3.connect(database_path)
                 cursor = conn.cursor()
+                payload_codec = MatchPayloadCodec(conn)
                 
                 if self.debug_mode:
                     logger.info(f"[Identity Aggregator] Connected to database: {database_path}")
@@ -709,7 +726,16 @@ class IdentityAggregator:
                     WHERE result_id IN ({placeholders})
                 """, result_ids)
                 
-                rows = cursor.fetchall()
+                # Stream the match rows (feather_records payloads included)
+                # in batches instead of loading them all at once
+                matches_found = 0
+                while True:
+                    rows = cursor.fetchmany(STREAMING_FETCH_BATCH_SIZE)
+                    if not rows:
+                        break
+                    matches_found += len(rows)
+                    for row in rows:
+                        self._aggregate_streamed_match(registry, payload_codec, row)
                 
             except sqlite3.Error as e:
                 error_msg = f"Failed to query matches: {e}"
@@ -718,67 +744,17 @@ class IdentityAggregator:
                 self.statistics.malformed_results_encountered += 1
                 return registry
             
-            if not rows:
+            if not matches_found:
                 warning_msg = f"No matches found for execution_id={execution_id}"
                 logger.warning(f"[Identity Aggregator] {warning_msg}")
                 self.statistics.warnings.append(warning_msg)
                 return registry
             
-            if self.debug_mode:
-                logger.info(f"[Identity Aggregator] Found {len(rows)} matches in database")
-            
-            self.statistics.total_identities_found = len(rows)
-            
-            # Aggregate identities from each match
-            for idx, (match_id, feather_records_json, matched_application, matched_file_path) in enumerate(rows):
-                try:
-                    # Create identity from match data
-                    # Use matched_application or matched_file_path as identity value
-                    identity_value = matched_application or matched_file_path or match_id
-                    
-                    if not identity_value:
-                        self.statistics.skipped_identities += 1
-                        continue
-                    
-                    # Parse feather_records to get record references
-                    record_refs = []
-                    if feather_records_json:
-                        try:
-                            feather_records = json.loads(feather_records_json)
-                            if isinstance(feather_records, dict):
-                                for feather_id, record_data in feather_records.items():
-                                    if isinstance(record_data, dict):
-                                        record_refs.append(RecordReference(
-                                            match_id=match_id,
-                                            feather_id=feather_id,
-                                            record_index=record_data.get('_rowid', 0),
-                                            original_record=record_data
-                                        ))
-                        except json.JSONDecodeError:
-                            pass  # Skip if JSON is malformed
-                    
-                    # Create identity record
-                    identity_record = IdentityRecord(
-                        identity_value=identity_value,
-                        identity_type='application' if matched_application else 'file_path',
-                        record_references=record_refs,
-                        semantic_data={}  # Will be populated during semantic enhancement
-                    )
-                    
-                    # Add to registry
-                    registry.add_identity(identity_record)
-                    self.statistics.identities_successfully_aggregated += 1
-                    
-                except Exception as e:
-                    error_msg = f"Error aggregating identity from match {match_id}: {e}"
-                    logger.error(f"[Identity Aggregator] {error_msg}")
-                    self.statistics.aggregation_errors += 1
-                    self.statistics.error_details.append(error_msg)
-                    continue
+            self.statistics.total_identities_found = matches_found
             
             if self.debug_mode:
                 logger.info(
-                    f"[Identity Aggregator] Aggregated {registry.get_unique_identity_count()} unique identities from database "
+                    f"[Identity Aggregator] Found {matches_found} matches in database; aggregated {registry.get_unique_identity_count()} unique identities from database "
                     f"({self.statistics.aggregation_errors} errors, {self.statistics.skipped_identities} skipped)"
                 )
             
@@ -802,6 +778,61 @@ class IdentityAggregator:
                 except Exception as e:
                     logger.warning(f"[Identity Aggregator] Error closing database connection: {e}")
     
+    def _aggregate_streamed_match(self, registry: IdentityRegistry,
+                                  payload_codec: MatchPayloadCodec, row: Tuple) -> None:
+        """
+        Add the identity of one streamed match row to the registry.
+        
+        Args:
+            registry: Registry to add the identity to
+            payload_codec: Codec of the database the row was read from
+            row: (match_id, feather_records, matched_application, matched_file_path)
+        """
+        match_id, feather_records_json, matched_application, matched_file_path = row
+        try:
+            # Create identity from match data
+            # Use matched_application or matched_file_path as identity value
+            identity_value = matched_application or matched_file_path or match_id
+            
+            if not identity_value:
+                self.statistics.skipped_identities += 1
+                return
+            
+            # Parse feather_records to get record references
+            record_refs = []
+            if feather_records_json:
+                try:
+                    feather_records = payload_codec.decode(feather_records_json)
+                    if isinstance(feather_records, dict):
+                        for feather_id, record_data in feather_records.items():
+                            if isinstance(record_data, dict):
+                                record_refs.append(RecordReference(
+                                    match_id=match_id,
+                                    feather_id=feather_id,
+                                    record_index=record_data.get('_rowid', 0),
+                                    original_record=record_data
+                                ))
+                except ValueError:
+                    pass  # Skip if JSON is malformed
+            
+            # Create identity record
+            identity_record = IdentityRecord(
+                identity_value=identity_value,
+                identity_type='application' if matched_application else 'file_path',
+                record_references=record_refs,
+                semantic_data={}  # Will be populated during semantic enhancement
+            )
+            
+            # Add to registry
+            registry.add_identity(identity_record)
+            self.statistics.identities_successfully_aggregated += 1
+            
+        except Exception as e:
+            error_msg = f"Error aggregating identity from match {match_id}: {e}"
+            logger.error(f"[Identity Aggregator] {error_msg}")
+            self.statistics.aggregation_errors += 1
+            self.statistics.error_details.append(error_msg)
+    
     def _create_identity_record_from_identity(self, identity) -> IdentityRecord:
         """
         Create IdentityRecord from Identity-Based engine Identity object.
@@ -1199,7 +1230,7 @@ class IdentityAggregator:
         Returns:
             IdentityRegistry with wing context
         """
-        registry = IdentityRegistry()
+        registry = self._new_registry()
         
         if not hasattr(results, 'identities'):
             return registry
@@ -1254,7 +1285,7 @@ class IdentityAggregator:
         Returns:
             IdentityRegistry with wing context
         """
-        registry = IdentityRegistry()
+        registry = self._new_registry()
         
         if not hasattr(results, 'matches'):
             return registry
@@ -1580,7 +1611,6 @@ class IdentityAggregator:
         Requirements: Identity Extraction Phase
         """
         import sqlite3
-        import json
         
         logger.info(f"[Identity Aggregator] Saving identity fields to database for execution {execution_id}")
         logger.info(f"[Identity Aggregator] Force update: {force_update}")
@@ -1588,11 +1618,17 @@ class IdentityAggregator:
         
         conn = sqlite3.connect(database_path)
         cursor = conn.cursor()
+        payload_codec = MatchPayloadCodec(conn)
+        
+        # Updated records are re-indexed in matches_fts with the update
+        fts_index = MatchFtsIndex(conn)
+        if not fts_index.exists():
+            fts_index = None
         
         try:
             # Get all matches for this execution (including matched_application column)
             cursor.execute("""
-                SELECT m.match_id, m.matched_application, m.anchor_feather_id, m.feather_records
+                SELECT m.rowid, m.match_id, m.matched_application, m.anchor_feather_id, m.feather_records
                 FROM matches m
                 INNER JOIN results r ON m.result_id = r.result_id
                 WHERE r.execution_id = ?
@@ -1606,12 +1642,12 @@ class IdentityAggregator:
             used_matched_application = 0
             used_feather_records = 0
             
-            for match_id, matched_application, anchor_feather_id, feather_records_json in matches:
+            for rowid, match_id, matched_application, anchor_feather_id, feather_records_json in matches:
                 try:
                     if not feather_records_json:
                         continue
                     
-                    records = json.loads(feather_records_json)
+                    records = payload_codec.decode(feather_records_json)
                     modified = False
                     
                     # STRATEGY 1: Try to use matched_application column (fast and simple)
@@ -1685,12 +1721,14 @@ class IdentityAggregator:
                     
                     # Update the match if modified
                     if modified:
-                        updated_feather_records = json.dumps(records)
+                        updated_feather_records = payload_codec.encode(records)
                         cursor.execute("""
                             UPDATE matches
                             SET feather_records = ?
                             WHERE match_id = ?
                         """, (updated_feather_records, match_id))
+                        if fts_index is not None:
+                            fts_index.replace_match(rowid, match_id, payload_codec.decode_json(feather_records_json), records)
                         updated_count += 1
                 
                 except Exception as e:
@@ -117,7 +117,7 @@ class IdentityRegistry:
         Property 4: Identity Consolidation Completeness
         Property 17: Identity-Level Semantic Processing
         """
-        identity_key = self._get_identity_key(identity.identity_value, identity.identity_type)
+        identity_key = self.identity_key(identity.identity_value, identity.identity_type)
         
         if identity_key not in self._identities:
             # New identity - add to registry
@@ -174,7 +174,7 @@ class IdentityRegistry:
         """
         if identity_type:
             # Use specific type
-            identity_key = self._get_identity_key(identity_value, identity_type)
+            identity_key = self.identity_key(identity_value, identity_type)
             return self._identities.get(identity_key)
         else:
             # Search all types for this value
@@ -202,7 +202,7 @@ class IdentityRegistry:
         identity = self.get_identity_record(identity_value, identity_type)
         if identity:
             # Get identity key for index updates
-            identity_key = self._get_identity_key(identity.identity_value, identity.identity_type)
+            identity_key = self.identity_key(identity.identity_value, identity.identity_type)
             
             # Task 17.1: Update status index efficiently
             old_status = identity.processing_status
@@ -232,7 +232,7 @@ class IdentityRegistry:
         identity = self.get_identity_record(identity_value, identity_type)
         if identity:
             # Get identity key for index updates
-            identity_key = self._get_identity_key(identity.identity_value, identity.identity_type)
+            identity_key = self.identity_key(identity.identity_value, identity.identity_type)
             
             # Task 17.1: Update status index efficiently
             old_status = identity.processing_status
@@ -336,7 +336,7 @@ class IdentityRegistry:
                 
                 # Rebuild the status index for processed identities
                 self._identities_by_status['processed'] = {
-                    self._get_identity_key(identity.identity_value, identity.identity_type)
+                    self.identity_key(identity.identity_value, identity.identity_type)
                     for identity in processed_from_scan
                 }
                 
@@ -411,6 +411,15 @@ class IdentityRegistry:
         """
         return list(self._identities_by_type.keys())
     
+    def close(self):
+        """
+        Release resources held by the registry.
+        
+        Nothing to release for the in-memory registry; backends that keep
+        identities outside of memory (SpillingIdentityRegistry) override this.
+        """
+        pass
+    
     def clear(self):
         """
         Clear all identities from registry.
@@ -425,10 +434,13 @@ class IdentityRegistry:
         self._identity_count = 0
         self._total_records = 0
     
-    def _get_identity_key(self, identity_value: str, identity_type: str) -> str:
+    def identity_key(self, identity_value: str, identity_type: str) -> str:
         """
         Generate unique key for identity lookup.
         
+        Also registered as an SQLite function by the semantic data propagator,
+        so matches are joined to identities with the same normalization.
+        
         Args:
             identity_value: Identity value
             identity_type: Identity type
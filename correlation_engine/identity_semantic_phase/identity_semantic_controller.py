@@ -7,8 +7,10 @@ in a dedicated phase rather than applying semantic mappings per-record.
 """
 
 import logging
+import sqlite3
 import time
 import re
+from functools import partial
 from datetime import datetime
 from typing import Dict, List, Any, Optional
 from dataclasses import dataclass, field
@@ -21,6 +23,7 @@ except ImportError:
     PSUTIL_AVAILABLE = False
 
 from ..engine.correlation_result import CorrelationResult
+from ..engine.match_fts import MatchFtsIndex
 from ..integration.semantic_mapping_integration import SemanticMappingIntegration
 
 logger = logging.getLogger(__name__)
@@ -38,6 +41,11 @@ class IdentitySemanticConfig:
     fallback_to_per_record: bool = True
     debug_mode: bool = False
     disable_per_record_semantic_mapping: bool = True  # NEW: Disable semantic mapping during correlation
+    # Estimated identity count from which identities spill to a temporary
+    # SQLite file instead of being kept in memory (0 disables spilling)
+    spill_identity_threshold: int = 500000
+    spill_hot_set_size: int = 10000  # Identity records kept in memory when spilling
+    spill_directory: Optional[str] = None  # System temp directory if None
 
 
 @dataclass
@@ -201,6 +209,8 @@ class IdentitySemanticController:
             if self.config.identity_extraction_enabled:
                 identity_registry = self._extract_identities(correlation_results, engine_type)
                 self.statistics.total_identities_extracted = identity_registry.get_unique_identity_count()
+                # Semantic mapping below works on the database, not the registry
+                identity_registry.close()
                 
                 if self.config.debug_mode:
                     logger.info(f"[Identity Semantic Phase] Extracted {self.statistics.total_identities_extracted} unique identities")
@@ -310,6 +320,7 @@ class IdentitySemanticController:
                     logger.info(f"[Identity Semantic Phase] Saved identity fields to {updated_count:,} matches")
         
         # Extract identities using the aggregator
+        self._configure_identity_registry([correlation_results])
         identity_registry = self._identity_extractor.extract_identities(
             correlation_results, 
             engine_type
@@ -319,6 +330,77 @@ class IdentitySemanticController:
         
         return identity_registry
     
+    def _configure_identity_registry(self, correlation_results_list: List[CorrelationResult]):
+        """
+        Pick the identity registry backend for the results about to be aggregated.
+        
+        Identities are kept in memory unless the estimated identity count
+        reaches spill_identity_threshold; larger executions use a
+        SpillingIdentityRegistry so the registry does not have to fit in memory.
+        
+        Args:
+            correlation_results_list: Results the identities are aggregated from
+        """
+        threshold = self.config.spill_identity_threshold
+        estimated_identities = sum(
+            self._estimate_identity_count(correlation_results)
+            for correlation_results in correlation_results_list
+        )
+        
+        if threshold > 0 and estimated_identities >= threshold:
+            from .spilling_identity_registry import SpillingIdentityRegistry
+            self._identity_extractor.registry_factory = partial(
+                SpillingIdentityRegistry,
+                debug_mode=self.config.debug_mode,
+                hot_set_size=self.config.spill_hot_set_size,
+                spill_directory=self.config.spill_directory
+            )
+            logger.info(
+                f"[Identity Semantic Phase] ~{estimated_identities:,} identities expected, "
+                f"spilling identity registry to disk"
+            )
+        else:
+            self._identity_extractor.registry_factory = None
+    
+    def _estimate_identity_count(self, correlation_results: CorrelationResult) -> int:
+        """
+        Upper estimate of the identities aggregated from correlation results.
+        
+        Every match contributes at most one identity in streaming mode, and
+        matches outnumber identities otherwise, so the match count is used.
+        
+        Args:
+            correlation_results: Results from correlation engine
+            
+        Returns:
+            Estimated identity count
+        """
+        match_count = max(
+            getattr(correlation_results, 'total_matches', 0) or 0,
+            len(getattr(correlation_results, 'matches', None) or [])
+        )
+        if match_count or not getattr(correlation_results, 'streaming_mode', False):
+            return match_count
+        
+        # Streaming results loaded without counts: count the stored matches
+        database_path = getattr(correlation_results, 'database_path', None)
+        execution_id = getattr(correlation_results, 'execution_id', None)
+        if not database_path or execution_id is None or not Path(database_path).exists():
+            return 0
+        try:
+            conn = sqlite3.connect(database_path)
+            try:
+                return conn.execute("""
+                    SELECT COUNT(*) FROM matches m
+                    JOIN results r ON m.result_id = r.result_id
+                    WHERE r.execution_id = ?
+                """, (execution_id,)).fetchone()[0]
+            finally:
+                conn.close()
+        except sqlite3.Error as e:
+            logger.warning(f"[Identity Semantic Phase] Could not estimate identity count: {e}")
+            return 0
+    
     def _enhance_identities(self, identity_registry):
         """
         Enhance identities with semantic mappings.
@@ -348,65 +430,40 @@ class IdentitySemanticController:
     
     def _create_fts_index(self, conn, execution_id):
         """
-        Create FTS5 index for fast semantic search.
+        Bring the FTS5 index for fast semantic search up to date.
         
-        This creates a virtual table that enables full-text search on feather_records,
-        providing 10-100x speedup over LIKE queries.
+        The index (matches_fts, see engine/match_fts.py) enables full-text search
+        on feather_records, providing 10-100x speedup over LIKE queries. The
+        streaming writer indexes matches as they are written, so only matches
+        written by other paths are indexed here.
         
         Args:
             conn: SQLite database connection
             execution_id: Execution ID to filter matches
             
         Returns:
-            True if index was created, False if already exists
+            True if matches were indexed, False if the index was already up to date
         """
-        cursor = conn.cursor()
-        
-        # Check if FTS table exists
-        cursor.execute("""
-            SELECT name FROM sqlite_master 
-            WHERE type='table' AND name='matches_fts'
-        """)
-        
-        if cursor.fetchone() is None:
-            logger.info("[FTS5] Creating FTS5 virtual table for semantic search...")
-            print("[FTS5] Creating FTS5 virtual table...")
-            
-            # Create FTS5 virtual table with porter stemming
-            cursor.execute("""
-                CREATE VIRTUAL TABLE matches_fts USING fts5(
-                    match_id UNINDEXED,
-                    feather_records,
-                    tokenize='porter unicode61 remove_diacritics 1'
-                )
-            """)
-            
-            logger.info("[FTS5] Populating FTS5 index...")
-            print("[FTS5] Populating FTS5 index (this may take 30-60 seconds)...")
-            
-            index_start = time.time()
-            
-            # Populate with data for this execution
-            cursor.execute("""
-                INSERT INTO matches_fts(match_id, feather_records)
-                SELECT m.match_id, m.feather_records
-                FROM matches m
-                INNER JOIN results r ON m.result_id = r.result_id
-                WHERE r.execution_id = ?
-            """, (execution_id,))
-            
-            conn.commit()
-            
-            index_time = time.time() - index_start
-            
-            logger.info(f"[FTS5] Indexed {cursor.rowcount:,} matches in {index_time:.2f}s")
-            print(f"[FTS5] Indexed {cursor.rowcount:,} matches in {index_time:.2f}s")
-            
-            return True
-        else:
-            logger.info("[FTS5] FTS5 index already exists")
-            print("[FTS5] FTS5 index already exists")
+        fts_index = MatchFtsIndex(conn)
+        if not fts_index.ensure_table():
+            logger.warning("[FTS5] FTS5 not available - index not created")
             return False
+        
+        index_start = time.time()
+        indexed = fts_index.catch_up(execution_id)
+        conn.commit()
+        
+        if not indexed:
+            logger.info("[FTS5] FTS5 index already up to date")
+            print("[FTS5] FTS5 index already up to date")
+            return False
+        
+        index_time = time.time() - index_start
+        
+        logger.info(f"[FTS5] Indexed {indexed:,} matches in {index_time:.2f}s")
+        print(f"[FTS5] Indexed {indexed:,} matches in {index_time:.2f}s")
+        
+        return True
     
     def _apply_semantic_mapping_to_database(self, correlation_results: CorrelationResult) -> Dict[str, Any]:
         """
@@ -930,6 +987,7 @@ class IdentitySemanticController:
             
             self.statistics.data_propagation_time_seconds = time.time() - propagation_start
             self.statistics.records_enhanced = total_records_enhanced
+            identity_registry.close()
             
             if self.config.debug_mode:
                 logger.info(
@@ -996,6 +1054,7 @@ class IdentitySemanticController:
             self._identity_extractor = IdentityAggregator(debug_mode=self.config.debug_mode)
         
         # Extract identities from multiple results using the aggregator
+        self._configure_identity_registry(correlation_results_list)
         identity_registry = self._identity_extractor.extract_identities_from_multiple_results(
             correlation_results_list, 
             engine_type
@@ -1112,6 +1171,14 @@ class IdentitySemanticController:
             validation_results["valid"] = False
             validation_results["errors"].append("max_identities_per_batch must be positive")
         
+        # Check identity registry spilling
+        if self.config.spill_identity_threshold < 0:
+            validation_results["valid"] = False
+            validation_results["errors"].append("spill_identity_threshold must not be negative")
+        if self.config.spill_hot_set_size <= 0:
+            validation_results["valid"] = False
+            validation_results["errors"].append("spill_hot_set_size must be positive")
+        
         # Warn if semantic mapping enabled but no integration
         if self.config.semantic_mapping_enabled and not self.semantic_integration:
             validation_results["warnings"].append(
@@ -6,6 +6,7 @@ This component ensures that semantic mappings applied at the identity level
 are consistently propagated to all records sharing that identity.
 """
 
+import json
 import logging
 import time
 from typing import Dict, List, Any, Optional
@@ -17,6 +18,18 @@ from ..engine.correlation_result import CorrelationResult, CorrelationMatch
 logger = logging.getLogger(__name__)
 
 
+def _set_semantic_entry(semantic_data_json: str, entry_key: str, entry_json: str) -> str:
+    """
+    Add an entry to a match's semantic data JSON object.
+    
+    SQL function for entry keys that a JSON path cannot address (keys with
+    double quotes); other keys are set with json_set().
+    """
+    semantic_data = json.loads(semantic_data_json)
+    semantic_data[entry_key] = json.loads(entry_json)
+    return json.dumps(semantic_data)
+
+
 @dataclass
 class PropagationStatistics:
     """Statistics for semantic data propagation operations"""
@@ -163,6 +176,11 @@ class SemanticDataPropagator:
         data from the identity registry. It's used when correlation results are too
         large to fit in memory and are stored directly in the database.
         
+        Propagation is set-based: the semantic data of processed identities is
+        loaded into a temporary table keyed by normalized identity, joined to
+        the matches through their identity columns, and all affected matches
+        are updated by one UPDATE statement, without reading matches into Python.
+        
         Args:
             identity_registry: Registry containing identities with semantic data
             database_path: Path to SQLite database containing correlation results
@@ -189,7 +207,6 @@ class SemanticDataPropagator:
         
         # Import required modules
         import sqlite3
-        import json
         
         # Initialize connection to None for proper cleanup
         conn = None
@@ -211,188 +228,77 @@ class SemanticDataPropagator:
                 self.statistics.processing_time_seconds = time.time() - start_time
                 return False
             
-            # Create indexes for efficient identity lookups (Requirements 3.1, 3.2)
-            # These indexes optimize semantic matching queries on identity fields
-            # Create indexes BEFORE checking for identities to ensure they exist
-            if self.debug_mode:
-                logger.info("[Semantic Data Propagator] Skipping database indexes for testing")
-            
-            # TEMPORARILY DISABLED: self._create_semantic_matching_indexes(cursor)
-            # This is causing performance issues with large datasets
-            
-            # Check if there are any processed identities with semantic data
-            # This check happens AFTER index creation
             if not processed_identities:
                 if self.debug_mode:
                     logger.info("[Semantic Data Propagator] No processed identities to propagate")
                 self.statistics.processing_time_seconds = time.time() - start_time
                 return True
             
-            # Build a lookup map from (match_id, feather_id) to identity records
-            record_to_identity_map = self._build_record_to_identity_map(identity_registry)
-            
-            if self.debug_mode:
-                logger.info(f"[Semantic Data Propagator] Built lookup map with {len(record_to_identity_map)} record references")
-                
-                # Debug: Show sample of the lookup map
-                sample_keys = list(record_to_identity_map.keys())[:5]
-                for key in sample_keys:
-                    identities = record_to_identity_map[key]
-                    logger.info(f"[Semantic Data Propagator] Sample lookup: {key} -> {len(identities)} identities")
-                    for identity in identities[:2]:  # Show first 2 identities
-                        semantic_count = len(identity.semantic_data) if identity.semantic_data else 0
-                        logger.info(f"[Semantic Data Propagator]   - {identity.identity_type}:{identity.identity_value} ({semantic_count} semantic fields)")
-            
-            # Also log simplified map if available
-            if hasattr(self, '_simplified_record_map'):
-                logger.info(f"[Semantic Data Propagator] Simplified lookup map has {len(self._simplified_record_map)} entries")
-            
-            # Query all matches for this execution using indexed fields (Requirements 3.3, 3.4, 3.5)
-            # This query uses the indexes created above for efficient lookups
             try:
+                # Matches are joined to identities with the registry's own key normalization
+                conn.create_function('identity_key', 2, identity_registry.identity_key,
+                                     deterministic=True)
+                conn.create_function('set_semantic_entry', 3, _set_semantic_entry,
+                                     deterministic=True)
+                
+                identity_count = self._load_identity_semantics(cursor, processed_identities)
+                if self.debug_mode:
+                    logger.info(f"[Semantic Data Propagator] Loaded semantic data of {identity_count} identities")
+                
+                matched_count, invalid_count = self._join_matches_to_identity_semantics(cursor, execution_id)
+                if invalid_count:
+                    logger.error(
+                        f"[Semantic Data Propagator] {invalid_count} matches have malformed semantic_data "
+                        f"and were not updated"
+                    )
+                    self.statistics.propagation_errors += invalid_count
+                
+                print(f"[Semantic Matching] Adding semantic data to {matched_count:,} matches in database...")
+                
+                records_updated = cursor.execute(
+                    "SELECT COALESCE(SUM(feather_count), 0) FROM temp.match_semantics"
+                ).fetchone()[0]
+                
+                # Matches keep their existing semantic data; the identity's entry is added
+                # (or replaced) under "<identity_type>_<identity_value>"
                 cursor.execute("""
-                    SELECT m.match_id, m.semantic_data, m.feather_records
-                    FROM matches m
-                    INNER JOIN results r ON m.result_id = r.result_id
-                    WHERE r.execution_id = ?
-                """, (execution_id,))
+                    UPDATE matches
+                    SET semantic_data = (
+                        SELECT CASE
+                            WHEN COALESCE(matches.semantic_data, '') = '' THEN
+                                json_object(s.entry_key, json(s.entry))
+                            WHEN instr(s.entry_key, '"') > 0 THEN
+                                set_semantic_entry(matches.semantic_data, s.entry_key, s.entry)
+                            ELSE
+                                json_set(matches.semantic_data, '$."' || s.entry_key || '"', json(s.entry))
+                        END
+                        FROM temp.match_semantics s
+                        WHERE s.match_rowid = matches.rowid
+                    )
+                    WHERE rowid IN (SELECT match_rowid FROM temp.match_semantics)
+                """)
+                matches_updated = cursor.rowcount
                 
-                rows = cursor.fetchall()
+                conn.commit()
                 
             except sqlite3.Error as e:
-                error_msg = f"Failed to query matches from database: {e}"
+                error_msg = f"Failed to propagate semantic data to database: {e}"
                 logger.error(f"[Semantic Data Propagator] {error_msg}")
+                conn.rollback()
                 self.statistics.propagation_errors += 1
                 self.statistics.processing_time_seconds = time.time() - start_time
                 return False
-            
-            matches_to_update = []
-            records_updated = 0
-            total_matches = len(rows)
-            total_saved = 0
-            
-            # Add progress reporting for database updates
-            print(f"[Semantic Matching] Adding semantic data to {total_matches:,} matches in database...")
-            
-            # Calculate commit interval (every 10% of total matches)
-            # Commit to database every 10% to avoid memory exhaustion with large datasets
-            commit_batch_size = max(100, total_matches // 10)  # Minimum 100 matches per commit
-            
-            for row_idx, row in enumerate(rows):
-                match_id, semantic_data_json, feather_records_json = row
                 
-                try:
-                    # Parse existing semantic data
-                    if semantic_data_json:
-                        semantic_data = json.loads(semantic_data_json)
-                    else:
-                        semantic_data = {}
-                    
-                    # Parse feather records to build match_data structure
-                    if feather_records_json:
-                        feather_records = json.loads(feather_records_json)
-                    else:
-                        feather_records = {}
-                    
-                    match_data = {
-                        'match_id': match_id,
-                        'feather_records': feather_records
-                    }
-                    
-                    # Debug logging for first few matches
-                    if self.debug_mode and row_idx < 3:
-                        logger.info(f"[Semantic Data Propagator] Processing match {row_idx+1}: {match_id}")
-                        logger.info(f"[Semantic Data Propagator]   Feather records: {list(feather_records.keys())}")
-                    
-                    # Collect semantic data for this match
-                    match_semantic_data = self._collect_semantic_data_for_match_dict(
-                        match_data,
-                        record_to_identity_map
-                    )
-                    
-                    # Debug logging for semantic data collection
-                    if self.debug_mode and row_idx < 3:
-                        logger.info(f"[Semantic Data Propagator]   Collected semantic data: {len(match_semantic_data)} entries")
-                        for key, data in list(match_semantic_data.items())[:2]:  # Show first 2 entries
-                            logger.info(f"[Semantic Data Propagator]     - {key}: {len(data.get('semantic_mappings', {}))} mappings")
-                    
-                    if match_semantic_data:
-                        # Merge semantic data
-                        semantic_data.update(match_semantic_data)
-                        
-                        # Store for batch update
-                        matches_to_update.append((json.dumps(semantic_data), match_id))
-                        records_updated += len(feather_records)
-                        
-                        if self.debug_mode and row_idx < 3:
-                            logger.info(f"[Semantic Data Propagator]   Match will be updated with {len(match_semantic_data)} semantic entries")
-                    else:
-                        if self.debug_mode and row_idx < 3:
-                            logger.info(f"[Semantic Data Propagator]   No semantic data found for match")
-                    
-                    # Commit to database every 10% to avoid memory exhaustion
-                    if len(matches_to_update) >= commit_batch_size:
-                        try:
-                            cursor.executemany("""
-                                UPDATE matches 
-                                SET semantic_data = ? 
-                                WHERE match_id = ?
-                            """, matches_to_update)
-                            
-                            conn.commit()
-                            
-                            total_saved += len(matches_to_update)
-                            progress_pct = (total_saved / total_matches) * 100
-                            print(f"[Semantic Matching] Progress: {progress_pct:.0f}% ({total_saved:,}/{total_matches:,} matches saved to database)")
-                            
-                            # Clear the batch to free memory
-                            matches_to_update = []
-                            
-                        except sqlite3.Error as e:
-                            error_msg = f"Failed to update matches in database: {e}"
-                            logger.error(f"[Semantic Data Propagator] {error_msg}")
-                            self.statistics.propagation_errors += 1
-                            # Continue processing remaining matches
-                            matches_to_update = []
-                        
-                except Exception as e:
-                    logger.error(f"[Semantic Data Propagator] Error processing match {match_id}: {e}")
-                    self.statistics.propagation_errors += 1
-                    continue
-            
-            # Commit any remaining matches (final batch)
-            if matches_to_update:
-                try:
-                    cursor.executemany("""
-                        UPDATE matches 
-                        SET semantic_data = ? 
-                        WHERE match_id = ?
-                    """, matches_to_update)
-                    
-                    conn.commit()
-                    
-                    total_saved += len(matches_to_update)
-                    print(f"[Semantic Matching] Progress: 100% ({total_saved:,}/{total_matches:,} matches saved to database)")
-                    
-                    if self.debug_mode:
-                        logger.info(f"[Semantic Data Propagator] Final batch: updated {len(matches_to_update)} matches")
-                        
-                except sqlite3.Error as e:
-                    error_msg = f"Failed to update final batch of matches in database: {e}"
-                    logger.error(f"[Semantic Data Propagator] {error_msg}")
-                    self.statistics.propagation_errors += 1
-                    self.statistics.processing_time_seconds = time.time() - start_time
-                    return False
-            
-            print(f"[Semantic Matching] ✓ Completed: {total_saved:,} matches updated with semantic data")
+            finally:
+                cursor.execute("DROP TABLE IF EXISTS temp.match_semantics")
+                cursor.execute("DROP TABLE IF EXISTS temp.identity_semantics")
             
-            # Update statistics
-            self.statistics.records_updated = records_updated
+            print(f"[Semantic Matching] ✓ Completed: {matches_updated:,} matches updated with semantic data")
             
             # Update statistics
             self.statistics.identities_propagated = len(processed_identities)
             self.statistics.records_updated = records_updated
-            self.statistics.matches_updated = len(matches_to_update)
+            self.statistics.matches_updated = matches_updated
             self.statistics.processing_time_seconds = time.time() - start_time
             
             if len(processed_identities) > 0:
@@ -400,7 +306,7 @@ class SemanticDataPropagator:
             
             if self.debug_mode:
                 logger.info(f"[Semantic Data Propagator] Completed streaming propagation: "
-                           f"{len(matches_to_update)} matches updated, "
+                           f"{matches_updated} matches updated, "
                            f"{records_updated} records enhanced in {self.statistics.processing_time_seconds:.2f}s")
             
             return True
@@ -423,6 +329,103 @@ class SemanticDataPropagator:
                 except Exception as e:
                     logger.warning(f"[Semantic Data Propagator] Error closing database connection: {e}")
     
+    def _load_identity_semantics(self, cursor, processed_identities) -> int:
+        """
+        Load the semantic data of processed identities into a temporary table.
+        
+        Only identities with semantic mappings (non-internal semantic data keys)
+        are loaded. Each row holds the identity's semantic data entry as a JSON
+        object without its feather_id, which comes from the match.
+        
+        Args:
+            cursor: Cursor of the results database
+            processed_identities: Processed IdentityRecords of the registry
+            
+        Returns:
+            Number of identities loaded
+        """
+        cursor.execute("DROP TABLE IF EXISTS temp.identity_semantics")
+        cursor.execute("""
+            CREATE TEMP TABLE identity_semantics (
+                identity_key TEXT PRIMARY KEY,
+                identity_value TEXT,
+                identity_type TEXT,
+                semantic_mappings TEXT
+            )
+        """)
+        
+        def rows():
+            for identity in processed_identities:
+                if not identity.semantic_data:
+                    continue
+                # Create a clean copy without internal fields
+                clean_semantic_data = {
+                    k: v for k, v in identity.semantic_data.items()
+                    if not k.startswith('_')
+                }
+                if clean_semantic_data:
+                    yield (identity.identity_value, identity.identity_type,
+                           identity.identity_value, identity.identity_type,
+                           json.dumps(clean_semantic_data))
+        
+        # Identities merged under one key keep the first one's data, like the registry
+        cursor.executemany("""
+            INSERT OR IGNORE INTO identity_semantics
+            VALUES (identity_key(?, ?), ?, ?, ?)
+        """, rows())
+        return cursor.execute("SELECT COUNT(*) FROM temp.identity_semantics").fetchone()[0]
+    
+    def _join_matches_to_identity_semantics(self, cursor, execution_id: int) -> tuple:
+        """
+        Join the execution's matches to the loaded identity semantics.
+        
+        A match's identity is derived from its identity columns the same way
+        IdentityAggregator.extract_from_streaming_results() derives it:
+        matched_application ('application'), else matched_file_path or the
+        match ID ('file_path'). The joined rows are stored in a temporary
+        match_semantics table with the semantic data entry of each match;
+        matches whose semantic_data is not a JSON object are left out.
+        
+        Args:
+            cursor: Cursor of the results database
+            execution_id: Execution ID of the matches
+            
+        Returns:
+            Tuple (matches joined, matches left out for malformed semantic_data)
+        """
+        cursor.execute("DROP TABLE IF EXISTS temp.match_semantics")
+        cursor.execute("""
+            CREATE TEMP TABLE match_semantics AS
+            SELECT m.rowid AS match_rowid,
+                   m.feather_count AS feather_count,
+                   CASE
+                       WHEN COALESCE(m.semantic_data, '') = '' THEN 0
+                       WHEN json_valid(m.semantic_data) THEN json_type(m.semantic_data) != 'object'
+                       ELSE 1
+                   END AS malformed,
+                   s.identity_type || '_' || s.identity_value AS entry_key,
+                   json_object(
+                       'identity_value', s.identity_value,
+                       'identity_type', s.identity_type,
+                       'semantic_mappings', json(s.semantic_mappings),
+                       'feather_id', m.anchor_feather_id
+                   ) AS entry
+            FROM matches m
+            INNER JOIN results r ON m.result_id = r.result_id
+            INNER JOIN temp.identity_semantics s ON s.identity_key = identity_key(
+                COALESCE(NULLIF(m.matched_application, ''), NULLIF(m.matched_file_path, ''), m.match_id),
+                CASE WHEN COALESCE(m.matched_application, '') != ''
+                     THEN 'application' ELSE 'file_path' END
+            )
+            WHERE r.execution_id = ?
+        """, (execution_id,))
+        invalid_count = cursor.execute(
+            "DELETE FROM temp.match_semantics WHERE malformed"
+        ).rowcount
+        cursor.execute("CREATE INDEX temp.idx_match_semantics_rowid ON match_semantics(match_rowid)")
+        matched_count = cursor.execute("SELECT COUNT(*) FROM temp.match_semantics").fetchone()[0]
+        return matched_count, invalid_count
+    
     def _build_record_to_identity_map(self, identity_registry: IdentityRegistry) -> Dict[tuple, IdentityRecord]:
         """
         Build a lookup map from record references to identity records.
@@ -456,25 +459,8 @@ class SemanticDataPropagator:
                     record_map[key] = []
                 record_map[key].append(identity)
         
-        # Also create a simplified lookup map for cases where record_index is not available
-        # This handles the case where we only have match_id and feather_id
-        simplified_map = {}
-        for identity in identity_registry.get_processed_identities():
-            if not identity.semantic_data:
-                continue
-            
-            for ref in identity.record_references:
-                # Create simplified key (match_id, feather_id)
-                simple_key = (ref.match_id, ref.feather_id)
-                if simple_key not in simplified_map:
-                    simplified_map[simple_key] = []
-                simplified_map[simple_key].append(identity)
-        
-        # Store simplified map for fallback lookup
-        self._simplified_record_map = simplified_map
-        
         if self.debug_mode:
-            logger.info(f"[Semantic Data Propagator] Built record map with {len(record_map)} exact references and {len(simplified_map)} simplified references")
+            logger.info(f"[Semantic Data Propagator] Built record map with {len(record_map)} references")
         
         return record_map
     
@@ -526,65 +512,6 @@ class SemanticDataPropagator:
         
         return semantic_data
     
-    def _collect_semantic_data_for_match_dict(self, match_data: Dict[str, Any],
-                                             record_to_identity_map: Dict[tuple, List[IdentityRecord]]) -> Dict[str, Any]:
-        """
-        Collect semantic data for a match dictionary (used in streaming mode).
-        
-        This is similar to _collect_semantic_data_for_match but works with
-        dictionary representations of matches instead of CorrelationMatch objects.
-        
-        Args:
-            match_data: Match data dictionary
-            record_to_identity_map: Lookup map from record references to identities
-            
-        Returns:
-            Dictionary with collected semantic data
-        """
-        semantic_data = {}
-        match_id = match_data.get('match_id', '')
-        
-        # Process each feather record in the match
-        feather_records = match_data.get('feather_records', {})
-        for feather_id in feather_records.keys():
-            # Try to find identity for this record using exact lookup first
-            key = (match_id, feather_id, 0)  # Default record_index
-            identities = record_to_identity_map.get(key, [])
-            
-            # If no exact match, try simplified lookup (match_id, feather_id)
-            if not identities and hasattr(self, '_simplified_record_map'):
-                simple_key = (match_id, feather_id)
-                identities = self._simplified_record_map.get(simple_key, [])
-            
-            # If still no match, try all possible record_index values for this match/feather
-            if not identities:
-                for full_key, identity_list in record_to_identity_map.items():
-                    if full_key[0] == match_id and full_key[1] == feather_id:
-                        identities.extend(identity_list)
-                        break
-            
-            # Collect semantic data from all identities for this record
-            for identity in identities:
-                if identity.semantic_data:
-                    # Add identity-level semantic data
-                    identity_key = f"{identity.identity_type}_{identity.identity_value}"
-                    
-                    # Create a clean copy without internal fields
-                    clean_semantic_data = {
-                        k: v for k, v in identity.semantic_data.items()
-                        if not k.startswith('_')
-                    }
-                    
-                    if clean_semantic_data:
-                        semantic_data[identity_key] = {
-                            'identity_value': identity.identity_value,
-                            'identity_type': identity.identity_type,
-                            'semantic_mappings': clean_semantic_data,
-                            'feather_id': feather_id
-                        }
-        
-        return semantic_data
-    
     def _create_semantic_matching_indexes(self, cursor) -> None:
         """
         Create database indexes for efficient semantic matching queries.
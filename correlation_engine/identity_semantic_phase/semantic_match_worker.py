@@ -0,0 +1,321 @@
+"""
+Process-Pool Worker for SQL Semantic Mapping
+
+Matching semantic rules against stored matches decodes every feather_records
+payload and runs Python string and regex work on it, so a thread pool
+serializes on the GIL. SQLSemanticMapper partitions the matches of an
+execution into rowid chunks and evaluates them in worker processes with this
+module instead.
+
+Data crossing the process boundary is kept compact:
+- A chunk descriptor is a tuple (chunk_index, low_rowid, high_rowid,
+  candidate_rowids). candidate_rowids is None to scan every match of the
+  execution in the range, or the packed rowids (array 'q' bytes) of the FTS5
+  candidates in it.
+- A chunk result carries only (match_id, matched_rule_ids) pairs, the number
+  of matches scanned, the error count and per-pattern match counts.
+
+Each worker opens its own read-only connection and compiles the rule rows of
+the semantic_rules table once, in the pool initializer. Rules are evaluated
+with the semantics of the thread-based matcher they replace: every condition
+of a rule must hold (AND), and a condition holds if its operator matches
+matched_application (for that field), the first value of its field in the
+feather records, or any string value of the feather records.
+"""
+
+import json
+import logging
+import sqlite3
+from array import array
+from collections import Counter
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from ..config.semantic_rule_compiler import FIELD_MEMO_SIZE, FieldPredicates
+from ..engine.match_payload import MatchPayloadCodec
+
+logger = logging.getLogger(__name__)
+
+# Predicate id of conditions that can never hold (unknown operator)
+_NEVER = -1
+
+# Condition entry of conditions that raise when evaluated (missing keys,
+# non-string values)
+_ERROR = None
+
+# Per-process worker state, created by initialize_semantic_worker()
+_worker_matcher: Optional['SemanticChunkMatcher'] = None
+
+
+class CompiledSQLRules:
+    """
+    The rule rows of the semantic_rules table compiled into shared predicates.
+
+    Each distinct (operator, value) pair becomes one predicate that is
+    evaluated once per distinct text; the regexes of all rules are searched
+    with the combined alternation of FieldPredicates.
+    """
+
+    def __init__(self, rule_rows: Sequence[Tuple], min_indicators_default: int = 1):
+        """
+        Compile rule rows.
+
+        Args:
+            rule_rows: (rule_id, logic_operator, conditions_json,
+                _requires_multi_indicator, _min_indicators) tuples
+            min_indicators_default: _min_indicators of rules that have none
+        """
+        self.rules: List[Tuple[str, List[Tuple[Optional[int], str]], bool]] = []
+        self.invalid_rules = 0
+        self.fields: List[str] = []
+
+        self._regexes = FieldPredicates('*')
+        self._equals: Dict[str, List[int]] = {}
+        self._contains: List[Tuple[str, int]] = []
+        self._regex_patterns: Dict[int, str] = {}
+        self._memo: Dict[str, frozenset] = {}
+
+        predicate_ids: Dict[Tuple[str, str], int] = {}
+        fields = set()
+
+        for rule_id, _logic_operator, conditions_json, requires_multi_indicator, min_indicators in rule_rows:
+            try:
+                conditions = json.loads(conditions_json)
+            except Exception as e:
+                logger.error(f"[Semantic Worker] Malformed conditions in rule {rule_id}: {e}")
+                self.invalid_rules += 1
+                continue
+            if not conditions:
+                continue
+
+            entries = []
+            for condition in conditions:
+                try:
+                    field_name = condition['field_name']
+                    value = condition['value']
+                    operator = condition['operator']
+                    if not value or value == "*" or operator == "wildcard":
+                        continue
+                    if operator not in ("regex", "contains", "equals"):
+                        entries.append((_NEVER, field_name))
+                        continue
+                    value_upper = value.upper()
+                except Exception:
+                    entries.append((_ERROR, ''))
+                    continue
+
+                key = (operator, value)
+                predicate_id = predicate_ids.get(key)
+                if predicate_id is None:
+                    predicate_id = predicate_ids[key] = len(predicate_ids)
+                    if operator == "regex":
+                        self._regexes.add_regex(value, predicate_id)
+                        self._regex_patterns[predicate_id] = value
+                    elif operator == "contains":
+                        self._contains.append((value_upper, predicate_id))
+                    else:
+                        self._equals.setdefault(value_upper, []).append(predicate_id)
+                entries.append((predicate_id, field_name))
+                fields.add(field_name)
+
+            if not entries:
+                continue  # only wildcard conditions
+
+            # Multi-indicator validation only depends on the rule: when all
+            # conditions hold, every non-wildcard condition is an indicator
+            if min_indicators is None:
+                min_indicators = min_indicators_default
+            valid = (
+                not requires_multi_indicator
+                or (min_indicators <= len(conditions) and len(entries) >= min_indicators)
+            )
+            self.rules.append((rule_id, entries, valid))
+
+        self._regexes.build_alternation()
+        self.fields = sorted(fields)
+
+    def text_predicates(self, text: str) -> frozenset:
+        """Ids of the predicates that hold for an upper-cased text"""
+        cached = self._memo.get(text)
+        if cached is not None:
+            return cached
+
+        true_ids = list(self._regexes.evaluate(text))
+        true_ids.extend(self._equals.get(text, ()))
+        for needle, predicate_id in self._contains:
+            if needle in text:
+                true_ids.append(predicate_id)
+
+        result = frozenset(true_ids)
+        if len(self._memo) >= FIELD_MEMO_SIZE:
+            self._memo.clear()
+        self._memo[text] = result
+        return result
+
+    def evaluate(self, feather_data: Dict[str, Any], matched_application: Any,
+                 pattern_counts: Counter) -> Tuple[List[str], int]:
+        """
+        Evaluate all rules against the decoded feather records of one match.
+
+        Args:
+            feather_data: Decoded feather_records (feather name -> records)
+            matched_application: matched_application column of the match
+            pattern_counts: Counter of regex patterns, incremented once per
+                pattern that held for the match
+
+        Returns:
+            (matched rule ids, errors); rules with malformed conditions
+            count as one error per match, as in the thread-based matcher
+        """
+        records = [
+            record
+            for content in feather_data.values() if isinstance(content, list)
+            for record in content if isinstance(record, dict)
+        ]
+
+        # Any string value of the feather records
+        true_any = set()
+        for text in {value.upper() for record in records for value in record.values() if isinstance(value, str)}:
+            true_any.update(self.text_predicates(text))
+
+        # Texts checked for one field only: matched_application and a
+        # non-string first value of the field (string values are covered above)
+        field_true: Dict[str, frozenset] = {}
+        for field_name in self.fields:
+            texts = []
+            if field_name == 'matched_application' and matched_application:
+                texts.append(str(matched_application).upper())
+            field_value = self._first_field_value(feather_data, field_name)
+            if field_value and not isinstance(field_value, str):
+                texts.append(str(field_value).upper())
+            if texts:
+                field_true[field_name] = frozenset().union(*(self.text_predicates(text) for text in texts))
+
+        matched_rules = []
+        matched_patterns = set()
+        errors = self.invalid_rules
+        for rule_id, entries, valid in self.rules:
+            all_met = True
+            for predicate_id, field_name in entries:
+                if predicate_id is _ERROR:
+                    errors += 1
+                    all_met = False
+                    break
+                if predicate_id in true_any or predicate_id in field_true.get(field_name, ()):
+                    pattern = self._regex_patterns.get(predicate_id)
+                    if pattern is not None:
+                        matched_patterns.add(pattern)
+                else:
+                    all_met = False
+                    break
+            if all_met and valid:
+                matched_rules.append(rule_id)
+
+        pattern_counts.update(matched_patterns)
+        return matched_rules, errors
+
+    @staticmethod
+    def _first_field_value(feather_data: Dict[str, Any], field_name: str) -> Any:
+        """First truthy value of a field, taking the first record with the field per feather"""
+        for content in feather_data.values():
+            if not isinstance(content, list):
+                continue
+            for record in content:
+                if isinstance(record, dict) and field_name in record:
+                    if record[field_name]:
+                        return record[field_name]
+                    break
+        return None
+
+
+class SemanticChunkMatcher:
+    """Matches the semantic rules against chunks of one execution's matches"""
+
+    _RANGE_QUERY = """
+        SELECT m.match_id, m.feather_records, m.matched_application
+        FROM matches m
+        INNER JOIN results r ON m.result_id = r.result_id
+        WHERE r.execution_id = ? AND m.rowid BETWEEN ? AND ?
+    """
+
+    _ROW_QUERY = """
+        SELECT match_id, feather_records, matched_application
+        FROM matches
+        WHERE rowid = ?
+    """
+
+    def __init__(self, database_path: str, execution_id: int, rule_rows: Sequence[Tuple],
+                 min_indicators_default: int = 1):
+        self.execution_id = execution_id
+        self.rules = CompiledSQLRules(rule_rows, min_indicators_default)
+        self.conn = sqlite3.connect(f"file:{database_path}?mode=ro", uri=True, timeout=30.0)
+        self.codec = MatchPayloadCodec(self.conn)
+
+    def close(self):
+        self.conn.close()
+
+    def _iter_rows(self, low_rowid: int, high_rowid: int, candidate_rowids: Optional[bytes]):
+        if candidate_rowids is None:
+            yield from self.conn.execute(self._RANGE_QUERY, (self.execution_id, low_rowid, high_rowid))
+            return
+        rowids = array('q')
+        rowids.frombytes(candidate_rowids)
+        for rowid in rowids:
+            row = self.conn.execute(self._ROW_QUERY, (rowid,)).fetchone()
+            if row is not None:
+                yield row
+
+    def match_chunk(self, chunk: Tuple[int, int, int, Optional[bytes]]) -> Tuple[int, List[Tuple[str, str]], int, int, Dict[str, int]]:
+        """
+        Match the rules against one chunk.
+
+        Args:
+            chunk: (chunk_index, low_rowid, high_rowid, candidate_rowids)
+
+        Returns:
+            (chunk_index, [(match_id, matched_rule_ids)], matches scanned,
+            errors, pattern -> number of matches)
+        """
+        chunk_index, low_rowid, high_rowid, candidate_rowids = chunk
+        results = []
+        scanned = 0
+        errors = 0
+        pattern_counts = Counter()
+
+        for match_id, feather_records, matched_application in self._iter_rows(low_rowid, high_rowid, candidate_rowids):
+            scanned += 1
+            if not feather_records:
+                continue
+            try:
+                feather_data = self.codec.decode(feather_records)
+            except Exception as e:
+                logger.warning(f"[Semantic Worker] Error parsing feather_records of match {match_id}: {e}")
+                errors += 1
+                continue
+            if not isinstance(feather_data, dict):
+                logger.warning(f"[Semantic Worker] Non-dict feather_records in match {match_id}: {type(feather_data)}")
+                errors += 1
+                continue
+
+            try:
+                matched_rules, condition_errors = self.rules.evaluate(feather_data, matched_application, pattern_counts)
+            except Exception as e:
+                logger.error(f"[Semantic Worker] Error processing match {match_id}: {e}")
+                errors += 1
+                continue
+            errors += condition_errors
+            if matched_rules:
+                results.append((match_id, ','.join(sorted(set(matched_rules)))))
+
+        return chunk_index, results, scanned, errors, dict(pattern_counts)
+
+
+def initialize_semantic_worker(database_path: str, execution_id: int, rule_rows: Sequence[Tuple],
+                               min_indicators_default: int = 1):
+    """Pool initializer: compile the rules and open this process's connection"""
+    global _worker_matcher
+    _worker_matcher = SemanticChunkMatcher(database_path, execution_id, rule_rows, min_indicators_default)
+
+
+def match_semantic_chunk(chunk: Tuple[int, int, int, Optional[bytes]]):
+    """Pool task: match one chunk with the per-process matcher"""
+    return _worker_matcher.match_chunk(chunk)
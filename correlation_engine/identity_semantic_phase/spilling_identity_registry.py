@@ -0,0 +1,502 @@
+"""
+Spilling Identity Registry
+
+IdentityRegistry keeps every IdentityRecord, with all of its RecordReference
+objects, in Python dicts, which does not fit in memory for the largest
+executions. SpillingIdentityRegistry has the same API but keeps identities
+and record references in a temporary SQLite file:
+- identities are rows keyed by the registry's identity key, with indexes on
+  processing status and type for the pending/processed/error and by-type
+  queries
+- record references are rows of their identity, deduplicated through an
+  index on (identity, match_id, feather_id, record_index)
+- only a bounded hot set of recently used IdentityRecord objects is kept in
+  memory; records are loaded back from the file when needed
+- identity lists (get_pending_identities() etc.) are lazy sequences of row
+  IDs that load their records chunk by chunk
+
+Records handed out by the registry write their changes through to the file
+(add_record_reference, mark_processed, mark_error), so callers can keep
+updating records directly as they do with the in-memory registry.
+"""
+
+import json
+import logging
+import os
+import sqlite3
+import tempfile
+import weakref
+from array import array
+from collections import OrderedDict
+from collections.abc import Sequence
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+from .identity_registry import IdentityRegistry, IdentityRecord, RecordReference
+
+logger = logging.getLogger(__name__)
+
+# IdentityRecord objects kept in memory
+DEFAULT_HOT_SET_SIZE = 10000
+
+# Identities loaded from the spill file per query
+_LOAD_CHUNK_SIZE = 500
+
+
+def _encode(data: Optional[Dict[str, Any]]) -> Optional[str]:
+    """JSON text of a record or semantic data dict (non-JSON values as strings)"""
+    return None if data is None else json.dumps(data, default=str)
+
+
+def _decode(text: Optional[str]) -> Optional[Dict[str, Any]]:
+    return None if text is None else json.loads(text)
+
+
+class _SpilledIdentityRecord(IdentityRecord):
+    """IdentityRecord of a SpillingIdentityRegistry that writes its changes through"""
+
+    def add_record_reference(self, reference: RecordReference):
+        super().add_record_reference(reference)
+        self._registry._insert_references(self._row_id, [reference])
+
+    def mark_processed(self, semantic_data: Dict[str, Any]):
+        super().mark_processed(semantic_data)
+        self._registry._store_status(self)
+
+    def mark_error(self, error_message: str):
+        super().mark_error(error_message)
+        self._registry._store_status(self)
+
+
+class _IdentityRecordList(Sequence):
+    """Lazy list of a registry's identities, loaded from the spill file on access"""
+
+    def __init__(self, registry: 'SpillingIdentityRegistry', row_ids: Iterable[int]):
+        self._registry = registry
+        self._row_ids = array('q', row_ids)
+
+    def __len__(self) -> int:
+        return len(self._row_ids)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return self._registry._load_records(self._row_ids[index])
+        return self._registry._load_records([self._row_ids[index]])[0]
+
+    def __iter__(self) -> Iterator[IdentityRecord]:
+        for start in range(0, len(self._row_ids), _LOAD_CHUNK_SIZE):
+            yield from self._registry._load_records(self._row_ids[start:start + _LOAD_CHUNK_SIZE])
+
+    def __bool__(self) -> bool:
+        return len(self._row_ids) > 0
+
+    def __repr__(self) -> str:
+        return f"_IdentityRecordList(identities={len(self._row_ids)})"
+
+
+def _close_spill_file(conn: sqlite3.Connection, path: str):
+    """Close and delete a spill file (also run when the registry is garbage collected)"""
+    try:
+        conn.close()
+    finally:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+
+class SpillingIdentityRegistry(IdentityRegistry):
+    """
+    IdentityRegistry that keeps identities and record references in a
+    temporary SQLite file, with a bounded in-memory hot set.
+
+    Used by IdentitySemanticController when the estimated identity count of
+    an execution crosses IdentitySemanticConfig.spill_identity_threshold.
+    """
+
+    def __init__(self, debug_mode: bool = False, hot_set_size: int = DEFAULT_HOT_SET_SIZE,
+                 spill_directory: Optional[str] = None):
+        """
+        Create a registry backed by a new temporary spill file.
+
+        Args:
+            debug_mode: Enable debug logging
+            hot_set_size: Number of IdentityRecord objects kept in memory
+            spill_directory: Directory of the spill file (system temp directory if None)
+        """
+        super().__init__(debug_mode=debug_mode)
+        self.hot_set_size = max(1, hot_set_size)
+
+        fd, self.spill_path = tempfile.mkstemp(prefix='identity_registry_', suffix='.db',
+                                               dir=spill_directory)
+        os.close(fd)
+        self._conn = sqlite3.connect(self.spill_path)
+        self._finalizer = weakref.finalize(self, _close_spill_file, self._conn, self.spill_path)
+        self._create_schema()
+
+        # Hot set: most recently used records; live records are also found
+        # through the weak map while callers still hold them
+        self._hot: 'OrderedDict[int, IdentityRecord]' = OrderedDict()
+        self._live: 'weakref.WeakValueDictionary[int, IdentityRecord]' = weakref.WeakValueDictionary()
+
+        if self.debug_mode:
+            logger.info(f"[Identity Registry] Spilling identities to {self.spill_path}")
+
+    def _create_schema(self):
+        """Create the spill file tables; the file is temporary, so durability is off"""
+        self._conn.execute("PRAGMA journal_mode=OFF")
+        self._conn.execute("PRAGMA synchronous=OFF")
+        self._conn.execute("PRAGMA cache_size=-16384")
+        self._conn.execute("""
+            CREATE TABLE identities (
+                id INTEGER PRIMARY KEY,
+                identity_key TEXT NOT NULL UNIQUE,
+                identity_value TEXT NOT NULL,
+                identity_type TEXT NOT NULL,
+                processing_status TEXT NOT NULL,
+                semantic_data TEXT,
+                error_message TEXT
+            )
+        """)
+        self._conn.execute("CREATE INDEX idx_identities_status ON identities(processing_status)")
+        self._conn.execute("CREATE INDEX idx_identities_type ON identities(identity_type)")
+        self._conn.execute("CREATE INDEX idx_identities_value ON identities(identity_value)")
+        # match_id and record_index are untyped to round-trip their Python types
+        self._conn.execute("""
+            CREATE TABLE record_references (
+                identity_id INTEGER NOT NULL,
+                match_id,
+                feather_id TEXT,
+                record_index,
+                original_record TEXT,
+                wing_id TEXT,
+                wing_name TEXT
+            )
+        """)
+        self._conn.execute("""
+            CREATE INDEX idx_record_references_identity
+            ON record_references(identity_id, match_id, feather_id, record_index)
+        """)
+
+    # ------------------------------------------------------------------
+    # Spill file access
+    # ------------------------------------------------------------------
+
+    def _find_row_id(self, identity_key: str) -> Optional[int]:
+        row = self._conn.execute(
+            "SELECT id FROM identities WHERE identity_key = ?", (identity_key,)
+        ).fetchone()
+        return row[0] if row else None
+
+    def _insert_references(self, row_id: int, references: Iterable[RecordReference]):
+        self._conn.executemany(
+            "INSERT INTO record_references VALUES (?, ?, ?, ?, ?, ?, ?)",
+            [(row_id, ref.match_id, ref.feather_id, ref.record_index,
+              _encode(ref.original_record), ref.wing_id, ref.wing_name)
+             for ref in references]
+        )
+
+    def _has_reference(self, row_id: int, ref: RecordReference) -> bool:
+        return self._conn.execute(
+            """SELECT 1 FROM record_references
+               WHERE identity_id = ? AND match_id = ? AND feather_id = ? AND record_index = ?
+               LIMIT 1""",
+            (row_id, ref.match_id, ref.feather_id, ref.record_index)
+        ).fetchone() is not None
+
+    def _store_status(self, identity: IdentityRecord):
+        self._conn.execute(
+            """UPDATE identities SET processing_status = ?, semantic_data = ?, error_message = ?
+               WHERE id = ?""",
+            (identity.processing_status, _encode(identity.semantic_data),
+             identity.error_message, identity._row_id)
+        )
+
+    def _remember(self, row_id: int, identity: IdentityRecord):
+        """Put a record in the hot set, evicting the least recently used"""
+        self._hot[row_id] = identity
+        self._hot.move_to_end(row_id)
+        self._live[row_id] = identity
+        while len(self._hot) > self.hot_set_size:
+            self._hot.popitem(last=False)
+
+    def _load_records(self, row_ids: Iterable[int]) -> List[IdentityRecord]:
+        """IdentityRecords of row IDs, in order, from memory or the spill file"""
+        row_ids = list(row_ids)
+        records: Dict[int, IdentityRecord] = {}
+        missing = []
+        for row_id in row_ids:
+            identity = self._live.get(row_id)
+            if identity is not None:
+                records[row_id] = identity
+            else:
+                missing.append(row_id)
+
+        for start in range(0, len(missing), _LOAD_CHUNK_SIZE):
+            chunk = missing[start:start + _LOAD_CHUNK_SIZE]
+            placeholders = ','.join('?' * len(chunk))
+            references: Dict[int, List[RecordReference]] = {row_id: [] for row_id in chunk}
+            for row in self._conn.execute(
+                f"""SELECT identity_id, match_id, feather_id, record_index,
+                           original_record, wing_id, wing_name
+                    FROM record_references WHERE identity_id IN ({placeholders})
+                    ORDER BY rowid""", chunk
+            ):
+                references[row[0]].append(RecordReference(
+                    match_id=row[1],
+                    feather_id=row[2],
+                    record_index=row[3],
+                    original_record=_decode(row[4]),
+                    wing_id=row[5],
+                    wing_name=row[6]
+                ))
+            for row in self._conn.execute(
+                f"""SELECT id, identity_value, identity_type, processing_status,
+                           semantic_data, error_message
+                    FROM identities WHERE id IN ({placeholders})""", chunk
+            ):
+                identity = _SpilledIdentityRecord(
+                    identity_value=row[1],
+                    identity_type=row[2],
+                    record_references=references[row[0]],
+                    semantic_data=_decode(row[4]),
+                    processing_status=row[3],
+                    error_message=row[5]
+                )
+                identity._registry = self
+                identity._row_id = row[0]
+                records[row[0]] = identity
+
+        for row_id in row_ids:
+            self._remember(row_id, records[row_id])
+        return [records[row_id] for row_id in row_ids]
+
+    def _query_list(self, where: str = '', parameters: tuple = ()) -> _IdentityRecordList:
+        """Lazy list of the identities matching a WHERE clause, in insertion order"""
+        rows = self._conn.execute(f"SELECT id FROM identities {where} ORDER BY id", parameters)
+        return _IdentityRecordList(self, (row[0] for row in rows))
+
+    def flush(self):
+        """Commit pending writes to the spill file"""
+        self._conn.commit()
+
+    def close(self):
+        """Close and delete the spill file"""
+        self._hot.clear()
+        self._live.clear()
+        self._finalizer()
+
+    # ------------------------------------------------------------------
+    # IdentityRegistry API
+    # ------------------------------------------------------------------
+
+    def add_identity(self, identity: IdentityRecord):
+        """
+        Add an identity to the registry with deduplication.
+
+        If the identity already exists, merges record references.
+
+        Args:
+            identity: IdentityRecord to add
+        """
+        identity_key = self.identity_key(identity.identity_value, identity.identity_type)
+        row_id = self._find_row_id(identity_key)
+
+        if row_id is None:
+            cursor = self._conn.execute(
+                """INSERT INTO identities (identity_key, identity_value, identity_type,
+                                          processing_status, semantic_data, error_message)
+                   VALUES (?, ?, ?, ?, ?, ?)""",
+                (identity_key, identity.identity_value, identity.identity_type,
+                 identity.processing_status, _encode(identity.semantic_data),
+                 identity.error_message)
+            )
+            self._insert_references(cursor.lastrowid, identity.record_references)
+            self._identity_count += 1
+            self._total_records += len(identity.record_references)
+        else:
+            # Existing identity - add only new record references
+            new_refs = [ref for ref in identity.record_references
+                        if not self._has_reference(row_id, ref)]
+            if new_refs:
+                self._insert_references(row_id, new_refs)
+                self._total_records += len(new_refs)
+                # Keep a loaded copy of the identity in step
+                loaded = self._live.get(row_id)
+                if loaded is not None:
+                    loaded.record_references.extend(new_refs)
+
+    def get_unique_identities(self) -> List[str]:
+        """
+        Get list of unique identity values.
+
+        Returns:
+            List of identity value strings
+        """
+        return [row[0] for row in self._conn.execute("SELECT identity_value FROM identities ORDER BY id")]
+
+    def get_identity_record(self, identity_value: str, identity_type: Optional[str] = None) -> Optional[IdentityRecord]:
+        """
+        Get identity record by value and optional type.
+
+        Args:
+            identity_value: Identity value to look up
+            identity_type: Optional identity type for disambiguation
+
+        Returns:
+            IdentityRecord if found, None otherwise
+        """
+        if identity_type:
+            row_id = self._find_row_id(self.identity_key(identity_value, identity_type))
+        else:
+            row = self._conn.execute(
+                "SELECT id FROM identities WHERE identity_value = ? ORDER BY id LIMIT 1",
+                (identity_value,)
+            ).fetchone()
+            row_id = row[0] if row else None
+        return self._load_records([row_id])[0] if row_id is not None else None
+
+    def mark_processed(self, identity_value: str, semantic_data: Dict[str, Any],
+                      identity_type: Optional[str] = None):
+        """
+        Mark an identity as processed with semantic data.
+
+        Args:
+            identity_value: Identity value to mark
+            semantic_data: Semantic data to associate
+            identity_type: Optional identity type for disambiguation
+        """
+        identity = self.get_identity_record(identity_value, identity_type)
+        if identity:
+            identity.mark_processed(semantic_data)
+
+    def mark_error(self, identity_value: str, error_message: str,
+                  identity_type: Optional[str] = None):
+        """
+        Mark an identity as having an error.
+
+        Args:
+            identity_value: Identity value to mark
+            error_message: Error message
+            identity_type: Optional identity type for disambiguation
+        """
+        identity = self.get_identity_record(identity_value, identity_type)
+        if identity:
+            identity.mark_error(error_message)
+
+    def get_all_identities(self) -> Sequence:
+        """
+        Get all identity records.
+
+        Returns:
+            Lazy list of all IdentityRecord objects
+        """
+        return self._query_list()
+
+    def get_identities_by_type(self, identity_type: str) -> Sequence:
+        """
+        Get identities filtered by type.
+
+        Args:
+            identity_type: Type to filter by
+
+        Returns:
+            Lazy list of IdentityRecord objects of specified type
+        """
+        return self._query_list("WHERE identity_type = ?", (identity_type,))
+
+    def get_pending_identities(self) -> Sequence:
+        """
+        Get identities that haven't been processed yet.
+
+        Returns:
+            Lazy list of pending IdentityRecord objects
+        """
+        return self._query_list("WHERE processing_status = ?", ('pending',))
+
+    def get_processed_identities(self) -> Sequence:
+        """
+        Get identities that have been processed.
+
+        Records write their status through, so the status index is always
+        consistent and no full scan fallback is needed.
+
+        Returns:
+            Lazy list of processed IdentityRecord objects
+        """
+        return self._query_list("WHERE processing_status = ?", ('processed',))
+
+    def get_error_identities(self) -> Sequence:
+        """
+        Get identities that encountered errors during processing.
+
+        Returns:
+            Lazy list of error IdentityRecord objects
+        """
+        return self._query_list("WHERE processing_status = ?", ('error',))
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """
+        Get comprehensive registry statistics.
+
+        Returns:
+            Dictionary with statistics
+        """
+        status_counts = dict(self._conn.execute(
+            "SELECT processing_status, COUNT(*) FROM identities GROUP BY processing_status"
+        ).fetchall())
+        identities_by_type = dict(self._conn.execute(
+            "SELECT identity_type, COUNT(*) FROM identities GROUP BY identity_type ORDER BY MIN(id)"
+        ).fetchall())
+        processed_count = status_counts.get('processed', 0)
+
+        avg_records_per_identity = (
+            self._total_records / self._identity_count
+            if self._identity_count > 0 else 0.0
+        )
+
+        return {
+            'total_identities': self._identity_count,
+            'total_records': self._total_records,
+            'avg_records_per_identity': round(avg_records_per_identity, 2),
+            'pending': status_counts.get('pending', 0),
+            'processed': processed_count,
+            'errors': status_counts.get('error', 0),
+            'identities_by_type': identities_by_type,
+            'processing_progress': round(
+                (processed_count / self._identity_count * 100) if self._identity_count > 0 else 0.0,
+                2
+            )
+        }
+
+    def get_identity_types(self) -> List[str]:
+        """
+        Get list of all identity types in registry.
+
+        Returns:
+            List of identity type strings
+        """
+        return [row[0] for row in self._conn.execute(
+            "SELECT identity_type FROM identities GROUP BY identity_type ORDER BY MIN(id)"
+        )]
+
+    def clear(self):
+        """Clear all identities from registry."""
+        self._conn.execute("DELETE FROM record_references")
+        self._conn.execute("DELETE FROM identities")
+        self._hot.clear()
+        self._live.clear()
+        self._identity_count = 0
+        self._total_records = 0
+
+    def __contains__(self, identity_value: str) -> bool:
+        """Check if identity value exists in registry"""
+        return self._conn.execute(
+            "SELECT 1 FROM identities WHERE identity_value = ? LIMIT 1", (identity_value,)
+        ).fetchone() is not None
+
+    def __repr__(self) -> str:
+        """String representation of registry"""
+        return (f"SpillingIdentityRegistry(identities={self._identity_count}, "
+                f"records={self._total_records}, "
+                f"types={len(self.get_identity_types())}, "
+                f"hot={len(self._hot)})")
@@ -5,9 +5,10 @@ This module implements semantic mapping using proper regex pattern matching.
 
 Approach:
 1. Create semantic_rules table with full regex patterns
-2. Load all matches from database
-3. Apply regex patterns to matched_application field
-4. Update matches with semantic data
+2. Partition the execution's matches (or their FTS5 candidates) into rowid chunks
+3. Apply regex patterns in worker processes, each streaming its chunks over
+   its own read-only connection (see semantic_match_worker)
+4. Update matches with semantic data from this process as chunks complete
 
 Key Fix: Uses proper regex matching instead of substring search to avoid over-matching.
 """
@@ -16,12 +17,22 @@ import sqlite3
 import json
 import time
 import logging
+import multiprocessing
 import os
-from typing import Dict, List, Any, Tuple, Optional
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from array import array
+from collections import Counter
+from typing import Dict, List, Any, Tuple, Optional, Iterator
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from ..engine.match_payload import MatchPayloadCodec
+from ..engine.match_fts import MatchFtsIndex
+from .semantic_match_worker import SemanticChunkMatcher, initialize_semantic_worker, match_semantic_chunk
 
 logger = logging.getLogger(__name__)
 
+# Chunks planned per worker process, so faster workers pick up more chunks
+CHUNKS_PER_WORKER = 4
+
 
 class SQLSemanticMapper:
     """
@@ -74,6 +85,7 @@ class SQLSemanticMapper:
         # Use a longer timeout to avoid lock issues
         self.conn = sqlite3.connect(self.database_path, timeout=30.0)
         self.cursor = self.conn.cursor()
+        MatchPayloadCodec(self.conn).register_functions()
         
         # Enable WAL mode for better concurrency
         self.cursor.execute("PRAGMA journal_mode=WAL")
@@ -103,6 +115,7 @@ class SQLSemanticMapper:
         default_config = {
             'batch_size': 1000,
             'worker_count': 4,
+            'chunk_size': 20000,
             'min_indicators_default': 1,
             'pattern_cache_size': 10000,
             'max_pattern_matches': 100,
@@ -155,6 +168,11 @@ class SQLSemanticMapper:
             warnings.append("worker_count must be >= 1, using default: 4")
             config['worker_count'] = 4
         
+        # Validate chunk_size
+        if config.get('chunk_size', 1) < 1:
+            warnings.append("chunk_size must be >= 1, using default: 20000")
+            config['chunk_size'] = 20000
+        
         # Validate min_indicators_default
         if config.get('min_indicators_default', 1) < 1:
             warnings.append("min_indicators_default must be >= 1, using default: 1")
@@ -776,402 +794,99 @@ class SQLSemanticMapper:
             except Exception as e:
                 logger.warning(f"Failed to write pattern warning to debug log: {e}")
 
-    def _process_match_batch(
-        self,
-        matches_batch: List[Tuple],
-        rules: List[Tuple],
-        worker_id: int,
-        progress_callback=None
-    ) -> Tuple[List[Tuple[str, str]], int, Dict[str, set]]:
+    def _plan_chunks(self, total_matches: int, candidate_rowids: Optional[array] = None) -> List[Tuple[int, int, int, Optional[bytes]]]:
         """
-        Process a batch of matches in a worker thread.
-        Called by ThreadPoolExecutor workers.
+        Partition the execution's matches into rowid chunks for the workers.
         
         Args:
-            matches_batch: List of (match_id, feather_records, matched_application) tuples
-            rules: List of rule tuples (rule_id, logic_operator, conditions_json, requires_multi_indicator, min_indicators)
-            worker_id: Worker thread identifier for logging
-            progress_callback: Optional callback function to report progress
+            total_matches: Number of matches of the execution
+            candidate_rowids: Sorted rowids of the FTS5 candidates, or None to
+                              scan every match of the execution
             
         Returns:
-            Tuple of (results, errors, pattern_match_counts) where:
-            - results: List of (match_id, matched_rule_ids) tuples
-            - errors: Number of errors encountered
-            - pattern_match_counts: Dict of pattern -> set of match_ids
+            List of (chunk_index, low_rowid, high_rowid, candidate_rowids)
+            chunk descriptors (see semantic_match_worker)
         """
-        import re
-        
-        # Each worker needs its own database connection for thread safety
-        worker_conn = sqlite3.connect(self.database_path, timeout=30.0)
-        worker_cursor = worker_conn.cursor()
-        
-        # Enable WAL mode for better concurrency
-        worker_cursor.execute("PRAGMA journal_mode=WAL")
-        worker_cursor.execute("PRAGMA synchronous=NORMAL")
-        
-        results = []
-        errors = 0
-        pattern_match_counts = {}
-        
-        # Progress reporting interval (every 100 matches for consistent reporting)
-        batch_size = len(matches_batch)
-        progress_interval = 100  # Report every 100 matches for consistent progress updates
-        last_reported_idx = 0
-        
-        try:
-            for idx, (match_id, feather_records, matched_application) in enumerate(matches_batch):
-                try:
-                    if not feather_records:
-                        continue
-                    
-                    # Report progress periodically (report the INCREMENT since last report)
-                    if progress_callback and (idx + 1) % progress_interval == 0:
-                        increment = (idx + 1) - last_reported_idx
-                        progress_callback(worker_id, increment)
-                        last_reported_idx = idx + 1
-                    
-                    # Parse feather_records JSON (Requirement 8.1: Graceful handling of malformed JSON)
-                    try:
-                        feather_data = json.loads(feather_records)
-                    except json.JSONDecodeError as e:
-                        # Log malformed JSON with match_id and continue processing (Requirement 8.1)
-                        logger.warning(f"[Worker {worker_id}] Malformed JSON in match {match_id}: {e}")
-                        errors += 1
-                        continue
-                    except Exception as e:
-                        # Catch any other JSON parsing errors
-                        logger.warning(f"[Worker {worker_id}] Error parsing JSON in match {match_id}: {e}")
-                        errors += 1
-                        continue
-                    
-                    # Validate feather_data is a dict (Requirement 8.2: Handle non-dict data)
-                    if not isinstance(feather_data, dict):
-                        logger.warning(f"[Worker {worker_id}] Non-dict feather_records in match {match_id}: {type(feather_data)}")
-                        errors += 1
-                        continue
-                    
-                    # Find matching rules
-                    matched_rules = set()
-                    
-                    for rule_id, logic_operator, conditions_json, requires_multi_indicator, min_indicators in rules:
-                        try:
-                            conditions = json.loads(conditions_json)
-                        except json.JSONDecodeError as e:
-                            # Log malformed JSON in rule and continue (Requirement 8.1)
-                            logger.error(f"[Worker {worker_id}] Malformed JSON in rule {rule_id}: {e}")
-                            errors += 1
-                            continue
-                        except Exception as e:
-                            # Catch any other JSON parsing errors
-                            logger.error(f"[Worker {worker_id}] Error parsing rule {rule_id}: {e}")
-                            errors += 1
-                            continue
-                        
-                        # Skip rules with no valid conditions
-                        if not conditions:
-                            continue
-                        
-                        # Check ALL conditions with AND logic
-                        all_conditions_met = True
-                        has_non_wildcard = False
-                        matched_conditions_count = 0
-                        
-                        for condition in conditions:
-                            # Requirement 8.3: Graceful handling of condition evaluation exceptions
-                            try:
-                                field_name = condition['field_name']
-                                pattern = condition['value']
-                                operator = condition['operator']
-                                
-                                # Skip wildcard, empty, and invalid conditions
-                                if not pattern or pattern == "*" or operator == "wildcard":
-                                    continue
-                                
-                                has_non_wildcard = True
-                                
-                                # For each condition, check MULTIPLE strategies (OR logic within condition)
-                                condition_met = False
-                                
-                                # STRATEGY 1: Check matched_application column directly (FASTEST)
-                                if field_name == 'matched_application' and matched_application:
-                                    matched_app_upper = str(matched_application).upper()
-                                    
-                                    if operator == "regex":
-                                        compiled_pattern = self._get_cached_pattern(pattern, rule_id)
-                                        if compiled_pattern:
-                                            try:
-                                                if compiled_pattern.search(matched_app_upper):
-                                                    condition_met = True
-                                            except Exception as e:
-                                                # Log regex matching error and treat condition as not matched (Requirement 8.3)
-                                                logger.warning(f"[Worker {worker_id}] Error matching pattern in rule {rule_id}: {e}")
-                                    
-                                    elif operator == "contains":
-                                        if pattern.upper() in matched_app_upper:
-                                            condition_met = True
-                                    
-                                    elif operator == "equals":
-                                        if pattern.upper() == matched_app_upper:
-                                            condition_met = True
-                            
-                                # STRATEGY 2: Check the specific field in feather_records
-                                if not condition_met:
-                                    field_value = None
-                                    for feather_name, feather_content in feather_data.items():
-                                        if isinstance(feather_content, list):
-                                            for record in feather_content:
-                                                if isinstance(record, dict) and field_name in record:
-                                                    field_value = record[field_name]
-                                                    break
-                                            if field_value:
-                                                break
-                                    
-                                    if field_value:
-                                        field_value_str = str(field_value).upper()
-                                        
-                                        if operator == "regex":
-                                            compiled_pattern = self._get_cached_pattern(pattern, rule_id)
-                                            if compiled_pattern:
-                                                try:
-                                                    if compiled_pattern.search(field_value_str):
-                                                        condition_met = True
-                                                except Exception as e:
-                                                    # Log regex matching error and treat condition as not matched (Requirement 8.3)
-                                                    logger.warning(f"[Worker {worker_id}] Error matching pattern in rule {rule_id}: {e}")
-                                        
-                                        elif operator == "contains":
-                                            if pattern.upper() in field_value_str:
-                                                condition_met = True
-                                        
-                                        elif operator == "equals":
-                                            if pattern.upper() == field_value_str:
-                                                condition_met = True
-                            
-                                # STRATEGY 3: Check ALL field values in feather_records
-                                if not condition_met:
-                                    all_values = []
-                                    for feather_name, feather_content in feather_data.items():
-                                        if isinstance(feather_content, list):
-                                            for record in feather_content:
-                                                if isinstance(record, dict):
-                                                    for key, value in record.items():
-                                                        if isinstance(value, str):
-                                                            all_values.append(value.upper())
-                                    
-                                    if operator == "regex":
-                                        compiled_pattern = self._get_cached_pattern(pattern, rule_id)
-                                        if compiled_pattern:
-                                            try:
-                                                for value in all_values:
-                                                    if compiled_pattern.search(value):
-                                                        condition_met = True
-                                                        break
-                                            except Exception as e:
-                                                # Log regex matching error and treat condition as not matched (Requirement 8.3)
-                                                logger.warning(f"[Worker {worker_id}] Error matching pattern in rule {rule_id}: {e}")
-                                    
-                                    elif operator == "contains":
-                                        pattern_upper = pattern.upper()
-                                        for value in all_values:
-                                            if pattern_upper in value:
-                                                condition_met = True
-                                                break
-                                    
-                                    elif operator == "equals":
-                                        pattern_upper = pattern.upper()
-                                        for value in all_values:
-                                            if pattern_upper == value:
-                                                condition_met = True
-                                                break
-                                
-                                # If this condition is not met by ANY strategy, the rule fails
-                                if not condition_met:
-                                    all_conditions_met = False
-                                    break
-                                else:
-                                    matched_conditions_count += 1
-                                    
-                                    # Track pattern matches for validation
-                                    if operator == "regex":
-                                        if pattern not in pattern_match_counts:
-                                            pattern_match_counts[pattern] = set()
-                                        pattern_match_counts[pattern].add(match_id)
-                            
-                            except KeyError as e:
-                                # Handle missing keys in condition dict (Requirement 8.3)
-                                logger.warning(f"[Worker {worker_id}] Missing key in condition for rule {rule_id}: {e}")
-                                errors += 1
-                                # Treat condition as not matched and continue
-                                all_conditions_met = False
-                                break
-                            except Exception as e:
-                                # Catch any other condition evaluation errors (Requirement 8.3)
-                                logger.warning(f"[Worker {worker_id}] Error evaluating condition in rule {rule_id}: {e}")
-                                errors += 1
-                                # Treat condition as not matched and continue
-                                all_conditions_met = False
-                                break
-                        
-                        # Only add rule if it has non-wildcard conditions AND all are met
-                        if has_non_wildcard and all_conditions_met:
-                            # Validate multi-indicator rule before adding
-                            rule_dict = {
-                                'rule_id': rule_id,
-                                '_requires_multi_indicator': bool(requires_multi_indicator),
-                                '_min_indicators': min_indicators,
-                                'conditions_json': conditions_json
-                            }
-                            is_valid, reason = self._validate_multi_indicator_rule(rule_dict, matched_conditions_count)
-                            
-                            if is_valid:
-                                matched_rules.add(rule_id)
-                    
-                    if matched_rules:
-                        sorted_rules = sorted(matched_rules)
-                        results.append((match_id, ','.join(sorted_rules)))
-                        
-                except Exception as e:
-                    errors += 1
-                    logger.error(f"[Worker {worker_id}] Error processing match {match_id}: {e}")
-                    if errors <= 5:
-                        print(f"[Worker {worker_id}] ERROR processing match {match_id}: {e}")
+        worker_count = self.config.get('worker_count', 4)
+        chunk_size = self.config.get('chunk_size', 20000)
+        
+        if candidate_rowids is not None:
+            # Chunks of consecutive candidates, each carrying its packed rowids
+            row_count = len(candidate_rowids)
+            chunk_count = min(row_count, max(worker_count * CHUNKS_PER_WORKER, -(-row_count // chunk_size)))
+            chunks = []
+            for i in range(chunk_count):
+                part = candidate_rowids[row_count * i // chunk_count:row_count * (i + 1) // chunk_count]
+                if part:
+                    chunks.append((len(chunks), part[0], part[-1], part.tobytes()))
+            return chunks
         
-        finally:
-            # Report final progress for any remaining matches
-            if progress_callback and last_reported_idx < batch_size:
-                final_increment = batch_size - last_reported_idx
-                progress_callback(worker_id, final_increment)
-            
-            # Close worker's database connection
-            worker_conn.close()
+        self.cursor.execute("""
+            SELECT MIN(m.rowid), MAX(m.rowid)
+            FROM matches m
+            INNER JOIN results r ON m.result_id = r.result_id
+            WHERE r.execution_id = ?
+        """, (self.execution_id,))
+        low, high = self.cursor.fetchone()
+        if low is None:
+            return []
         
-        return results, errors, pattern_match_counts
-
-    def _process_matches_parallel(
+        # Rowids of one execution are (nearly) contiguous, so equal rowid
+        # spans hold similar numbers of matches
+        span = high - low + 1
+        chunk_count = min(span, max(worker_count * CHUNKS_PER_WORKER, -(-total_matches // chunk_size)))
+        return [
+            (i, low + span * i // chunk_count, low + span * (i + 1) // chunk_count - 1, None)
+            for i in range(chunk_count)
+        ]
+    
+    def _match_chunks(
         self,
-        candidate_matches: List[Tuple],
-        rules: List[Tuple]
-    ) -> Tuple[List[Tuple[str, str]], int, Dict[str, set]]:
+        chunks: List[Tuple[int, int, int, Optional[bytes]]],
+        rules: List[Tuple],
+        total_candidates: int
+    ) -> Iterator[Tuple[List[Tuple[str, str]], int, Dict[str, int]]]:
         """
-        Process matches in parallel across worker threads.
+        Match the rules against chunks in worker processes.
+        
+        Workers open their own read-only connection and return only
+        (match_id, matched_rule_ids) pairs; chunk results are yielded as they
+        complete so the caller can write them while the workers continue.
+        With worker_count 1 the chunks are matched in this process.
         
         Args:
-            candidate_matches: List of (match_id, feather_records, matched_application) tuples
-            rules: List of rule tuples
+            chunks: Chunk descriptors from _plan_chunks()
+            rules: List of rule tuples (rule_id, logic_operator, conditions_json, requires_multi_indicator, min_indicators)
+            total_candidates: Number of matches in all chunks (for progress)
             
-        Returns:
-            Tuple of (results, total_errors, pattern_match_counts) where:
+        Yields:
+            (results, errors, pattern_match_counts) per chunk where:
             - results: List of (match_id, matched_rule_ids) tuples
-            - total_errors: Total number of errors across all workers
-            - pattern_match_counts: Aggregated pattern match counts
+            - errors: Number of errors encountered
+            - pattern_match_counts: Dict of pattern -> number of matches
         """
-        # Handle empty matches early
-        if not candidate_matches:
+        if not chunks:
             print("[SQL Semantic] No candidate matches to process")
-            return [], 0, {}
-        
-        worker_count = self.config.get('worker_count', 4)
+            return
         
-        # If worker_count is 1, process sequentially (no parallelization)
-        if worker_count == 1:
-            print("[SQL Semantic] Processing sequentially (worker_count=1)")
-            logger.info("[SQL Semantic] Processing sequentially with worker_count=1")
-            
-            # Create progress tracking for sequential mode
-            from threading import Lock
-            import time as time_module
-            progress_lock = Lock()
-            processed_count = [0]
-            last_report_pct = [0]
-            last_report_time = [time_module.time()]
-            total_matches_to_process = len(candidate_matches)
-            
-            def sequential_progress_callback(worker_id, count_increment):
-                """Progress callback for sequential processing."""
-                with progress_lock:
-                    processed_count[0] += count_increment
-                    current_pct = (processed_count[0] / total_matches_to_process) * 100
-                    current_time = time_module.time()
-                    time_since_last = current_time - last_report_time[0]
-                    
-                    # Report every 5% OR every 5 minutes
-                    should_report = False
-                    if current_pct - last_report_pct[0] >= 5:
-                        should_report = True
-                    elif time_since_last >= 300:  # 5 minutes
-                        should_report = True
-                    
-                    if should_report and processed_count[0] < total_matches_to_process:
-                        print(f"[SQL Semantic] Progress: {current_pct:.0f}% ({processed_count[0]:,}/{total_matches_to_process:,} matches processed)")
-                        logger.info(f"[SQL Semantic] Progress: {current_pct:.0f}% - {processed_count[0]} matches processed")
-                        
-                        # Force GUI update to prevent freezing
-                        try:
-                            from PyQt5.QtWidgets import QApplication
-                            QApplication.processEvents()
-                        except:
-                            pass  # Ignore if not in GUI context
-                        
-                        last_report_pct[0] = current_pct
-                        last_report_time[0] = current_time
-            
-            results, errors, pattern_match_counts = self._process_match_batch(
-                candidate_matches, rules, worker_id=0, progress_callback=sequential_progress_callback
-            )
-            return results, errors, pattern_match_counts
+        worker_count = min(self.config.get('worker_count', 4), len(chunks))
+        min_indicators_default = self.config.get('min_indicators_default', 1)
         
-        # Distribute matches across workers
-        batch_size = max(1, len(candidate_matches) // worker_count)
-        batches = []
+        processed_count = 0
+        last_report_pct = 0
+        last_report_time = time.time()
         
-        for i in range(worker_count):
-            start_idx = i * batch_size
-            if i == worker_count - 1:
-                # Last worker gets remaining matches
-                end_idx = len(candidate_matches)
-            else:
-                end_idx = start_idx + batch_size
-            
-            if start_idx < len(candidate_matches):
-                batches.append(candidate_matches[start_idx:end_idx])
-        
-        print(f"[SQL Semantic] Processing with {len(batches)} workers ({batch_size} matches per worker)")
-        logger.info(f"[SQL Semantic] Starting parallel processing with {len(batches)} workers")
-        
-        # Calculate total matches for progress tracking
-        total_matches_to_process = len(candidate_matches)
-        
-        # Process batches in parallel with progress tracking
-        all_results = []
-        total_errors = 0
-        aggregated_pattern_counts = {}
-        
-        # Shared progress tracking using a simple counter
-        from threading import Lock
-        import time as time_module
-        progress_lock = Lock()
-        processed_count = [0]  # Use list to allow modification in nested function
-        last_report_pct = [0]  # Track last reported percentage
-        last_report_time = [time_module.time()]  # Track last report time
-        
-        def worker_progress_callback(worker_id, count_increment):
-            """Called by workers to report progress incrementally."""
-            with progress_lock:
-                processed_count[0] += count_increment
-                current_pct = (processed_count[0] / total_matches_to_process) * 100
-                current_time = time_module.time()
-                time_since_last = current_time - last_report_time[0]
-                
-                # Report every 5% OR every 5 minutes
-                should_report = False
-                if current_pct - last_report_pct[0] >= 5:
-                    should_report = True
-                elif time_since_last >= 300:  # 5 minutes
-                    should_report = True
-                
-                if should_report and processed_count[0] < total_matches_to_process:
-                    print(f"[SQL Semantic] Worker progress: {current_pct:.0f}% ({processed_count[0]:,}/{total_matches_to_process:,} matches processed)")
-                    logger.info(f"[SQL Semantic] Worker progress: {current_pct:.0f}% - {processed_count[0]} matches processed")
+        def report_progress(scanned):
+            nonlocal processed_count, last_report_pct, last_report_time
+            processed_count += scanned
+            current_pct = (processed_count / total_candidates) * 100 if total_candidates else 100
+            current_time = time.time()
+            
+            # Report every 5% OR every 5 minutes
+            if current_pct - last_report_pct >= 5 or current_time - last_report_time >= 300:
+                if processed_count < total_candidates:
+                    print(f"[SQL Semantic] Progress: {current_pct:.0f}% ({processed_count:,}/{total_candidates:,} matches processed)")
+                    logger.info(f"[SQL Semantic] Progress: {current_pct:.0f}% - {processed_count} matches processed")
                     
                     # Force GUI update to prevent freezing
                     try:
@@ -1179,62 +894,54 @@ class SQLSemanticMapper:
                         QApplication.processEvents()
                     except:
                         pass  # Ignore if not in GUI context
-                    
-                    last_report_pct[0] = current_pct
-                    last_report_time[0] = current_time
+                
+                last_report_pct = current_pct
+                last_report_time = current_time
         
-        # No need for separate monitoring thread since workers report directly
+        if worker_count <= 1:
+            print(f"[SQL Semantic] Processing {len(chunks)} chunks sequentially (worker_count=1)")
+            logger.info("[SQL Semantic] Processing sequentially with worker_count=1")
+            
+            matcher = SemanticChunkMatcher(self.database_path, self.execution_id, rules, min_indicators_default)
+            try:
+                for chunk in chunks:
+                    _, results, scanned, errors, pattern_counts = matcher.match_chunk(chunk)
+                    report_progress(scanned)
+                    yield results, errors, pattern_counts
+            finally:
+                matcher.close()
+            return
         
-        try:
-            with ThreadPoolExecutor(max_workers=worker_count) as executor:
-                # Submit all batches to workers with progress callback
-                future_to_worker = {}
-                for worker_id, batch in enumerate(batches):
-                    future = executor.submit(self._process_match_batch, batch, rules, worker_id, worker_progress_callback)
-                    future_to_worker[future] = worker_id
-                
-                # Collect results as workers complete
-                completed_workers = 0
-                for future in as_completed(future_to_worker):
-                    worker_id = future_to_worker[future]
-                    try:
-                        results, errors, pattern_counts = future.result()
-                        all_results.extend(results)
-                        total_errors += errors
-                        
-                        # Aggregate pattern match counts
-                        for pattern, match_ids in pattern_counts.items():
-                            if pattern not in aggregated_pattern_counts:
-                                aggregated_pattern_counts[pattern] = set()
-                            aggregated_pattern_counts[pattern].update(match_ids)
-                        
-                        # Worker completed - show completion message
-                        completed_workers += 1
-                        with progress_lock:
-                            final_pct = (processed_count[0] / total_matches_to_process) * 100
-                        
-                        print(f"[SQL Semantic] Worker {worker_id} completed ({completed_workers}/{len(batches)}) - "
-                              f"Found {len(results):,} matches - Overall: {final_pct:.0f}%")
-                        logger.info(f"[SQL Semantic] Worker {worker_id} completed with {len(results)} matches")
-                        
-                    except Exception as e:
-                        # Requirement 8.4: Graceful handling of worker thread failures
-                        # Log error with context and continue with remaining workers
-                        error_msg = str(e)
-                        logger.error(f"[SQL Semantic] Worker {worker_id} failed with error: {error_msg}", exc_info=True)
-                        print(f"[SQL Semantic] ERROR: Worker {worker_id} failed: {error_msg}")
-                        self._log_worker_error(worker_id, error_msg)
-                        total_errors += 1
-                        # Continue processing with remaining workers (Requirement 8.4)
-        finally:
-            # No monitoring thread to stop
-            pass
+        print(f"[SQL Semantic] Processing {len(chunks)} chunks with {worker_count} worker processes")
+        logger.info(f"[SQL Semantic] Starting parallel processing of {len(chunks)} chunks with {worker_count} processes")
         
-        print(f"[SQL Semantic] All workers completed - Total matches: {len(all_results):,}")
-        logger.info(f"[SQL Semantic] Parallel processing complete: {len(all_results)} total matches")
+        with ProcessPoolExecutor(
+            max_workers=worker_count,
+            mp_context=multiprocessing.get_context('spawn'),
+            initializer=initialize_semantic_worker,
+            initargs=(self.database_path, self.execution_id, rules, min_indicators_default)
+        ) as executor:
+            futures = {executor.submit(match_semantic_chunk, chunk): chunk[0] for chunk in chunks}
+            
+            for future in as_completed(futures):
+                chunk_index = futures[future]
+                try:
+                    _, results, scanned, errors, pattern_counts = future.result()
+                except Exception as e:
+                    # Requirement 8.4: Graceful handling of worker failures
+                    # Log error with context and continue with remaining chunks
+                    error_msg = str(e)
+                    logger.error(f"[SQL Semantic] Chunk {chunk_index} failed with error: {error_msg}", exc_info=True)
+                    print(f"[SQL Semantic] ERROR: Chunk {chunk_index} failed: {error_msg}")
+                    self._log_worker_error(chunk_index, error_msg)
+                    yield [], 1, {}
+                    continue
+                
+                report_progress(scanned)
+                yield results, errors, pattern_counts
         
-        return all_results, total_errors, aggregated_pattern_counts
-
+        print("[SQL Semantic] All chunks completed")
+        logger.info(f"[SQL Semantic] Parallel processing complete: {len(chunks)} chunks")
     
     def create_semantic_rules_table(self, rules: List[Any]) -> int:
         """
@@ -1339,19 +1046,32 @@ class SQLSemanticMapper:
         """
         Use FTS5 + proper regex matching to find all matches that satisfy semantic rules.
         
-        Step 1: Use FTS5 to quickly filter candidates
-        Step 2: Apply full regex matching with AND logic on candidates
-        
         Returns:
             List of (match_id, matched_rule_ids) tuples
         """
+        results = []
+        for chunk_results in self.iter_matches_with_semantic_rules():
+            results.extend(chunk_results)
+        return results
+    
+    def iter_matches_with_semantic_rules(self) -> Iterator[List[Tuple[str, str]]]:
+        """
+        Use FTS5 + proper regex matching to find all matches that satisfy semantic rules.
+        
+        Step 1: Use FTS5 to quickly filter candidates (only their rowids are loaded)
+        Step 2: Apply full regex matching with AND logic on rowid chunks of the
+                candidates in worker processes
+        
+        Yields:
+            List of (match_id, matched_rule_ids) tuples per chunk, as chunks complete
+        """
         print("[SQL Semantic] Finding matches using FTS5 + regex pattern matching...")
         logger.info("[SQL Semantic] Starting semantic rule matching")
         
         start_time = time.time()
         
-        # Track pattern match counts for validation (pattern -> set of match_ids)
-        pattern_match_counts = {}
+        # Track pattern match counts for validation (pattern -> number of matches)
+        pattern_match_counts = Counter()
         
         # Load all rules with their conditions
         self.cursor.execute("""
@@ -1367,7 +1087,7 @@ class SQLSemanticMapper:
         if not rules:
             print("[SQL Semantic] ❌ ERROR: No semantic rules found!")
             logger.error("[SQL Semantic] No semantic rules found - cannot perform semantic mapping")
-            return []
+            return
         
         # Get total match count for progress reporting
         self.cursor.execute("""
@@ -1382,45 +1102,31 @@ class SQLSemanticMapper:
         logger.info(f"[SQL Semantic] Total matches in database: {total_matches}")
         print("")
         
-        # STEP 1: Build FTS5 index for fast filtering
-        print("[SQL Semantic] Step 1/2: Building FTS5 index...")
+        # STEP 1: Bring the FTS5 index up to date for fast filtering
+        # (the streaming writer indexes matches as they are written, so only
+        # matches written by other paths are indexed here)
+        print("[SQL Semantic] Step 1/2: Updating FTS5 index...")
         fts_available = True
         
         try:
-            # Check if FTS5 index already exists (Requirement 6.2)
-            self.cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='matches_fts'")
-            fts_exists = self.cursor.fetchone() is not None
-            
-            if fts_exists:
-                # Reuse existing FTS5 index
-                print("[SQL Semantic] Reusing existing FTS5 index")
-                logger.info("[SQL Semantic] Reusing existing FTS5 index")
+            fts_index = MatchFtsIndex(self.conn)
+            if not fts_index.ensure_table():
+                raise sqlite3.OperationalError("FTS5 module not available")
+            
+            fts_count = fts_index.catch_up(self.execution_id)
+            self.conn.commit()
+            
+            if fts_count:
+                print(f"[SQL Semantic] FTS5 index: indexed {fts_count:,} matches not indexed during the scan")
+                logger.info(f"[SQL Semantic] FTS5 index: indexed {fts_count} matches")
             else:
-                # Create new FTS5 index with porter stemmer and unicode61 tokenizer (Requirement 6.1)
-                self.cursor.execute("""
-                    CREATE VIRTUAL TABLE matches_fts USING fts5(
-                        match_id UNINDEXED,
-                        feather_records,
-                        tokenize='porter unicode61 remove_diacritics 1'
-                    )
-                """)
-                
-                self.cursor.execute("""
-                    INSERT INTO matches_fts(match_id, feather_records)
-                    SELECT m.match_id, m.feather_records
-                    FROM matches m
-                    INNER JOIN results r ON m.result_id = r.result_id
-                    WHERE r.execution_id = ?
-                """, (self.execution_id,))
-                
-                fts_count = self.cursor.rowcount
-                self.conn.commit()
-                print(f"[SQL Semantic] FTS5 index built with {fts_count:,} matches")
-                logger.info(f"[SQL Semantic] FTS5 index built with {fts_count} matches")
+                print("[SQL Semantic] FTS5 index is up to date")
+                logger.info("[SQL Semantic] FTS5 index is up to date")
         
         except Exception as e:
             # FTS5 not available - log warning and fall back to regex matching (Requirement 6.3)
             fts_available = False
+            self.conn.rollback()
             print(f"[SQL Semantic] WARNING: FTS5 not available - {str(e)}")
             print("[SQL Semantic] Falling back to regex-only matching (slower)")
             logger.warning(f"[SQL Semantic] FTS5 not available: {str(e)} - falling back to regex matching")
@@ -1440,6 +1146,9 @@ class SQLSemanticMapper:
                 conditions = json.loads(conditions_json)
                 for cond in conditions:
                     if cond['operator'] == 'regex' and cond['value'] != '*':
+                        # Compile once here so invalid patterns are logged
+                        self._get_cached_pattern(cond['value'], rule_id)
+                        
                         # Extract alternatives from regex (split on |)
                         alternatives = cond['value'].split('|')
                         for alt in alternatives:
@@ -1464,28 +1173,15 @@ class SQLSemanticMapper:
                 logger.debug(f"[FTS5] Error extracting terms from rule {rule_id}: {e}")
                 continue
         
-        # Determine which filtering strategy to use
+        # Determine which filtering strategy to use (None = all matches)
+        candidate_rowids = None
         if not fts_available:
             # FTS5 not available - process all matches
             print("[SQL Semantic] Processing all matches (FTS5 unavailable)")
-            self.cursor.execute("""
-                SELECT m.match_id, m.feather_records, m.matched_application
-                FROM matches m
-                INNER JOIN results r ON m.result_id = r.result_id
-                WHERE r.execution_id = ?
-            """, (self.execution_id,))
-            candidate_matches = self.cursor.fetchall()
         elif not fts_terms:
             # No FTS terms extracted - process all matches
             print("[SQL Semantic] WARNING: No FTS terms extracted, processing all matches")
             logger.warning("[SQL Semantic] No FTS terms extracted from rules")
-            self.cursor.execute("""
-                SELECT m.match_id, m.feather_records, m.matched_application
-                FROM matches m
-                INNER JOIN results r ON m.result_id = r.result_id
-                WHERE r.execution_id = ?
-            """, (self.execution_id,))
-            candidate_matches = self.cursor.fetchall()
         else:
             # Use FTS5 to filter candidates (Requirement 6.4: limit to 1000 terms)
             print(f"[SQL Semantic] Extracted {len(fts_terms)} FTS5 search terms")
@@ -1501,36 +1197,32 @@ class SQLSemanticMapper:
                 print(f"[SQL Semantic] WARNING: Limited FTS5 query to 1000 terms (from {len(fts_terms)})")
                 logger.warning(f"[SQL Semantic] FTS5 query limited to 1000 terms from {len(fts_terms)} total terms")
             
+            # Only the candidates' rowids are kept; workers read the rows
             self.cursor.execute("""
-                SELECT m.match_id, m.feather_records, m.matched_application
+                SELECT m.rowid
                 FROM matches_fts mf
-                INNER JOIN matches m ON mf.match_id = m.match_id
+                INNER JOIN matches m ON m.rowid = mf.rowid
                 INNER JOIN results r ON m.result_id = r.result_id
                 WHERE r.execution_id = ?
                   AND mf.feather_records MATCH ?
+                ORDER BY m.rowid
             """, (self.execution_id, fts_query))
-            
-            candidate_matches = self.cursor.fetchall()
+            candidate_rowids = array('q', (row[0] for row in self.cursor))
             
             # Requirement 6.5: Fallback to all matches if FTS5 returns zero candidates
-            if len(candidate_matches) == 0 and total_matches > 0:
+            if len(candidate_rowids) == 0 and total_matches > 0:
                 print("[SQL Semantic] WARNING: FTS5 returned zero candidates, falling back to all matches")
                 logger.warning("[SQL Semantic] FTS5 returned zero candidates - falling back to processing all matches")
                 self._log_fts5_zero_results(len(fts_terms))
-                
-                self.cursor.execute("""
-                    SELECT m.match_id, m.feather_records, m.matched_application
-                    FROM matches m
-                    INNER JOIN results r ON m.result_id = r.result_id
-                    WHERE r.execution_id = ?
-                """, (self.execution_id,))
-                candidate_matches = self.cursor.fetchall()
-        
-        coverage_pct = (len(candidate_matches)/total_matches*100) if total_matches > 0 else 0
-        print(f"[SQL Semantic] FTS5 filtered to {len(candidate_matches):,} candidates ({coverage_pct:.1f}%)")
+                candidate_rowids = None
+        
+        candidate_count = total_matches if candidate_rowids is None else len(candidate_rowids)
+        coverage_pct = (candidate_count/total_matches*100) if total_matches > 0 else 0
+        print(f"[SQL Semantic] FTS5 filtered to {candidate_count:,} candidates ({coverage_pct:.1f}%)")
         print("")
         
-        # STEP 3: Apply full regex matching with AND logic (parallel or sequential based on config)
+        # STEP 3: Apply full regex matching with AND logic on rowid chunks
+        # (worker processes, or sequential when worker_count is 1)
         worker_count = self.config.get('worker_count', 4)
         
         if worker_count > 1:
@@ -1538,17 +1230,23 @@ class SQLSemanticMapper:
         else:
             print("[SQL Semantic] Applying full regex matching with AND logic...")
         
-        # Use parallel processing if worker_count > 1, otherwise sequential
-        results, errors, pattern_match_counts = self._process_matches_parallel(
-            candidate_matches, rules
-        )
+        chunks = self._plan_chunks(total_matches, candidate_rowids)
+        candidate_rowids = None
+        
+        found = 0
+        errors = 0
+        for results, chunk_errors, chunk_pattern_counts in self._match_chunks(chunks, rules, candidate_count):
+            errors += chunk_errors
+            pattern_match_counts.update(chunk_pattern_counts)
+            found += len(results)
+            yield results
         
         elapsed = time.time() - start_time
         
         print("")
         print(f"[SQL Semantic] Rule matching complete in {elapsed:.2f}s")
-        print(f"[SQL Semantic] Found {len(results):,} matches with semantic data")
-        coverage_pct = (len(results)/total_matches*100) if total_matches > 0 else 0
+        print(f"[SQL Semantic] Found {found:,} matches with semantic data")
+        coverage_pct = (found/total_matches*100) if total_matches > 0 else 0
         print(f"[SQL Semantic] Coverage: {coverage_pct:.1f}%")
         
         if errors > 0:
@@ -1559,8 +1257,7 @@ class SQLSemanticMapper:
         max_pattern_matches = self.config.get('max_pattern_matches', 100)
         generic_patterns_found = 0
         
-        for pattern, match_ids in pattern_match_counts.items():
-            match_count = len(match_ids)
+        for pattern, match_count in pattern_match_counts.items():
             if match_count > max_pattern_matches:
                 # Find which rule(s) use this pattern
                 for rule_id, logic_operator, conditions_json, requires_multi_indicator, min_indicators in rules:
@@ -1578,26 +1275,15 @@ class SQLSemanticMapper:
             print(f"[SQL Semantic] WARNING: {generic_patterns_found} patterns exceeded match threshold ({max_pattern_matches})")
             logger.warning(f"[SQL Semantic] {generic_patterns_found} patterns exceeded match threshold")
         
-        logger.info(f"[SQL Semantic] Matching complete: {len(results)} matches with semantic data")
-        
-        return results
+        logger.info(f"[SQL Semantic] Matching complete: {found} matches with semantic data")
     
-    def build_and_update_semantic_data(self, matches_with_rules: List[Tuple[str, str]]) -> int:
+    def _load_rule_metadata(self) -> Dict[str, Dict[str, Any]]:
         """
-        Build semantic data and update matches in bulk.
+        Load the metadata of the indexed rules for building semantic data.
         
-        Args:
-            matches_with_rules: List of (match_id, matched_rule_ids) tuples
-            
         Returns:
-            Number of matches updated
+            Dict of rule_id -> rule metadata
         """
-        print("")
-        print("[SQL Semantic] Building semantic data...")
-        logger.info("[SQL Semantic] Starting semantic data building")
-        
-        start_time = time.time()
-        
         # Get rule metadata
         self.cursor.execute("""
             SELECT rule_id, semantic_value, rule_name, category, severity, confidence, conditions_json
@@ -1629,11 +1315,41 @@ class SQLSemanticMapper:
                 'technical_value': technical_value
             }
         
-        print(f"[SQL Semantic] Loaded metadata for {len(rule_metadata):,} rules")
         logger.info(f"[SQL Semantic] Loaded metadata for {len(rule_metadata)} rules")
+        return rule_metadata
+    
+    def build_and_update_semantic_data(
+        self,
+        matches_with_rules: List[Tuple[str, str]],
+        rule_metadata: Optional[Dict[str, Dict[str, Any]]] = None,
+        verbose: bool = True
+    ) -> int:
+        """
+        Build semantic data and update matches in bulk.
+        
+        Args:
+            matches_with_rules: List of (match_id, matched_rule_ids) tuples
+            rule_metadata: Rule metadata from _load_rule_metadata() (loaded if None)
+            verbose: Print progress (callers writing many batches pass False)
+            
+        Returns:
+            Number of matches updated
+        """
+        if verbose:
+            print("")
+            print("[SQL Semantic] Building semantic data...")
+        logger.info("[SQL Semantic] Starting semantic data building")
+        
+        start_time = time.time()
+        
+        if rule_metadata is None:
+            rule_metadata = self._load_rule_metadata()
+            if verbose:
+                print(f"[SQL Semantic] Loaded metadata for {len(rule_metadata):,} rules")
         
         # Build semantic data for each match with progress reporting
-        print("[SQL Semantic] Building semantic data...")
+        if verbose:
+            print("[SQL Semantic] Building semantic data...")
         
         update_data = []
         build_errors = 0
@@ -1641,14 +1357,9 @@ class SQLSemanticMapper:
         
         # Guard against empty matches
         if total_matches == 0:
-            print("[SQL Semantic] No matches to process")
-            return {
-                'identities_processed': 0,
-                'mappings_applied': 0,
-                'matches_updated': 0,
-                'processing_time': 0,
-                'errors': 0
-            }
+            if verbose:
+                print("[SQL Semantic] No matches to process")
+            return 0
         
         progress_interval = max(1, total_matches // 20)  # 5% increments (100% / 20 = 5%)
         
@@ -1696,7 +1407,7 @@ class SQLSemanticMapper:
                     print(f"[SQL Semantic] ERROR building data for match {match_id}: {e}")
             
             # Progress reporting every 5%
-            if (idx + 1) % progress_interval == 0 or idx == total_matches - 1:
+            if verbose and ((idx + 1) % progress_interval == 0 or idx == total_matches - 1):
                 progress_pct = ((idx + 1) / total_matches) * 100
                 print(f"[SQL Semantic] Building progress: {progress_pct:.0f}% ({idx + 1:,}/{total_matches:,} processed, {len(update_data):,} with semantic data)")
                 logger.info(f"[SQL Semantic] Build progress: {progress_pct:.0f}% - {len(update_data)} matches with semantic data")
@@ -1712,24 +1423,20 @@ class SQLSemanticMapper:
             print(f"[SQL Semantic] WARNING: {build_errors} errors occurred during data building")
             logger.warning(f"[SQL Semantic] {build_errors} errors during data building")
         
-        print("")
-        print(f"[SQL Semantic] Built semantic data for {len(update_data):,} matches")
+        if verbose:
+            print("")
+            print(f"[SQL Semantic] Built semantic data for {len(update_data):,} matches")
+            print("[SQL Semantic] Updating database...")
         logger.info(f"[SQL Semantic] Built semantic data for {len(update_data)} matches")
-        print(f"[SQL Semantic] Updating database...")
         
         # Update in batches with progress reporting and error handling
         # Commit per batch for better error recovery and memory management (Requirement 4.2)
         
         # Guard against empty update_data
         if not update_data:
-            print("[SQL Semantic] No semantic data to update")
-            return {
-                'identities_processed': 0,
-                'mappings_applied': 0,
-                'matches_updated': 0,
-                'processing_time': time.time() - start_time,
-                'errors': build_errors
-            }
+            if verbose:
+                print("[SQL Semantic] No semantic data to update")
+            return 0
         
         batch_size = self.config.get('batch_size', 1000)
         total_batches = (len(update_data) + batch_size - 1) // batch_size
@@ -1759,7 +1466,7 @@ class SQLSemanticMapper:
                     self._log_batch_progress(batch_num, total_batches, len(batch), successful_updates)
                     
                     # Progress reporting every 5%
-                    if batch_num % progress_interval == 0 or batch_num == total_batches:
+                    if verbose and (batch_num % progress_interval == 0 or batch_num == total_batches):
                         progress_pct = (successful_updates / len(update_data)) * 100
                         print(f"[SQL Semantic] Database update progress: {progress_pct:.0f}% ({successful_updates:,}/{len(update_data):,} records updated)")
                         logger.info(f"[SQL Semantic] Update progress: {progress_pct:.0f}% - {successful_updates} records updated")
@@ -1856,9 +1563,10 @@ class SQLSemanticMapper:
         
         elapsed = time.time() - start_time
         
-        print("")
-        print(f"[SQL Semantic] Database update complete in {elapsed:.2f} seconds")
-        print(f"[SQL Semantic] Successfully updated {successful_updates:,} matches with semantic data")
+        if verbose:
+            print("")
+            print(f"[SQL Semantic] Database update complete in {elapsed:.2f} seconds")
+            print(f"[SQL Semantic] Successfully updated {successful_updates:,} matches with semantic data")
         
         if update_errors > 0:
             print(f"[SQL Semantic] WARNING: {update_errors} batch errors occurred during database update")
@@ -1895,11 +1603,24 @@ class SQLSemanticMapper:
             # Step 1: Create semantic rules table
             rule_count = self.create_semantic_rules_table(rules)
             
-            # Step 2: Find matches using proper regex matching
-            matches_with_rules = self.find_matches_with_semantic_rules()
+            # Steps 2 and 3: Find matches using proper regex matching in worker
+            # processes while this process, the single writer, builds and
+            # updates their semantic data in batches
+            rule_metadata = self._load_rule_metadata()
+            write_batch_size = self.config.get('batch_size', 1000)
+            matches_updated = 0
+            pending = []
+            
+            for chunk_results in self.iter_matches_with_semantic_rules():
+                pending.extend(chunk_results)
+                if len(pending) >= write_batch_size:
+                    matches_updated += self.build_and_update_semantic_data(pending, rule_metadata, verbose=False)
+                    pending = []
+            
+            if pending:
+                matches_updated += self.build_and_update_semantic_data(pending, rule_metadata, verbose=False)
             
-            # Step 3: Build and update semantic data
-            matches_updated = self.build_and_update_semantic_data(matches_with_rules)
+            print(f"[SQL Semantic] Updated {matches_updated:,} matches with semantic data")
             
             total_time = time.time() - total_start
             
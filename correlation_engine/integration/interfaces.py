@@ -63,7 +63,28 @@ class IScoringIntegration(ABC):
             }
         """
         pass
-    
+
+    def calculate_batch_match_scores(self,
+                                     match_records_list: List[Dict[str, Dict]],
+                                     wing_config: Any,
+                                     case_id: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Calculate weighted scores for a batch of matches.
+
+        Implementations should override this with a batched calculation;
+        the default scores the matches one at a time.
+
+        Args:
+            match_records_list: feather_records of each match
+            wing_config: Wing configuration with weights
+            case_id: Optional case ID for case-specific configuration
+
+        Returns:
+            Score result of each match, in order (see calculate_match_scores)
+        """
+        return [self.calculate_match_scores(match_records, wing_config, case_id)
+                for match_records in match_records_list]
+
     @abstractmethod
     def reload_configuration(self) -> bool:
         """
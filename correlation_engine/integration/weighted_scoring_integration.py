@@ -12,6 +12,7 @@ from typing import Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass
 import json
 
+from ..engine.score_matrix import ScoreThresholds
 from ..engine.weighted_scoring import WeightedScoringEngine
 from .integration_error_handler import IntegrationErrorHandler, FallbackStrategy
 from .integration_monitor import IntegrationMonitor
@@ -465,6 +466,158 @@ class WeightedScoringIntegration(IScoringIntegration):
             self.stats.fallback_to_simple_count += 1
             return self._calculate_simple_score(match_records, wing_config)
     
+    def calculate_batch_match_scores(self,
+                                     match_records_list: List[Dict[str, Dict]],
+                                     wing_config: Any,
+                                     case_id: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Calculate weighted scores for a batch of matches (e.g. one window or identity).
+        
+        The configuration is resolved, validated and applied once per batch;
+        scores come from one feather-presence matrix product and interpretations
+        from one threshold lookup. Each result is the same as
+        calculate_match_scores() gives for that match.
+        
+        Args:
+            match_records_list: feather_records (feather_id -> record) of each match
+            wing_config: Wing configuration with weights
+            case_id: Optional case ID for case-specific configuration
+            
+        Returns:
+            Score result of each match, in order
+        """
+        if not match_records_list:
+            return []
+        if len(match_records_list) == 1:
+            return [self.calculate_match_scores(match_records_list[0], wing_config, case_id)]
+        
+        batch_size = len(match_records_list)
+        operation_id = self.monitor.start_operation(
+            "weighted_scoring",
+            "calculate_batch_match_scores",
+            context={'batch_size': batch_size, 'case_id': case_id},
+            input_size=batch_size
+        )
+        
+        start_time = time.time()
+        
+        try:
+            effective_config = self.get_scoring_configuration(case_id)
+            
+            validation_result = self.validate_scoring_configuration(wing_config, effective_config)
+            if not validation_result['valid']:
+                logger.warning(f"Wing configuration validation failed for batch of {batch_size}: {validation_result['errors']}")
+                self.stats.validation_failures += 1
+                wing_config = self._apply_configuration_fixes(wing_config, validation_result['fixes'])
+            
+            use_weighted_scoring = getattr(wing_config, 'use_weighted_scoring', True)
+            
+            if not effective_config.enabled or use_weighted_scoring is False:
+                self.stats.fallback_to_simple_count += batch_size
+                results = self._calculate_simple_scores(match_records_list, wing_config)
+                operation_name = "calculate_batch_match_scores_fallback"
+            else:
+                wing_config = self._apply_case_specific_weights(wing_config, effective_config)
+                
+                # Use the existing WeightedScoringEngine, one batch at a time
+                results = self.scoring_engine.calculate_batch_scores(match_records_list, wing_config)
+                
+                scores = [result.get('score', 0.0) for result in results]
+                levels = ScoreThresholds(effective_config.score_interpretation).lookup(scores)
+                
+                # Interpretations are shared by matches with the same score
+                interpretations: Dict[Tuple[float, Optional[str]], Dict[str, Any]] = {}
+                for result, score, level in zip(results, scores, levels):
+                    interpretation_info = interpretations.get((score, level))
+                    if interpretation_info is None:
+                        interpretation_info = self._interpretation_for_level(score, level, effective_config)
+                        interpretations[(score, level)] = interpretation_info
+                    
+                    result['scoring_mode'] = 'weighted'
+                    result['interpretation'] = interpretation_info['label']
+                    result['interpretation_details'] = interpretation_info
+                    result['tier'] = interpretation_info['tier']
+                    result['confidence_percentage'] = interpretation_info['confidence_percentage']
+                    result['description'] = interpretation_info['description']
+                
+                self._record_batch_statistics(scores)
+                operation_name = "calculate_batch_match_scores"
+            
+            if logger.isEnabledFor(logging.DEBUG):
+                first_match_number = self.stats.total_matches_scored - batch_size + 1
+                for offset, result in enumerate(results):
+                    self.log_scoring_calculation(f"match_{first_match_number + offset}", result, wing_config, case_id)
+            
+            execution_time_ms = (time.time() - start_time) * 1000
+            self.monitor.record_weighted_scoring_metrics(
+                operation_name=operation_name,
+                matches_scored=batch_size,
+                scores_calculated=batch_size,
+                execution_time_ms=execution_time_ms,
+                average_score=sum(result.get('score', 0) for result in results) / batch_size
+            )
+            self.monitor.complete_operation(operation_id, success=True)
+            
+            return results
+            
+        except Exception as e:
+            self.monitor.complete_operation(operation_id, success=False, error_message=str(e))
+            logger.error(f"Batch weighted scoring failed, scoring {batch_size} matches one by one: {e}")
+            
+            # Per-match scoring has its own error handling and fallbacks
+            return [self.calculate_match_scores(match_records, wing_config, case_id)
+                    for match_records in match_records_list]
+    
+    def _record_batch_statistics(self, scores: List[float]):
+        """Update scoring statistics with the scores of one batch"""
+        previous_count = self.stats.scores_calculated
+        self.stats.total_matches_scored += len(scores)
+        self.stats.scores_calculated += len(scores)
+        
+        highest = max(scores)
+        if highest > self.stats.highest_score:
+            self.stats.highest_score = highest
+        for score in scores:
+            if self.stats.lowest_score == 0.0 or score < self.stats.lowest_score:
+                self.stats.lowest_score = score
+        
+        self.stats.average_score = (
+            (self.stats.average_score * previous_count + sum(scores)) / self.stats.scores_calculated
+        )
+        
+        if self.case_specific_config:
+            self.stats.case_specific_configs_used += len(scores)
+        else:
+            self.stats.global_configs_used += len(scores)
+    
+    def _calculate_simple_scores(self,
+                                 match_records_list: List[Dict[str, Dict]],
+                                 wing_config: Any) -> List[Dict[str, Any]]:
+        """
+        Calculate simple count-based scores for a batch of matches.
+        
+        Matches with the same feathers share their breakdown.
+        
+        Args:
+            match_records_list: feather_records of each match
+            wing_config: Wing configuration
+            
+        Returns:
+            Simple score result of each match, in order
+        """
+        results = []
+        breakdowns: Dict[frozenset, Dict[str, Any]] = {}
+        for match_records in match_records_list:
+            if not isinstance(match_records, dict):
+                results.append(self._calculate_simple_score(match_records, wing_config))
+                continue
+            pattern = frozenset(match_records)
+            template = breakdowns.get(pattern)
+            if template is None:
+                template = breakdowns[pattern] = self._calculate_simple_score(match_records, wing_config)
+            results.append(dict(template))
+        return results
+    
     def _calculate_simple_score(self, 
                               match_records: Dict[str, Dict],
                               wing_config: Any) -> Dict[str, Any]:
@@ -920,28 +1073,7 @@ class WeightedScoringIntegration(IScoringIntegration):
                     best_match = level
                     best_min_score = min_score
             
-            if best_match:
-                interpretation_config = effective_config.score_interpretation[best_match]
-                return {
-                    'level': best_match,
-                    'label': interpretation_config.get('label', best_match.title()),
-                    'min_threshold': interpretation_config.get('min', 0.0),
-                    'score': score,
-                    'confidence_percentage': min(100.0, (score / 1.0) * 100),  # Assuming max score is 1.0
-                    'tier': self._get_score_tier(score, effective_config),
-                    'description': self._generate_score_description(score, best_match, interpretation_config)
-                }
-            else:
-                # Fallback interpretation
-                return {
-                    'level': 'unknown',
-                    'label': 'Unknown',
-                    'min_threshold': 0.0,
-                    'score': score,
-                    'confidence_percentage': 0.0,
-                    'tier': 4,
-                    'description': f'Score {score:.3f} does not match any configured interpretation level'
-                }
+            return self._interpretation_for_level(score, best_match, effective_config)
                 
         except Exception as e:
             logger.error(f"Failed to interpret score {score}: {e}")
@@ -955,6 +1087,44 @@ class WeightedScoringIntegration(IScoringIntegration):
                 'description': f'Error interpreting score: {str(e)}'
             }
     
+    def _interpretation_for_level(self,
+                                  score: float,
+                                  level: Optional[str],
+                                  effective_config: ScoringConfiguration) -> Dict[str, Any]:
+        """
+        Interpretation information of a score at its interpretation level.
+        
+        Args:
+            score: Score value
+            level: Interpretation level reached by the score (None for none)
+            effective_config: Effective scoring configuration
+            
+        Returns:
+            Dictionary with interpretation information
+        """
+        if level:
+            interpretation_config = effective_config.score_interpretation[level]
+            return {
+                'level': level,
+                'label': interpretation_config.get('label', level.title()),
+                'min_threshold': interpretation_config.get('min', 0.0),
+                'score': score,
+                'confidence_percentage': min(100.0, (score / 1.0) * 100),  # Assuming max score is 1.0
+                'tier': self._get_score_tier(score, effective_config),
+                'description': self._generate_score_description(score, level, interpretation_config)
+            }
+        
+        # Fallback interpretation
+        return {
+            'level': 'unknown',
+            'label': 'Unknown',
+            'min_threshold': 0.0,
+            'score': score,
+            'confidence_percentage': 0.0,
+            'tier': 4,
+            'description': f'Score {score:.3f} does not match any configured interpretation level'
+        }
+    
     def _get_score_tier(self, score: float, config: ScoringConfiguration) -> int:
         """
         Get tier number for a score based on interpretation levels.
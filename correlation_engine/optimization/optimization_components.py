@@ -326,7 +326,8 @@ class EmptyWindowDetector:
                 continue
             
             feathers_checked += 1
-            if query_manager.has_timestamp_index():
+            # A time-bucket histogram answers range counts without touching the table
+            if getattr(query_manager, 'time_histogram', None) is not None or query_manager.has_timestamp_index():
                 feathers_with_indexes += 1
             else:
                 if self.debug_mode:
@@ -39,6 +39,7 @@ class PerformanceConfig:
     max_workers: Optional[int] = None  # None = auto-detect
     enable_parallel: bool = True
     parallel_threshold_windows: int = 100  # Min windows for parallel to be worth it
+    parallel_backend: str = "thread"  # "thread" or "process" (process pool avoids the GIL)
 
     # Memory management (Requirement 8.4)
     memory_threshold_mb: int = 4096
@@ -52,6 +53,17 @@ class PerformanceConfig:
 
     # Empty window detection
     enable_empty_window_skipping: bool = True
+    # Persisted per-feather time-bucket histogram: O(1) empty-range checks and task sizing
+    enable_time_histogram_index: bool = True
+
+    # Window scanning strategy: stream each feather once instead of one query per window
+    enable_sweep_line_scanning: bool = False
+
+    # Resumable scans (opt-in): stream matches from the first window and checkpoint progress
+    # (every N windows or T seconds, whichever comes first) when an output directory is set
+    enable_scan_checkpoints: bool = False
+    scan_checkpoint_interval_windows: int = 100
+    scan_checkpoint_interval_seconds: float = 30.0
 
     # Profiling
     enable_profiling: bool = True
@@ -91,6 +103,9 @@ class PerformanceConfig:
         if self.parallel_threshold_windows < 1:
             errors.append("parallel_threshold_windows must be >= 1")
 
+        if self.parallel_backend not in ("thread", "process"):
+            errors.append("parallel_backend must be 'thread' or 'process'")
+
         # Memory threshold validation
         if self.memory_threshold_mb < 1024:
             errors.append("memory_threshold_mb must be >= 1024 (1 GB)")
@@ -113,6 +128,12 @@ class PerformanceConfig:
         if self.timestamp_cache_size < 0:
             errors.append("timestamp_cache_size must be >= 0")
 
+        # Scan checkpoint validation
+        if self.scan_checkpoint_interval_windows < 1:
+            errors.append("scan_checkpoint_interval_windows must be >= 1")
+        if self.scan_checkpoint_interval_seconds <= 0:
+            errors.append("scan_checkpoint_interval_seconds must be > 0")
+
         return errors
 
     @staticmethod
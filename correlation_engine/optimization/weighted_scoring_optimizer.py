@@ -223,40 +223,26 @@ class OptimizedWeightedScoringEngine:
             return [(match_id, self.calculate_match_score_optimized(match_records, wing_config))
                    for match_id, match_records in matches]
         
-        start_time = time.time()
-        results = []
+        scoring_config = getattr(wing_config, 'scoring', {})
+        if not scoring_config.get('enabled', False):
+            # Simple count scoring is cached per feather combination
+            return [(match_id, self.calculate_match_score_optimized(match_records, wing_config))
+                   for match_id, match_records in matches]
         
-        # Get optimized config once for all matches
-        optimized_config = self._get_optimized_config(wing_config)
+        start_time = time.time()
         
-        # Group matches by pattern for better cache utilization
-        pattern_groups = defaultdict(list)
-        for match_id, match_records in matches:
-            pattern = frozenset(match_records.keys())
-            pattern_groups[pattern].append((match_id, match_records))
-        
-        # Process each pattern group
-        for pattern, pattern_matches in pattern_groups.items():
-            # Calculate score for first match in pattern
-            first_match_id, first_match_records = pattern_matches[0]
-            first_result = self.calculate_match_score_optimized(first_match_records, wing_config)
-            results.append((first_match_id, first_result))
-            
-            # For remaining matches with same pattern, reuse calculation structure
-            if len(pattern_matches) > 1:
-                for match_id, match_records in pattern_matches[1:]:
-                    # Quick calculation since pattern is the same
-                    result = self._calculate_score_with_pattern_reuse(
-                        match_records, optimized_config, first_result
-                    )
-                    results.append((match_id, result))
+        # One presence-matrix product for the whole batch, no per-match cache keys
+        scores = self.base_engine.calculate_batch_scores(
+            [match_records for _, match_records in matches], wing_config
+        )
+        results = [(match_id, score) for (match_id, _), score in zip(matches, scores)]
         
+        self.metrics.total_calculations += len(matches)
         self.metrics.batch_operations += 1
         batch_time = (time.time() - start_time) * 1000
         self.metrics.total_processing_time_ms += batch_time
         
-        logger.debug(f"Batch calculated {len(matches)} scores in {batch_time:.2f}ms "
-                    f"({len(pattern_groups)} unique patterns)")
+        logger.debug(f"Batch calculated {len(matches)} scores in {batch_time:.2f}ms")
         
         return results
     
@@ -397,38 +383,6 @@ class OptimizedWeightedScoringEngine:
             'scoring_mode': 'simple_count'
         }
     
-    def _calculate_score_with_pattern_reuse(self, 
-                                          match_records: Dict[str, Dict],
-                                          optimized_config: OptimizedWingConfig,
-                                          template_result: Dict[str, Any]) -> Dict[str, Any]:
-        """
-        Calculate score by reusing the structure from a template result.
-        
-        Args:
-            match_records: Dictionary of feather_id -> record
-            optimized_config: Optimized wing configuration
-            template_result: Template result to reuse structure from
-            
-        Returns:
-            Dictionary with score, interpretation, and breakdown
-        """
-        # Since the pattern is the same, we can reuse most of the calculation
-        # Only need to verify the matched feathers are the same
-        template_breakdown = template_result.get('breakdown', {})
-        
-        # Quick verification that the pattern matches
-        matched_feathers_template = {fid for fid, details in template_breakdown.items() if details.get('matched', False)}
-        matched_feathers_current = set(match_records.keys())
-        
-        if matched_feathers_template == matched_feathers_current:
-            # Pattern matches exactly, can reuse the result
-            return template_result.copy()
-        else:
-            # Pattern doesn't match exactly, fall back to full calculation
-            return self._calculate_weighted_score_optimized(
-                match_records, optimized_config, {'enabled': True}
-            )
-    
     @lru_cache(maxsize=1000)
     def _interpret_score_cached(self, score: float, interpretation_config_str: str) -> str:
         """
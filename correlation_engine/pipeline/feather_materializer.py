@@ -0,0 +1,328 @@
+"""
+Feather Materialization for Pipelines
+
+Builds the feather database of every FeatherConfig in a pipeline from its
+source database: the selected columns of source_table are streamed through
+FeatherDatabase.insert_data with the configured column mapping, the column
+named by timestamp_column is imported as DATETIME so it gets its epoch
+companion column.
+
+Builds are incremental. Each feather stores a fingerprint of its source
+database (path, size and modification time, including a WAL file) and of
+the mapping fields of its FeatherConfig in feather_metadata under
+'source_fingerprint'. On re-runs a feather whose fingerprint is unchanged
+is skipped, so adding one artifact to a pipeline only builds that feather.
+
+Feathers that exist without a fingerprint were built outside the pipeline
+(Feather Builder UI) and are left untouched.
+
+Builds run concurrently in worker processes ('spawn', like the rest of the
+application). Each build writes to <output>.building and replaces the output
+only when it is complete, so a failed build never leaves a partial feather.
+"""
+
+import hashlib
+import json
+import multiprocessing
+import os
+import sqlite3
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from ..config import FeatherConfig
+
+FINGERPRINT_METADATA_KEY = 'source_fingerprint'
+
+# Bump when the build itself changes so existing feathers are rebuilt
+MATERIALIZER_VERSION = 1
+
+# FeatherConfig fields that change the content of the built feather
+FINGERPRINT_FIELDS = (
+    'feather_name', 'artifact_type', 'source_table', 'selected_columns',
+    'column_mapping', 'timestamp_column', 'timestamp_format',
+    'application_column', 'path_column'
+)
+
+MAX_BUILD_WORKERS = 4
+
+# Result statuses
+STATUS_BUILT = 'built'
+STATUS_UNCHANGED = 'unchanged'
+STATUS_EXTERNAL = 'external'
+STATUS_MISSING_SOURCE = 'missing_source'
+STATUS_FAILED = 'failed'
+
+
+@dataclass
+class FeatherMaterializationResult:
+    """Outcome of materializing one FeatherConfig"""
+    config_name: str
+    feather_name: str
+    output_database: str
+    status: str
+    records: int = 0
+    elapsed_seconds: float = 0.0
+    error: Optional[str] = None
+
+    @property
+    def usable(self) -> bool:
+        """True if output_database holds a feather the wings can use"""
+        return self.status in (STATUS_BUILT, STATUS_UNCHANGED, STATUS_EXTERNAL)
+
+
+def compute_feather_fingerprint(config: Dict[str, Any]) -> Optional[str]:
+    """
+    Fingerprint a feather config's source database and mapping.
+
+    Args:
+        config: FeatherConfig as a dictionary
+
+    Returns:
+        Hex digest, or None if the source database does not exist
+    """
+    source = Path(config['source_database'])
+    try:
+        stat = source.stat()
+    except OSError:
+        return None
+
+    parts = {
+        'version': MATERIALIZER_VERSION,
+        'source': str(source.resolve()),
+        'size': stat.st_size,
+        'mtime_ns': stat.st_mtime_ns,
+        'mapping': {name: config.get(name) for name in FINGERPRINT_FIELDS}
+    }
+
+    # Sources in WAL mode change without touching the main file
+    wal = Path(f"{source}-wal")
+    if wal.exists():
+        wal_stat = wal.stat()
+        parts['wal'] = [wal_stat.st_size, wal_stat.st_mtime_ns]
+
+    return hashlib.sha256(json.dumps(parts, sort_keys=True, default=str).encode('utf-8')).hexdigest()
+
+
+def read_feather_fingerprint(database_path: str) -> Optional[str]:
+    """Fingerprint stored in a feather, or None if it has none."""
+    try:
+        conn = sqlite3.connect(f"file:{database_path}?mode=ro", uri=True)
+        try:
+            row = conn.execute(
+                "SELECT value FROM feather_metadata WHERE key = ?", (FINGERPRINT_METADATA_KEY,)
+            ).fetchone()
+        finally:
+            conn.close()
+    except sqlite3.Error:
+        return None
+    return row[0] if row else None
+
+
+def build_feather(config: Dict[str, Any], fingerprint: str) -> FeatherMaterializationResult:
+    """
+    Build one feather from its source database (runs in a worker process).
+
+    Args:
+        config: FeatherConfig as a dictionary
+        fingerprint: Fingerprint to store in the built feather
+
+    Returns:
+        FeatherMaterializationResult with status 'built' or 'failed'
+    """
+    from ..feather.database import FeatherDatabase
+
+    started = time.perf_counter()
+    result = FeatherMaterializationResult(
+        config_name=config['config_name'],
+        feather_name=config['feather_name'],
+        output_database=config['output_database'],
+        status=STATUS_FAILED
+    )
+
+    output = Path(config['output_database'])
+    temp_path = output.with_name(output.name + '.building')
+    source = None
+    feather_db = None
+
+    try:
+        output.parent.mkdir(parents=True, exist_ok=True)
+        if temp_path.exists():
+            temp_path.unlink()
+
+        source = sqlite3.connect(f"file:{config['source_database']}?mode=ro", uri=True)
+        source_table = config['source_table']
+        source_types = {
+            row[1]: row[2] for row in source.execute(f'PRAGMA table_info("{source_table}")')
+        }
+        if not source_types:
+            raise ValueError(f"Table '{source_table}' not found in {config['source_database']}")
+
+        selected_columns = config.get('selected_columns') or list(source_types)
+        missing = [column for column in selected_columns if column not in source_types]
+        if missing:
+            raise ValueError(f"Columns not found in '{source_table}': {', '.join(missing)}")
+
+        column_mapping = config.get('column_mapping') or {}
+        columns = [
+            {
+                'original': column,
+                'feather': column_mapping.get(column) or column,
+                'type': 'DATETIME' if column == config.get('timestamp_column') else (source_types[column] or 'TEXT')
+            }
+            for column in selected_columns
+        ]
+
+        # Build next to the output and swap it in when complete
+        feather_db = FeatherDatabase(str(output.parent), config['feather_name'])
+        feather_db.full_path = str(temp_path)
+        feather_db.connect()
+        feather_db.create_base_schema()
+        feather_db.create_feather_table(source_table, columns)
+
+        column_list = ', '.join(f'"{column}"' for column in selected_columns)
+        source_cursor = source.execute(f'SELECT {column_list} FROM "{source_table}"')
+        source_info = {
+            'source_type': 'database',
+            'source_path': config['source_database'],
+            'source_tool': 'PipelineExecutor',
+            'artifact_type': config['artifact_type']
+        }
+        success, error = feather_db.insert_data(source_table, source_cursor, source_info, columns)
+        if not success:
+            raise RuntimeError(error)
+
+        feather_db.cursor.execute(
+            "INSERT OR REPLACE INTO feather_metadata (key, value) VALUES (?, ?)",
+            (FINGERPRINT_METADATA_KEY, fingerprint)
+        )
+        feather_db.connection.commit()
+        feather_db.close()
+        result.records = feather_db.last_import_stats.rows_inserted
+        feather_db = None
+
+        os.replace(temp_path, output)
+
+        result.status = STATUS_BUILT
+    except Exception as e:
+        result.error = str(e)
+        if feather_db is not None:
+            feather_db.close()
+        if temp_path.exists():
+            temp_path.unlink()
+    finally:
+        if source is not None:
+            source.close()
+        result.elapsed_seconds = time.perf_counter() - started
+
+    return result
+
+
+class FeatherMaterializer:
+    """
+    Builds the feathers of a pipeline, skipping feathers that are up to date.
+
+    Usage:
+        >>> materializer = FeatherMaterializer()
+        >>> results = materializer.materialize(pipeline_config.feather_configs)
+        >>> [r.output_database for r in results if r.usable]
+    """
+
+    def __init__(self, max_workers: Optional[int] = None, verbose: bool = False):
+        """
+        Initialize the materializer.
+
+        Args:
+            max_workers: Worker processes for concurrent builds
+                (min(CPU count, MAX_BUILD_WORKERS) if None)
+            verbose: Print one line per feather
+        """
+        self.max_workers = max_workers or min(os.cpu_count() or 1, MAX_BUILD_WORKERS)
+        self.verbose = verbose
+
+    def materialize(self, feather_configs: List[FeatherConfig]) -> List[FeatherMaterializationResult]:
+        """
+        Build every feather whose source or mapping changed since its last build.
+
+        Args:
+            feather_configs: Feather configurations of the pipeline
+
+        Returns:
+            One result per configuration, in the same order
+        """
+        results: List[Optional[FeatherMaterializationResult]] = [None] * len(feather_configs)
+        pending = []
+
+        for index, feather_config in enumerate(feather_configs):
+            config = feather_config.to_dict()
+            fingerprint = compute_feather_fingerprint(config)
+
+            status = None
+            if fingerprint is None:
+                status = STATUS_MISSING_SOURCE
+            elif Path(feather_config.output_database).exists():
+                existing = read_feather_fingerprint(feather_config.output_database)
+                if existing is None:
+                    status = STATUS_EXTERNAL
+                elif existing == fingerprint:
+                    status = STATUS_UNCHANGED
+
+            if status is None:
+                pending.append((index, config, fingerprint))
+                continue
+
+            results[index] = FeatherMaterializationResult(
+                config_name=feather_config.config_name,
+                feather_name=feather_config.feather_name,
+                output_database=feather_config.output_database,
+                status=status
+            )
+            self._report(results[index])
+
+        workers = min(self.max_workers, len(pending))
+        if workers <= 1:
+            for index, config, fingerprint in pending:
+                results[index] = build_feather(config, fingerprint)
+                self._report(results[index])
+        else:
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context('spawn')
+            ) as executor:
+                futures = {
+                    executor.submit(build_feather, config, fingerprint): (index, config)
+                    for index, config, fingerprint in pending
+                }
+                for future in as_completed(futures):
+                    index, config = futures[future]
+                    try:
+                        results[index] = future.result()
+                    except Exception as e:
+                        # The worker process itself failed
+                        results[index] = FeatherMaterializationResult(
+                            config_name=config['config_name'],
+                            feather_name=config['feather_name'],
+                            output_database=config['output_database'],
+                            status=STATUS_FAILED,
+                            error=str(e)
+                        )
+                    self._report(results[index])
+
+        return results
+
+    def _report(self, result: FeatherMaterializationResult):
+        if not self.verbose:
+            return
+        if result.status == STATUS_BUILT:
+            print(f"      ✓ Built {result.feather_name}: {result.records:,} records "
+                  f"in {result.elapsed_seconds:.1f}s")
+        elif result.status == STATUS_UNCHANGED:
+            print(f"      ✓ Unchanged {result.feather_name} (skipped)")
+        elif result.status == STATUS_EXTERNAL:
+            print(f"      ✓ Using existing {result.feather_name} (not built by the pipeline)")
+        elif result.status == STATUS_MISSING_SOURCE:
+            print(f"      ✗ Source database not found for {result.feather_name}")
+        else:
+            print(f"      ✗ Error building {result.feather_name}: {result.error}")
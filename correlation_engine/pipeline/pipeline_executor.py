@@ -14,6 +14,15 @@ from ..engine import CorrelationEngine, CorrelationResult
 from ..engine.engine_selector import EngineSelector, EngineType
 from ..engine.base_engine import FilterConfig, BaseCorrelationEngine
 from ..wings.core.wing_model import Wing, FeatherSpec, CorrelationRules
+from .feather_materializer import (
+    FeatherMaterializer,
+    FeatherMaterializationResult,
+    STATUS_BUILT,
+    STATUS_UNCHANGED,
+    STATUS_EXTERNAL,
+    STATUS_MISSING_SOURCE,
+    STATUS_FAILED
+)
 
 
 class PipelineExecutor:
@@ -84,6 +93,7 @@ class PipelineExecutor:
         self.results: List[CorrelationResult] = []
         self.errors: List[str] = []
         self.warnings: List[str] = []
+        self.materialization_results: List[FeatherMaterializationResult] = []
         self.progress_widget = None  # Optional progress display widget
         self.verbose = False  # Set to True for debug output
     
@@ -383,43 +393,47 @@ class PipelineExecutor:
     
     def _create_feathers(self) -> Dict[str, str]:
         """
-        Create feather databases from configurations.
+        Build feather databases from configurations.
+        
+        Feathers are built concurrently in worker processes; feathers whose
+        source database and mapping are unchanged since their last build are
+        skipped (see feather_materializer).
         
         Returns:
             Dictionary mapping feather_config_name -> database_path
         """
         feather_paths = {}
+        started = time.time()
         
-        for i, feather_config in enumerate(self.config.feather_configs, 1):
-            if self.verbose:
-                print(f"  [{i}/{len(self.config.feather_configs)}] Creating {feather_config.feather_name}...")
+        materializer = FeatherMaterializer(verbose=self.verbose)
+        results = materializer.materialize(self.config.feather_configs)
+        self.materialization_results = results
+        
+        for feather_config, result in zip(self.config.feather_configs, results):
+            if result.status == STATUS_MISSING_SOURCE:
+                self.warnings.append(
+                    f"Source database not found for {feather_config.feather_name}: "
+                    f"{feather_config.source_database}"
+                )
+                continue
             
-            try:
-                # In a real implementation, this would:
-                # 1. Load source data
-                # 2. Apply transformations
-                # 3. Create feather database
-                # For now, we'll just validate the config
-                
-                if not Path(feather_config.source_database).exists():
-                    self.warnings.append(
-                        f"Source database not found for {feather_config.feather_name}: "
-                        f"{feather_config.source_database}"
-                    )
-                    continue
-                
-                # Store the output path - map by BOTH config_name AND feather_name
-                feather_paths[feather_config.config_name] = feather_config.output_database
-                feather_paths[feather_config.feather_name] = feather_config.output_database
-                
-                if self.verbose:
-                    print(f"      ✓ Created: {feather_config.output_database}")
-                
-            except Exception as e:
-                error_msg = f"Failed to create feather {feather_config.feather_name}: {str(e)}"
-                self.errors.append(error_msg)
-                if self.verbose:
-                    print(f"      ✗ Error: {str(e)}")
+            if not result.usable:
+                self.errors.append(f"Failed to create feather {feather_config.feather_name}: {result.error}")
+                continue
+            
+            # Store the output path - map by BOTH config_name AND feather_name
+            feather_paths[feather_config.config_name] = feather_config.output_database
+            feather_paths[feather_config.feather_name] = feather_config.output_database
+        
+        status_counts = {}
+        for result in results:
+            status_counts[result.status] = status_counts.get(result.status, 0) + 1
+        print(
+            f"[PipelineExecutor] Feathers: {status_counts.get(STATUS_BUILT, 0)} built, "
+            f"{status_counts.get(STATUS_UNCHANGED, 0)} unchanged, "
+            f"{status_counts.get(STATUS_EXTERNAL, 0)} existing, "
+            f"{status_counts.get(STATUS_FAILED, 0)} failed ({time.time() - started:.1f}s)"
+        )
         
         return feather_paths
 
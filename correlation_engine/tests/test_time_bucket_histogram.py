@@ -0,0 +1,157 @@
+"""
+Tests for the time-bucket histogram index.
+
+The histogram must agree with the SQL range queries of OptimizedFeatherQuery
+whatever the local timezone of the host is.
+"""
+
+import os
+import sqlite3
+import time
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+import pytest
+
+from correlation_engine.engine.epoch_timestamps import (
+    EPOCH_TIMESTAMP_FORMAT, from_epoch_microseconds, to_epoch_microseconds
+)
+from correlation_engine.engine.time_based_engine import OptimizedFeatherQuery
+from correlation_engine.engine.time_bucket_histogram import load_or_build_histogram
+
+
+@pytest.fixture
+def tokyo_timezone():
+    """Run the test with the host timezone set to UTC+9."""
+    if not hasattr(time, 'tzset'):
+        pytest.skip("time.tzset() is not available on this platform")
+    previous = os.environ.get('TZ')
+    os.environ['TZ'] = 'Asia/Tokyo'
+    time.tzset()
+    try:
+        yield
+    finally:
+        if previous is None:
+            os.environ.pop('TZ', None)
+        else:
+            os.environ['TZ'] = previous
+        time.tzset()
+
+
+def _unix_seconds_feather(values):
+    connection = sqlite3.connect(':memory:')
+    connection.execute("CREATE TABLE events (id INTEGER PRIMARY KEY, ts INTEGER)")
+    connection.executemany("INSERT INTO events (ts) VALUES (?)", [(v,) for v in values])
+    connection.commit()
+    return connection
+
+
+def _unix_seconds_query():
+    query = SimpleNamespace(timestamp_format='unix_s', debug_mode=False)
+    return lambda dt: OptimizedFeatherQuery._convert_datetime_for_query(query, dt)
+
+
+def _epoch_us_query():
+    query = SimpleNamespace(timestamp_format=EPOCH_TIMESTAMP_FORMAT, debug_mode=False)
+    return lambda dt: OptimizedFeatherQuery._convert_datetime_for_query(query, dt)
+
+
+def _sql_count(connection, convert, start, end, column='ts'):
+    return connection.execute(
+        f"SELECT COUNT(*) FROM events WHERE {column} >= ? AND {column} <= ?", (convert(start), convert(end))
+    ).fetchone()[0]
+
+
+def test_histogram_counts_match_sql_in_non_utc_timezone(tokyo_timezone):
+    first = datetime(2024, 1, 1, 12, 0, tzinfo=timezone.utc)
+    values = [int((first + timedelta(minutes=7 * i)).timestamp()) for i in range(50)]
+    connection = _unix_seconds_feather(values)
+    convert = _unix_seconds_query()
+
+    histogram = load_or_build_histogram(
+        connection, 'events', ['ts'], 'unix_s', convert,
+        lambda value: datetime.fromtimestamp(value, tz=timezone.utc)
+    )
+    assert histogram is not None
+
+    for start, end in [
+        (first - timedelta(minutes=30), first + timedelta(minutes=30)),
+        (first + timedelta(hours=1), first + timedelta(hours=2)),
+        (first + timedelta(minutes=3), first + timedelta(minutes=4)),
+        (first - timedelta(hours=10), first - timedelta(hours=9)),
+    ]:
+        sql_count = _sql_count(connection, convert, start, end)
+        estimate = histogram.count_in_range(start, end)
+        assert estimate >= sql_count
+        if sql_count:
+            assert estimate > 0
+
+    # Skipping ahead from before the data must stop at or before the first record
+    answered, empty_until = histogram.empty_until(first - timedelta(days=1))
+    assert answered
+    assert empty_until is not None and empty_until <= first
+    assert empty_until.utcoffset() == timedelta(0)
+
+
+def test_stored_histogram_is_reloaded_in_non_utc_timezone(tokyo_timezone):
+    first = datetime(2024, 3, 1, tzinfo=timezone.utc)
+    connection = _unix_seconds_feather([int(first.timestamp()) + 60 * i for i in range(10)])
+    convert = _unix_seconds_query()
+    parse = lambda value: datetime.fromtimestamp(value, tz=timezone.utc)
+
+    built = load_or_build_histogram(connection, 'events', ['ts'], 'unix_s', convert, parse)
+    loaded = load_or_build_histogram(connection, 'events', ['ts'], 'unix_s', convert, parse, build=False)
+
+    assert built.stats.columns_built == 1
+    assert loaded is not None and loaded.stats.columns_loaded == 1
+    window = (first, first + timedelta(minutes=5))
+    assert loaded.count_in_range(*window) == built.count_in_range(*window) > 0
+
+
+def test_tables_with_the_same_column_keep_separate_histograms():
+    first = datetime(2024, 5, 1, tzinfo=timezone.utc)
+    connection = _unix_seconds_feather([int(first.timestamp())])
+    connection.execute("CREATE TABLE other_events (id INTEGER PRIMARY KEY, ts INTEGER)")
+    connection.execute("INSERT INTO other_events (ts) VALUES (?)",
+                       (int((first + timedelta(days=30)).timestamp()),))
+    connection.commit()
+    convert = _unix_seconds_query()
+    parse = lambda value: datetime.fromtimestamp(value, tz=timezone.utc)
+
+    for table in ('events', 'other_events'):
+        load_or_build_histogram(connection, table, ['ts'], 'unix_s', convert, parse)
+
+    events = load_or_build_histogram(connection, 'events', ['ts'], 'unix_s', convert, parse, build=False)
+    other = load_or_build_histogram(connection, 'other_events', ['ts'], 'unix_s', convert, parse, build=False)
+
+    assert events is not None and other is not None
+    window = (first - timedelta(minutes=5), first + timedelta(minutes=5))
+    assert events.count_in_range(*window) == 1
+    assert other.count_in_range(*window) == 0
+
+
+def test_naive_bounds_on_epoch_column_are_read_as_utc(tokyo_timezone):
+    first = datetime(2024, 1, 1, 12, 0)
+    connection = sqlite3.connect(':memory:')
+    connection.execute("CREATE TABLE events (id INTEGER PRIMARY KEY, ts_epoch_us INTEGER)")
+    connection.executemany(
+        "INSERT INTO events (ts_epoch_us) VALUES (?)",
+        [(to_epoch_microseconds(first + timedelta(minutes=5 * i)),) for i in range(20)]
+    )
+    connection.commit()
+    convert = _epoch_us_query()
+
+    histogram = load_or_build_histogram(
+        connection, 'events', ['ts_epoch_us'], EPOCH_TIMESTAMP_FORMAT, convert, from_epoch_microseconds
+    )
+    assert histogram is not None
+
+    start, end = first, first + timedelta(minutes=30)
+    sql_count = _sql_count(connection, convert, start, end, column='ts_epoch_us')
+    assert sql_count == 7
+    assert histogram.count_in_range(start, end) >= sql_count
+
+    answered, empty_until = histogram.empty_until(first - timedelta(hours=3))
+    assert answered
+    assert empty_until.tzinfo is None
+    assert empty_until <= first
@@ -16,6 +16,12 @@ import sqlite3
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Union
 
+# Decodes the compact feather_records format of newer correlation databases
+try:
+    from correlation_engine.engine.match_payload import MatchPayloadCodec
+except ImportError:
+    MatchPayloadCodec = None
+
 
 class CorrelationService:
     """
@@ -83,6 +89,27 @@ class CorrelationService:
             )
             return None
     
+    def _rows_to_matches(self, conn: sqlite3.Connection, rows: List[sqlite3.Row]) -> List[Dict[str, Any]]:
+        """
+        Convert match rows to dictionaries with feather_records as JSON text.
+        
+        Args:
+            conn: Connection the rows were read from
+            rows: Rows of the matches query
+            
+        Returns:
+            List of match dictionaries
+        """
+        payload_codec = MatchPayloadCodec(conn) if MatchPayloadCodec else None
+        
+        matches = []
+        for row in rows:
+            match_dict = dict(row)
+            if payload_codec and match_dict.get('feather_records') is not None:
+                match_dict['feather_records'] = payload_codec.decode_json(match_dict['feather_records'])
+            matches.append(match_dict)
+        return matches
+    
     def query_time_correlations(
         self,
         start_time: str,
@@ -162,10 +189,7 @@ class CorrelationService:
             )
             
             # Convert rows to dictionaries
-            matches = []
-            for row in cursor.fetchall():
-                match_dict = dict(row)
-                matches.append(match_dict)
+            matches = self._rows_to_matches(conn, cursor.fetchall())
             
             self.logger.info(
                 f"Time correlation query: {len(matches)} matches found "
@@ -296,10 +320,7 @@ class CorrelationService:
             cursor = conn.execute(query, (query_value, 500))
             
             # Convert rows to dictionaries
-            matches = []
-            for row in cursor.fetchall():
-                match_dict = dict(row)
-                matches.append(match_dict)
+            matches = self._rows_to_matches(conn, cursor.fetchall())
             
             self.logger.info(
                 f"Identity correlation query: {len(matches)} matches found "